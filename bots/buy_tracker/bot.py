@@ -14,6 +14,7 @@ from telegram.ext import Application, CallbackQueryHandler, ContextTypes, Messag
 
 from bots.buy_tracker.config import BuyBotConfig, load_config
 from bots.buy_tracker.monitor import BuyTransaction, TransactionMonitor
+from core.state_paths import STATE_PATHS
 from core.utils.instance_lock import acquire_instance_lock
 from bots.buy_tracker.ape_buttons import (
     parse_ape_callback,
@@ -285,6 +286,7 @@ class JarvisBuyBot:
             on_buy=self._on_buy_detected,
             pair_address=self.config.pair_address,
             additional_pairs=self.config.additional_pairs,
+            state_path=STATE_PATHS.buy_tracker_state,
         )
 
         self._running = True
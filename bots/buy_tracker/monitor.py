@@ -5,11 +5,15 @@ Transaction Monitor - Real-time monitoring of token buys using Helius.
 import asyncio
 import json
 import logging
+import os
+import tempfile
+import time
 import aiohttp
 from aiohttp import ClientTimeout
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 import base58
 
 logger = logging.getLogger(__name__)
@@ -57,6 +61,18 @@ class TransactionMonitor:
     # Maximum number of signatures to keep in memory (prevent unbounded growth)
     MAX_PROCESSED_SIGNATURES = 500
 
+    # getSignaturesForAddress page size, and max pages walked back to the
+    # cursor when a burst outruns one page
+    SIGNATURE_PAGE_LIMIT = 100
+    MAX_SIGNATURE_PAGES = 5
+
+    # Helius enhanced transactions API accepts up to 100 signatures per call
+    TX_BATCH_SIZE = 100
+
+    # Persisted cursors older than this are dropped so a long outage does not
+    # replay stale buys as fresh alerts
+    STATE_MAX_AGE_SECONDS = 900
+
     def __init__(
         self,
         token_address: str,
@@ -65,6 +81,7 @@ class TransactionMonitor:
         on_buy: Optional[Callable[[BuyTransaction], None]] = None,
         pair_address: str = "",
         additional_pairs: Optional[List[tuple]] = None,
+        state_path: Optional[Path] = None,
     ):
         self.token_address = token_address
         self.pair_address = pair_address  # LP pair address where trades happen
@@ -100,7 +117,20 @@ class TransactionMonitor:
         self._market_cap: float = 0
 
         # Track processed signatures to prevent duplicate notifications
-        self._processed_signatures: List[str] = []
+        # (insertion-ordered dict used as a bounded set: O(1) lookups, oldest evicted first)
+        self._processed_signatures: Dict[str, None] = {}
+
+        # Newest seen signature per watched address, passed as `until` so
+        # polls only return signatures we have not seen yet
+        self._signature_cursors: Dict[str, str] = {}
+        # Addresses whose existing history has been skipped (or restored)
+        self._primed_addresses: set = set()
+
+        # Seen-set and cursors survive restarts when a state file is configured
+        self.state_path = Path(state_path) if state_path else None
+        self._state_dirty = False
+        if self.state_path:
+            self._load_state()
 
     def _is_already_processed(self, signature: str) -> bool:
         """Check if a signature has already been processed."""
@@ -109,10 +139,55 @@ class TransactionMonitor:
     def _mark_as_processed(self, signature: str):
         """Mark a signature as processed, maintaining max size."""
         if signature not in self._processed_signatures:
-            self._processed_signatures.append(signature)
+            self._processed_signatures[signature] = None
+            self._state_dirty = True
             # Trim old signatures if we exceed max
-            if len(self._processed_signatures) > self.MAX_PROCESSED_SIGNATURES:
-                self._processed_signatures = self._processed_signatures[-self.MAX_PROCESSED_SIGNATURES:]
+            while len(self._processed_signatures) > self.MAX_PROCESSED_SIGNATURES:
+                del self._processed_signatures[next(iter(self._processed_signatures))]
+
+    def _load_state(self):
+        """Restore the seen-set and poll cursors from the state file."""
+        try:
+            if not self.state_path.exists():
+                return
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning(f"Could not load monitor state from {self.state_path}: {e}")
+            return
+
+        for sig in state.get("signatures", [])[-self.MAX_PROCESSED_SIGNATURES:]:
+            self._processed_signatures[sig] = None
+
+        age = time.time() - float(state.get("saved_at", 0))
+        if age <= self.STATE_MAX_AGE_SECONDS:
+            self._signature_cursors.update(state.get("cursors", {}))
+            self._primed_addresses.update(self._signature_cursors)
+            logger.info(
+                f"Restored {len(self._processed_signatures)} seen signatures and "
+                f"{len(self._signature_cursors)} poll cursors ({age:.0f}s old)"
+            )
+        else:
+            logger.info(f"Monitor state is {age:.0f}s old; re-priming poll cursors")
+
+    def _save_state(self):
+        """Atomically write the seen-set and poll cursors if they changed."""
+        if not self.state_path or not self._state_dirty:
+            return
+        state = {
+            "signatures": list(self._processed_signatures),
+            "cursors": self._signature_cursors,
+            "saved_at": time.time(),
+        }
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=str(self.state_path.parent), delete=False
+            ) as tmp:
+                json.dump(state, tmp)
+            os.replace(tmp.name, self.state_path)
+            self._state_dirty = False
+        except Exception as e:
+            logger.warning(f"Could not save monitor state to {self.state_path}: {e}")
 
     async def start(self):
         """Start monitoring transactions."""
@@ -170,6 +245,7 @@ class TransactionMonitor:
             await self._ws.close()
         if self._session:
             await self._session.close()
+        self._save_state()
         logger.info("Transaction monitor stopped")
 
     def _handle_task_exception(self, task: asyncio.Task):
@@ -222,8 +298,12 @@ class TransactionMonitor:
             logger.error(f"Failed to update prices: {e}")
 
     async def _transaction_poll_loop(self):
-        """Poll for recent transactions across all monitored pairs."""
-        first_run = True
+        """Poll for recent transactions across all monitored pairs.
+
+        Each round polls every pair concurrently from its signature cursor,
+        fetches all new transactions in batches, then parses them in bulk
+        and alerts in chronological order.
+        """
         poll_count = 0
 
         # Get list of all addresses to monitor
@@ -235,73 +315,144 @@ class TransactionMonitor:
         while self._running:
             try:
                 poll_count += 1
-                total_new_count = 0
-
-                # Poll each pair address
-                for watch_address in addresses_to_monitor:
-                    pair_name = self._pair_names.get(watch_address, "unknown")
-                    signatures = await self._get_recent_signatures(watch_address)
-                    new_count = 0
-
-                    for sig_info in signatures:
-                        sig = sig_info.get("signature")
-
-                        # Skip if already processed (prevents duplicates)
-                        if self._is_already_processed(sig):
-                            continue
-
-                        new_count += 1
-                        total_new_count += 1
-
-                        # On first run, just mark existing signatures as processed
-                        if first_run:
-                            self._mark_as_processed(sig)
-                            continue
-
-                        # Parse transaction with LP pair info
-                        buy = await self._parse_transaction(sig, pair_name, watch_address)
-                        if buy:
-                            if buy.usd_amount >= self.min_buy_usd:
-                                lp_label = f" on {pair_name}" if pair_name and pair_name != "main" else ""
-                                logger.info(f"Buy detected: ${buy.usd_amount:.2f} by {buy.buyer_short}{lp_label} ({buy.sol_amount:.4f} SOL)")
-                                self._mark_as_processed(sig)
-                                if self.on_buy:
-                                    await self._safe_callback(buy)
-                            else:
-                                logger.debug(f"Buy below threshold: ${buy.usd_amount:.2f} < ${self.min_buy_usd} by {buy.buyer_short}")
-                                self._mark_as_processed(sig)
-                        else:
-                            # Mark non-buy transactions too (likely sells or other tx types)
-                            logger.debug(f"Non-buy transaction: {sig[:12]}...")
-                            self._mark_as_processed(sig)
-
-                    # Small delay between polling different pairs to avoid rate limits
-                    if len(addresses_to_monitor) > 1:
-                        await asyncio.sleep(0.2)
+                new_count, skipped_count = await self._poll_round(addresses_to_monitor)
 
                 # Log status periodically
-                if first_run and total_new_count > 0:
-                    logger.info(f"Initialized with {total_new_count} existing transactions across {len(addresses_to_monitor)} pairs (skipped)")
+                if skipped_count > 0:
+                    logger.info(f"Initialized with {skipped_count} existing transactions across {len(addresses_to_monitor)} pairs (skipped)")
                 elif poll_count % 15 == 0:  # Every ~30 seconds
                     logger.debug(f"Poll #{poll_count}: {len(self._processed_signatures)} txns tracked across {len(addresses_to_monitor)} pairs, min=${self.min_buy_usd}")
 
                 # Log new transactions found (for debugging)
-                if total_new_count > 0 and not first_run:
-                    logger.info(f"Found {total_new_count} new transaction(s) to process")
+                if new_count > 0:
+                    logger.info(f"Found {new_count} new transaction(s) to process")
 
-                first_run = False
+                self._save_state()
                 await asyncio.sleep(2)  # Poll every 2 seconds
 
             except Exception as e:
                 logger.error(f"Transaction poll error: {e}")
                 await asyncio.sleep(5)
 
-    async def _get_recent_signatures(self, watch_address: str = "") -> List[Dict]:
+    async def _poll_round(self, addresses: List[str]) -> Tuple[int, int]:
+        """Run one poll over all addresses.
+
+        Returns:
+            (new_count, skipped_count) - signatures processed, and existing
+            signatures skipped while priming newly watched addresses
+        """
+        results = await asyncio.gather(*(self._poll_address(addr) for addr in addresses))
+
+        pending: List[Tuple[str, str, str]] = []  # (signature, pair name, pair address)
+        queued = set()
+        skipped_count = 0
+        for watch_address, signatures in zip(addresses, results):
+            priming = watch_address not in self._primed_addresses
+            self._primed_addresses.add(watch_address)
+            pair_name = self._pair_names.get(watch_address, "unknown")
+
+            # RPC returns newest first; alert oldest first
+            for sig_info in reversed(signatures):
+                sig = sig_info.get("signature")
+
+                # Skip if already processed (prevents duplicates)
+                if not sig or sig in queued or self._is_already_processed(sig):
+                    continue
+
+                # On an address's first poll, just mark existing signatures as processed
+                if priming:
+                    self._mark_as_processed(sig)
+                    skipped_count += 1
+                    continue
+
+                # Failed transactions can't be buys
+                if sig_info.get("err") is not None:
+                    self._mark_as_processed(sig)
+                    continue
+
+                queued.add(sig)
+                pending.append((sig, pair_name, watch_address))
+
+        failed: Set[str] = set()
+        if pending:
+            transactions, failed = await self._fetch_transactions([sig for sig, _, _ in pending])
+            for sig, pair_name, watch_address in pending:
+                if sig in failed:
+                    continue  # Batch request failed; retried next round
+                tx = transactions.get(sig)
+                buy = self._build_buy(sig, tx, pair_name, watch_address) if tx else None
+                self._mark_as_processed(sig)
+                await self._handle_parsed(sig, buy, pair_name)
+            if failed:
+                logger.warning(f"{len(failed)} transaction(s) not fetched; retrying next poll")
+
+        for watch_address, signatures in zip(addresses, results):
+            self._advance_cursor(watch_address, signatures, failed)
+
+        return len(pending) - len(failed), skipped_count
+
+    async def _poll_address(self, watch_address: str) -> List[Dict]:
+        """Get signatures newer than the address's cursor (newest first).
+
+        Walks back up to MAX_SIGNATURE_PAGES pages when a burst fills a page.
+        The cursor is advanced by _advance_cursor once the round is handled.
+        """
+        until = self._signature_cursors.get(watch_address)
+        signatures: List[Dict] = []
+        before = None
+        for _ in range(self.MAX_SIGNATURE_PAGES if until else 1):
+            page = await self._get_recent_signatures(watch_address, until=until, before=before)
+            signatures.extend(page)
+            if len(page) < self.SIGNATURE_PAGE_LIMIT:
+                break
+            before = page[-1].get("signature")
+        return signatures
+
+    def _advance_cursor(self, watch_address: str, signatures: List[Dict], failed: Set[str]):
+        """Move the cursor to the newest signature with nothing unfetched before it.
+
+        Signatures after the oldest unfetched one stay above the cursor, so the
+        next poll returns them again (already-processed ones are skipped).
+        """
+        cursor = None
+        for sig_info in reversed(signatures):  # Oldest first
+            sig = sig_info.get("signature")
+            if not sig:
+                continue
+            if sig in failed:
+                break
+            cursor = sig
+        if cursor and cursor != self._signature_cursors.get(watch_address):
+            self._signature_cursors[watch_address] = cursor
+            self._state_dirty = True
+
+    async def _handle_parsed(self, signature: str, buy: Optional[BuyTransaction], pair_name: str):
+        """Log a parsed transaction and fire the buy callback if it qualifies."""
+        if buy:
+            if buy.usd_amount >= self.min_buy_usd:
+                lp_label = f" on {pair_name}" if pair_name and pair_name != "main" else ""
+                logger.info(f"Buy detected: ${buy.usd_amount:.2f} by {buy.buyer_short}{lp_label} ({buy.sol_amount:.4f} SOL)")
+                if self.on_buy:
+                    await self._safe_callback(buy)
+            else:
+                logger.debug(f"Buy below threshold: ${buy.usd_amount:.2f} < ${self.min_buy_usd} by {buy.buyer_short}")
+        else:
+            # Non-buy transactions (likely sells or other tx types)
+            logger.debug(f"Non-buy transaction: {signature[:12]}...")
+
+    async def _get_recent_signatures(
+        self,
+        watch_address: str = "",
+        until: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> List[Dict]:
         """Get recent transaction signatures for a specific address.
 
         Args:
             watch_address: The address to get signatures for. If empty, uses
                           pair_address or token_address as fallback.
+            until: Only return signatures newer than this one.
+            before: Only return signatures older than this one (paging).
         """
         try:
             # Use provided address, or fall back to defaults
@@ -312,14 +463,17 @@ class TransactionMonitor:
                 logger.warning("No address to watch for signatures")
                 return []
 
+            options: Dict[str, Any] = {"limit": self.SIGNATURE_PAGE_LIMIT if until else 30}
+            if until:
+                options["until"] = until
+            if before:
+                options["before"] = before
+
             payload = {
                 "jsonrpc": "2.0",
                 "id": 1,
                 "method": "getSignaturesForAddress",
-                "params": [
-                    watch_address,
-                    {"limit": 30}  # Increased limit for more coverage
-                ]
+                "params": [watch_address, options]
             }
 
             async with self._session.post(self.rpc_url, json=payload) as resp:
@@ -337,34 +491,88 @@ class TransactionMonitor:
 
         return []
 
+    async def _fetch_transactions(self, signatures: List[str]) -> Tuple[Dict[str, Dict], Set[str]]:
+        """Fetch enhanced transactions, TX_BATCH_SIZE signatures per request.
+
+        Returns:
+            (transactions, failed) - mapping of signature -> Helius enhanced
+            transaction, and the signatures whose batch request failed
+        """
+        batches = [
+            signatures[i:i + self.TX_BATCH_SIZE]
+            for i in range(0, len(signatures), self.TX_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(self._fetch_transaction_batch(b) for b in batches))
+        transactions: Dict[str, Dict] = {}
+        failed: Set[str] = set()
+        for batch, result in zip(batches, results):
+            if result is None:
+                failed.update(batch)
+            else:
+                transactions.update(result)
+        return transactions, failed
+
+    async def _fetch_transaction_batch(self, signatures: List[str]) -> Optional[Dict[str, Dict]]:
+        """Fetch one batch from the Helius enhanced transaction API.
+
+        Returns:
+            Mapping of signature -> transaction, or None if the request failed
+        """
+        try:
+            url = f"https://api.helius.xyz/v0/transactions/?api-key={self.helius_api_key}"
+            payload = {"transactions": signatures}
+
+            async with self._session.post(url, json=payload) as resp:
+                if resp.status != 200:
+                    logger.warning(f"Transaction batch of {len(signatures)} failed (status={resp.status})")
+                    return None
+                data = await resp.json()
+
+        except Exception as e:
+            logger.error(f"Failed to fetch {len(signatures)} transaction(s): {e}")
+            return None
+
+        # Results come back in request order; prefer the signature Helius reports
+        transactions: Dict[str, Dict] = {}
+        for sig, tx in zip(signatures, data or []):
+            if tx:
+                transactions[tx.get("signature") or sig] = tx
+        return transactions
+
     async def _parse_transaction(
         self,
         signature: str,
         lp_pair_name: str = "",
         lp_pair_address: str = "",
     ) -> Optional[BuyTransaction]:
-        """Parse a transaction to detect if it's a buy.
+        """Fetch and parse a single transaction to detect if it's a buy.
 
         Args:
             signature: The transaction signature to parse.
             lp_pair_name: Name of the LP pair (e.g., "kr8tiv/ralph").
             lp_pair_address: Address of the LP pair.
         """
-        try:
-            # Use Helius enhanced transaction API
-            url = f"https://api.helius.xyz/v0/transactions/?api-key={self.helius_api_key}"
-            payload = {"transactions": [signature]}
-
-            async with self._session.post(url, json=payload) as resp:
-                if resp.status != 200:
-                    return None
-
-                data = await resp.json()
-                if not data:
-                    return None
+        tx = (await self._fetch_transaction_batch([signature]) or {}).get(signature)
+        if not tx:
+            return None
+        return self._build_buy(signature, tx, lp_pair_name, lp_pair_address)
 
-                tx = data[0]
+    def _build_buy(
+        self,
+        signature: str,
+        tx: Dict[str, Any],
+        lp_pair_name: str = "",
+        lp_pair_address: str = "",
+    ) -> Optional[BuyTransaction]:
+        """Detect a buy in a Helius enhanced transaction.
 
+        Args:
+            signature: The transaction signature.
+            tx: Enhanced transaction data.
+            lp_pair_name: Name of the LP pair (e.g., "kr8tiv/ralph").
+            lp_pair_address: Address of the LP pair.
+        """
+        try:
             # Check for token transfers
             token_transfers = tx.get("tokenTransfers", [])
             native_transfers = tx.get("nativeTransfers", [])
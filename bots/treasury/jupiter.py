@@ -25,6 +25,8 @@ from core.security.tx_confirmation import (
     get_confirmation_service
 )
 
+from .trigger_book import TriggerBook
+
 logger = logging.getLogger(__name__)
 
 
@@ -1093,6 +1095,11 @@ class LimitOrderManager:
     Manages limit orders, take profit, and stop loss triggers.
     Uses price monitoring and executes via Jupiter when triggered.
     Orders are persisted to disk for reliability across restarts.
+
+    Active orders rest in a TriggerBook keyed by mint, so each poll fetches
+    one price per mint (not per order) and a price tick resolves all
+    crossed orders with a bisect. Streaming price feeds can push ticks
+    through on_price() between polls.
     """
 
     ORDERS_FILE = Path(os.getenv("DATA_DIR", "data")) / "limit_orders.json"
@@ -1112,6 +1119,7 @@ class LimitOrderManager:
         self._running = False
         self._monitor_task: Optional[asyncio.Task] = None
         self._on_order_filled = on_order_filled
+        self._book = TriggerBook()
         self._load_orders()
 
     def _load_orders(self):
@@ -1124,6 +1132,11 @@ class LimitOrderManager:
             except Exception as e:
                 logger.warning(f"Failed to load orders: {e}")
 
+        self._book.clear()
+        for order_id, order in self.orders.items():
+            if order.get('status') == 'ACTIVE':
+                self._book.add(order_id, order['token_mint'], order['type'], order['target_price'])
+
     def _save_orders(self):
         """Save orders to disk."""
         self.ORDERS_FILE.parent.mkdir(parents=True, exist_ok=True)
@@ -1167,6 +1180,7 @@ class LimitOrderManager:
             'result': None
         }
 
+        self._book.add(order_id, token_mint, 'TAKE_PROFIT', target_price)
         self._save_orders()
         logger.info(f"Created take profit order {order_id}: sell at ${target_price}")
         return order_id
@@ -1205,6 +1219,7 @@ class LimitOrderManager:
             'result': None
         }
 
+        self._book.add(order_id, token_mint, 'STOP_LOSS', stop_price)
         self._save_orders()
         logger.info(f"Created stop loss order {order_id}: sell at ${stop_price}")
         return order_id
@@ -1213,6 +1228,7 @@ class LimitOrderManager:
         """Cancel an order."""
         if order_id in self.orders:
             self.orders[order_id]['status'] = 'CANCELLED'
+            self._book.remove(order_id)
             self._save_orders()
             logger.info(f"Cancelled order {order_id}")
             return True
@@ -1251,36 +1267,42 @@ class LimitOrderManager:
             await asyncio.sleep(interval)
 
     async def _check_orders(self):
-        """Check all active orders against current prices."""
-        active_orders = [
-            (oid, order) for oid, order in self.orders.items()
-            if order['status'] == 'ACTIVE'
-        ]
-
-        for order_id, order in active_orders:
-            try:
-                current_price = await self.jupiter.get_token_price(order['token_mint'])
-
-                if current_price <= 0:
-                    continue
+        """Poll one price per mint with resting orders and apply each tick."""
+        mints = self._book.mints()
+        if not mints:
+            return
 
-                triggered = False
+        prices = await asyncio.gather(
+            *(self.jupiter.get_token_price(mint) for mint in mints),
+            return_exceptions=True,
+        )
 
-                if order['type'] == 'TAKE_PROFIT':
-                    # Trigger when price goes ABOVE target
-                    if current_price >= order['target_price']:
-                        triggered = True
+        for mint, price in zip(mints, prices):
+            if isinstance(price, Exception):
+                logger.error(f"Failed to get price for {mint}: {price}")
+                continue
+            await self.on_price(mint, price)
 
-                elif order['type'] == 'STOP_LOSS':
-                    # Trigger when price goes BELOW target
-                    if current_price <= order['target_price']:
-                        triggered = True
+    async def on_price(self, token_mint: str, current_price: float) -> List[str]:
+        """
+        Apply a price tick for one mint (polled or pushed by a stream).
 
-                if triggered:
-                    await self._execute_order(order_id, order, current_price)
+        Executes every order the price crosses and returns their IDs.
+        """
+        if not current_price or current_price <= 0:
+            return []
 
+        executed = []
+        for order_id, _ in self._book.on_price(token_mint, current_price):
+            order = self.orders.get(order_id)
+            if order is None or order['status'] != 'ACTIVE':
+                continue
+            try:
+                await self._execute_order(order_id, order, current_price)
+                executed.append(order_id)
             except Exception as e:
                 logger.error(f"Failed to check order {order_id}: {e}")
+        return executed
 
     async def _execute_order(self, order_id: str, order: Dict, current_price: float):
         """Execute a triggered order."""
@@ -11,9 +11,11 @@ Tracks:
 Data persisted to JSON for reliability.
 """
 
+import atexit
 import json
 import logging
 import os
+import threading
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -30,6 +32,9 @@ DB_PATH = DATA_DIR / "jarvis_core.db"  # Updated to use core DB
 SCOREKEEPER_FILE = DATA_DIR / "treasury_scorekeeper.json"
 ORDERS_FILE = DATA_DIR / "treasury_orders.json"
 
+# Coalesce scorekeeper writes within this window (0 = write synchronously)
+WRITE_BEHIND_MS = float(os.getenv("SCOREKEEPER_WRITE_BEHIND_MS", "0"))
+
 
 class PositionStatus(Enum):
     OPEN = "open"
@@ -39,8 +44,29 @@ class PositionStatus(Enum):
     FAILED = "failed"
 
 
+class _ChangeTracked:
+    """Mixin that flags a dataclass row dirty whenever one of its fields is assigned."""
+
+    _dirty = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in self.__dataclass_fields__:
+            object.__setattr__(self, "_dirty", True)
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._dirty
+
+    def mark_clean(self) -> None:
+        object.__setattr__(self, "_dirty", False)
+
+    def mark_dirty(self) -> None:
+        object.__setattr__(self, "_dirty", True)
+
+
 @dataclass
-class Position:
+class Position(_ChangeTracked):
     """A trading position with TP/SL."""
     id: str
     symbol: str
@@ -72,7 +98,7 @@ class Position:
 
 
 @dataclass
-class TradeRecord:
+class TradeRecord(_ChangeTracked):
     """Record of a completed trade."""
     id: str
     symbol: str
@@ -91,7 +117,7 @@ class TradeRecord:
 
 
 @dataclass
-class ScoreCard:
+class ScoreCard(_ChangeTracked):
     """Performance metrics."""
     total_trades: int = 0
     winning_trades: int = 0
@@ -117,7 +143,8 @@ class Scorekeeper:
     Persistent scorekeeper for treasury trading.
     
     Tracks all positions, trades, and performance metrics.
-    Data is persisted to disk on every update.
+    Only changed rows are persisted on each update; set
+    SCOREKEEPER_WRITE_BEHIND_MS to coalesce bursts into one transaction.
     """
 
     _instance: Optional["Scorekeeper"] = None
@@ -138,6 +165,16 @@ class Scorekeeper:
         self.scorecard = ScoreCard()
         self.orders: Dict[str, Dict] = {}  # TP/SL orders
 
+        # Change tracking: only dirty rows are written on each save
+        self._dirty_orders: set[str] = set()
+        self._removed_orders: set[str] = set()
+        # Guards positions/trades/orders/scorecard and the writes of them;
+        # with write-behind, flush runs on a timer thread
+        self._save_lock = threading.RLock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._write_behind_s = max(0.0, WRITE_BEHIND_MS / 1000.0)
+        atexit.register(self.flush)
+
         self._init_db()
         self._load()
         self._initialized = True
@@ -385,6 +422,11 @@ class Scorekeeper:
                     row["order_id"]: json.loads(row["order_json"])
                     for row in order_rows
                 }
+                # Rows just read back already match the database
+                for pos in self.positions.values():
+                    pos.mark_clean()
+                for trade in self.trades:
+                    trade.mark_clean()
                 logger.info(f"Loaded scorekeeper from SQLite: {len(self.positions)} positions")
                 return
         except Exception as e:
@@ -409,6 +451,7 @@ class Scorekeeper:
             try:
                 with open(ORDERS_FILE) as f:
                     self.orders = json.load(f)
+                self._dirty_orders.update(self.orders)
                 logger.info(f"Loaded legacy orders: {len(self.orders)} orders")
             except Exception as e:
                 logger.error(f"Failed to load legacy orders: {e}")
@@ -417,26 +460,105 @@ class Scorekeeper:
             self._save()
 
     def _save(self):
-        """Persist data to SQLite with explicit transaction control."""
-        conn = None
-        try:
-            conn = self._get_conn()
+        """Persist pending changes, coalescing bursts when write-behind is on."""
+        if self._write_behind_s <= 0:
+            self.flush()
+            return
+
+        with self._save_lock:
+            if self._flush_timer is not None:
+                return
+            self._flush_timer = threading.Timer(self._write_behind_s, self._flush_from_timer)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_from_timer(self):
+        with self._save_lock:
+            self._flush_timer = None
+        self.flush()
+
+    def set_write_behind(self, window_seconds: float) -> None:
+        """
+        Configure write-behind persistence.
+
+        With a positive window, mutations inside the window are coalesced into
+        a single transaction. Zero restores synchronous writes.
+        """
+        self._write_behind_s = max(0.0, float(window_seconds))
+        if self._write_behind_s <= 0:
+            self.flush()
+
+    def _collect_dirty(self):
+        """Snapshot dirty rows and mark them clean. Caller holds _save_lock (as do all mutators)."""
+        positions = [p for p in self.positions.values() if p.is_dirty]
+        trades = [t for t in self.trades if t.is_dirty]
+        for record in positions:
+            record.mark_clean()
+        for record in trades:
+            record.mark_clean()
+
+        orders = {
+            order_id: json.dumps(self.orders[order_id])
+            for order_id in self._dirty_orders
+            if order_id in self.orders
+        }
+        removed_orders = list(self._removed_orders)
+        self._dirty_orders.clear()
+        self._removed_orders.clear()
+
+        scorecard_dirty = self.scorecard.is_dirty
+        self.scorecard.mark_clean()
+        return positions, trades, orders, removed_orders, scorecard_dirty
+
+    def flush(self) -> None:
+        """Upsert dirty positions, trades and orders in one transaction."""
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            positions, trades, orders, removed_orders, scorecard_dirty = self._collect_dirty()
+            if not (positions or trades or orders or removed_orders or scorecard_dirty):
+                return
+
+            try:
+                self._write_rows(positions, trades, orders, removed_orders, scorecard_dirty)
+            except Exception as e:
+                logger.error(f"Failed to save scorekeeper to SQLite: {e}")
+                # Re-queue so the next save retries the rows this one dropped
+                for record in positions:
+                    record.mark_dirty()
+                for record in trades:
+                    record.mark_dirty()
+                self._dirty_orders.update(orders)
+                self._removed_orders.update(removed_orders)
+                if scorecard_dirty:
+                    self.scorecard.mark_dirty()
+
+    def _write_rows(
+        self,
+        positions: List[Position],
+        trades: List["TradeRecord"],
+        orders: Dict[str, str],
+        removed_orders: List[str],
+        scorecard_dirty: bool,
+    ) -> None:
+        """Write a batch of changed rows with explicit transaction control."""
+        with self._get_conn() as conn:
             # Begin immediate transaction to lock the database for writing
             conn.execute("BEGIN IMMEDIATE")
 
-            try:
-                conn.execute("DELETE FROM positions")
-                for pos in self.positions.values():
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO positions (
-                            id, symbol, token_mint, entry_price, entry_amount_sol,
-                            entry_amount_tokens, take_profit_price, stop_loss_price,
-                            tp_order_id, sl_order_id, status, exit_price, exit_amount_sol,
-                            pnl_sol, pnl_pct, opened_at, closed_at, tx_signature_entry,
-                            tx_signature_exit, user_id
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
+            if positions:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO positions (
+                        id, symbol, token_mint, entry_price, entry_amount_sol,
+                        entry_amount_tokens, take_profit_price, stop_loss_price,
+                        tp_order_id, sl_order_id, status, exit_price, exit_amount_sol,
+                        pnl_sol, pnl_pct, opened_at, closed_at, tx_signature_entry,
+                        tx_signature_exit, user_id
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
                         (
                             pos.id,
                             pos.symbol,
@@ -458,18 +580,20 @@ class Scorekeeper:
                             pos.tx_signature_entry,
                             pos.tx_signature_exit,
                             pos.user_id,
-                        ),
-                    )
+                        )
+                        for pos in positions
+                    ],
+                )
 
-                conn.execute("DELETE FROM trades")
-                for trade in self.trades:
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO trades (
-                            id, symbol, token_mint, side, amount_sol, amount_tokens,
-                            price, timestamp, tx_signature, position_id, user_id
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
+            if trades:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO trades (
+                        id, symbol, token_mint, side, amount_sol, amount_tokens,
+                        price, timestamp, tx_signature, position_id, user_id
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
                         (
                             trade.id,
                             trade.symbol,
@@ -482,70 +606,69 @@ class Scorekeeper:
                             trade.tx_signature,
                             trade.position_id,
                             trade.user_id,
-                        ),
-                    )
-
-                conn.execute("DELETE FROM treasury_orders")
-                for order_id, order_data in self.orders.items():
-                    conn.execute(
-                        "INSERT OR REPLACE INTO treasury_orders (order_id, order_json) VALUES (?, ?)",
-                        (order_id, json.dumps(order_data)),
-                    )
-
-                conn.execute(
-                    """
-                    UPDATE scorecard SET
-                        total_trades = ?,
-                        winning_trades = ?,
-                        losing_trades = ?,
-                        total_pnl_sol = ?,
-                        total_pnl_usd = ?,
-                        largest_win_sol = ?,
-                        largest_loss_sol = ?,
-                        current_streak = ?,
-                        best_streak = ?,
-                        worst_streak = ?,
-                        avg_win_pct = ?,
-                        avg_loss_pct = ?,
-                        win_rate = ?,
-                        last_updated = ?
-                    WHERE id = 1
-                    """,
-                    (
-                        self.scorecard.total_trades,
-                        self.scorecard.winning_trades,
-                        self.scorecard.losing_trades,
-                        self.scorecard.total_pnl_sol,
-                        self.scorecard.total_pnl_usd,
-                        self.scorecard.largest_win_sol,
-                        self.scorecard.largest_loss_sol,
-                        self.scorecard.current_streak,
-                        self.scorecard.best_streak,
-                        self.scorecard.worst_streak,
-                        self.scorecard.avg_win_pct,
-                        self.scorecard.avg_loss_pct,
-                        self.scorecard.win_rate,
-                        self.scorecard.last_updated,
-                    ),
+                        )
+                        for trade in trades
+                    ],
                 )
 
-                # Commit the transaction atomically
-                conn.commit()
-
-                # Checkpoint WAL to ensure data is written to main database
-                # This prevents unbounded WAL growth and ensures durability
-                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
-
-            except Exception as e:
-                # Rollback on any error
-                conn.rollback()
-                raise
+            if removed_orders:
+                conn.executemany(
+                    "DELETE FROM treasury_orders WHERE order_id = ?",
+                    [(order_id,) for order_id in removed_orders],
+                )
+            if orders:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO treasury_orders (order_id, order_json) VALUES (?, ?)",
+                    list(orders.items()),
+                )
 
-        except Exception as e:
-            logger.error(f"Failed to save scorekeeper to SQLite: {e}")
-        finally:
-            if conn:
-                conn.close()
+            if scorecard_dirty:
+                self._write_scorecard(conn)
+
+            # Commit the transaction atomically
+            conn.commit()
+
+            # Passive checkpoint keeps the WAL bounded without waiting on readers
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def _write_scorecard(self, conn) -> None:
+        """Write the singleton scorecard row."""
+        conn.execute(
+            """
+            UPDATE scorecard SET
+                total_trades = ?,
+                winning_trades = ?,
+                losing_trades = ?,
+                total_pnl_sol = ?,
+                total_pnl_usd = ?,
+                largest_win_sol = ?,
+                largest_loss_sol = ?,
+                current_streak = ?,
+                best_streak = ?,
+                worst_streak = ?,
+                avg_win_pct = ?,
+                avg_loss_pct = ?,
+                win_rate = ?,
+                last_updated = ?
+            WHERE id = 1
+            """,
+            (
+                self.scorecard.total_trades,
+                self.scorecard.winning_trades,
+                self.scorecard.losing_trades,
+                self.scorecard.total_pnl_sol,
+                self.scorecard.total_pnl_usd,
+                self.scorecard.largest_win_sol,
+                self.scorecard.largest_loss_sol,
+                self.scorecard.current_streak,
+                self.scorecard.best_streak,
+                self.scorecard.worst_streak,
+                self.scorecard.avg_win_pct,
+                self.scorecard.avg_loss_pct,
+                self.scorecard.win_rate,
+                self.scorecard.last_updated,
+            ),
+        )
 
     def open_position(
         self,
@@ -580,26 +703,27 @@ class Scorekeeper:
             user_id=user_id,
         )
 
-        self.positions[position_id] = position
-
-        # Record the buy trade
-        trade = TradeRecord(
-            id=f"buy_{position_id}",
-            symbol=symbol,
-            token_mint=token_mint,
-            side="buy",
-            amount_sol=entry_amount_sol,
-            amount_tokens=entry_amount_tokens,
-            price=entry_price,
-            timestamp=position.opened_at,
-            tx_signature=tx_signature,
-            position_id=position_id,
-            user_id=user_id,
-        )
-        self.trades.append(trade)
-        self.scorecard.total_trades += 1
+        with self._save_lock:
+            self.positions[position_id] = position
+
+            # Record the buy trade
+            trade = TradeRecord(
+                id=f"buy_{position_id}",
+                symbol=symbol,
+                token_mint=token_mint,
+                side="buy",
+                amount_sol=entry_amount_sol,
+                amount_tokens=entry_amount_tokens,
+                price=entry_price,
+                timestamp=position.opened_at,
+                tx_signature=tx_signature,
+                position_id=position_id,
+                user_id=user_id,
+            )
+            self.trades.append(trade)
+            self.scorecard.total_trades += 1
 
-        self._save()
+            self._save()
         logger.info(f"Opened position {position_id}: {symbol} @ ${entry_price}")
         return position
 
@@ -612,52 +736,53 @@ class Scorekeeper:
         tx_signature: str = "",
     ) -> Optional[Position]:
         """Close a position and calculate P&L."""
-        if position_id not in self.positions:
-            logger.error(f"Position {position_id} not found")
-            return None
-
-        position = self.positions[position_id]
-        if position.status != "open":
-            logger.warning(f"Position {position_id} already closed")
-            return position
-
-        # Calculate P&L
-        position.exit_price = exit_price
-        position.exit_amount_sol = exit_amount_sol
-        position.pnl_sol = exit_amount_sol - position.entry_amount_sol
-        position.pnl_pct = (position.pnl_sol / position.entry_amount_sol * 100) if position.entry_amount_sol > 0 else 0
-        position.closed_at = datetime.now(timezone.utc).isoformat()
-        position.tx_signature_exit = tx_signature
-
-        # Set status based on close type
-        if close_type == "tp":
-            position.status = "closed_tp"
-        elif close_type == "sl":
-            position.status = "closed_sl"
-        else:
-            position.status = "closed_manual"
-
-        # Update scorecard
-        self._update_scorecard(position)
-
-        # Record the sell trade
-        trade = TradeRecord(
-            id=f"sell_{position_id}",
-            symbol=position.symbol,
-            token_mint=position.token_mint,
-            side="sell",
-            amount_sol=exit_amount_sol,
-            amount_tokens=position.entry_amount_tokens,
-            price=exit_price,
-            timestamp=position.closed_at,
-            tx_signature=tx_signature,
-            position_id=position_id,
-            user_id=position.user_id,
-        )
-        self.trades.append(trade)
-        self.scorecard.total_trades += 1
+        with self._save_lock:
+            if position_id not in self.positions:
+                logger.error(f"Position {position_id} not found")
+                return None
+
+            position = self.positions[position_id]
+            if position.status != "open":
+                logger.warning(f"Position {position_id} already closed")
+                return position
+
+            # Calculate P&L
+            position.exit_price = exit_price
+            position.exit_amount_sol = exit_amount_sol
+            position.pnl_sol = exit_amount_sol - position.entry_amount_sol
+            position.pnl_pct = (position.pnl_sol / position.entry_amount_sol * 100) if position.entry_amount_sol > 0 else 0
+            position.closed_at = datetime.now(timezone.utc).isoformat()
+            position.tx_signature_exit = tx_signature
+
+            # Set status based on close type
+            if close_type == "tp":
+                position.status = "closed_tp"
+            elif close_type == "sl":
+                position.status = "closed_sl"
+            else:
+                position.status = "closed_manual"
+
+            # Update scorecard
+            self._update_scorecard(position)
+
+            # Record the sell trade
+            trade = TradeRecord(
+                id=f"sell_{position_id}",
+                symbol=position.symbol,
+                token_mint=position.token_mint,
+                side="sell",
+                amount_sol=exit_amount_sol,
+                amount_tokens=position.entry_amount_tokens,
+                price=exit_price,
+                timestamp=position.closed_at,
+                tx_signature=tx_signature,
+                position_id=position_id,
+                user_id=position.user_id,
+            )
+            self.trades.append(trade)
+            self.scorecard.total_trades += 1
 
-        self._save()
+            self._save()
         logger.info(
             f"Closed position {position_id}: {position.symbol} "
             f"P&L: {position.pnl_sol:+.4f} SOL ({position.pnl_pct:+.1f}%)"
@@ -713,14 +838,20 @@ class Scorekeeper:
 
     def save_order(self, order_id: str, order_data: Dict):
         """Save a TP/SL order for persistence."""
-        self.orders[order_id] = order_data
-        self._save()
+        with self._save_lock:
+            self.orders[order_id] = order_data
+            self._dirty_orders.add(order_id)
+            self._removed_orders.discard(order_id)
+            self._save()
 
     def remove_order(self, order_id: str):
         """Remove a completed/cancelled order."""
-        if order_id in self.orders:
-            del self.orders[order_id]
-            self._save()
+        with self._save_lock:
+            if order_id in self.orders:
+                del self.orders[order_id]
+                self._dirty_orders.discard(order_id)
+                self._removed_orders.add(order_id)
+                self._save()
 
     def get_open_positions(self) -> List[Position]:
         """Get all open positions."""
@@ -752,42 +883,43 @@ class Scorekeeper:
         """
         synced_count = 0
         try:
-            for pos_data in treasury_positions:
-                # Only sync OPEN positions
-                if pos_data.get("status") != "OPEN":
-                    continue
-
-                pos_id = pos_data.get("id")
-                token_mint = pos_data.get("token_mint")
-
-                # Skip if already in scorekeeper
-                if pos_id in self.positions:
-                    continue
-
-                # Convert treasury position format to scorekeeper Position
-                pos = Position(
-                    id=pos_id,
-                    symbol=pos_data.get("token_symbol", "UNKNOWN"),
-                    token_mint=token_mint,
-                    entry_price=pos_data.get("entry_price", 0.0),
-                    entry_amount_sol=pos_data.get("amount_usd", 0.0) / 100.0,  # Approximate SOL value
-                    entry_amount_tokens=pos_data.get("amount", 0.0),
-                    take_profit_price=pos_data.get("take_profit_price", 0.0),
-                    stop_loss_price=pos_data.get("stop_loss_price", 0.0),
-                    tp_order_id=pos_data.get("tp_order_id", ""),
-                    sl_order_id=pos_data.get("sl_order_id", ""),
-                    status="open",
-                    opened_at=pos_data.get("opened_at", datetime.now(timezone.utc).isoformat()),
-                )
+            with self._save_lock:
+                for pos_data in treasury_positions:
+                    # Only sync OPEN positions
+                    if pos_data.get("status") != "OPEN":
+                        continue
 
-                self.positions[pos_id] = pos
-                synced_count += 1
-                logger.info(f"Synced position: {pos.symbol} ({pos.id})")
+                    pos_id = pos_data.get("id")
+                    token_mint = pos_data.get("token_mint")
 
-            # Save after syncing
-            if synced_count > 0:
-                self._save()
-                logger.info(f"Synced {synced_count} positions from treasury")
+                    # Skip if already in scorekeeper
+                    if pos_id in self.positions:
+                        continue
+
+                    # Convert treasury position format to scorekeeper Position
+                    pos = Position(
+                        id=pos_id,
+                        symbol=pos_data.get("token_symbol", "UNKNOWN"),
+                        token_mint=token_mint,
+                        entry_price=pos_data.get("entry_price", 0.0),
+                        entry_amount_sol=pos_data.get("amount_usd", 0.0) / 100.0,  # Approximate SOL value
+                        entry_amount_tokens=pos_data.get("amount", 0.0),
+                        take_profit_price=pos_data.get("take_profit_price", 0.0),
+                        stop_loss_price=pos_data.get("stop_loss_price", 0.0),
+                        tp_order_id=pos_data.get("tp_order_id", ""),
+                        sl_order_id=pos_data.get("sl_order_id", ""),
+                        status="open",
+                        opened_at=pos_data.get("opened_at", datetime.now(timezone.utc).isoformat()),
+                    )
+
+                    self.positions[pos_id] = pos
+                    synced_count += 1
+                    logger.info(f"Synced position: {pos.symbol} ({pos.id})")
+
+                # Save after syncing
+                if synced_count > 0:
+                    self._save()
+                    logger.info(f"Synced {synced_count} positions from treasury")
 
         except Exception as e:
             logger.error(f"Failed to sync treasury positions: {e}")
@@ -0,0 +1,122 @@
+"""
+Price-indexed trigger book for take-profit / stop-loss orders.
+
+Orders are bucketed by mint, and each bucket keeps its thresholds sorted:
+
+- take-profits fire when price >= target, i.e. a prefix of the
+  ascending target list
+- stop-losses fire when price <= target, i.e. a suffix of it
+
+One price tick for a mint finds the crossed orders with a single bisect
+and slices them off, so resolving k orders costs O(log n + k) regardless
+of how many orders rest on that mint. Prices can come from a poll loop or
+be pushed by a streaming feed; both go through the same on_price path.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import count
+from typing import Dict, List, Tuple
+
+TAKE_PROFIT = 'TAKE_PROFIT'
+STOP_LOSS = 'STOP_LOSS'
+
+# (target_price, insertion seq, order_id); seq keeps ties in creation order
+_Entry = Tuple[float, int, str]
+
+
+class _MintBook:
+    """Sorted thresholds for one mint."""
+
+    __slots__ = ('take_profits', 'stop_losses')
+
+    def __init__(self):
+        self.take_profits: List[_Entry] = []
+        self.stop_losses: List[_Entry] = []
+
+    def __len__(self) -> int:
+        return len(self.take_profits) + len(self.stop_losses)
+
+
+class TriggerBook:
+    """
+    Resting TP/SL orders indexed by mint and trigger price.
+
+    Not thread-safe; meant to be driven from one event loop. Every method
+    is synchronous, so a crossed order is handed out exactly once even when
+    polled and pushed prices interleave.
+    """
+
+    def __init__(self):
+        self._books: Dict[str, _MintBook] = {}
+        self._index: Dict[str, Tuple[str, str, _Entry]] = {}  # order_id -> (mint, type, entry)
+        self._seq = count()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._index
+
+    def mints(self) -> List[str]:
+        """Mints with at least one resting order."""
+        return list(self._books)
+
+    def add(self, order_id: str, token_mint: str, order_type: str, target_price: float) -> None:
+        """Insert (or replace) an order."""
+        if order_type not in (TAKE_PROFIT, STOP_LOSS):
+            raise ValueError(f"Unknown order type: {order_type}")
+        self.remove(order_id)
+
+        entry = (float(target_price), next(self._seq), order_id)
+        book = self._books.setdefault(token_mint, _MintBook())
+        insort(book.take_profits if order_type == TAKE_PROFIT else book.stop_losses, entry)
+        self._index[order_id] = (token_mint, order_type, entry)
+
+    def remove(self, order_id: str) -> bool:
+        """Drop an order; False if it is not in the book."""
+        located = self._index.pop(order_id, None)
+        if located is None:
+            return False
+
+        token_mint, order_type, entry = located
+        book = self._books[token_mint]
+        side = book.take_profits if order_type == TAKE_PROFIT else book.stop_losses
+        i = bisect_left(side, entry)
+        if i < len(side) and side[i] == entry:
+            del side[i]
+        if not book:
+            del self._books[token_mint]
+        return True
+
+    def on_price(self, token_mint: str, price: float) -> List[Tuple[str, str]]:
+        """
+        Pop every order crossed by this price.
+
+        Returns (order_id, order_type) pairs: stop-losses first (highest
+        target first), then take-profits (lowest target first).
+        """
+        book = self._books.get(token_mint)
+        if book is None or price <= 0:
+            return []
+
+        # Stop-losses with target >= price (ties are crossed)
+        cut = bisect_left(book.stop_losses, (price, -1, ''))
+        stops = book.stop_losses[cut:]
+        del book.stop_losses[cut:]
+
+        # Take-profits with target <= price
+        cut = bisect_right(book.take_profits, (price, float('inf'), ''))
+        profits = book.take_profits[:cut]
+        del book.take_profits[:cut]
+
+        fired = [(entry[2], STOP_LOSS) for entry in reversed(stops)]
+        fired += [(entry[2], TAKE_PROFIT) for entry in profits]
+        for order_id, _ in fired:
+            del self._index[order_id]
+        if not book:
+            del self._books[token_mint]
+        return fired
+
+    def clear(self) -> None:
+        self._books.clear()
+        self._index.clear()
@@ -35,6 +35,7 @@ from core.memory.dedup_store import (
     get_memory_store
 )
 from bots.twitter.telegram_sync import sync_tweet_to_telegram
+from bots.twitter.dedup_index import INDEX_RETENTION_DAYS, NearDuplicateIndex, time_bucket
 from core.context_engine import context
 from core.async_utils import fire_and_forget
 
@@ -428,6 +429,8 @@ class XMemory:
         self.db_path = db_path
         self._lock = threading.Lock()
         self._memory_store = get_memory_store()  # Get global MemoryStore instance for dedup
+        self._dedup = NearDuplicateIndex(self._extract_semantic_concepts)
+        self._dedup_maintained_bucket: Optional[int] = None
         self._init_db()
     
     def _init_db(self):
@@ -615,6 +618,14 @@ class XMemory:
                     CREATE INDEX IF NOT EXISTS idx_external_reply_author ON external_replies(author_handle)
                 """)
 
+                # Near-duplicate index (features, LSH buckets, cashtags)
+                NearDuplicateIndex.init_schema(conn)
+                indexed = self._dedup.backfill(
+                    conn, datetime.now(timezone.utc) - timedelta(days=INDEX_RETENTION_DAYS)
+                )
+                if indexed:
+                    logger.info(f"Indexed {indexed} existing tweets for duplicate detection")
+
                 conn.commit()
             finally:
                 if conn:
@@ -627,11 +638,13 @@ class XMemory:
             try:
                 conn = sqlite3.connect(str(self.db_path))
                 cursor = conn.cursor()
+                now = datetime.now(timezone.utc)
                 cursor.execute("""
                     INSERT OR REPLACE INTO tweets (tweet_id, content, category, cashtags, posted_at)
                     VALUES (?, ?, ?, ?, ?)
-                """, (tweet_id, content, category, json.dumps(cashtags), 
-                      datetime.now(timezone.utc).isoformat()))
+                """, (tweet_id, content, category, json.dumps(cashtags), now.isoformat()))
+                self._dedup.add(conn, tweet_id, content, now)
+                self._maintain_dedup_index(conn, now)
                 conn.commit()
             finally:
                 if conn:
@@ -716,6 +729,9 @@ class XMemory:
         Calculate freshness score for proposed content (0.0 to 1.0).
         Higher = more unique/fresh. Lower = too similar to recent content.
 
+        Scores against the features stored in the near-duplicate index, so
+        recent tweets are not re-parsed on every call.
+
         Returns:
             float: Freshness score where:
             - 1.0 = Completely unique
@@ -723,73 +739,15 @@ class XMemory:
             - 0.3-0.7 = Borderline, may want to skip
             - <0.3 = Too similar, should reject
         """
-        import re
-
-        recent = self.get_recent_tweets(hours=hours)
-        if not recent:
-            return 1.0  # No recent tweets = totally fresh
-
-        content_lower = content.lower()
-
-        # Extract features from new content
-        new_cashtags = set(re.findall(r'\$([a-z]{2,10})\b', content_lower))
-        new_concepts = self._extract_semantic_concepts(content)
-        new_subjects = set(new_concepts.get("subjects", []))
-        new_sentiment = new_concepts.get("sentiment", "unknown")
-        new_words = set(re.sub(r'[^\w\s]', '', content_lower).split())
-
-        # Calculate similarity scores
-        max_similarity = 0.0
-
-        for tweet in recent:
-            old_content = tweet.get("content", "").lower()
-
-            # Extract features from old content
-            old_cashtags = set(re.findall(r'\$([a-z]{2,10})\b', old_content))
-            old_concepts = self._extract_semantic_concepts(old_content)
-            old_subjects = set(old_concepts.get("subjects", []))
-            old_sentiment = old_concepts.get("sentiment", "unknown")
-            old_words = set(re.sub(r'[^\w\s]', '', old_content).split())
-
-            # Component similarities
-
-            # 1. Cashtag overlap (excluding major coins)
-            MAJOR_COINS = {'sol', 'btc', 'eth', 'usdc', 'usdt'}
-            new_non_major = new_cashtags - MAJOR_COINS
-            old_non_major = old_cashtags - MAJOR_COINS
-            if new_non_major and old_non_major:
-                cashtag_overlap = len(new_non_major & old_non_major) / max(len(new_non_major), 1)
-            else:
-                cashtag_overlap = 0.0
-
-            # 2. Subject overlap
-            if new_subjects and old_subjects:
-                subject_overlap = len(new_subjects & old_subjects) / max(len(new_subjects | old_subjects), 1)
-            else:
-                subject_overlap = 0.0
-
-            # 3. Sentiment match (binary)
-            sentiment_match = 1.0 if new_sentiment == old_sentiment != "unknown" else 0.0
-
-            # 4. Word overlap (Jaccard)
-            if new_words and old_words:
-                word_overlap = len(new_words & old_words) / max(len(new_words | old_words), 1)
-            else:
-                word_overlap = 0.0
-
-            # Weighted similarity score
-            similarity = (
-                cashtag_overlap * 0.35 +  # Cashtags matter most
-                subject_overlap * 0.25 +   # Subject matters
-                sentiment_match * 0.15 +   # Sentiment adds repetition
-                word_overlap * 0.25         # Word overlap catches direct repeats
-            )
-
-            max_similarity = max(max_similarity, similarity)
-
-        # Freshness = inverse of similarity
-        freshness = 1.0 - max_similarity
-        return round(freshness, 2)
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        with self._lock:
+            conn = None
+            try:
+                conn = sqlite3.connect(str(self.db_path))
+                return self._dedup.freshness(conn, content, since)
+            finally:
+                if conn:
+                    conn.close()
 
     def record_token_mention(self, symbol: str, contract: str, sentiment: str, price: float = 0.0):
         """Record that we mentioned a token and save for performance tracking."""
@@ -863,6 +821,13 @@ class XMemory:
                 if conn:
                     conn.close()
 
+    def _maintain_dedup_index(self, conn: sqlite3.Connection, now: datetime):
+        """Expire old dedup index buckets, at most once per hour bucket."""
+        bucket = time_bucket(now)
+        if self._dedup_maintained_bucket != bucket:
+            self._dedup.maintain(conn, now)
+            self._dedup_maintained_bucket = bucket
+
     def is_similar_to_recent(self, content: str, hours: int = 48, threshold: float = 0.5) -> Tuple[bool, Optional[str]]:
         """
         Check if content is too similar to recent tweets within the last N hours.
@@ -870,87 +835,26 @@ class XMemory:
         Extended duplicate window to 48h to prevent bot spam patterns.
 
         Uses multiple detection methods:
-        1. Extract key entities (tokens, prices) and check for duplicates
-        2. Jaccard word similarity as fallback
+        1. Key entities (tokens, prices) of tweets sharing a cashtag
+        2. Jaccard word similarity over MinHash/LSH candidates
 
         Returns:
             (is_similar, similar_content) - True if duplicate/similar found
         """
-        import re
-
-        content_lower = content.lower()
-
-        # Extract key entities from new content
-        def extract_entities(text: str) -> dict:
-            text_lower = text.lower()
-            entities = {}
-            # Extract cashtags/tokens - ONLY match actual $CASHTAGS, not random words
-            # Must start with $ to be considered a token
-            tokens = re.findall(r'\$([a-z]{2,10})\b', text_lower)
-            entities['tokens'] = set(t.upper() for t in tokens)
-            # Extract prices
-            prices = re.findall(r'\$?([\d,]+\.?\d*)', text)
-            entities['prices'] = set(p.replace(',', '') for p in prices if len(p) > 1)
-            return entities
-
-        new_entities = extract_entities(content)
-        recent = self.get_recent_tweets(hours=hours)
-
-        for tweet in recent:
-            old_entities = extract_entities(tweet["content"])
-
-            # Check for same token + same price combo (strong duplicate signal)
-            common_tokens = new_entities['tokens'] & old_entities['tokens']
-            common_prices = new_entities['prices'] & old_entities['prices']
-
-            # If same token AND same price, it's likely duplicate content
-            # Skip major coins (SOL, BTC, ETH) for this check - they appear in most tweets
-            MAJOR_COINS = {'SOL', 'BTC', 'ETH', 'USDC', 'USDT'}
-            non_major_common = common_tokens - MAJOR_COINS
-
-            if non_major_common and common_prices:
-                for token in non_major_common:
-                    for price in common_prices:
-                        try:
-                            price_val = float(price)
-                            # Accept any meaningful price (including small meme coin prices)
-                            if price_val > 0.0000001:
-                                logger.warning(f"Duplicate detected: {token} at ${price} already tweeted")
-                                return True, tweet["content"]
-                        except ValueError:
-                            pass
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        with self._lock:
+            conn = None
+            try:
+                conn = sqlite3.connect(str(self.db_path))
+                similar, reason = self._dedup.find_similar(conn, content, since, threshold)
+            finally:
+                if conn:
+                    conn.close()
 
-            # Also flag if 3+ non-major tokens in common (topic-level dedup)
-            if len(non_major_common) >= 3:
-                logger.warning(f"Topic duplicate: tokens {non_major_common} already tweeted about")
-                return True, tweet["content"]
-
-        # Fallback to Jaccard similarity for word overlap
-        def normalize(text: str) -> set:
-            text = re.sub(r'https?://\S+', '', text.lower())
-            text = re.sub(r'@\w+', '', text)
-            text = re.sub(r'\$\w+', '', text)
-            text = re.sub(r'[^\w\s]', '', text)
-            return set(text.split())
-
-        new_words = normalize(content)
-        if not new_words:
+        if similar is None:
             return False, None
-
-        for tweet in recent:
-            old_words = normalize(tweet["content"])
-            if not old_words:
-                continue
-
-            intersection = len(new_words & old_words)
-            union = len(new_words | old_words)
-            similarity = intersection / union if union > 0 else 0
-
-            if similarity >= threshold:
-                logger.warning(f"Tweet too similar ({similarity:.1%}) to: {tweet['content'][:50]}...")
-                return True, tweet["content"]
-
-        return False, None
+        logger.warning(f"Duplicate detected: {reason}: {similar[:50]}...")
+        return True, similar
     
     def was_mention_replied(self, tweet_id: str) -> bool:
         """Check if we already replied to a mention."""
@@ -24,6 +24,8 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, field
 
+from bots.twitter.dedup_index import INDEX_RETENTION_DAYS, NearDuplicateIndex, time_bucket
+
 logger = logging.getLogger(__name__)
 
 # Configuration constants
@@ -102,6 +104,8 @@ class XMemory:
         self.db_path = db_path or DEFAULT_DB_PATH
         self._lock = threading.Lock()
         self._memory_store = None  # Lazy loaded
+        self._dedup = NearDuplicateIndex(self._extract_semantic_concepts)
+        self._dedup_maintained_bucket: Optional[int] = None
         self._init_db()
 
     def _get_memory_store(self):
@@ -252,6 +256,14 @@ class XMemory:
                     ON external_replies(author_handle)
                 """)
 
+                # Near-duplicate index (features, LSH buckets, cashtags)
+                NearDuplicateIndex.init_schema(conn)
+                indexed = self._dedup.backfill(
+                    conn, datetime.now(timezone.utc) - timedelta(days=INDEX_RETENTION_DAYS)
+                )
+                if indexed:
+                    logger.info(f"Indexed {indexed} existing tweets for duplicate detection")
+
                 conn.commit()
                 logger.debug(f"XMemory database initialized at {self.db_path}")
             finally:
@@ -277,6 +289,7 @@ class XMemory:
             try:
                 conn = sqlite3.connect(str(self.db_path))
                 cursor = conn.cursor()
+                now = datetime.now(timezone.utc)
                 cursor.execute("""
                     INSERT OR REPLACE INTO tweets
                     (tweet_id, content, category, cashtags, posted_at, reply_to, contract_address)
@@ -286,10 +299,12 @@ class XMemory:
                     content,
                     category,
                     json.dumps(cashtags or []),
-                    datetime.now(timezone.utc).isoformat(),
+                    now.isoformat(),
                     reply_to,
                     contract_address
                 ))
+                self._dedup.add(conn, tweet_id, content, now)
+                self._maintain_dedup_index(conn, now)
                 conn.commit()
                 return True
             except Exception as e:
@@ -361,6 +376,13 @@ class XMemory:
     # Novelty Detection
     # =========================================================================
 
+    def _maintain_dedup_index(self, conn: sqlite3.Connection, now: datetime):
+        """Expire old dedup index buckets, at most once per hour bucket."""
+        bucket = time_bucket(now)
+        if self._dedup_maintained_bucket != bucket:
+            self._dedup.maintain(conn, now)
+            self._dedup_maintained_bucket = bucket
+
     def is_similar_to_recent(
         self,
         content: str,
@@ -370,75 +392,26 @@ class XMemory:
         """
         Check if content is too similar to recent tweets.
 
+        Candidates come from the near-duplicate index (shared cashtags and
+        MinHash/LSH buckets) and are verified with their stored features.
+
         Returns:
             (is_similar, similar_content) - True if duplicate/similar found
         """
-        content_lower = content.lower()
-
-        # Extract entities
-        def extract_entities(text: str) -> dict:
-            text_lower = text.lower()
-            entities = {}
-            # Extract cashtags
-            tokens = re.findall(r'\$([a-z]{2,10})\b', text_lower)
-            entities['tokens'] = set(t.upper() for t in tokens)
-            # Extract prices
-            prices = re.findall(r'\$?([\d,]+\.?\d*)', text)
-            entities['prices'] = set(p.replace(',', '') for p in prices if len(p) > 1)
-            return entities
-
-        new_entities = extract_entities(content)
-        recent = self.get_recent_tweets(hours=hours)
-
-        MAJOR_COINS = {'SOL', 'BTC', 'ETH', 'USDC', 'USDT'}
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        with self._lock:
+            conn = None
+            try:
+                conn = sqlite3.connect(str(self.db_path))
+                similar, reason = self._dedup.find_similar(conn, content, since, threshold)
+            finally:
+                if conn:
+                    conn.close()
 
-        for tweet in recent:
-            old_entities = extract_entities(tweet["content"])
-
-            # Check for same token + same price combo
-            common_tokens = new_entities['tokens'] & old_entities['tokens']
-            common_prices = new_entities['prices'] & old_entities['prices']
-            non_major_common = common_tokens - MAJOR_COINS
-
-            if non_major_common and common_prices:
-                for token in non_major_common:
-                    for price in common_prices:
-                        try:
-                            if float(price) > 0.0000001:
-                                logger.debug(f"Duplicate: {token} at ${price}")
-                                return True, tweet["content"]
-                        except ValueError:
-                            pass
-
-            # Flag if 3+ non-major tokens in common
-            if len(non_major_common) >= 3:
-                return True, tweet["content"]
-
-        # Jaccard similarity fallback
-        def normalize(text: str) -> set:
-            text = re.sub(r'https?://\S+', '', text.lower())
-            text = re.sub(r'@\w+', '', text)
-            text = re.sub(r'\$\w+', '', text)
-            text = re.sub(r'[^\w\s]', '', text)
-            return set(text.split())
-
-        new_words = normalize(content)
-        if not new_words:
+        if similar is None:
             return False, None
-
-        for tweet in recent:
-            old_words = normalize(tweet["content"])
-            if not old_words:
-                continue
-
-            intersection = len(new_words & old_words)
-            union = len(new_words | old_words)
-            similarity = intersection / union if union > 0 else 0
-
-            if similarity >= threshold:
-                return True, tweet["content"]
-
-        return False, None
+        logger.debug(f"Duplicate: {reason}")
+        return True, similar
 
     def calculate_content_freshness(self, content: str, hours: int = 4) -> float:
         """
@@ -447,64 +420,15 @@ class XMemory:
         Returns:
             float: 1.0 = completely unique, <0.3 = too similar
         """
-        recent = self.get_recent_tweets(hours=hours)
-        if not recent:
-            return 1.0
-
-        content_lower = content.lower()
-
-        # Extract features
-        new_cashtags = set(re.findall(r'\$([a-z]{2,10})\b', content_lower))
-        new_concepts = self._extract_semantic_concepts(content)
-        new_subjects = set(new_concepts.get("subjects", []))
-        new_sentiment = new_concepts.get("sentiment", "unknown")
-        new_words = set(re.sub(r'[^\w\s]', '', content_lower).split())
-
-        max_similarity = 0.0
-        MAJOR_COINS = {'sol', 'btc', 'eth', 'usdc', 'usdt'}
-
-        for tweet in recent:
-            old_content = tweet.get("content", "").lower()
-
-            old_cashtags = set(re.findall(r'\$([a-z]{2,10})\b', old_content))
-            old_concepts = self._extract_semantic_concepts(old_content)
-            old_subjects = set(old_concepts.get("subjects", []))
-            old_sentiment = old_concepts.get("sentiment", "unknown")
-            old_words = set(re.sub(r'[^\w\s]', '', old_content).split())
-
-            # Cashtag overlap
-            new_non_major = new_cashtags - MAJOR_COINS
-            old_non_major = old_cashtags - MAJOR_COINS
-            if new_non_major and old_non_major:
-                cashtag_overlap = len(new_non_major & old_non_major) / max(len(new_non_major), 1)
-            else:
-                cashtag_overlap = 0.0
-
-            # Subject overlap
-            if new_subjects and old_subjects:
-                subject_overlap = len(new_subjects & old_subjects) / max(len(new_subjects | old_subjects), 1)
-            else:
-                subject_overlap = 0.0
-
-            # Sentiment match
-            sentiment_match = 1.0 if new_sentiment == old_sentiment != "unknown" else 0.0
-
-            # Word overlap
-            if new_words and old_words:
-                word_overlap = len(new_words & old_words) / max(len(new_words | old_words), 1)
-            else:
-                word_overlap = 0.0
-
-            # Weighted similarity
-            similarity = (
-                cashtag_overlap * 0.35 +
-                subject_overlap * 0.25 +
-                sentiment_match * 0.15 +
-                word_overlap * 0.25
-            )
-            max_similarity = max(max_similarity, similarity)
-
-        return round(1.0 - max_similarity, 2)
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        with self._lock:
+            conn = None
+            try:
+                conn = sqlite3.connect(str(self.db_path))
+                return self._dedup.freshness(conn, content, since)
+            finally:
+                if conn:
+                    conn.close()
 
     def _extract_semantic_concepts(self, content: str) -> Dict[str, Any]:
         """Extract semantic concepts from content."""
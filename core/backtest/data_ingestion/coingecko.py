@@ -10,13 +10,20 @@ class CoinGeckoFetcher:
     """
     Data ingestion wrapper for CoinGecko API.
     Handles rate limiting, caching, and pandas DataFrame conversion.
+
+    With a candle_store (core.backtesting.candle_store.CandleStore) every
+    fetch is appended to the store's memory-mapped history, and requests the
+    store already covers are served from it without touching the API or
+    parsing a cache file.
     """
 
     BASE_URL = "https://api.coingecko.com/api/v3"
+    STORE_COLUMNS = ("price", "volume", "market_cap")
 
-    def __init__(self, cache_dir: str = "data/cache"):
+    def __init__(self, cache_dir: str = "data/cache", candle_store=None):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.candle_store = candle_store
         # Default sleep for rate limit
         self.rate_limit_sleep = 60
         self.max_retries = 3
@@ -25,11 +32,59 @@ class CoinGeckoFetcher:
         """Generate a standardized cache path."""
         return self.cache_dir / f"{coin_id}_{vs_currency}_{days}d.parquet"
 
+    @staticmethod
+    def granularity(days: int) -> str:
+        """Bar interval CoinGecko returns for a market_chart request of this length."""
+        if days <= 1:
+            return "5m"
+        if days <= 90:
+            return "1h"
+        return "1d"
+
+    def _store_symbol(self, coin_id: str, vs_currency: str) -> str:
+        return f"{coin_id}-{vs_currency}"
+
+    def _load_from_store(self, coin_id: str, days: int, vs_currency: str) -> Optional[pd.DataFrame]:
+        """Serve the request from the candle store if it covers the whole range."""
+        timeframe = self.granularity(days)
+        symbol = self._store_symbol(coin_id, vs_currency)
+        bounds = self.candle_store.bounds(symbol, timeframe)
+        if bounds is None:
+            return None
+
+        step_ms = {"5m": 300_000, "1h": 3_600_000, "1d": 86_400_000}[timeframe]
+        now_ms = int(time.time() * 1000)
+        start_ms = now_ms - days * 86_400_000
+        first, last = bounds
+        if first > start_ms + step_ms or last < now_ms - step_ms:
+            return None
+        return self.candle_store.window(symbol, timeframe, start=start_ms).to_dataframe()
+
+    def _append_to_store(self, coin_id: str, days: int, vs_currency: str, df: pd.DataFrame) -> None:
+        columns = {
+            name: df[name].to_numpy(dtype="float64") if name in df else [float("nan")] * len(df)
+            for name in self.STORE_COLUMNS
+        }
+        self.candle_store.append(
+            self._store_symbol(coin_id, vs_currency),
+            self.granularity(days),
+            df["timestamp"].to_numpy(dtype="datetime64[ms]"),
+            columns,
+        )
+
     def fetch_historical_data(self, coin_id: str, days: int, vs_currency: str = "usd", use_cache: bool = True) -> Optional[pd.DataFrame]:
         """
         Fetch historical price, total_volume, and market_cap data.
         Returns a Pandas DataFrame aligned by timestamp.
         """
+        if use_cache and self.candle_store is not None:
+            try:
+                df = self._load_from_store(coin_id, days, vs_currency)
+                if df is not None:
+                    return df
+            except Exception as e:
+                print(f"[CoinGeckoFetcher] Failed to read candle store: {e}")
+
         cache_path = self._get_cache_path(coin_id, vs_currency, days)
 
         # Check Local Cache
@@ -54,6 +109,12 @@ class CoinGeckoFetcher:
                     data = response.json()
                     df = self._parse_market_chart(data)
 
+                    if self.candle_store is not None and df is not None and not df.empty:
+                        try:
+                            self._append_to_store(coin_id, days, vs_currency, df)
+                        except Exception as e:
+                            print(f"[CoinGeckoFetcher] Failed to append to candle store: {e}")
+
                     if use_cache and df is not None and not df.empty:
                         df.to_parquet(cache_path, index=False)
 
@@ -100,3 +100,28 @@ class TestCoinGeckoFetcher:
         assert mock_sleep.call_count == 1
         assert df is not None
         assert len(df) == 2
+
+    @patch("core.backtest.data_ingestion.coingecko.time.time", return_value=1672617600.0)
+    @patch("core.backtest.data_ingestion.coingecko.requests.get")
+    def test_candle_store_serves_repeat_requests(self, mock_get, _mock_time, mock_coingecko_response, tmp_path):
+        """Fetched history is appended to the candle store and served from it."""
+        pytest.importorskip("numpy")
+        from core.backtesting.candle_store import CandleStore
+
+        mock_resp = Mock()
+        mock_resp.status_code = 200
+        mock_resp.json.return_value = mock_coingecko_response
+        mock_get.return_value = mock_resp
+
+        store = CandleStore(tmp_path / "candles")
+        fetcher = CoinGeckoFetcher(cache_dir=str(tmp_path / "cache"), candle_store=store)
+
+        df1 = fetcher.fetch_historical_data("bitcoin", 1, "usd", use_cache=False)
+        assert store.count("bitcoin-usd", "5m") == 2
+
+        df2 = fetcher.fetch_historical_data("bitcoin", 1, "usd", use_cache=True)
+
+        assert mock_get.call_count == 1
+        assert list(df2.columns) == ["timestamp", "price", "volume", "market_cap"]
+        assert df2["price"].tolist() == df1["price"].tolist()
+        assert df2["timestamp"].tolist() == df1["timestamp"].tolist()
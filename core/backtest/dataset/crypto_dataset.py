@@ -32,18 +32,56 @@ class CryptoTimeSeriesDataset(Dataset):
         stds[stds == 0] = 1.0
 
         self.data = (raw_data - means) / stds
+        self._columns = None
+
+    @classmethod
+    def from_store(cls, store, symbol: str, timeframe: str, start=None, end=None,
+                   feature_cols=None, window_size: int = 60, horizon: int = 1):
+        """
+        Build the dataset over a CandleStore window without copying it.
+
+        Features stay as the store's memory-mapped columns; each item is
+        sliced and normalized on access, so the history is never loaded
+        into memory as a whole. The first feature is the prediction target.
+
+        Args:
+            store: core.backtesting.candle_store.CandleStore
+            feature_cols: Columns to use (default: all stored columns)
+        """
+        window = store.window(symbol, timeframe, start, end)
+        dataset = cls.__new__(cls)
+        dataset.window_size = window_size
+        dataset.horizon = horizon
+        dataset.feature_cols = list(feature_cols or window.column_names)
+        dataset._columns = [window[col] for col in dataset.feature_cols]
+
+        dataset._means = np.array([np.mean(col) for col in dataset._columns])
+        stds = np.array([np.std(col) for col in dataset._columns])
+        stds[stds == 0] = 1.0
+        dataset._stds = stds
+        dataset.data = None
+        return dataset
 
     def __len__(self):
         # Total sequences possible
-        return len(self.data) - self.window_size - self.horizon + 1
+        n = len(self.data) if self._columns is None else len(self._columns[0])
+        return n - self.window_size - self.horizon + 1
 
     def __getitem__(self, idx: int):
         """Returns input sequence X and target y"""
+        target_idx = idx + self.window_size + self.horizon - 1
+
+        if self._columns is not None:
+            X = np.column_stack([col[idx : idx + self.window_size] for col in self._columns])
+            X = (X - self._means) / self._stds
+            y = (self._columns[0][target_idx] - self._means[0]) / self._stds[0]
+            return torch.tensor(X, dtype=torch.float32), torch.tensor(y, dtype=torch.float32)
+
         X = self.data[idx : idx + self.window_size]
 
         # y could be price change prediction.
         # Price is at index 0 of features. We predict the price at `horizon`
-        y = self.data[idx + self.window_size + self.horizon - 1, 0]
+        y = self.data[target_idx, 0]
 
         # Convert to torch tensor
         return torch.tensor(X, dtype=torch.float32), torch.tensor(y, dtype=torch.float32)
@@ -264,6 +264,32 @@ class BacktestEngine:
         ]
         self.load_data(symbol, candles)
 
+    def load_data_from_store(
+        self,
+        store,
+        symbol: str,
+        timeframe: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ):
+        """Load a window from a CandleStore (core.backtesting.candle_store)."""
+        window = store.window(symbol, timeframe, start, end)
+        volume = window.columns.get('volume')
+        candles = [
+            OHLCV(timestamp=ts, open=o, high=h, low=l, close=c, volume=v)
+            for ts, o, h, l, c, v in zip(
+                window.iso_timestamps(),
+                window['open'].tolist(),
+                window['high'].tolist(),
+                window['low'].tolist(),
+                window['close'].tolist(),
+                volume.tolist() if volume is not None else [0.0] * len(window),
+            )
+        ]
+        # Already sorted by the store
+        self._data[symbol.upper()] = candles
+        logger.info(f"Loaded {len(candles)} candles for {symbol} from candle store")
+
     def run(
         self,
         strategy: Callable,
@@ -6,6 +6,8 @@ Provides:
 - WalkForwardAnalyzer: Walk-forward analysis for overfitting detection
 - MonteCarloSimulator: Monte Carlo simulation for risk analysis
 - ParameterOptimizer: Grid search parameter optimization
+- ColumnarOHLCV / IndicatorCache: NumPy columns and precomputed indicators
+- CandleStore: Persistent memory-mapped candle history per symbol/timeframe
 """
 
 from core.backtesting.backtest_engine import (
@@ -14,6 +16,8 @@ from core.backtesting.backtest_engine import (
     BacktestMetrics,
     BacktestResult,
 )
+from core.backtesting.columnar import ColumnarOHLCV, IndicatorCache
+from core.backtesting.candle_store import CandleStore, CandleWindow
 from core.backtesting.walk_forward import WalkForwardAnalyzer
 from core.backtesting.monte_carlo import MonteCarloSimulator
 from core.backtesting.parameter_optimizer import ParameterOptimizer
@@ -23,6 +27,10 @@ __all__ = [
     'BacktestConfig',
     'BacktestMetrics',
     'BacktestResult',
+    'ColumnarOHLCV',
+    'IndicatorCache',
+    'CandleStore',
+    'CandleWindow',
     'WalkForwardAnalyzer',
     'MonteCarloSimulator',
     'ParameterOptimizer',
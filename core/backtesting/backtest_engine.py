@@ -6,17 +6,26 @@ Enhanced backtesting engine with:
 - JSON/Text report generation
 - Live vs backtest comparison
 - OHLCV data management
+- Optional columnar mode with precomputed indicator series (see columnar.py)
 """
 
 import json
 import logging
 import math
+import random
 import uuid
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Callable, Sequence, Tuple, Union
+
+from core.backtesting.columnar import (
+    HAS_NUMPY,
+    ColumnarOHLCV,
+    IndicatorCache,
+    date_range_bounds,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +54,53 @@ class OHLCV:
     volume: float = 0.0
 
 
+class _ColumnCandles(Sequence):
+    """
+    Read-only OHLCV sequence backed by a ColumnarOHLCV.
+
+    Candles are built when accessed, so loading columns (e.g. memory maps
+    from a CandleStore) costs nothing per row. Slices are views.
+    """
+
+    # Rows converted per batch when iterating
+    _BLOCK_ROWS = 4096
+
+    def __init__(self, columns: ColumnarOHLCV):
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __getitem__(self, idx: Union[int, slice]):
+        cols = self.columns
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(cols))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return _ColumnCandles(cols.slice(start, max(start, stop)))
+        return OHLCV(
+            timestamp=cols.timestamps[idx],
+            open=float(cols.open[idx]),
+            high=float(cols.high[idx]),
+            low=float(cols.low[idx]),
+            close=float(cols.close[idx]),
+            volume=float(cols.volume[idx]),
+        )
+
+    def __iter__(self) -> Iterator[OHLCV]:
+        for start in range(0, len(self), self._BLOCK_ROWS):
+            block = self.columns.slice(start, start + self._BLOCK_ROWS)
+            for ts, o, h, l, c, v in zip(
+                block.timestamps,
+                block.open.tolist(),
+                block.high.tolist(),
+                block.low.tolist(),
+                block.close.tolist(),
+                block.volume.tolist(),
+            ):
+                yield OHLCV(timestamp=ts, open=o, high=h, low=l, close=c, volume=v)
+
+
 @dataclass
 class BacktestTrade:
     """A trade executed during backtest."""
@@ -234,14 +290,26 @@ class AdvancedBacktestEngine:
     - Position management
     - Report generation (JSON, text)
     - Live vs backtest comparison
+    - Columnar mode: NumPy-backed candles with O(1) indicator lookups
+
+    Args:
+        results_dir: Where save_result writes reports
+        columnar: Keep candles as NumPy columns and serve indicators from
+            series precomputed once per run. Per-bar indicator cost no
+            longer depends on the period. Requires numpy.
     """
 
-    def __init__(self, results_dir: Optional[Path] = None):
+    def __init__(self, results_dir: Optional[Path] = None, columnar: bool = False):
+        if columnar and not HAS_NUMPY:
+            logger.warning("numpy not installed; columnar backtest mode disabled")
+            columnar = False
+        self.columnar = columnar
         self.results_dir = results_dir or Path(__file__).parent.parent.parent / "data" / "backtests"
         self.results_dir.mkdir(parents=True, exist_ok=True)
 
         # Data storage
-        self._data: Dict[str, List[OHLCV]] = {}
+        self._data: Dict[str, Sequence[OHLCV]] = {}
+        self._columns: Dict[str, ColumnarOHLCV] = {}
 
         # State during backtest
         self._config: Optional[BacktestConfig] = None
@@ -251,7 +319,13 @@ class AdvancedBacktestEngine:
         self._equity_curve: List[Dict] = []
         self._current_idx: int = 0
         self._current_candle: Optional[OHLCV] = None
-        self._all_candles: List[OHLCV] = []
+        self._all_candles: Sequence[OHLCV] = []
+        self._indicators: Optional[IndicatorCache] = None
+        # Indicator series of the last run's window, shared with spawn()ed engines
+        self._indicator_cache: Dict[Tuple[str, int, int], IndicatorCache] = {}
+
+        # Random source for strategies; run() replaces it per backtest
+        self.rng: random.Random = random.Random()
 
     def load_data(self, symbol: str, data: List[Dict]) -> None:
         """Load historical OHLCV data."""
@@ -266,14 +340,62 @@ class AdvancedBacktestEngine:
             )
             for d in data
         ]
-        self._data[symbol.upper()] = sorted(candles, key=lambda c: c.timestamp)
+        candles = sorted(candles, key=lambda c: c.timestamp)
+        self._data[symbol.upper()] = candles
+        if self.columnar:
+            self._columns[symbol.upper()] = ColumnarOHLCV.from_candles(candles)
+        self._indicator_cache = {}
         logger.info(f"Loaded {len(candles)} candles for {symbol}")
 
+    def load_columns(self, symbol: str, columns: ColumnarOHLCV) -> None:
+        """
+        Load candles that are already in columnar form (sorted by timestamp).
+
+        Skips dict parsing entirely; the arrays are used as-is (memory maps
+        included) and OHLCV objects are only built for rows a run visits.
+        """
+        candles = _ColumnCandles(columns)
+        self._data[symbol.upper()] = candles
+        if self.columnar:
+            self._columns[symbol.upper()] = columns
+        self._indicator_cache = {}
+        logger.info(f"Loaded {len(candles)} candles for {symbol}")
+
+    def load_from_store(
+        self,
+        store,
+        symbol: str,
+        timeframe: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> None:
+        """
+        Load a window from a CandleStore.
+
+        The engine works directly on the store's memory maps; only the
+        requested range is touched and nothing is copied up front.
+        """
+        self.load_columns(symbol, store.load_columns(symbol, timeframe, start, end))
+
+    def spawn(self) -> "AdvancedBacktestEngine":
+        """
+        A fresh engine over this engine's loaded candles.
+
+        No run state carries over; only the read-only candles and the
+        indicator series (which depend on nothing else) are shared, so a
+        sweep can give every run a clean engine without reparsing.
+        """
+        engine = AdvancedBacktestEngine(results_dir=self.results_dir, columnar=self.columnar)
+        engine._data = dict(self._data)
+        engine._columns = dict(self._columns)
+        engine._indicator_cache = self._indicator_cache
+        return engine
+
     def has_data(self, symbol: str) -> bool:
         """Check if data is loaded for symbol."""
         return symbol.upper() in self._data
 
-    def get_data(self, symbol: str) -> List[OHLCV]:
+    def get_data(self, symbol: str) -> Sequence[OHLCV]:
         """Get loaded data for symbol."""
         return self._data.get(symbol.upper(), [])
 
@@ -282,9 +404,16 @@ class AdvancedBacktestEngine:
         strategy: Callable,
         config: BacktestConfig,
         strategy_name: str = "unnamed",
-        parameters: Dict[str, Any] = None
+        parameters: Dict[str, Any] = None,
+        rng: Optional[random.Random] = None
     ) -> BacktestResult:
-        """Run a backtest."""
+        """
+        Run a backtest.
+
+        Strategies that need randomness should draw from engine.rng, which
+        is `rng` when given (e.g. seeded per walk-forward task) or a fresh
+        unseeded generator.
+        """
         start_time = datetime.now(timezone.utc)
         backtest_id = str(uuid.uuid4())[:8]
 
@@ -293,6 +422,7 @@ class AdvancedBacktestEngine:
             raise ValueError(f"No data loaded for {config.symbol}")
 
         # Initialize state
+        self.rng = rng if rng is not None else random.Random()
         self._config = config
         self._capital = config.initial_capital
         self._position = BacktestPosition(
@@ -306,15 +436,36 @@ class AdvancedBacktestEngine:
 
         # Get and filter data
         candles = self._data.get(config.symbol.upper(), [])
-        filtered_candles = [
-            c for c in candles
-            if config.start_date <= c.timestamp[:10] <= config.end_date
-        ]
+        if self.columnar:
+            bounds = date_range_bounds(
+                self._columns[config.symbol.upper()].timestamps,
+                config.start_date,
+                config.end_date,
+            )
+            filtered_candles = candles[bounds[0]:bounds[1]] if bounds else []
+        else:
+            filtered_candles = [
+                c for c in candles
+                if config.start_date <= c.timestamp[:10] <= config.end_date
+            ]
 
         if not filtered_candles:
             raise ValueError("No data in specified date range")
 
         self._all_candles = filtered_candles
+        if self.columnar:
+            # Indicator series depend only on the candles, so repeated runs
+            # over the same window (e.g. an optimizer sweep) share them
+            key = (config.symbol.upper(), bounds[0], bounds[1])
+            self._indicators = self._indicator_cache.get(key)
+            if self._indicators is None:
+                self._indicators = IndicatorCache(
+                    self._columns[config.symbol.upper()].slice(*bounds)
+                )
+                self._indicator_cache.clear()
+                self._indicator_cache[key] = self._indicators
+        else:
+            self._indicators = None
         logger.info(f"Running backtest {backtest_id}: {strategy_name} on {config.symbol}")
 
         # Main loop
@@ -517,6 +668,8 @@ class AdvancedBacktestEngine:
         """Get closing price."""
         idx = self._current_idx - lookback
         if 0 <= idx < len(self._all_candles):
+            if self._indicators is not None:
+                return float(self._indicators.columns.close[idx])
             return self._all_candles[idx].close
         return 0
 
@@ -524,6 +677,8 @@ class AdvancedBacktestEngine:
         """Get high price."""
         idx = self._current_idx - lookback
         if 0 <= idx < len(self._all_candles):
+            if self._indicators is not None:
+                return float(self._indicators.columns.high[idx])
             return self._all_candles[idx].high
         return 0
 
@@ -531,6 +686,8 @@ class AdvancedBacktestEngine:
         """Get low price."""
         idx = self._current_idx - lookback
         if 0 <= idx < len(self._all_candles):
+            if self._indicators is not None:
+                return float(self._indicators.columns.low[idx])
             return self._all_candles[idx].low
         return 0
 
@@ -538,11 +695,15 @@ class AdvancedBacktestEngine:
         """Get volume."""
         idx = self._current_idx - lookback
         if 0 <= idx < len(self._all_candles):
+            if self._indicators is not None:
+                return float(self._indicators.columns.volume[idx])
             return self._all_candles[idx].volume
         return 0
 
     def sma(self, period: int = 20) -> float:
         """Simple Moving Average."""
+        if self._indicators is not None:
+            return self._indicators.sma(self._current_idx, period)
         if self._current_idx < period - 1:
             return self.close()
         closes = [self.close(i) for i in range(period)]
@@ -550,6 +711,8 @@ class AdvancedBacktestEngine:
 
     def ema(self, period: int = 20) -> float:
         """Exponential Moving Average."""
+        if self._indicators is not None:
+            return self._indicators.ema(self._current_idx, period)
         closes = [self.close(i) for i in range(min(period * 2, self._current_idx + 1))][::-1]
         if len(closes) < period:
             return sum(closes) / len(closes) if closes else 0
@@ -564,6 +727,8 @@ class AdvancedBacktestEngine:
 
     def rsi(self, period: int = 14) -> float:
         """Relative Strength Index."""
+        if self._indicators is not None:
+            return self._indicators.rsi(self._current_idx, period)
         if self._current_idx < period:
             return 50
 
@@ -602,6 +767,8 @@ class AdvancedBacktestEngine:
 
     def bollinger_bands(self, period: int = 20, std_dev: float = 2) -> Dict[str, float]:
         """Bollinger Bands."""
+        if self._indicators is not None:
+            return self._indicators.bollinger_bands(self._current_idx, period, std_dev)
         closes = [self.close(i) for i in range(min(period, self._current_idx + 1))]
         if not closes:
             return {'upper': 0, 'middle': 0, 'lower': 0}
@@ -621,6 +788,8 @@ class AdvancedBacktestEngine:
 
     def atr(self, period: int = 14) -> float:
         """Average True Range."""
+        if self._indicators is not None:
+            return self._indicators.atr(self._current_idx, period)
         if self._current_idx < period:
             return 0
 
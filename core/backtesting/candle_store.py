@@ -0,0 +1,427 @@
+"""
+Persistent on-disk candle store.
+
+Keeps candle history per (symbol, timeframe) as append-only columnar files
+so repeated backtests, walk-forward runs and dataset builders stop
+re-reading and re-parsing the same JSON history:
+
+    <root>/<SYMBOL>/<timeframe>/
+        timestamp.i8    int64 epoch milliseconds, strictly increasing
+        <column>.f8     one float64 file per column (open, high, ...)
+        meta.json       column names and committed row count
+
+Reads memory-map the files read-only, so a window is a zero-copy view
+and every process reading the same series shares one copy through the
+page cache. The sorted timestamp column is the index: a range lookup is
+two binary searches (O(log n)) regardless of history length.
+
+Appends only ever add rows newer than the last stored timestamp, so
+re-ingesting an overlapping download is idempotent. meta.json is written
+last; bytes past the committed row count (a crash mid-append) are
+discarded on the next open.
+"""
+
+import json
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from core.backtesting.columnar import ColumnarOHLCV, EpochTimestamps, _PRICE_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+TimeLike = Union[int, float, str, datetime, date]
+
+_TIMESTAMP_FILE = "timestamp.i8"
+_META_FILE = "meta.json"
+_DATE_ONLY = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_SAFE_NAME = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+@dataclass
+class CandleWindow:
+    """
+    A contiguous range of one stored series.
+
+    Arrays are read-only views into the memory-mapped column files.
+    """
+    symbol: str
+    timeframe: str
+    timestamps: "np.ndarray"  # int64 epoch ms
+    columns: Dict[str, "np.ndarray"]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, name: str) -> "np.ndarray":
+        return self.columns[name]
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.columns)
+
+    def iso_timestamps(self) -> List[str]:
+        """Timestamps as naive UTC ISO strings, as used by the backtest engines."""
+        return _format_iso(self.timestamps)
+
+    def to_columnar(self) -> ColumnarOHLCV:
+        """
+        View the window as ColumnarOHLCV (requires OHLC columns; volume defaults to 0).
+
+        Nothing is copied: prices stay memory maps and timestamps are
+        formatted only when read.
+        """
+        missing = [c for c in _PRICE_COLUMNS[:4] if c not in self.columns]
+        if missing:
+            raise ValueError(f"{self.symbol}/{self.timeframe} has no {', '.join(missing)} column")
+        volume = self.columns.get('volume')
+        return ColumnarOHLCV(
+            timestamps=EpochTimestamps(self.timestamps),
+            open=self.columns['open'],
+            high=self.columns['high'],
+            low=self.columns['low'],
+            close=self.columns['close'],
+            volume=volume if volume is not None else np.zeros(len(self), dtype=np.float64),
+        )
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Materialize the window as OHLCV dicts (copies)."""
+        names = self.column_names
+        values = [self.columns[n].tolist() for n in names]
+        return [
+            {'timestamp': ts, **dict(zip(names, row))}
+            for ts, row in zip(self.iso_timestamps(), zip(*values))
+        ]
+
+    def to_dataframe(self):
+        """Materialize the window as a pandas DataFrame with a datetime 'timestamp' column."""
+        import pandas as pd
+
+        frame = {'timestamp': pd.to_datetime(np.asarray(self.timestamps), unit='ms')}
+        frame.update({name: np.asarray(col) for name, col in self.columns.items()})
+        return pd.DataFrame(frame)
+
+
+class _Series:
+    """Open handle on one <symbol>/<timeframe> directory."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.columns: List[str] = []
+        self.rows = 0
+        self._maps: Optional[Dict[str, "np.ndarray"]] = None
+        self._load()
+
+    @property
+    def _meta_path(self) -> Path:
+        return self.directory / _META_FILE
+
+    def _path(self, column: str) -> Path:
+        if column == 'timestamp':
+            return self.directory / _TIMESTAMP_FILE
+        return self.directory / f"{column}.f8"
+
+    def _load(self) -> None:
+        if not self._meta_path.exists():
+            return
+        try:
+            meta = json.loads(self._meta_path.read_text())
+            self.columns = list(meta["columns"])
+            self.rows = int(meta["rows"])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Candle store meta unreadable at {self.directory}, starting empty: {e}")
+            self.columns, self.rows = [], 0
+            return
+
+        # A crash mid-append leaves uncommitted bytes past the row count
+        stored = min(
+            (self._path(c).stat().st_size // 8 if self._path(c).exists() else 0)
+            for c in ['timestamp', *self.columns]
+        )
+        if stored < self.rows:
+            logger.warning(f"Candle store {self.directory} shorter than its meta, truncating to {stored} rows")
+            self.rows = stored
+            self._write_meta()
+
+    def _write_meta(self) -> None:
+        tmp = self._meta_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"columns": self.columns, "rows": self.rows}))
+        tmp.replace(self._meta_path)
+
+    def maps(self) -> Dict[str, "np.ndarray"]:
+        """Read-only memory maps of the committed rows (cached until the next append)."""
+        if self._maps is None:
+            self._maps = {}
+            for name in ['timestamp', *self.columns]:
+                dtype = np.int64 if name == 'timestamp' else np.float64
+                if self.rows:
+                    self._maps[name] = np.memmap(self._path(name), dtype=dtype, mode='r', shape=(self.rows,))
+                else:
+                    self._maps[name] = np.empty(0, dtype=dtype)
+        return self._maps
+
+    def last_timestamp(self) -> Optional[int]:
+        return int(self.maps()['timestamp'][-1]) if self.rows else None
+
+    def append(self, timestamps: "np.ndarray", columns: Dict[str, "np.ndarray"]) -> int:
+        if not self.columns:
+            self.columns = list(columns)
+        elif set(columns) != set(self.columns):
+            raise ValueError(
+                f"Column mismatch for {self.directory}: stored {self.columns}, got {sorted(columns)}"
+            )
+
+        # Sort, drop duplicate timestamps (last write wins) and anything not newer than the tail
+        order = np.argsort(timestamps, kind='stable')
+        timestamps = timestamps[order]
+        keep = np.ones(len(timestamps), dtype=bool)
+        keep[:-1] = timestamps[1:] != timestamps[:-1]
+        last = self.last_timestamp()
+        if last is not None:
+            keep &= timestamps > last
+        if not keep.any():
+            return 0
+        rows = order[keep]
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._maps = None
+        for name in ['timestamp', *self.columns]:
+            values = timestamps[keep] if name == 'timestamp' else columns[name][rows]
+            with open(self._path(name), "ab") as f:
+                f.truncate(self.rows * 8)  # Drop bytes from an interrupted append
+                f.write(np.ascontiguousarray(values).tobytes())
+
+        self.rows += len(rows)
+        self._write_meta()
+        return len(rows)
+
+
+class CandleStore:
+    """
+    Append-only, memory-mapped candle history keyed by symbol and timeframe.
+
+    Args:
+        root: Directory holding one subdirectory per symbol.
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        if not HAS_NUMPY:
+            raise ImportError("CandleStore requires numpy")
+        self.root = Path(root) if root else Path(__file__).parent.parent.parent / "data" / "candles"
+        self._lock = threading.RLock()
+        self._series: Dict[Tuple[str, str], _Series] = {}
+
+    def _get(self, symbol: str, timeframe: str) -> _Series:
+        key = (symbol.upper(), timeframe)
+        series = self._series.get(key)
+        if series is None:
+            directory = self.root / _SAFE_NAME.sub("_", key[0]) / _SAFE_NAME.sub("_", timeframe)
+            series = _Series(directory)
+            self._series[key] = series
+        return series
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(
+        self,
+        symbol: str,
+        timeframe: str,
+        timestamps: Sequence[TimeLike],
+        columns: Dict[str, Sequence[float]],
+    ) -> int:
+        """
+        Append rows to a series.
+
+        Rows at or before the last stored timestamp are skipped, so
+        overlapping downloads can be appended as-is. The first append fixes
+        the series' column set.
+
+        Args:
+            timestamps: Epoch milliseconds, ISO strings or datetimes
+            columns: Column name to values, each the same length as timestamps
+
+        Returns:
+            Number of rows written
+        """
+        ts = _to_epoch_ms_array(timestamps)
+        arrays = {name: np.asarray(values, dtype=np.float64) for name, values in columns.items()}
+        for name, values in arrays.items():
+            if name == 'timestamp':
+                raise ValueError("'timestamp' is reserved")
+            if len(values) != len(ts):
+                raise ValueError(f"Column {name} has {len(values)} rows, expected {len(ts)}")
+        if not len(ts):
+            return 0
+
+        with self._lock:
+            written = self._get(symbol, timeframe).append(ts, arrays)
+        if written:
+            logger.debug(f"Appended {written} candles to {symbol.upper()}/{timeframe}")
+        return written
+
+    def append_records(
+        self,
+        symbol: str,
+        timeframe: str,
+        records: Sequence[Dict[str, Any]],
+        columns: Sequence[str] = _PRICE_COLUMNS,
+    ) -> int:
+        """Append OHLCV dicts (the format taken by the engines' load_data)."""
+        return self.append(
+            symbol,
+            timeframe,
+            [r['timestamp'] for r in records],
+            {name: [r.get(name, 0.0) for r in records] for name in columns},
+        )
+
+    def append_columnar(self, symbol: str, timeframe: str, data: ColumnarOHLCV) -> int:
+        """Append a ColumnarOHLCV block."""
+        return self.append(
+            symbol,
+            timeframe,
+            data.timestamps,
+            {name: getattr(data, name) for name in _PRICE_COLUMNS},
+        )
+
+    def delete(self, symbol: str, timeframe: str) -> bool:
+        """Remove a series from disk."""
+        with self._lock:
+            series = self._get(symbol, timeframe)
+            self._series.pop((symbol.upper(), timeframe), None)
+            if not series.directory.exists():
+                return False
+            for path in series.directory.iterdir():
+                path.unlink()
+            series.directory.rmdir()
+            return True
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def has(self, symbol: str, timeframe: str) -> bool:
+        return self._get(symbol, timeframe).rows > 0
+
+    def count(self, symbol: str, timeframe: str) -> int:
+        return self._get(symbol, timeframe).rows
+
+    def bounds(self, symbol: str, timeframe: str) -> Optional[Tuple[int, int]]:
+        """First and last stored timestamps (epoch ms), or None if empty."""
+        series = self._get(symbol, timeframe)
+        if not series.rows:
+            return None
+        ts = series.maps()['timestamp']
+        return int(ts[0]), int(ts[-1])
+
+    def series(self) -> List[Tuple[str, str]]:
+        """List stored (symbol, timeframe) pairs."""
+        if not self.root.exists():
+            return []
+        return sorted(
+            (meta.parent.parent.name, meta.parent.name)
+            for meta in self.root.glob(f"*/*/{_META_FILE}")
+        )
+
+    def window(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[TimeLike] = None,
+        end: Optional[TimeLike] = None,
+    ) -> CandleWindow:
+        """
+        Zero-copy view of rows with start <= timestamp <= end.
+
+        A date-only end ('2024-03-31') covers that whole day. Either bound
+        may be omitted.
+        """
+        with self._lock:
+            series = self._get(symbol, timeframe)
+            maps = series.maps()
+        lo, hi = self._range(maps['timestamp'], start, end)
+        return CandleWindow(
+            symbol=symbol.upper(),
+            timeframe=timeframe,
+            timestamps=maps['timestamp'][lo:hi],
+            columns={name: maps[name][lo:hi] for name in series.columns},
+        )
+
+    def load_columns(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[TimeLike] = None,
+        end: Optional[TimeLike] = None,
+    ) -> ColumnarOHLCV:
+        """Window as ColumnarOHLCV, ready for AdvancedBacktestEngine.load_columns."""
+        return self.window(symbol, timeframe, start, end).to_columnar()
+
+    @staticmethod
+    def _range(ts: "np.ndarray", start: Optional[TimeLike], end: Optional[TimeLike]) -> Tuple[int, int]:
+        lo = int(np.searchsorted(ts, _to_epoch_ms(start), side='left')) if start is not None else 0
+        hi = int(np.searchsorted(ts, _to_epoch_ms(end, end=True), side='right')) if end is not None else len(ts)
+        return lo, max(lo, hi)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Row counts per stored series."""
+        return {
+            f"{symbol}/{timeframe}": self.count(symbol, timeframe)
+            for symbol, timeframe in self.series()
+        }
+
+
+def _to_epoch_ms(value: TimeLike, end: bool = False) -> int:
+    """
+    Convert a timestamp to epoch milliseconds (naive values are UTC).
+
+    With end=True a date-only value maps to the last millisecond of that day.
+    """
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return int(round(value))
+    if isinstance(value, np.datetime64):
+        return int(value.astype('datetime64[ms]').astype(np.int64))
+    if isinstance(value, str):
+        text = value.strip()
+        if _DATE_ONLY.match(text):
+            day = datetime.fromisoformat(text).replace(tzinfo=timezone.utc)
+            if end:
+                day += timedelta(days=1, milliseconds=-1)
+            return int(day.timestamp() * 1000)
+        value = datetime.fromisoformat(text.replace('Z', '+00:00'))
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        delta = value - datetime(1970, 1, 1, tzinfo=timezone.utc)
+        return delta // timedelta(milliseconds=1)
+    if isinstance(value, date):
+        return _to_epoch_ms(value.isoformat(), end=end)
+    raise TypeError(f"Unsupported timestamp type: {type(value).__name__}")
+
+
+def _to_epoch_ms_array(values: Sequence[TimeLike]) -> "np.ndarray":
+    if isinstance(values, np.ndarray):
+        if np.issubdtype(values.dtype, np.datetime64):
+            return values.astype('datetime64[ms]').astype(np.int64)
+        if np.issubdtype(values.dtype, np.number):
+            return values.astype(np.int64)
+    return np.fromiter((_to_epoch_ms(v) for v in values), dtype=np.int64, count=len(values))
+
+
+def _format_iso(timestamps: "np.ndarray") -> List[str]:
+    """Epoch ms to 'YYYY-MM-DDTHH:MM:SS' (milliseconds kept only when present)."""
+    return EpochTimestamps(np.asarray(timestamps, dtype=np.int64)).tolist()
@@ -0,0 +1,389 @@
+"""
+Columnar OHLCV storage and precomputed indicator series.
+
+Used by AdvancedBacktestEngine in columnar mode:
+- Candles are held as contiguous NumPy arrays instead of OHLCV objects
+- Each indicator series is computed once per run with vectorized kernels
+- Strategy-facing indicator calls become O(1) lookups by bar index
+- Columns can be written as .npy files and memory-mapped back read-only,
+  so worker processes share one parsed copy through the page cache
+
+Every series reproduces the bar-by-bar semantics of the row-mode
+accessors in backtest_engine.py (warm-up values included), so a strategy
+produces the same trades in either mode.
+"""
+
+import logging
+from pathlib import Path
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+# Rows per block when a kernel needs an explicit (rows x period) window view
+_WINDOW_BLOCK_ROWS = 65536
+
+_PRICE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# Rows formatted per batch when iterating EpochTimestamps
+_FORMAT_BLOCK_ROWS = 4096
+
+
+class EpochTimestamps(Sequence):
+    """
+    Read-only ISO timestamp sequence over an int64 epoch-ms array.
+
+    Strings are formatted on access ('YYYY-MM-DDTHH:MM:SS', milliseconds
+    kept only when any row has them), so a memory-mapped column can back
+    ColumnarOHLCV without building one string per row up front. Slices
+    are views sharing the parent's format.
+    """
+
+    def __init__(self, epoch_ms: "np.ndarray", unit: Optional[str] = None):
+        self.epoch_ms = epoch_ms
+        self._unit = unit or ('s' if not (epoch_ms % 1000).any() else 'ms')
+
+    def __len__(self) -> int:
+        return len(self.epoch_ms)
+
+    def __getitem__(self, idx: Union[int, slice]):
+        if isinstance(idx, slice):
+            return EpochTimestamps(self.epoch_ms[idx], self._unit)
+        return str(self._format(self.epoch_ms[idx]))
+
+    def __iter__(self) -> Iterator[str]:
+        for start in range(0, len(self.epoch_ms), _FORMAT_BLOCK_ROWS):
+            yield from self._format(self.epoch_ms[start:start + _FORMAT_BLOCK_ROWS]).tolist()
+
+    def _format(self, values: "np.ndarray") -> "np.ndarray":
+        return np.datetime_as_string(values.astype('datetime64[ms]'), unit=self._unit)
+
+    def tolist(self) -> List[str]:
+        return list(self)
+
+
+@dataclass
+class ColumnarOHLCV:
+    """OHLCV candles stored column-wise as float64 arrays."""
+    timestamps: Sequence[str]  # List[str] or EpochTimestamps
+    open: "np.ndarray"
+    high: "np.ndarray"
+    low: "np.ndarray"
+    close: "np.ndarray"
+    volume: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def from_candles(cls, candles: Sequence) -> "ColumnarOHLCV":
+        """Build columns from a sequence of OHLCV objects (already sorted)."""
+        n = len(candles)
+        return cls(
+            timestamps=[c.timestamp for c in candles],
+            open=np.fromiter((c.open for c in candles), dtype=np.float64, count=n),
+            high=np.fromiter((c.high for c in candles), dtype=np.float64, count=n),
+            low=np.fromiter((c.low for c in candles), dtype=np.float64, count=n),
+            close=np.fromiter((c.close for c in candles), dtype=np.float64, count=n),
+            volume=np.fromiter((c.volume for c in candles), dtype=np.float64, count=n),
+        )
+
+    @classmethod
+    def from_records(cls, data: Sequence[Dict]) -> "ColumnarOHLCV":
+        """Build columns from OHLCV dicts, sorting by timestamp."""
+        rows = sorted(data, key=lambda d: d['timestamp'])
+        n = len(rows)
+        return cls(
+            timestamps=[d['timestamp'] for d in rows],
+            open=np.fromiter((d['open'] for d in rows), dtype=np.float64, count=n),
+            high=np.fromiter((d['high'] for d in rows), dtype=np.float64, count=n),
+            low=np.fromiter((d['low'] for d in rows), dtype=np.float64, count=n),
+            close=np.fromiter((d['close'] for d in rows), dtype=np.float64, count=n),
+            volume=np.fromiter((d.get('volume', 0) for d in rows), dtype=np.float64, count=n),
+        )
+
+    def slice(self, start: int, stop: int) -> "ColumnarOHLCV":
+        """Return a view over rows [start, stop) without copying the arrays."""
+        return ColumnarOHLCV(
+            timestamps=self.timestamps[start:stop],
+            open=self.open[start:stop],
+            high=self.high[start:stop],
+            low=self.low[start:stop],
+            close=self.close[start:stop],
+            volume=self.volume[start:stop],
+        )
+
+    def save(self, directory: Path) -> Path:
+        """Write each column to <directory>/<name>.npy."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / "timestamp.npy", np.array(list(self.timestamps), dtype=np.bytes_))
+        for name in _PRICE_COLUMNS:
+            np.save(directory / f"{name}.npy", np.ascontiguousarray(getattr(self, name)))
+        return directory
+
+    @classmethod
+    def load(cls, directory: Path, mmap: bool = True) -> "ColumnarOHLCV":
+        """
+        Read columns written by save().
+
+        With mmap=True the price columns are read-only memory maps, so
+        every process loading the same directory shares the same pages.
+        """
+        directory = Path(directory)
+        mode = 'r' if mmap else None
+        raw_ts = np.load(directory / "timestamp.npy", mmap_mode=mode)
+        columns = {
+            name: np.load(directory / f"{name}.npy", mmap_mode=mode)
+            for name in _PRICE_COLUMNS
+        }
+        return cls(timestamps=raw_ts.astype(str).tolist(), **columns)
+
+
+def _rolling_sum(values: "np.ndarray", period: int) -> "np.ndarray":
+    """Sum of each trailing window; element i covers values[i-period+1..i]."""
+    csum = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1:] = csum[period:] - csum[:-period]
+    return out
+
+
+def _rolling_std(values: "np.ndarray", period: int) -> "np.ndarray":
+    """
+    Population std of each full trailing window.
+
+    Computed in blocks over strided window views (two-pass per window)
+    rather than from running sums of squares, which lose precision on
+    long, drifting price series.
+    """
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n < period:
+        return out
+    windows = np.lib.stride_tricks.sliding_window_view(values, period)
+    for start in range(0, len(windows), _WINDOW_BLOCK_ROWS):
+        block = windows[start:start + _WINDOW_BLOCK_ROWS]
+        out[period - 1 + start:period - 1 + start + len(block)] = block.std(axis=1)
+    return out
+
+
+class IndicatorCache:
+    """
+    Lazily computed, memoized indicator series over one ColumnarOHLCV.
+
+    The first request for an indicator/parameter pair computes the full
+    series in one vectorized pass; every later request is an array lookup.
+    """
+
+    def __init__(self, columns: ColumnarOHLCV):
+        self.columns = columns
+        self._series: Dict[Tuple, "np.ndarray"] = {}
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def cached_keys(self) -> List[Tuple]:
+        """List indicator keys that have been computed."""
+        return list(self._series.keys())
+
+    def precompute(self, specs: Dict[str, Sequence[int]]) -> None:
+        """
+        Compute indicator series ahead of the run.
+
+        Args:
+            specs: Indicator name to periods, e.g. {'sma': [20, 50], 'rsi': [14]}
+        """
+        for name, periods in specs.items():
+            builder = getattr(self, f"_build_{name}", None)
+            if builder is None:
+                raise ValueError(f"Unknown indicator: {name}")
+            for period in periods:
+                self._get((name, int(period)), builder, int(period))
+
+    def _get(self, key: Tuple, builder, *args) -> "np.ndarray":
+        series = self._series.get(key)
+        if series is None:
+            series = builder(*args)
+            self._series[key] = series
+        return series
+
+    # Lookups (O(1) after the first call per key)
+
+    def sma(self, idx: int, period: int) -> float:
+        return float(self._get(('sma', period), self._build_sma, period)[idx])
+
+    def ema(self, idx: int, period: int) -> float:
+        return float(self._get(('ema', period), self._build_ema, period)[idx])
+
+    def rsi(self, idx: int, period: int) -> float:
+        return float(self._get(('rsi', period), self._build_rsi, period)[idx])
+
+    def atr(self, idx: int, period: int) -> float:
+        return float(self._get(('atr', period), self._build_atr, period)[idx])
+
+    def bollinger_bands(self, idx: int, period: int, std_dev: float) -> Dict[str, float]:
+        middle = float(self._get(('bb_mid', period), self._build_bb_mid, period)[idx])
+        std = float(self._get(('bb_std', period), self._build_bb_std, period)[idx])
+        return {
+            'upper': middle + (std_dev * std),
+            'middle': middle,
+            'lower': middle - (std_dev * std),
+        }
+
+    # Series builders
+
+    def _build_sma(self, period: int) -> "np.ndarray":
+        """Full-window mean; the close itself during warm-up."""
+        close = self.columns.close
+        out = close.copy()
+        if period > 0 and len(close) >= period:
+            out[period - 1:] = _rolling_sum(close, period)[period - 1:] / period
+        return out
+
+    def _build_ema(self, period: int) -> "np.ndarray":
+        """
+        EMA seeded from an SMA over a trailing window of 2*period bars.
+
+        Once the full 2*period window exists, the value is the seed decayed
+        over `period` steps plus a fixed-weight sum of the last `period`
+        closes, which is a single convolution.
+        """
+        close = self.columns.close
+        n = len(close)
+        out = np.empty(n)
+        if n == 0 or period <= 0:
+            return out
+
+        # Fewer than `period` bars: running mean
+        head = min(period - 1, n)
+        out[:head] = np.cumsum(close[:head]) / np.arange(1, head + 1)
+        if n < period:
+            return out
+
+        multiplier = 2 / (period + 1)
+        decay = 1 - multiplier
+
+        # period-1 <= i < 2*period-1: plain recursion from the first SMA
+        value = float(close[:period].mean())
+        out[period - 1] = value
+        for i in range(period, min(2 * period - 1, n)):
+            value = close[i] * multiplier + value * decay
+            out[i] = value
+
+        if n >= 2 * period:
+            weights = multiplier * decay ** np.arange(period)
+            tail = np.convolve(close, weights, mode='full')[:n]
+            seed = _rolling_sum(close, period) / period
+            idx = np.arange(2 * period - 1, n)
+            out[idx] = (decay ** period) * seed[idx - period] + tail[idx]
+        return out
+
+    def _build_rsi(self, period: int) -> "np.ndarray":
+        """Simple-average RSI over the last `period` changes; 50 during warm-up."""
+        close = self.columns.close
+        n = len(close)
+        out = np.full(n, 50.0)
+        if n <= period:
+            return out
+
+        change = np.diff(close)
+        gains = _rolling_sum(np.maximum(change, 0.0), period)
+        losses = _rolling_sum(np.abs(np.minimum(change, 0.0)), period)
+        # Count of losing bars decides the "no losses" case exactly, so
+        # cumsum rounding cannot turn a flat RSI of 100 into 99.999...
+        loss_bars = _rolling_sum((change < 0).astype(np.float64), period)
+
+        avg_gain = gains[period - 1:] / period
+        avg_loss = losses[period - 1:] / period
+        no_loss = loss_bars[period - 1:] == 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        out[period:] = np.where(no_loss, 100.0, rsi)
+        return out
+
+    def _build_atr(self, period: int) -> "np.ndarray":
+        """Mean true range over the last `period` bars; 0 during warm-up."""
+        cols = self.columns
+        n = len(cols)
+        out = np.zeros(n)
+        if n <= period or period <= 0:
+            return out
+
+        prev_close = cols.close[:-1]
+        high = cols.high[1:]
+        low = cols.low[1:]
+        true_range = np.maximum.reduce([
+            high - low,
+            np.abs(high - prev_close),
+            np.abs(low - prev_close),
+        ])
+        # true_range[j] belongs to bar j+1
+        out[period:] = _rolling_sum(true_range, period)[period - 1:] / period
+        return out
+
+    def _build_bb_mid(self, period: int) -> "np.ndarray":
+        """Mean of the last min(period, i+1) closes."""
+        close = self.columns.close
+        n = len(close)
+        out = np.zeros(n)
+        if n == 0 or period <= 0:
+            return out
+        head = min(period - 1, n)
+        out[:head] = np.cumsum(close[:head]) / np.arange(1, head + 1)
+        if n >= period:
+            out[period - 1:] = _rolling_sum(close, period)[period - 1:] / period
+        return out
+
+    def _build_bb_std(self, period: int) -> "np.ndarray":
+        """Population std of the last min(period, i+1) closes."""
+        close = self.columns.close
+        n = len(close)
+        out = np.zeros(n)
+        if n == 0 or period <= 0:
+            return out
+        for i in range(1, min(period - 1, n)):
+            out[i] = close[:i + 1].std()
+        if n >= period:
+            out[period - 1:] = _rolling_std(close, period)[period - 1:]
+        return out
+
+
+def date_range_bounds(
+    timestamps: List[str],
+    start_date: str,
+    end_date: str,
+) -> Optional[Tuple[int, int]]:
+    """
+    Locate rows whose date prefix lies in [start_date, end_date].
+
+    Timestamps must be sorted ISO strings. Returns (start, stop) row
+    indices or None when the range is empty.
+    """
+    dates = _DatePrefixView(timestamps)
+    start = bisect_left(dates, start_date)
+    stop = bisect_right(dates, end_date)
+    if start >= stop:
+        return None
+    return start, stop
+
+
+class _DatePrefixView:
+    """Sequence view yielding timestamp[:10] for bisect without a copy."""
+
+    def __init__(self, timestamps: List[str]):
+        self._timestamps = timestamps
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __getitem__(self, idx: int) -> str:
+        return self._timestamps[idx][:10]
@@ -7,17 +7,28 @@ Provides Monte Carlo simulation for trading strategies:
 - Calculate P10, P50, P90 percentiles
 - Compute Value at Risk (VaR) and confidence intervals
 - Generate probability distribution curves
+- Batched NumPy engine: (simulations x trades) PnL matrices built in chunks
 """
 
 import logging
 import math
 import random
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional
 import statistics
 
 logger = logging.getLogger(__name__)
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+# Upper bound on matrix cells (simulations x trades) held per chunk (~16 MB)
+_CHUNK_CELLS = 2_000_000
+
 
 @dataclass
 class MonteCarloResult:
@@ -36,6 +47,20 @@ class MonteCarloResult:
     max_return: float
     returns: List[float]  # All simulated returns
     final_capitals: List[float]  # All simulated final capitals
+    ruined_simulations: int = 0  # Simulations where capital hit zero
+    _sorted: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def _sorted_returns(self):
+        """Returns as a sorted float64 array, built once per result."""
+        if self._sorted is None or len(self._sorted) != len(self.returns):
+            self._sorted = np.sort(np.asarray(self.returns, dtype=np.float64))
+        return self._sorted
+
+    def probability_of_ruin(self) -> float:
+        """Fraction of simulations that lost all capital."""
+        if not self.n_simulations:
+            return 0
+        return self.ruined_simulations / self.n_simulations
 
     def probability_of_loss(self, threshold: float = 0.0) -> float:
         """
@@ -51,6 +76,9 @@ class MonteCarloResult:
             return 0
 
         loss_threshold = -abs(threshold) * 100  # Convert to percentage
+        if HAS_NUMPY:
+            ordered = self._sorted_returns()
+            return int(np.searchsorted(ordered, loss_threshold, side='left')) / len(ordered)
         losses = [r for r in self.returns if r < loss_threshold]
         return len(losses) / len(self.returns)
 
@@ -68,6 +96,10 @@ class MonteCarloResult:
             return 0
 
         gain_threshold = abs(threshold) * 100  # Convert to percentage
+        if HAS_NUMPY:
+            ordered = self._sorted_returns()
+            above = len(ordered) - int(np.searchsorted(ordered, gain_threshold, side='right'))
+            return above / len(ordered)
         gains = [r for r in self.returns if r > gain_threshold]
         return len(gains) / len(self.returns)
 
@@ -84,7 +116,7 @@ class MonteCarloResult:
         if not self.returns:
             return {'lower': 0, 'upper': 0}
 
-        sorted_returns = sorted(self.returns)
+        sorted_returns = self._sorted_returns() if HAS_NUMPY else sorted(self.returns)
         n = len(sorted_returns)
 
         alpha = 1 - confidence
@@ -92,8 +124,8 @@ class MonteCarloResult:
         upper_idx = int(n * (1 - alpha / 2))
 
         return {
-            'lower': sorted_returns[lower_idx],
-            'upper': sorted_returns[min(upper_idx, n - 1)],
+            'lower': float(sorted_returns[lower_idx]),
+            'upper': float(sorted_returns[min(upper_idx, n - 1)]),
             'confidence': confidence
         }
 
@@ -112,12 +144,12 @@ class MonteCarloResult:
         if not self.returns:
             return 0
 
-        sorted_returns = sorted(self.returns)
+        sorted_returns = self._sorted_returns() if HAS_NUMPY else sorted(self.returns)
         n = len(sorted_returns)
 
         # VaR is the (1-confidence) percentile
         idx = int(n * (1 - confidence))
-        return sorted_returns[idx]
+        return float(sorted_returns[idx])
 
     def expected_shortfall(self, confidence: float = 0.95) -> float:
         """
@@ -135,6 +167,10 @@ class MonteCarloResult:
             return 0
 
         var = self.value_at_risk(confidence)
+        if HAS_NUMPY:
+            ordered = self._sorted_returns()
+            tail = ordered[:int(np.searchsorted(ordered, var, side='right'))]
+            return float(tail.mean()) if len(tail) else var
         tail_losses = [r for r in self.returns if r <= var]
 
         if not tail_losses:
@@ -158,11 +194,26 @@ class MonteCarloResult:
         n_bins = 50
         bin_width = (max_r - min_r) / n_bins if max_r != min_r else 1
 
+        if HAS_NUMPY:
+            # Per-bin counts of bin_start <= r < bin_end via sorted positions
+            ordered = self._sorted_returns()
+            starts = min_r + np.arange(n_bins) * bin_width
+            ends = starts + bin_width
+            counts = (
+                np.searchsorted(ordered, ends, side='left')
+                - np.searchsorted(ordered, starts, side='left')
+            ).tolist()
+        else:
+            counts = None
+
         histogram = []
         for i in range(n_bins):
             bin_start = min_r + i * bin_width
             bin_end = bin_start + bin_width
-            count = len([r for r in self.returns if bin_start <= r < bin_end])
+            if counts is not None:
+                count = counts[i]
+            else:
+                count = len([r for r in self.returns if bin_start <= r < bin_end])
             histogram.append({
                 'bin_start': bin_start,
                 'bin_end': bin_end,
@@ -193,6 +244,8 @@ class MonteCarloResult:
         mean = self.mean_return
         std = self.std_return
 
+        if HAS_NUMPY:
+            return float(np.mean((self._sorted_returns() - mean) ** 3)) / (std ** 3)
         skew = sum((r - mean) ** 3 for r in self.returns) / n
         return skew / (std ** 3)
 
@@ -205,6 +258,9 @@ class MonteCarloResult:
         mean = self.mean_return
         std = self.std_return
 
+        if HAS_NUMPY:
+            kurt = float(np.mean((self._sorted_returns() - mean) ** 4))
+            return (kurt / (std ** 4)) - 3
         kurt = sum((r - mean) ** 4 for r in self.returns) / n
         return (kurt / (std ** 4)) - 3  # Excess kurtosis
 
@@ -230,6 +286,7 @@ class MonteCarloResult:
             'prob_loss_10pct': self.probability_of_loss(0.10),
             'prob_loss_25pct': self.probability_of_loss(0.25),
             'prob_profit_20pct': self.probability_of_profit(0.20),
+            'prob_ruin': self.probability_of_ruin(),
         }
 
 
@@ -245,17 +302,47 @@ class MonteCarloSimulator:
 
     This helps understand the range of possible outcomes
     and the probability of various scenarios.
+
+    With numpy installed, simulations run as batched (simulations x trades)
+    matrices drawn from a seeded numpy Generator, processed in chunks so
+    memory stays bounded regardless of n_simulations.
     """
 
-    def __init__(self, seed: Optional[int] = None):
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        vectorized: bool = True,
+        chunk_size: Optional[int] = None
+    ):
         """
         Initialize Monte Carlo simulator.
 
         Args:
             seed: Random seed for reproducibility
+            vectorized: Use the batched numpy engine when numpy is available
+            chunk_size: Simulations per batch (default: sized to ~2M matrix cells)
         """
         if seed is not None:
             random.seed(seed)
+        self.vectorized = vectorized and HAS_NUMPY
+        self.chunk_size = chunk_size
+        self._rng = np.random.default_rng(seed) if HAS_NUMPY else None
+
+    def _chunks(self, n_simulations: int, n_trades: int) -> Iterator[int]:
+        """Yield batch sizes that cover n_simulations."""
+        size = self.chunk_size or max(1, _CHUNK_CELLS // max(n_trades, 1))
+        remaining = n_simulations
+        while remaining > 0:
+            batch = min(size, remaining)
+            yield batch
+            remaining -= batch
+
+    def _pnl_matrix(self, pnls, rows: int, shuffle: bool):
+        """Tile trade PnLs into a (rows x trades) matrix, optionally shuffling each row."""
+        matrix = np.broadcast_to(pnls, (rows, len(pnls)))
+        if shuffle:
+            return self._rng.permuted(matrix, axis=1)
+        return matrix.copy()
 
     def run_simulation(
         self,
@@ -285,8 +372,16 @@ class MonteCarloSimulator:
         if not trades:
             raise ValueError("Cannot run Monte Carlo with empty trade list")
 
+        if self.vectorized:
+            return self._run_simulation_batched(
+                trades, n_simulations, initial_capital,
+                entry_timing_variance, exit_price_variance,
+                position_size_variance, shuffle_trades
+            )
+
         returns = []
         final_capitals = []
+        ruined = 0
 
         for sim in range(n_simulations):
             # Copy and optionally shuffle trades
@@ -323,6 +418,7 @@ class MonteCarloSimulator:
                 # Prevent negative capital
                 if capital <= 0:
                     capital = 0
+                    ruined += 1
                     break
 
             final_capitals.append(capital)
@@ -356,14 +452,75 @@ class MonteCarloSimulator:
             min_return=min(returns) if returns else 0,
             max_return=max(returns) if returns else 0,
             returns=returns,
-            final_capitals=final_capitals
+            final_capitals=final_capitals,
+            ruined_simulations=ruined
+        )
+
+    def _run_simulation_batched(
+        self,
+        trades: List[Dict[str, Any]],
+        n_simulations: int,
+        initial_capital: float,
+        entry_timing_variance: float,
+        exit_price_variance: float,
+        position_size_variance: float,
+        shuffle_trades: bool
+    ) -> MonteCarloResult:
+        """Vectorized run_simulation over chunks of the simulation matrix."""
+        pnls = np.fromiter((t.get('pnl', 0) for t in trades), dtype=np.float64, count=len(trades))
+        variances = [
+            v for v in (entry_timing_variance, exit_price_variance, position_size_variance)
+            if v > 0
+        ]
+
+        final_capitals = np.empty(n_simulations)
+        ruined = 0
+        offset = 0
+        for rows in self._chunks(n_simulations, len(pnls)):
+            matrix = self._pnl_matrix(pnls, rows, shuffle_trades)
+            for variance in variances:
+                matrix *= self._rng.uniform(1 - variance, 1 + variance, size=matrix.shape)
+
+            # Capital is absorbed at zero: a path that ever touches it ends there
+            capital = np.cumsum(matrix, axis=1)
+            capital += initial_capital
+            busted = (capital <= 0).any(axis=1)
+            final_capitals[offset:offset + rows] = np.where(busted, 0.0, capital[:, -1])
+            ruined += int(busted.sum())
+            offset += rows
+
+        returns = np.sort((final_capitals - initial_capital) / initial_capital * 100)
+        n = len(returns)
+
+        def pct(q: float) -> float:
+            return float(returns[int(n * q)]) if n > 0 else 0
+
+        result = MonteCarloResult(
+            n_simulations=n_simulations,
+            initial_capital=initial_capital,
+            mean_return=float(returns.mean()) if n > 0 else 0,
+            std_return=float(returns.std(ddof=1)) if n > 1 else 0,
+            median_return=float(np.median(returns)) if n > 0 else 0,
+            p10=pct(0.10),
+            p25=pct(0.25),
+            p50=pct(0.50),
+            p75=pct(0.75),
+            p90=pct(0.90),
+            min_return=float(returns[0]) if n else 0,
+            max_return=float(returns[-1]) if n else 0,
+            returns=returns.tolist(),
+            final_capitals=final_capitals.tolist(),
+            ruined_simulations=ruined
         )
+        result._sorted = returns
+        return result
 
     def run_path_simulation(
         self,
         trades: List[Dict[str, Any]],
         n_simulations: int = 1000,
-        initial_capital: float = 10000
+        initial_capital: float = 10000,
+        include_paths: bool = True
     ) -> Dict[str, Any]:
         """
         Run path-dependent Monte Carlo simulation.
@@ -375,6 +532,8 @@ class MonteCarloSimulator:
             trades: List of trade dictionaries
             n_simulations: Number of simulations
             initial_capital: Starting capital
+            include_paths: Return every equity path (skip for large runs
+                where only the drawdown statistics are needed)
 
         Returns:
             Dictionary with paths and path statistics
@@ -382,6 +541,11 @@ class MonteCarloSimulator:
         if not trades:
             raise ValueError("Cannot run simulation with empty trade list")
 
+        if self.vectorized:
+            return self._run_path_simulation_batched(
+                trades, n_simulations, initial_capital, include_paths
+            )
+
         paths = []
         max_drawdowns = []
 
@@ -411,7 +575,8 @@ class MonteCarloSimulator:
                 dd = (peak - capital) / peak if peak > 0 else 0
                 max_dd = max(max_dd, dd)
 
-            paths.append(path)
+            if include_paths:
+                paths.append(path)
             max_drawdowns.append(max_dd * 100)
 
         return {
@@ -426,6 +591,54 @@ class MonteCarloSimulator:
             'path_lengths': len(trades) + 1
         }
 
+    def _run_path_simulation_batched(
+        self,
+        trades: List[Dict[str, Any]],
+        n_simulations: int,
+        initial_capital: float,
+        include_paths: bool
+    ) -> Dict[str, Any]:
+        """Vectorized run_path_simulation over chunks of the path matrix."""
+        pnls = np.fromiter((t.get('pnl', 0) for t in trades), dtype=np.float64, count=len(trades))
+
+        paths = []
+        max_drawdowns = np.empty(n_simulations)
+        offset = 0
+        for rows in self._chunks(n_simulations, len(pnls) + 1):
+            matrix = self._pnl_matrix(pnls, rows, shuffle=True)
+            matrix *= 1 + self._rng.normal(0, 0.1, size=matrix.shape)
+
+            # Capital floors at zero but keeps trading: c_k = max(c_{k-1} + pnl_k, 0).
+            # That reflected walk equals S_k - min(0, min_{j<=k} S_j) over the
+            # unfloored running sum S, so no per-trade loop is needed.
+            running = np.empty((rows, len(pnls) + 1))
+            running[:, 0] = initial_capital
+            np.cumsum(matrix, axis=1, out=running[:, 1:])
+            running[:, 1:] += initial_capital
+            capital = running - np.minimum(np.minimum.accumulate(running, axis=1), 0)
+
+            peaks = np.maximum.accumulate(capital, axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                drawdowns = np.where(peaks > 0, (peaks - capital) / peaks, 0.0)
+            max_drawdowns[offset:offset + rows] = drawdowns.max(axis=1) * 100
+
+            if include_paths:
+                paths.extend(capital.tolist())
+            offset += rows
+
+        ordered = np.sort(max_drawdowns)
+        return {
+            'n_simulations': n_simulations,
+            'paths': paths,
+            'max_drawdowns': {
+                'mean': float(ordered.mean()),
+                'median': float(np.median(ordered)),
+                'p95': float(ordered[int(len(ordered) * 0.95)]),
+                'max': float(ordered[-1])
+            },
+            'path_lengths': len(trades) + 1
+        }
+
     def generate_report(self, result: MonteCarloResult) -> str:
         """Generate text report for Monte Carlo results."""
         return f"""
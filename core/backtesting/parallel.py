@@ -0,0 +1,161 @@
+"""
+Process-pool helpers shared by the optimizer and walk-forward testers.
+
+- TaskPool: applies fn(state, task) to tasks, in this process for one
+  worker or on a process pool whose workers build `state` once
+- SharedCandles: candles written once as memory-mapped .npy columns
+- metric_value: BacktestMetrics lookup by name (higher is better)
+- task_seed / task_rng: per-task random generators derived from
+  (seed, *key), so results do not depend on worker count or scheduling
+"""
+
+import functools
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from core.backtesting.backtest_engine import BacktestMetrics
+from core.backtesting.columnar import HAS_NUMPY, ColumnarOHLCV
+
+# State built by TaskPool's setup; only ever set inside pool worker processes
+_worker_state: Any = None
+
+
+def worker_count(n_jobs: int, n_tasks: int) -> int:
+    """Processes to use for n_tasks (n_jobs <= 0 = all CPUs); 1 means in-process."""
+    workers = n_jobs if n_jobs > 0 else (os.cpu_count() or 1)
+    return max(1, min(workers, n_tasks))
+
+
+def task_seed(seed: int, *key: Any) -> int:
+    """Stable 32-bit seed for the task identified by (seed, *key)."""
+    return zlib.crc32(repr((seed,) + key).encode())
+
+
+def task_rng(seed: int, *key: Any) -> random.Random:
+    """A random.Random owned by one task; the global RNG is left untouched."""
+    return random.Random(task_seed(seed, *key))
+
+
+def metric_value(metrics: BacktestMetrics, metric_name: str) -> float:
+    """Get metric value by name."""
+    metric_map = {
+        'sharpe_ratio': metrics.sharpe_ratio,
+        'sortino_ratio': metrics.sortino_ratio,
+        'total_return_pct': metrics.total_return_pct,
+        'total_return': metrics.total_return,
+        'annualized_return': metrics.annualized_return,
+        'max_drawdown': -metrics.max_drawdown,  # Negate so higher is better
+        'win_rate': metrics.win_rate,
+        'profit_factor': metrics.profit_factor,
+        'recovery_factor': metrics.recovery_factor,
+        'calmar_ratio': metrics.calmar_ratio,
+        'expectancy': metrics.expectancy,
+    }
+
+    return metric_map.get(metric_name, 0)
+
+
+class SharedCandles:
+    """
+    Candle records handed to pool workers.
+
+    With numpy and share=True the candles are parsed once and written as
+    .npy columns to a temp directory that every worker memory-maps
+    read-only, so the OS keeps a single copy. Otherwise the records are
+    kept (and shipped once per worker).
+    """
+
+    def __init__(self, data: List[Dict], share: bool = True, prefix: str = "jarvis_"):
+        self.data_dir: Optional[str] = None
+        self.records: Optional[List[Dict]] = data
+        if share and HAS_NUMPY:
+            self.data_dir = tempfile.mkdtemp(prefix=prefix)
+            ColumnarOHLCV.from_records(data).save(self.data_dir)
+            self.records = None
+
+    def columns(self) -> Optional[ColumnarOHLCV]:
+        """The candles as columns (memory-mapped when shared), None without numpy."""
+        if self.data_dir is not None:
+            return ColumnarOHLCV.load(self.data_dir, mmap=True)
+        return ColumnarOHLCV.from_records(self.records) if HAS_NUMPY else None
+
+    def close(self) -> None:
+        if self.data_dir is not None:
+            shutil.rmtree(self.data_dir, ignore_errors=True)
+
+
+def _init_worker(setup: Callable[..., Any], args: Sequence[Any]) -> None:
+    global _worker_state
+    _worker_state = setup(*args)
+
+
+def _call_in_worker(fn: Callable[[Any, Any], Any], task: Any) -> Any:
+    return fn(_worker_state, task)
+
+
+class TaskPool:
+    """
+    Runs fn(state, task) for many tasks.
+
+    `state = setup(*args)` is built once per worker process, or once on
+    this instance when workers == 1 (so in-process runs share no module
+    state and may nest). On Linux the pool forks, which lets closures and
+    lambdas in args serve as strategies; elsewhere args must be picklable.
+    Task functions must be module-level so they can be sent to workers.
+    """
+
+    def __init__(self, workers: int, setup: Callable[..., Any], *args: Any):
+        self.workers = workers
+        self._state: Any = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        if workers > 1:
+            mp_context = (
+                multiprocessing.get_context('fork')
+                if sys.platform.startswith('linux') else None
+            )
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=mp_context,
+                initializer=_init_worker,
+                initargs=(setup, args),
+            )
+        else:
+            self._state = setup(*args)
+
+    def map(self, fn: Callable[[Any, Any], Any], tasks: List[Any]) -> List[Any]:
+        """Results in task order."""
+        if self._executor is None:
+            return [fn(self._state, task) for task in tasks]
+        # Chunks of consecutive tasks keep neighbouring work on one worker
+        chunksize = max(1, len(tasks) // (self.workers * 4))
+        return list(self._executor.map(
+            functools.partial(_call_in_worker, fn), tasks, chunksize=chunksize
+        ))
+
+    def imap_unordered(self, fn: Callable[[Any, Any], Any], tasks: List[Any]) -> Iterator[Any]:
+        """Results as they complete (task order when in-process)."""
+        if self._executor is None:
+            for task in tasks:
+                yield fn(self._state, task)
+            return
+        futures = [self._executor.submit(_call_in_worker, fn, task) for task in tasks]
+        for future in as_completed(futures):
+            yield future.result()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        self._state = None
+
+    def __enter__(self) -> "TaskPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -7,13 +7,15 @@ Provides grid search and optimization for trading strategies:
 - Find optimal parameters
 - Generate parameter matrix with scores
 - Support parameter constraints
+- Parallel evaluation over a process pool with memory-mapped candle data
+- Streaming results and optional pruning of dominated parameter regions
 """
 
 import logging
 import itertools
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Any, Callable, Optional, Tuple
+from typing import Dict, Iterator, List, Any, Callable, Optional, Tuple
 
 from core.backtesting.backtest_engine import (
     AdvancedBacktestEngine,
@@ -21,6 +23,8 @@ from core.backtesting.backtest_engine import (
     BacktestMetrics,
     BacktestResult,
 )
+from core.backtesting.columnar import HAS_NUMPY
+from core.backtesting.parallel import SharedCandles, TaskPool, metric_value, worker_count
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +63,13 @@ class ParameterOptimizer:
     - Grid search optimization
     - Parameter constraints
     - Multiple optimization metrics
-    - Parallel evaluation (future)
+    - Parallel evaluation (n_jobs) over a process pool
+    - Coarse-to-fine pruning of dominated regions (prune_margin)
+
+    Parallel runs parse the candles once, write them as memory-mapped
+    columns and let every worker load that read-only copy. On platforms
+    without fork (Windows, macOS default) the strategy_factory must be
+    picklable, i.e. a module-level function.
     """
 
     def __init__(self):
@@ -108,18 +118,30 @@ class ParameterOptimizer:
 
     def _generate_combinations(self) -> List[Dict[str, Any]]:
         """Generate all parameter combinations."""
+        return [params for params, _ in self._generate_grid()]
+
+    def _generate_grid(self) -> List[Tuple[Dict[str, Any], Tuple[int, ...]]]:
+        """Generate (params, grid coordinates) for every combination."""
         if not self._parameters:
-            return [{}]
+            return [({}, ())]
 
         keys = list(self._parameters.keys())
-        values = [self._parameters[k] for k in keys]
+        ranges = [range(len(self._parameters[k])) for k in keys]
 
-        combinations = []
-        for combo in itertools.product(*values):
-            params = dict(zip(keys, combo))
-            combinations.append(params)
+        grid = []
+        for coords in itertools.product(*ranges):
+            params = {k: self._parameters[k][c] for k, c in zip(keys, coords)}
+            grid.append((params, coords))
 
-        return combinations
+        return grid
+
+    def valid_grid(self) -> List[Tuple[int, Dict[str, Any], Tuple[int, ...]]]:
+        """(grid index, params, grid coordinates) for combinations passing the constraints."""
+        return [
+            (i, params, coords)
+            for i, (params, coords) in enumerate(self._generate_grid())
+            if self._check_constraints(params)
+        ]
 
     def grid_search(
         self,
@@ -129,7 +151,10 @@ class ParameterOptimizer:
         initial_capital: float = 10000,
         metric: str = 'sharpe_ratio',
         start_date: str = None,
-        end_date: str = None
+        end_date: str = None,
+        n_jobs: int = 1,
+        prune_margin: Optional[float] = None,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Run grid search optimization.
@@ -142,85 +167,56 @@ class ParameterOptimizer:
             metric: Metric to optimize ('sharpe_ratio', 'total_return_pct', 'calmar_ratio', etc.)
             start_date: Start date (default: first date in data)
             end_date: End date (default: last date in data)
+            n_jobs: Worker processes (1 = in-process, <= 0 = all CPUs)
+            prune_margin: If set, skip combinations whose evaluated coarse-grid
+                neighbours all score more than this below the best score
+            on_result: Called with each result entry as soon as it is available
 
         Returns:
             Dictionary with best_params, best_score, all_results
         """
         start_time = datetime.now()
 
-        # Determine date range from data
-        if not data:
-            raise ValueError("No data provided")
-
-        if start_date is None:
-            start_date = data[0]['timestamp'][:10]
-        if end_date is None:
-            end_date = data[-1]['timestamp'][:10]
-
-        # Generate all combinations
-        all_combinations = self._generate_combinations()
-        total_combinations = len(all_combinations)
-
-        # Filter by constraints
-        valid_combinations = [c for c in all_combinations if self._check_constraints(c)]
-        valid_count = len(valid_combinations)
-
-        logger.info(f"Grid search: {valid_count}/{total_combinations} valid combinations")
-
         results = []
         best_score = float('-inf')
         best_params = None
         best_metrics = None
-
-        for i, params in enumerate(valid_combinations):
-            try:
-                # Create strategy from parameters
-                strategy = strategy_factory(params)
-
-                # Run backtest
-                engine = AdvancedBacktestEngine()
-                engine.load_data(symbol, data)
-
-                config = BacktestConfig(
-                    symbol=symbol,
-                    start_date=start_date,
-                    end_date=end_date,
-                    initial_capital=initial_capital
-                )
-
-                result = engine.run(strategy, config, strategy_name=f"opt_{i}")
-
-                # Get score
-                score = self._get_metric_value(result.metrics, metric)
-
-                results.append({
-                    'params': params,
-                    'score': score,
-                    'metrics': {
-                        'sharpe_ratio': result.metrics.sharpe_ratio,
-                        'total_return_pct': result.metrics.total_return_pct,
-                        'max_drawdown': result.metrics.max_drawdown,
-                        'win_rate': result.metrics.win_rate,
-                        'profit_factor': result.metrics.profit_factor,
-                        'calmar_ratio': result.metrics.calmar_ratio,
-                    }
-                })
-
-                if score > best_score:
-                    best_score = score
-                    best_params = params
-                    best_metrics = result.metrics
-
-                if (i + 1) % 10 == 0:
-                    logger.info(f"Progress: {i + 1}/{valid_count} combinations tested")
-
-            except Exception as e:
-                logger.warning(f"Combination {params} failed: {e}")
-                results.append({
-                    'params': params,
-                    'score': float('-inf'),
-                    'error': str(e)
-                })
+        best_index = -1
+        pruned = 0
+
+        for entry in self._iter_grid_entries(
+            data=data,
+            symbol=symbol,
+            strategy_factory=strategy_factory,
+            initial_capital=initial_capital,
+            metric=metric,
+            start_date=start_date,
+            end_date=end_date,
+            n_jobs=n_jobs,
+            prune_margin=prune_margin,
+        ):
+            metrics_obj = entry.pop('_metrics', None)
+            results.append(entry)
+            if on_result is not None:
+                on_result(entry)
+            if entry.get('pruned'):
+                pruned += 1
+                continue
+
+            # Ties go to the earliest combination, as in a sequential sweep
+            score = entry['score']
+            if score > best_score or (
+                score == best_score and best_params is not None and entry['index'] < best_index
+            ):
+                best_score = score
+                best_params = entry['params']
+                best_metrics = metrics_obj
+                best_index = entry['index']
+
+        # Parallel workers finish out of order; report in grid order
+        results.sort(key=lambda r: r['index'])
+        total_combinations = len(self._generate_grid())
+        valid_count = len(results)
 
         end_time = datetime.now()
         optimization_time = (end_time - start_time).total_seconds()
@@ -236,26 +232,139 @@ class ParameterOptimizer:
             'metric_used': metric,
             'total_combinations': total_combinations,
             'valid_combinations': valid_count,
+            'pruned_combinations': pruned,
             'optimization_time': optimization_time
         }
 
+    def iter_grid_search(
+        self,
+        data: List[Dict],
+        symbol: str,
+        strategy_factory: Callable[[Dict], Callable],
+        initial_capital: float = 10000,
+        metric: str = 'sharpe_ratio',
+        start_date: str = None,
+        end_date: str = None,
+        n_jobs: int = 1,
+        prune_margin: Optional[float] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Evaluate the grid, yielding each result entry as it completes.
+
+        Entries carry 'index' (position in the full grid), 'params' and
+        'score', plus 'metrics', 'error' or 'pruned'. In parallel mode they
+        arrive in completion order. Arguments match grid_search.
+        """
+        for entry in self._iter_grid_entries(
+            data=data,
+            symbol=symbol,
+            strategy_factory=strategy_factory,
+            initial_capital=initial_capital,
+            metric=metric,
+            start_date=start_date,
+            end_date=end_date,
+            n_jobs=n_jobs,
+            prune_margin=prune_margin,
+        ):
+            entry.pop('_metrics', None)
+            yield entry
+
+    def _iter_grid_entries(
+        self,
+        data: List[Dict],
+        symbol: str,
+        strategy_factory: Callable[[Dict], Callable],
+        initial_capital: float,
+        metric: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        n_jobs: int,
+        prune_margin: Optional[float]
+    ) -> Iterator[Dict[str, Any]]:
+        """iter_grid_search entries, still carrying the BacktestMetrics as '_metrics'."""
+        # Determine date range from data
+        if not data:
+            raise ValueError("No data provided")
+
+        if start_date is None:
+            start_date = data[0]['timestamp'][:10]
+        if end_date is None:
+            end_date = data[-1]['timestamp'][:10]
+
+        # Generate all combinations and filter by constraints
+        valid = self.valid_grid()
+        logger.info(f"Grid search: {len(valid)} valid combinations")
+
+        if prune_margin is None:
+            phases = [valid]
+        else:
+            # Coarse pass over every other grid point on each axis, then the
+            # fine points in between unless their whole neighbourhood is weak
+            coarse = [v for v in valid if all(c % 2 == 0 for c in v[2])]
+            coarse_ids = {v[0] for v in coarse}
+            phases = [coarse, [v for v in valid if v[0] not in coarse_ids]]
+
+        context = _EvaluationContext(
+            symbol=symbol,
+            strategy_factory=strategy_factory,
+            config_kwargs={
+                'symbol': symbol,
+                'start_date': start_date,
+                'end_date': end_date,
+                'initial_capital': initial_capital,
+            },
+            metric=metric,
+        )
+
+        workers = worker_count(n_jobs, len(valid))
+        candles = SharedCandles(data, share=workers > 1, prefix="jarvis_opt_")
+        if workers > 1:
+            logger.info(f"Grid search: {workers} worker processes")
+
+        scores_by_coords: Dict[Tuple[int, ...], float] = {}
+        done = 0
+        try:
+            with TaskPool(workers, _evaluation_state, context, candles) as pool:
+                for phase_index, phase in enumerate(phases):
+                    pending = phase
+                    if phase_index > 0:
+                        best = max(scores_by_coords.values(), default=float('-inf'))
+                        pending = []
+                        for i, params, coords in phase:
+                            if self._is_dominated(coords, scores_by_coords, best, prune_margin):
+                                done += 1
+                                yield {'index': i, 'params': params, 'score': float('-inf'), 'pruned': True}
+                            else:
+                                pending.append((i, params, coords))
+
+                    coords_by_index = {i: coords for i, _, coords in pending}
+                    for entry in pool.imap_unordered(_evaluate, [(i, params) for i, params, _ in pending]):
+                        scores_by_coords[coords_by_index[entry['index']]] = entry['score']
+                        done += 1
+                        if done % 10 == 0:
+                            logger.info(f"Progress: {done}/{len(valid)} combinations tested")
+                        yield entry
+        finally:
+            candles.close()
+
+    @staticmethod
+    def _is_dominated(
+        coords: Tuple[int, ...],
+        scores_by_coords: Dict[Tuple[int, ...], float],
+        best_score: float,
+        margin: float
+    ) -> bool:
+        """True if every evaluated coarse neighbour is worse than best - margin."""
+        neighbours = [
+            scores_by_coords[n]
+            for n in itertools.product(*[(c - 1, c, c + 1) for c in coords])
+            if n in scores_by_coords
+        ]
+        return bool(neighbours) and all(s < best_score - margin for s in neighbours)
+
     def _get_metric_value(self, metrics: BacktestMetrics, metric_name: str) -> float:
         """Get metric value by name."""
-        metric_map = {
-            'sharpe_ratio': metrics.sharpe_ratio,
-            'sortino_ratio': metrics.sortino_ratio,
-            'total_return_pct': metrics.total_return_pct,
-            'total_return': metrics.total_return,
-            'annualized_return': metrics.annualized_return,
-            'max_drawdown': -metrics.max_drawdown,  # Negate so higher is better
-            'win_rate': metrics.win_rate,
-            'profit_factor': metrics.profit_factor,
-            'recovery_factor': metrics.recovery_factor,
-            'calmar_ratio': metrics.calmar_ratio,
-            'expectancy': metrics.expectancy,
-        }
-
-        return metric_map.get(metric_name, 0)
+        return metric_value(metrics, metric_name)
 
     def get_parameter_matrix(
         self,
@@ -434,3 +543,71 @@ TOP {min(top_n, len(top_results))} PARAMETER COMBINATIONS:
                     report += f"  {i+1}. Score={score:.4f} | {params_str}\n"
 
         return report
+
+
+@dataclass
+class _EvaluationContext:
+    """Everything needed to score one combination, in or out of process."""
+    symbol: str
+    strategy_factory: Callable[[Dict], Callable]
+    config_kwargs: Dict[str, Any]
+    metric: str
+
+    def evaluate(
+        self,
+        engine: AdvancedBacktestEngine,
+        index: int,
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Backtest one combination on an engine that already holds the data."""
+        try:
+            strategy = self.strategy_factory(params)
+            config = BacktestConfig(**self.config_kwargs)
+            result = engine.run(strategy, config, strategy_name=f"opt_{index}")
+            score = metric_value(result.metrics, self.metric)
+            return {
+                'index': index,
+                'params': params,
+                'score': score,
+                'metrics': {
+                    'sharpe_ratio': result.metrics.sharpe_ratio,
+                    'total_return_pct': result.metrics.total_return_pct,
+                    'max_drawdown': result.metrics.max_drawdown,
+                    'win_rate': result.metrics.win_rate,
+                    'profit_factor': result.metrics.profit_factor,
+                    'calmar_ratio': result.metrics.calmar_ratio,
+                },
+                '_metrics': result.metrics,
+            }
+        except Exception as e:
+            logger.warning(f"Combination {params} failed: {e}")
+            return {
+                'index': index,
+                'params': params,
+                'score': float('-inf'),
+                'error': str(e)
+            }
+
+
+def _evaluation_state(
+    context: _EvaluationContext,
+    candles: SharedCandles
+) -> Tuple[_EvaluationContext, AdvancedBacktestEngine]:
+    """Per-process state: the context and a template engine holding the candles."""
+    engine = AdvancedBacktestEngine(columnar=HAS_NUMPY)
+    if candles.data_dir is not None:
+        engine.load_columns(context.symbol, candles.columns())
+    else:
+        engine.load_data(context.symbol, candles.records)
+    return context, engine
+
+
+def _evaluate(
+    state: Tuple[_EvaluationContext, AdvancedBacktestEngine],
+    item: Tuple[int, Dict[str, Any]]
+) -> Dict[str, Any]:
+    context, engine = state
+    index, params = item
+    # Each combination runs on its own engine, so a failed or misbehaving
+    # run cannot leak into the next one; indicator series are still shared
+    return context.evaluate(engine.spawn(), index, params)
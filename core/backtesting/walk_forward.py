@@ -6,18 +6,31 @@ Provides walk-forward testing to detect overfitting:
 - Train on period 1, test on period 2, slide window
 - Calculate robustness ratio and overfitting score
 - Generate degradation curves
+- Optional in-sample parameter optimization per fold
+- Parallel folds (n_jobs) over a process pool with deterministic seeding
 """
 
 import logging
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Any, Callable, Optional
+from typing import Dict, List, Any, Callable, Optional, Tuple, Union
 
 from core.backtesting.backtest_engine import (
     AdvancedBacktestEngine,
     BacktestConfig,
     BacktestMetrics,
 )
+from core.backtesting.columnar import ColumnarOHLCV
+from core.backtesting.parallel import (
+    SharedCandles,
+    TaskPool,
+    metric_value,
+    task_rng,
+    worker_count,
+)
+from core.backtesting.parameter_optimizer import ParameterOptimizer
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +47,7 @@ class WalkForwardPeriod:
     test_performance: Dict[str, float]
     train_metrics: Optional[BacktestMetrics] = None
     test_metrics: Optional[BacktestMetrics] = None
+    best_params: Dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -73,6 +87,7 @@ class WalkForwardResult:
                     'test_sharpe': p.test_performance.get('sharpe_ratio', 0),
                     'train_return': p.train_performance.get('total_return_pct', 0),
                     'test_return': p.test_performance.get('total_return_pct', 0),
+                    'best_params': p.best_params,
                 }
                 for p in self.periods
             ]
@@ -91,10 +106,24 @@ class WalkForwardAnalyzer:
 
     A robust strategy should have similar performance on train and test data.
     Large gaps indicate overfitting.
+
+    Folds are independent, so with n_jobs > 1 every train/test backtest (and
+    every in-sample grid point in run_optimized_walk_forward) is a task on a
+    process pool. Candles are written once as memory-mapped columns that all
+    workers share. Each task's engine gets its own engine.rng seeded from
+    (seed, fold, phase, grid index), so strategies that draw from it give
+    the same results for any n_jobs. As with ParameterOptimizer, strategies
+    must be picklable on platforms without fork.
+
+    Args:
+        n_jobs: Default worker processes (1 = in-process, <= 0 = all CPUs)
+        seed: Base seed for per-task seeding
     """
 
-    def __init__(self):
+    def __init__(self, n_jobs: int = 1, seed: int = 0):
         self._engine = AdvancedBacktestEngine()
+        self.n_jobs = n_jobs
+        self.seed = seed
 
     def create_splits(
         self,
@@ -115,16 +144,27 @@ class WalkForwardAnalyzer:
         Returns:
             List of {'train': [...], 'test': [...]} dictionaries
         """
-        if len(data) < 10:
+        return [
+            {'train': data[start:split], 'test': data[split:stop]}
+            for start, split, stop in self._split_bounds(len(data), train_size, n_splits)
+        ]
+
+    def _split_bounds(
+        self,
+        total_size: int,
+        train_size: float,
+        n_splits: int
+    ) -> List[Tuple[int, int, int]]:
+        """Row bounds (window_start, train_end, window_end) for each non-empty split."""
+        if total_size < 10:
             raise ValueError("Insufficient data for walk-forward analysis (need >= 10 points)")
 
-        total_size = len(data)
         window_size = total_size // n_splits
 
         if window_size < 2:
             raise ValueError(f"Window size too small ({window_size}) for {n_splits} splits")
 
-        splits = []
+        bounds = []
 
         for i in range(n_splits):
             # Calculate window boundaries
@@ -136,19 +176,12 @@ class WalkForwardAnalyzer:
                 window_start = max(0, window_end - window_size)
 
             # Split into train/test
-            window_data = data[window_start:window_end]
-            train_end_idx = int(len(window_data) * train_size)
-
-            train_data = window_data[:train_end_idx]
-            test_data = window_data[train_end_idx:]
+            train_end = window_start + int((window_end - window_start) * train_size)
 
-            if len(train_data) > 0 and len(test_data) > 0:
-                splits.append({
-                    'train': train_data,
-                    'test': test_data
-                })
+            if window_start < train_end < window_end:
+                bounds.append((window_start, train_end, window_end))
 
-        return splits
+        return bounds
 
     def run_walk_forward(
         self,
@@ -159,7 +192,8 @@ class WalkForwardAnalyzer:
         test_size: float = 0.3,
         n_splits: int = 5,
         initial_capital: float = 10000,
-        strategy_name: str = "unnamed"
+        strategy_name: str = "unnamed",
+        n_jobs: Optional[int] = None
     ) -> WalkForwardResult:
         """
         Run walk-forward analysis.
@@ -173,6 +207,7 @@ class WalkForwardAnalyzer:
             n_splits: Number of walk-forward periods
             initial_capital: Starting capital for each period
             strategy_name: Name of the strategy
+            n_jobs: Worker processes (default: the analyzer's n_jobs)
 
         Returns:
             WalkForwardResult with all period results
@@ -180,87 +215,157 @@ class WalkForwardAnalyzer:
         if len(data) < n_splits * 2:
             raise ValueError(f"Insufficient data for {n_splits} walk-forward splits")
 
-        splits = self.create_splits(data, train_size, test_size, n_splits)
-        periods: List[WalkForwardPeriod] = []
+        data = sorted(data, key=lambda d: d['timestamp'])
+        bounds = self._split_bounds(len(data), train_size, n_splits)
+        runner = _FoldRunner(
+            symbol=symbol,
+            initial_capital=initial_capital,
+            strategy_name=strategy_name,
+            seed=self.seed,
+            strategy=strategy,
+        )
 
-        for i, split in enumerate(splits):
-            train_data = split['train']
-            test_data = split['test']
+        tasks = []
+        for i, (start, split, stop) in enumerate(bounds):
+            tasks.append(_WindowTask(i, 'train', -1, None, start, split))
+            tasks.append(_WindowTask(i, 'test', -1, None, split, stop))
 
-            if not train_data or not test_data:
-                continue
+        with _open_pool(runner, data, self._workers(n_jobs, len(tasks))) as pool:
+            outcomes = pool.map(_run_window, tasks)
 
-            # Get date ranges
-            train_start = train_data[0]['timestamp'][:10]
-            train_end = train_data[-1]['timestamp'][:10]
-            test_start = test_data[0]['timestamp'][:10]
-            test_end = test_data[-1]['timestamp'][:10]
+        periods = []
+        for i, (start, split, stop) in enumerate(bounds):
+            train, test = outcomes[2 * i], outcomes[2 * i + 1]
+            periods.append(self._make_period(i, data, start, split, stop, train, test))
 
-            # Run train backtest
-            train_engine = AdvancedBacktestEngine()
-            train_engine.load_data(symbol, train_data)
+        return self._build_result(periods, symbol, strategy_name, n_splits, train_size, test_size)
 
-            train_config = BacktestConfig(
-                symbol=symbol,
-                start_date=train_start,
-                end_date=train_end,
-                initial_capital=initial_capital
-            )
+    def run_optimized_walk_forward(
+        self,
+        data: List[Dict],
+        strategy_factory: Callable[[Dict], Callable],
+        symbol: str,
+        param_grid: Union[Dict[str, List[Any]], ParameterOptimizer],
+        metric: str = 'sharpe_ratio',
+        train_size: float = 0.7,
+        test_size: float = 0.3,
+        n_splits: int = 5,
+        initial_capital: float = 10000,
+        strategy_name: str = "unnamed",
+        n_jobs: Optional[int] = None
+    ) -> WalkForwardResult:
+        """
+        Walk-forward with a grid search on every train window.
 
-            try:
-                train_result = train_engine.run(strategy, train_config, strategy_name)
-                train_perf = {
-                    'sharpe_ratio': train_result.metrics.sharpe_ratio,
-                    'total_return_pct': train_result.metrics.total_return_pct,
-                    'max_drawdown': train_result.metrics.max_drawdown,
-                    'win_rate': train_result.metrics.win_rate,
-                    'profit_factor': train_result.metrics.profit_factor,
-                }
-                train_metrics = train_result.metrics
-            except Exception as e:
-                logger.warning(f"Train period {i} failed: {e}")
-                train_perf = {'sharpe_ratio': 0, 'total_return_pct': 0}
-                train_metrics = None
-
-            # Run test backtest
-            test_engine = AdvancedBacktestEngine()
-            test_engine.load_data(symbol, test_data)
-
-            test_config = BacktestConfig(
-                symbol=symbol,
-                start_date=test_start,
-                end_date=test_end,
-                initial_capital=initial_capital
-            )
+        Each fold picks the best parameters in-sample (ties go to the earliest
+        grid point, as in ParameterOptimizer) and tests them out-of-sample.
+        All folds' grids run as one batch of pool tasks, followed by the
+        out-of-sample tests.
 
-            try:
-                test_result = test_engine.run(strategy, test_config, strategy_name)
-                test_perf = {
-                    'sharpe_ratio': test_result.metrics.sharpe_ratio,
-                    'total_return_pct': test_result.metrics.total_return_pct,
-                    'max_drawdown': test_result.metrics.max_drawdown,
-                    'win_rate': test_result.metrics.win_rate,
-                    'profit_factor': test_result.metrics.profit_factor,
-                }
-                test_metrics = test_result.metrics
-            except Exception as e:
-                logger.warning(f"Test period {i} failed: {e}")
-                test_perf = {'sharpe_ratio': 0, 'total_return_pct': 0}
-                test_metrics = None
-
-            periods.append(WalkForwardPeriod(
-                period_index=i,
-                train_start=train_start,
-                train_end=train_end,
-                test_start=test_start,
-                test_end=test_end,
-                train_performance=train_perf,
-                test_performance=test_perf,
-                train_metrics=train_metrics,
-                test_metrics=test_metrics
-            ))
-
-        # Calculate aggregate metrics
+        Args:
+            strategy_factory: Function that takes params and returns a strategy
+            param_grid: Parameter values to search, or a ParameterOptimizer
+                (its constraints are applied)
+            metric: Metric to optimize in-sample (see ParameterOptimizer)
+            Other arguments match run_walk_forward.
+
+        Returns:
+            WalkForwardResult; each period carries its best_params
+        """
+        if len(data) < n_splits * 2:
+            raise ValueError(f"Insufficient data for {n_splits} walk-forward splits")
+
+        optimizer = param_grid
+        if not isinstance(optimizer, ParameterOptimizer):
+            optimizer = ParameterOptimizer()
+            for name, values in param_grid.items():
+                optimizer.add_parameter(name, values)
+        combos = [(i, params) for i, params, _ in optimizer.valid_grid()]
+        if not combos:
+            raise ValueError("No valid parameter combinations")
+
+        data = sorted(data, key=lambda d: d['timestamp'])
+        bounds = self._split_bounds(len(data), train_size, n_splits)
+        runner = _FoldRunner(
+            symbol=symbol,
+            initial_capital=initial_capital,
+            strategy_name=strategy_name,
+            seed=self.seed,
+            strategy_factory=strategy_factory,
+            metric=metric,
+        )
+
+        train_tasks = [
+            _WindowTask(fold, 'train', index, params, start, split)
+            for fold, (start, split, _) in enumerate(bounds)
+            for index, params in combos
+        ]
+        workers = self._workers(n_jobs, len(train_tasks))
+        logger.info(
+            f"Walk-forward optimization: {len(bounds)} folds x {len(combos)} combinations, "
+            f"{workers} worker(s)"
+        )
+
+        with _open_pool(runner, data, workers) as pool:
+            train_outcomes = pool.map(_run_window, train_tasks)
+
+            best: List[Tuple[int, Dict[str, Any], Dict[str, Any]]] = []
+            for fold in range(len(bounds)):
+                fold_outcomes = train_outcomes[fold * len(combos):(fold + 1) * len(combos)]
+                # max() keeps the first of equal scores, i.e. the earliest grid point
+                k = max(range(len(combos)), key=lambda j: fold_outcomes[j]['score'])
+                best.append((combos[k][0], combos[k][1], fold_outcomes[k]))
+
+            test_tasks = [
+                _WindowTask(fold, 'test', index, params, split, stop)
+                for fold, ((index, params, _), (_, split, stop)) in enumerate(zip(best, bounds))
+            ]
+            test_outcomes = pool.map(_run_window, test_tasks)
+
+        periods = []
+        for fold, (start, split, stop) in enumerate(bounds):
+            _, params, train = best[fold]
+            period = self._make_period(fold, data, start, split, stop, train, test_outcomes[fold])
+            period.best_params = dict(params)
+            periods.append(period)
+
+        return self._build_result(periods, symbol, strategy_name, n_splits, train_size, test_size)
+
+    def _workers(self, n_jobs: Optional[int], n_tasks: int) -> int:
+        return worker_count(self.n_jobs if n_jobs is None else n_jobs, n_tasks)
+
+    @staticmethod
+    def _make_period(
+        index: int,
+        data: List[Dict],
+        start: int,
+        split: int,
+        stop: int,
+        train: Dict[str, Any],
+        test: Dict[str, Any]
+    ) -> WalkForwardPeriod:
+        return WalkForwardPeriod(
+            period_index=index,
+            train_start=data[start]['timestamp'][:10],
+            train_end=data[split - 1]['timestamp'][:10],
+            test_start=data[split]['timestamp'][:10],
+            test_end=data[stop - 1]['timestamp'][:10],
+            train_performance=train['performance'],
+            test_performance=test['performance'],
+            train_metrics=train['metrics'],
+            test_metrics=test['metrics'],
+        )
+
+    def _build_result(
+        self,
+        periods: List[WalkForwardPeriod],
+        symbol: str,
+        strategy_name: str,
+        n_splits: int,
+        train_size: float,
+        test_size: float
+    ) -> WalkForwardResult:
+        """Aggregate period results."""
         train_sharpes = [p.train_performance.get('sharpe_ratio', 0) for p in periods]
         test_sharpes = [p.test_performance.get('sharpe_ratio', 0) for p in periods]
 
@@ -429,3 +534,115 @@ Period {period.period_index + 1}:
 """
 
         return report
+
+
+@dataclass
+class _WindowTask:
+    """One backtest over rows [start, stop) of the sorted candles."""
+    fold: int
+    phase: str  # 'train' or 'test'
+    index: int  # Grid index, -1 for a fixed strategy
+    params: Optional[Dict[str, Any]]
+    start: int
+    stop: int
+
+
+@dataclass
+class _FoldRunner:
+    """Runs window tasks on engines built from one shared candle source."""
+    symbol: str
+    initial_capital: float
+    strategy_name: str
+    seed: int
+    strategy: Optional[Callable] = None
+    strategy_factory: Optional[Callable[[Dict], Callable]] = None
+    metric: str = 'sharpe_ratio'
+
+    def run(self, engine: AdvancedBacktestEngine, task: _WindowTask) -> Dict[str, Any]:
+        candles = engine.get_data(self.symbol)
+        rng = task_rng(self.seed, task.fold, task.phase, task.index)
+        try:
+            strategy = self.strategy if self.strategy_factory is None else self.strategy_factory(task.params)
+            config = BacktestConfig(
+                symbol=self.symbol,
+                start_date=candles[0].timestamp[:10],
+                end_date=candles[-1].timestamp[:10],
+                initial_capital=self.initial_capital
+            )
+            result = engine.run(strategy, config, self.strategy_name, parameters=task.params, rng=rng)
+        except Exception as e:
+            logger.warning(f"{task.phase.capitalize()} period {task.fold} failed: {e}")
+            return {
+                'performance': {'sharpe_ratio': 0, 'total_return_pct': 0},
+                'metrics': None,
+                'score': float('-inf'),
+            }
+
+        return {
+            'performance': {
+                'sharpe_ratio': result.metrics.sharpe_ratio,
+                'total_return_pct': result.metrics.total_return_pct,
+                'max_drawdown': result.metrics.max_drawdown,
+                'win_rate': result.metrics.win_rate,
+                'profit_factor': result.metrics.profit_factor,
+            },
+            'metrics': result.metrics,
+            'score': metric_value(result.metrics, self.metric),
+        }
+
+
+class _WindowEngines:
+    """
+    Backtest engines per row window, built from columns or records.
+
+    Tasks on the same window (a fold's grid) share one loaded engine and
+    its precomputed indicator series; each task runs on a spawn() of it,
+    so no run state carries from one parameter set to the next.
+    """
+
+    _MAX_ENGINES = 8
+
+    def __init__(self, symbol: str, columns: Optional[ColumnarOHLCV], records: Optional[List[Dict]]):
+        self._symbol = symbol
+        self._columns = columns
+        self._records = records
+        self._engines: "OrderedDict[Tuple[int, int], AdvancedBacktestEngine]" = OrderedDict()
+
+    def get(self, start: int, stop: int) -> AdvancedBacktestEngine:
+        key = (start, stop)
+        engine = self._engines.get(key)
+        if engine is not None:
+            self._engines.move_to_end(key)
+            return engine
+
+        engine = AdvancedBacktestEngine(columnar=self._columns is not None)
+        if self._columns is not None:
+            engine.load_columns(self._symbol, self._columns.slice(start, stop))
+        else:
+            engine.load_data(self._symbol, self._records[start:stop])
+        self._engines[key] = engine
+        if len(self._engines) > self._MAX_ENGINES:
+            self._engines.popitem(last=False)
+        return engine
+
+
+def _window_state(runner: _FoldRunner, candles: SharedCandles) -> Tuple[_FoldRunner, _WindowEngines]:
+    """Per-process state: the runner and engines over the shared candles."""
+    columns = candles.columns()
+    return runner, _WindowEngines(runner.symbol, columns, None if columns is not None else candles.records)
+
+
+def _run_window(state: Tuple[_FoldRunner, _WindowEngines], task: _WindowTask) -> Dict[str, Any]:
+    runner, engines = state
+    return runner.run(engines.get(task.start, task.stop).spawn(), task)
+
+
+@contextmanager
+def _open_pool(runner: _FoldRunner, data: List[Dict], workers: int):
+    """Yield a TaskPool over the candles: a process pool, or in-process for one worker."""
+    candles = SharedCandles(data, share=workers > 1, prefix="jarvis_wf_")
+    try:
+        with TaskPool(workers, _window_state, runner, candles) as pool:
+            yield pool
+    finally:
+        candles.close()
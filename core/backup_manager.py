@@ -41,6 +41,7 @@ class BackupManager:
     BACKUP_TARGETS = {
         "positions": "bots/treasury/.positions.json",
         "exit_intents": Path.home() / ".lifeos" / "trading" / "exit_intents.json",
+        "exit_intents_db": Path.home() / ".lifeos" / "trading" / "exit_intents.db",
         "grok_state": "bots/twitter/.grok_state.json",
         "supervisor_config": "bots/supervisor_config.json",
         "treasury_config": "bots/treasury/config.json",
@@ -47,6 +47,7 @@ from .api_cache import (
     get_api_cache,
     get_llm_cache,
     parallel_fetch,
+    canonicalize_prompt,
 )
 
 from .memory_cache import LRUCache
@@ -88,6 +89,7 @@ __all__ = [
     "get_api_cache",
     "get_llm_cache",
     "parallel_fetch",
+    "canonicalize_prompt",
     # memory_cache
     "LRUCache",
     # manager (ClawdBot specific)
@@ -7,6 +7,7 @@ Provides optimized caching for external APIs with:
 - Request deduplication
 - Batch operations
 - Parallel fetch support
+- Two-tier LLM response cache (exact + semantic), persisted in SQLite
 
 Default TTLs:
 - Jupiter quotes: 5 minutes (prices change but not constantly)
@@ -31,13 +32,19 @@ import asyncio
 import hashlib
 import json
 import logging
+import math
+import operator
+import re
+import sqlite3
 import sys
 import time
 import threading
+from array import array
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Awaitable
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Awaitable, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -626,12 +633,89 @@ async def parallel_fetch(**fetchers: Awaitable[Any]) -> Dict[str, Any]:
     return results
 
 
+# =============================================================================
+# LLM response cache
+# =============================================================================
+
+# Volatile or variable parts of a prompt, replaced by placeholders in the
+# normalized template. Order matters: URLs, dates and times contain digits.
+_SLOT_PATTERNS = [
+    ("url", r"https?://\S+"),
+    ("date", r"(?<!\d)\d{4}-\d{2}-\d{2}(?!\d)"),
+    ("time", r"(?:(?<=\d)T|(?<![\d:]))\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?"
+             r"(?:\s*(?i:[ap]m|utc))?(?![\d:])"),
+    ("addr", r"\b0x[0-9a-fA-F]{40}\b|\b[1-9A-HJ-NP-Za-km-z]{32,44}\b"),
+    ("ticker", r"\$[A-Za-z][A-Za-z0-9]{0,9}\b"),
+    ("num", r"[-+]?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?"),
+]
+
+# Slot kinds left out of the key: clock times change on every call (dates are kept)
+_VOLATILE_SLOTS = frozenset({"time"})
+
+_SLOT_SPLIT = re.compile("|".join(f"(?P<{kind}>{pattern})" for kind, pattern in _SLOT_PATTERNS))
+
+
+def _normalize_number(text: str, precision: Optional[int]) -> str:
+    text = text.replace(",", "")
+    if precision is None:
+        return text
+    try:
+        return f"{float(text):.{precision}g}"
+    except ValueError:
+        return text
+
+
+def canonicalize_prompt(prompt: str, number_precision: Optional[int] = None) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Split a prompt into a normalized template and its variable slots.
+
+    Whitespace and case are normalized; URLs, dates, clock times, addresses,
+    $tickers and numbers become typed placeholders. Slot values are returned
+    in order with clock times dropped, so prompts that differ only in
+    formatting or time of day share a key. Numbers are kept exactly unless
+    `number_precision` opts in to rounding to that many significant digits.
+
+    Returns:
+        (template, slots)
+    """
+    slots: List[str] = []
+
+    def replace(match: "re.Match") -> str:
+        kind = match.lastgroup
+        value = match.group()
+        if kind == "num":
+            slots.append(_normalize_number(value, number_precision))
+        elif kind == "ticker":
+            slots.append(value.upper())
+        elif kind not in _VOLATILE_SLOTS:
+            slots.append(value)
+        return f"<{kind}>"
+
+    template = _SLOT_SPLIT.sub(replace, prompt)
+    template = " ".join(template.lower().split())
+    return template, tuple(slots)
+
+
+def _semantic_key(prompt: str, number_precision: Optional[int]) -> str:
+    template, slots = canonicalize_prompt(prompt, number_precision)
+    payload = "\x1f".join((template,) + slots)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def _normalize_vector(vector: Sequence[float]) -> Optional[array]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    if not norm:
+        return None
+    return array("f", (x / norm for x in vector))
+
+
 @dataclass
 class LLMCacheStats:
     """Statistics for LLM response caching."""
     hits: int = 0
     misses: int = 0
     writes: int = 0
+    semantic_hits: int = 0
     by_model: Dict[str, Dict[str, int]] = field(default_factory=dict)
 
     @property
@@ -640,20 +724,71 @@ class LLMCacheStats:
         return self.hits / total if total > 0 else 0.0
 
 
+@dataclass
+class _SemanticEntry(CacheEntry):
+    """Semantic-tier entry: prefix group and unit embedding for similarity search."""
+    prefix_key: str = ""
+    embedding: Optional[array] = None
+
+
+_LLM_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    tier TEXT NOT NULL,
+    model TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    prefix_key TEXT NOT NULL DEFAULT '',
+    embedding BLOB,
+    PRIMARY KEY (tier, model, key)
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_lru ON llm_cache(tier, model, last_used);
+"""
+
+# Prune expired/overflow rows from SQLite every N writes
+_LLM_PRUNE_EVERY = 100
+
+# Hits refresh last_used in SQLite in batches: at this many pending, after
+# this many seconds, or alongside the next write
+_LLM_TOUCH_BATCH = 256
+_LLM_TOUCH_INTERVAL = 60.0
+
+
 class LLMResponseCache:
     """
     Specialized cache for LLM API responses.
 
     Provides caching for expensive LLM calls with:
     - Per-model namespacing
-    - Prompt hash-based keys
+    - Two tiers, each with its own TTL and LRU bound:
+      - exact: prompt hash-based keys
+      - semantic (opt-in per call with semantic=True): canonicalized
+        template + variable slots (see canonicalize_prompt), plus optional
+        embedding similarity
+    - Persistence in SQLite (shared across processes and restarts)
     - Optional metadata storage
     - Statistics tracking
 
+    Most prompts share a long static prefix and differ only in a short tail
+    (clock times, formatting), so exact hashing rarely hits. Callers whose
+    answers tolerate that noise pass semantic=True on both writes and reads
+    to catch those near-identical re-asks. For embedding
+    similarity, pass the static part as `prefix`: only the tail is embedded
+    and only entries with the same prefix are compared.
+
     Args:
         cache_dir: Directory for cache files
         default_ttl: Default TTL in seconds (default: 7200 = 2 hours)
         max_size: Maximum entries per model (default: 1000)
+        semantic_ttl: TTL cap for the semantic tier (default: default_ttl)
+        semantic_max_size: Semantic entries per model (default: max_size)
+        embedder: Optional text -> vector function enabling similarity lookups
+        similarity_threshold: Minimum cosine similarity for an embedding hit
+        number_precision: Round numbers to this many significant digits in
+            the semantic key (default None: numbers must match exactly)
+        persist: Store entries in SQLite under cache_dir
 
     Usage:
         from core.cache.api_cache import LLMResponseCache
@@ -663,47 +798,266 @@ class LLMResponseCache:
         # Cache a response
         cache.cache_llm_response(prompt, response, model="grok")
 
-        # Get cached response
-        cached = cache.get_cached_response(prompt, model="grok")
+        # Get cached response (exact, then semantic)
+        cached = cache.get_cached_response(prompt, model="grok", semantic=True)
     """
 
+    DB_NAME = "llm_responses.db"
+
     def __init__(
         self,
         cache_dir: Optional[str] = None,
         default_ttl: int = 7200,
-        max_size: int = 1000
+        max_size: int = 1000,
+        semantic_ttl: Optional[int] = None,
+        semantic_max_size: Optional[int] = None,
+        embedder: Optional[Callable[[str], Sequence[float]]] = None,
+        similarity_threshold: float = 0.95,
+        number_precision: Optional[int] = None,
+        persist: bool = True,
     ):
         self.cache_dir = cache_dir or "bots/data/cache"
         self.default_ttl = default_ttl
         self.max_size = max_size
+        self.semantic_ttl = semantic_ttl if semantic_ttl is not None else default_ttl
+        self.semantic_max_size = semantic_max_size if semantic_max_size is not None else max_size
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.number_precision = number_precision
 
         # Ensure cache directory exists
-        from pathlib import Path
         Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
 
-        # In-memory cache by model
+        # In-memory LRU tiers by model (front for SQLite)
         self._cache: Dict[str, OrderedDict[str, CacheEntry]] = {}
+        self._semantic: Dict[str, OrderedDict[str, _SemanticEntry]] = {}
         self._stats = LLMCacheStats()
         self._lock = threading.Lock()
+        self._last_embedding: Tuple[Optional[str], Optional[array]] = (None, None)
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes_since_prune = 0
+        self._pending_touches: Dict[Tuple[str, str, str], float] = {}
+        self._last_touch_flush = time.monotonic()
+        if persist:
+            self._open_db()
+
+    # ==================== PERSISTENCE ====================
+
+    def _open_db(self) -> None:
+        try:
+            self._conn = sqlite3.connect(
+                str(Path(self.cache_dir) / self.DB_NAME), check_same_thread=False, timeout=30.0
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA busy_timeout=5000")
+            self._conn.executescript(_LLM_CACHE_SCHEMA)
+            self._conn.commit()
+            self._prune_db()
+            self._load_semantic()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache persistence disabled: {e}")
+            self._conn = None
+
+    def _load_semantic(self) -> None:
+        """Warm the semantic tier (embeddings are only searched in memory)."""
+        rows = self._conn.execute(
+            "SELECT model, key, value, created_at, expires_at, prefix_key, embedding "
+            "FROM llm_cache WHERE tier = 'semantic' AND expires_at > ? ORDER BY last_used",
+            (time.time(),),
+        ).fetchall()
+        for model, key, value, created_at, expires_at, prefix_key, blob in rows:
+            embedding = None
+            if blob:
+                embedding = array("f")
+                embedding.frombytes(blob)
+            self._put(self._semantic_cache(model), key, _SemanticEntry(
+                value=json.loads(value), created_at=created_at, expires_at=expires_at,
+                api_name=model, prefix_key=prefix_key, embedding=embedding,
+            ), self.semantic_max_size)
+
+    def _db_get(self, tier: str, model: str, key: str) -> Optional[CacheEntry]:
+        if self._conn is None:
+            return None
+        row = self._conn.execute(
+            "SELECT value, created_at, expires_at FROM llm_cache "
+            "WHERE tier = ? AND model = ? AND key = ? AND expires_at > ?",
+            (tier, model, key, time.time()),
+        ).fetchone()
+        if row is None:
+            return None
+        entry_cls = _SemanticEntry if tier == "semantic" else CacheEntry
+        return entry_cls(value=json.loads(row[0]), created_at=row[1], expires_at=row[2], api_name=model)
+
+    def _db_touch(self, tier: str, model: str, key: str) -> None:
+        """Queue a last_used refresh so disk pruning follows LRU order."""
+        if self._conn is None:
+            return
+        self._pending_touches[(tier, model, key)] = time.time()
+        if (len(self._pending_touches) >= _LLM_TOUCH_BATCH
+                or time.monotonic() - self._last_touch_flush >= _LLM_TOUCH_INTERVAL):
+            self._flush_touches()
+
+    def _flush_touches(self) -> None:
+        """Write queued last_used refreshes in one transaction."""
+        self._last_touch_flush = time.monotonic()
+        if not self._pending_touches or self._conn is None:
+            return
+        touches, self._pending_touches = self._pending_touches, {}
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE llm_cache SET last_used = ? WHERE tier = ? AND model = ? AND key = ?",
+                [(used, tier, model, key) for (tier, model, key), used in touches.items()],
+            )
+
+    def _db_put(self, tier: str, model: str, key: str, entry: CacheEntry) -> None:
+        if self._conn is None:
+            return
+        try:
+            encoded = json.dumps(entry.value, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return  # Not JSON-serializable: memory only
+        prefix_key = getattr(entry, "prefix_key", "")
+        embedding = getattr(entry, "embedding", None)
+        self._flush_touches()  # Already paying for a commit
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache "
+                "(tier, model, key, value, created_at, expires_at, last_used, prefix_key, embedding) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (tier, model, key, encoded, entry.created_at, entry.expires_at, entry.created_at,
+                 prefix_key, embedding.tobytes() if embedding is not None else None),
+            )
+        self._writes_since_prune += 1
+        if self._writes_since_prune >= _LLM_PRUNE_EVERY:
+            self._writes_since_prune = 0
+            self._prune_db()
+
+    def _prune_db(self) -> None:
+        """Drop expired rows and the least recently used beyond each tier's bound."""
+        self._flush_touches()
+        with self._conn:
+            self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (time.time(),))
+            for tier, limit in (("exact", self.max_size), ("semantic", self.semantic_max_size)):
+                self._conn.execute(
+                    "DELETE FROM llm_cache WHERE tier = ? AND rowid IN ("
+                    "  SELECT rowid FROM (SELECT rowid, ROW_NUMBER() OVER ("
+                    "    PARTITION BY model ORDER BY last_used DESC) AS rank"
+                    "    FROM llm_cache WHERE tier = ?) WHERE rank > ?)",
+                    (tier, tier, limit),
+                )
+
+    def _db_clear(self, model: Optional[str] = None) -> None:
+        if self._conn is None:
+            return
+        with self._conn:
+            if model is None:
+                self._pending_touches.clear()
+                self._conn.execute("DELETE FROM llm_cache")
+            else:
+                self._conn.execute("DELETE FROM llm_cache WHERE model = ?", (model,))
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._flush_touches()
+                self._conn.close()
+                self._conn = None
+
+    # ==================== TIERS ====================
 
     def _get_model_cache(self, model: str) -> OrderedDict:
         """Get or create cache for a model."""
         if model not in self._cache:
             self._cache[model] = OrderedDict()
-            self._stats.by_model[model] = {"hits": 0, "misses": 0, "writes": 0}
+        self._model_stats(model)
         return self._cache[model]
 
+    def _semantic_cache(self, model: str) -> OrderedDict:
+        if model not in self._semantic:
+            self._semantic[model] = OrderedDict()
+        return self._semantic[model]
+
+    def _model_stats(self, model: str) -> Dict[str, int]:
+        if model not in self._stats.by_model:
+            self._stats.by_model[model] = {"hits": 0, "misses": 0, "writes": 0, "semantic_hits": 0}
+        return self._stats.by_model[model]
+
+    @staticmethod
+    def _put(tier: OrderedDict, key: str, entry: CacheEntry, max_size: int) -> None:
+        tier.pop(key, None)
+        while len(tier) >= max_size:
+            tier.popitem(last=False)
+        tier[key] = entry
+
+    def _lookup(self, tier_name: str, tier: OrderedDict, model: str, key: str) -> Optional[CacheEntry]:
+        """Memory first, then SQLite (entries written by other processes)."""
+        entry = tier.get(key)
+        if entry is not None and entry.is_expired:
+            del tier[key]
+            entry = None
+        if entry is None:
+            entry = self._db_get(tier_name, model, key)
+            if entry is None:
+                return None
+            self._put(tier, key, entry, self.max_size if tier_name == "exact" else self.semantic_max_size)
+        tier.move_to_end(key)
+        self._db_touch(tier_name, model, key)
+        return entry
+
+    def _similar(self, tier: OrderedDict, prefix_key: str, embedding: array) -> Optional[_SemanticEntry]:
+        best, best_score = None, self.similarity_threshold
+        for key, entry in list(tier.items()):
+            if entry.embedding is None or entry.prefix_key != prefix_key:
+                continue
+            if entry.is_expired:
+                del tier[key]
+                continue
+            score = sum(map(operator.mul, embedding, entry.embedding))
+            if score >= best_score:
+                best, best_score = entry, score
+        return best
+
+    def _embed(self, text: str) -> Optional[array]:
+        """Embed text, reusing the last result (a miss is usually followed by a write)."""
+        if self._last_embedding[0] == text:
+            return self._last_embedding[1]
+        try:
+            embedding = _normalize_vector(self.embedder(text))
+        except Exception as e:
+            logger.debug(f"LLM cache embedding failed: {e}")
+            return None
+        self._last_embedding = (text, embedding)
+        return embedding
+
     def _hash_prompt(self, prompt: str) -> str:
         """Generate a hash for a prompt."""
         return hashlib.sha256(prompt.encode()).hexdigest()[:16]
 
+    @staticmethod
+    def _is_hash(prompt_or_hash: str) -> bool:
+        return len(prompt_or_hash) == 16 and prompt_or_hash.isalnum()
+
+    @staticmethod
+    def _split_prefix(prompt: str, prefix: Optional[str]) -> Tuple[str, str]:
+        """(prefix group key, variable tail) for similarity search."""
+        if prefix and prompt.startswith(prefix):
+            return hashlib.sha256(prefix.encode()).hexdigest()[:16], prompt[len(prefix):]
+        return "", prompt
+
+    # ==================== PUBLIC API ====================
+
     def cache_llm_response(
         self,
         prompt_or_hash: str,
         response: Any,
         model: str = "grok",
         ttl_seconds: Optional[int] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        prefix: Optional[str] = None,
+        semantic: bool = False,
     ) -> None:
         """
         Cache an LLM response.
@@ -714,94 +1068,114 @@ class LLMResponseCache:
             model: Model name (grok, claude, etc.)
             ttl_seconds: Optional TTL override
             metadata: Optional metadata (tokens used, latency, etc.)
+            prefix: Static leading part of the prompt (scopes similarity search)
+            semantic: Also store under the normalized/embedding tier
         """
-        # Generate key (hash if it's a prompt, use directly if it's already a hash)
-        if len(prompt_or_hash) == 16 and prompt_or_hash.isalnum():
-            key = prompt_or_hash
-        else:
-            key = self._hash_prompt(prompt_or_hash)
+        is_hash = self._is_hash(prompt_or_hash)
+        key = prompt_or_hash if is_hash else self._hash_prompt(prompt_or_hash)
 
         effective_ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
         now = time.time()
 
-        with self._lock:
-            model_cache = self._get_model_cache(model)
-
-            # Evict if at capacity
-            while len(model_cache) >= self.max_size:
-                model_cache.popitem(last=False)
-
-            entry = CacheEntry(
-                value=response,
-                created_at=now,
-                expires_at=now + effective_ttl,
-                api_name=model
-            )
+        value = response
+        # Store metadata as a separate field
+        if metadata:
+            value = {
+                "_response": response,
+                "_metadata": metadata,
+                "_has_metadata": True
+            }
 
-            # Store metadata as a separate field
-            if metadata:
-                entry.value = {
-                    "_response": response,
-                    "_metadata": metadata,
-                    "_has_metadata": True
-                }
+        semantic = semantic and not is_hash
+        embedding = None
+        prefix_key = ""
+        if semantic and self.embedder is not None:
+            prefix_key, tail = self._split_prefix(prompt_or_hash, prefix)
+            embedding = self._embed(tail)
 
-            model_cache[key] = entry
-            model_cache.move_to_end(key)
+        with self._lock:
+            entry = CacheEntry(value=value, created_at=now, expires_at=now + effective_ttl, api_name=model)
+            self._put(self._get_model_cache(model), key, entry, self.max_size)
+            self._db_put("exact", model, key, entry)
+
+            if semantic:
+                semantic_key = _semantic_key(prompt_or_hash, self.number_precision)
+                semantic_entry = _SemanticEntry(
+                    value=value,
+                    created_at=now,
+                    expires_at=now + min(effective_ttl, self.semantic_ttl),
+                    api_name=model,
+                    prefix_key=prefix_key,
+                    embedding=embedding,
+                )
+                self._put(self._semantic_cache(model), semantic_key, semantic_entry, self.semantic_max_size)
+                self._db_put("semantic", model, semantic_key, semantic_entry)
 
             self._stats.writes += 1
-            self._stats.by_model[model]["writes"] += 1
+            self._model_stats(model)["writes"] += 1
 
     def get_cached_response(
         self,
         prompt_or_hash: str,
         model: str = "grok",
-        include_metadata: bool = False
+        include_metadata: bool = False,
+        prefix: Optional[str] = None,
+        semantic: bool = False,
     ) -> Any:
         """
         Get a cached LLM response.
 
+        Looks up the exact prompt first. With semantic=True, then tries its
+        normalized template and (with an embedder) the most similar cached
+        prompt above the threshold.
+
         Args:
             prompt_or_hash: The prompt text or a pre-computed hash
             model: Model name
             include_metadata: If True, returns (response, metadata) tuple
+            prefix: Static leading part of the prompt (scopes similarity search)
+            semantic: Fall back to the normalized/embedding tier on a miss
 
         Returns:
             Cached response, or None if not found/expired.
             If include_metadata=True, returns (response, metadata) or (None, None)
         """
-        # Generate key
-        if len(prompt_or_hash) == 16 and prompt_or_hash.isalnum():
-            key = prompt_or_hash
-        else:
-            key = self._hash_prompt(prompt_or_hash)
+        is_hash = self._is_hash(prompt_or_hash)
+        key = prompt_or_hash if is_hash else self._hash_prompt(prompt_or_hash)
 
+        semantic = semantic and not is_hash
         with self._lock:
-            if model not in self._cache:
-                self._stats.misses += 1
-                if model in self._stats.by_model:
-                    self._stats.by_model[model]["misses"] += 1
-                return (None, None) if include_metadata else None
+            entry = self._lookup("exact", self._get_model_cache(model), model, key)
+            if entry is None and semantic:
+                entry = self._lookup(
+                    "semantic", self._semantic_cache(model), model,
+                    _semantic_key(prompt_or_hash, self.number_precision),
+                )
+            else:
+                semantic = False
+            search = entry is None and semantic and self.embedder is not None and self._semantic.get(model)
 
-            model_cache = self._cache[model]
-            entry = model_cache.get(key)
+        if search:
+            # Embedding may call out to a model; don't hold the lock for it
+            prefix_key, tail = self._split_prefix(prompt_or_hash, prefix)
+            embedding = self._embed(tail)
+            if embedding is not None:
+                with self._lock:
+                    entry = self._similar(self._semantic_cache(model), prefix_key, embedding)
 
+        with self._lock:
+            stats = self._model_stats(model)
             if entry is None:
                 self._stats.misses += 1
-                self._stats.by_model[model]["misses"] += 1
+                stats["misses"] += 1
                 return (None, None) if include_metadata else None
 
-            if entry.is_expired:
-                del model_cache[key]
-                self._stats.misses += 1
-                self._stats.by_model[model]["misses"] += 1
-                return (None, None) if include_metadata else None
-
-            # Move to end (most recently used)
-            model_cache.move_to_end(key)
             entry.hits += 1
             self._stats.hits += 1
-            self._stats.by_model[model]["hits"] += 1
+            stats["hits"] += 1
+            if semantic:
+                self._stats.semantic_hits += 1
+                stats["semantic_hits"] += 1
 
             # Check if response has metadata
             value = entry.value
@@ -818,24 +1192,26 @@ class LLMResponseCache:
             hits=self._stats.hits,
             misses=self._stats.misses,
             writes=self._stats.writes,
-            by_model=dict(self._stats.by_model)
+            semantic_hits=self._stats.semantic_hits,
+            by_model={model: dict(stats) for model, stats in self._stats.by_model.items()}
         )
 
     def clear_model(self, model: str) -> int:
         """Clear all cached responses for a model."""
         with self._lock:
-            if model in self._cache:
-                count = len(self._cache[model])
-                self._cache[model].clear()
-                return count
-            return 0
+            count = len(self._cache.get(model, ()))
+            self._cache.pop(model, None)
+            self._semantic.pop(model, None)
+            self._db_clear(model)
+            return count
 
     def clear_all(self) -> int:
         """Clear all cached responses."""
         with self._lock:
             total = sum(len(c) for c in self._cache.values())
-            for model_cache in self._cache.values():
-                model_cache.clear()
+            self._cache.clear()
+            self._semantic.clear()
+            self._db_clear()
             return total
 
 
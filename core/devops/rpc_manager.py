@@ -14,6 +14,8 @@ import random
 import aiohttp
 from aiohttp import ClientTimeout
 
+from core.metrics.latency_window import RollingLatencyWindow
+
 logger = logging.getLogger(__name__)
 
 
@@ -144,7 +146,7 @@ class RPCManager:
         # Metrics
         self.total_requests = 0
         self.total_failures = 0
-        self.request_latencies: List[float] = []
+        self.request_latencies = RollingLatencyWindow(window_size=1000)
 
     async def start(self):
         """Start the RPC manager"""
@@ -431,11 +433,7 @@ class RPCManager:
         endpoint.last_success = datetime.utcnow()
         endpoint.consecutive_failures = 0
         endpoint.latency_ms = (endpoint.latency_ms * 0.8) + (latency_ms * 0.2)  # EMA
-        self.request_latencies.append(latency_ms)
-
-        # Limit stored latencies
-        if len(self.request_latencies) > 1000:
-            self.request_latencies = self.request_latencies[-1000:]
+        self.request_latencies.record(latency_ms)
 
     async def _record_failure(self, endpoint: RPCEndpoint, error: str):
         """Record a failed request"""
@@ -470,10 +468,7 @@ class RPCManager:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get overall RPC stats"""
-        avg_latency = (
-            sum(self.request_latencies) / len(self.request_latencies)
-            if self.request_latencies else 0
-        )
+        avg_latency = self.request_latencies.average or 0
 
         return {
             "total_requests": self.total_requests,
@@ -484,8 +479,8 @@ class RPCManager:
             ),
             "average_latency_ms": avg_latency,
             "p99_latency_ms": (
-                sorted(self.request_latencies)[int(len(self.request_latencies) * 0.99)]
-                if len(self.request_latencies) >= 100 else avg_latency
+                self.request_latencies.p99
+                if self.request_latencies.count >= 100 else avg_latency
             ),
             "healthy_endpoints": len([
                 e for e in self.endpoints if e.status == EndpointStatus.HEALTHY
@@ -3,18 +3,21 @@ EventBus - Async event-driven architecture with backpressure and timeout handlin
 
 Addresses:
 - Issue #4: Hung tasks (via handler timeout wrapping)
+- Head-of-line blocking (sharded workers, concurrent handler fan-out)
 - Decoupling of components
 - Async/await pattern throughout
 """
 
 import asyncio
+import bisect
 import logging
+import time
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional, Dict, List, Any, Callable, Awaitable, Tuple
+from typing import Optional, Dict, List, Any, Callable, Awaitable, Tuple, Hashable
 
 logger = logging.getLogger("jarvis.event_bus")
 
@@ -65,6 +68,7 @@ class Event:
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
     source: str = ""  # Which component created this event
     expires_at: Optional[str] = None  # TTL for event
+    shard_key: Optional[Hashable] = None  # Events with the same key keep their order
 
     def is_expired(self) -> bool:
         """Check if event TTL has passed."""
@@ -90,6 +94,53 @@ class HandlerResult:
     trace_id: str = ""
 
 
+class _Histogram:
+    """Fixed-bucket histogram with approximate percentiles."""
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # Last bucket is +inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for i, n in enumerate(self.counts):
+            cumulative += n
+            if cumulative >= target:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets = {f"<={b:g}": n for b, n in zip(self.bounds, self.counts)}
+        buckets["+inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else 0.0,
+            "max": round(self.max, 3),
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "buckets": buckets,
+        }
+
+
+_LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+_DEPTH_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
 class EventHandler(ABC):
     """Abstract base for event handlers."""
 
@@ -121,7 +172,13 @@ class EventBus:
 
     Features:
     - Async queue with configurable size limits
-    - Priority-based event ordering
+    - Priority-based event ordering (within a shard)
+    - Sharded workers: events are routed by shard key (default: event type)
+      to one of num_workers queues, so ordering holds per key while a slow
+      handler only stalls its own shard
+    - Concurrent fan-out to the handlers of an event, with optional
+      per-handler concurrency limits
+    - Queue-depth and per-handler latency histograms in get_stats()
     - Handler timeout wrapping (prevents hung tasks)
     - Dead letter queue for failed events
     - Trace ID propagation
@@ -133,6 +190,9 @@ class EventBus:
         max_queue_size: int = 1000,
         handler_timeout: float = 30.0,
         dlq_retention: int = 100,
+        num_workers: int = 1,
+        shard_key: Optional[Callable[[Event], Hashable]] = None,
+        handler_concurrency: Optional[int] = None,
     ):
         """
         Initialize EventBus.
@@ -141,17 +201,34 @@ class EventBus:
             max_queue_size: Maximum events in queue (backpressure threshold)
             handler_timeout: Timeout for handler execution (seconds)
             dlq_retention: Max failed events to keep in dead letter queue
+            num_workers: Number of shard queues/workers
+            shard_key: Maps an event to its shard key when Event.shard_key is
+                unset (default: the event type)
+            handler_concurrency: Default max concurrent calls per handler
+                (None = unlimited)
         """
         self.max_queue_size = max_queue_size
         self.handler_timeout = handler_timeout
         self.dlq_retention = dlq_retention
+        self.num_workers = max(1, num_workers)
+        self.handler_concurrency = handler_concurrency
+        self._shard_key = shard_key
 
-        # Event queue (priority queue)
-        self._queue: asyncio.PriorityQueue[Tuple[int, Event]] = asyncio.PriorityQueue()
+        # One priority queue per shard
+        self._shards: List[asyncio.PriorityQueue] = [
+            asyncio.PriorityQueue() for _ in range(self.num_workers)
+        ]
 
         # Handlers by event type
         self._handlers: Dict[EventType, List[EventHandler]] = {}
 
+        # Per-handler concurrency limits (by handler name)
+        self._handler_limits: Dict[str, asyncio.Semaphore] = {}
+
+        # Histograms
+        self._queue_depth = _Histogram(_DEPTH_BUCKETS)
+        self._handler_latency: Dict[str, _Histogram] = {}
+
         # Dead letter queue for failed events
         self._dead_letter_queue: List[Tuple[Event, str]] = []
 
@@ -165,16 +242,46 @@ class EventBus:
 
         # Running flag
         self._running = False
-        self._consumer_task: Optional[asyncio.Task] = None
+        self._consumer_tasks: List[asyncio.Task] = []
+
+    def register_handler(
+        self,
+        handler: EventHandler,
+        event_types: List[EventType],
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        """
+        Register a handler for specific event types.
+
+        Args:
+            handler: Handler to register
+            event_types: Event types it receives
+            max_concurrency: Max concurrent calls to this handler across
+                shards (defaults to the bus-wide handler_concurrency)
+        """
+        limit = max_concurrency or self.handler_concurrency
+        if limit:
+            self._handler_limits[handler.name] = asyncio.Semaphore(limit)
 
-    def register_handler(self, handler: EventHandler, event_types: List[EventType]) -> None:
-        """Register a handler for specific event types."""
         for event_type in event_types:
             if event_type not in self._handlers:
                 self._handlers[event_type] = []
             self._handlers[event_type].append(handler)
             logger.debug(f"Registered handler {handler.name} for {event_type.value}")
 
+    def _shard_for(self, event: Event) -> int:
+        """Pick the shard queue for an event."""
+        if self.num_workers == 1:
+            return 0
+        key = event.shard_key
+        if key is None:
+            key = self._shard_key(event) if self._shard_key else event.event_type
+        return hash(key) % self.num_workers
+
+    def _pending(self) -> int:
+        """Events queued across all shards."""
+        return sum(q.qsize() for q in self._shards)
+
     async def emit(self, event: Event) -> bool:
         """
         Emit an event to the bus.
@@ -190,21 +297,23 @@ class EventBus:
 
         try:
             # Backpressure: wait if queue is full, but don't block forever
-            queue_full = self._queue.qsize() >= self.max_queue_size
+            pending = self._pending()
+            queue_full = pending >= self.max_queue_size
+            self._queue_depth.observe(pending)
 
             if queue_full:
                 logger.warning(
-                    f"EventBus queue full ({self._queue.qsize()}/{self.max_queue_size}), "
+                    f"EventBus queue full ({pending}/{self.max_queue_size}), "
                     f"blocking {event.event_type.value} (trace: {event.trace_id})"
                 )
 
             # Put with timeout to prevent permanent blocking
             try:
                 await asyncio.wait_for(
-                    self._queue.put((event.priority.value, event)),
+                    self._shards[self._shard_for(event)].put((event.priority.value, event)),
                     timeout=5.0  # 5 second timeout for queue operations
                 )
-                self._stats["queue_size"] = self._queue.qsize()
+                self._stats["queue_size"] = self._pending()
                 return True
             except asyncio.TimeoutError:
                 logger.error(f"Timeout queueing event {event.event_type.value} (queue full)")
@@ -216,75 +325,100 @@ class EventBus:
             return False
 
     async def _dispatch_event(self, event: Event) -> None:
-        """Dispatch event to all registered handlers."""
+        """Dispatch event to all registered handlers concurrently."""
         handlers = self._handlers.get(event.event_type, [])
 
         if not handlers:
             logger.debug(f"No handlers for {event.event_type.value} (trace: {event.trace_id})")
             return
 
-        for handler in handlers:
-            try:
-                # Wrap handler with timeout to prevent hung tasks
-                start = datetime.utcnow()
+        if len(handlers) == 1:
+            await self._run_handler(handlers[0], event)
+        else:
+            await asyncio.gather(*(self._run_handler(h, event) for h in handlers))
+
+    async def _run_handler(self, handler: EventHandler, event: Event) -> None:
+        """Run one handler under its concurrency limit."""
+        limit = self._handler_limits.get(handler.name)
+        if limit is None:
+            await self._invoke_handler(handler, event)
+        else:
+            async with limit:
+                await self._invoke_handler(handler, event)
+
+    async def _invoke_handler(self, handler: EventHandler, event: Event) -> None:
+        """Run one handler with timeout, stats and DLQ handling."""
+        try:
+            # Wrap handler with timeout to prevent hung tasks
+            start = time.perf_counter()
 
-                try:
-                    success, error = await asyncio.wait_for(
-                        handler.handle(event),
-                        timeout=self.handler_timeout
-                    )
-                except asyncio.TimeoutError:
-                    success = False
-                    error = f"Handler timeout ({self.handler_timeout}s)"
-                    self._stats["handler_timeouts"] += 1
-                    logger.error(
-                        f"Handler timeout: {handler.name} for {event.event_type.value} "
-                        f"(trace: {event.trace_id})"
-                    )
+            try:
+                success, error = await asyncio.wait_for(
+                    handler.handle(event),
+                    timeout=self.handler_timeout
+                )
+            except asyncio.TimeoutError:
+                success = False
+                error = f"Handler timeout ({self.handler_timeout}s)"
+                self._stats["handler_timeouts"] += 1
+                logger.error(
+                    f"Handler timeout: {handler.name} for {event.event_type.value} "
+                    f"(trace: {event.trace_id})"
+                )
 
-                duration_ms = (datetime.utcnow() - start).total_seconds() * 1000
+            duration_ms = (time.perf_counter() - start) * 1000
+            self._latency_for(handler.name).observe(duration_ms)
 
-                if success:
-                    self._stats["events_processed"] += 1
-                    logger.debug(
-                        f"Handler {handler.name} processed {event.event_type.value} "
-                        f"in {duration_ms:.1f}ms (trace: {event.trace_id})"
-                    )
-                else:
-                    self._stats["events_failed"] += 1
-                    self._dead_letter_queue.append((event, error or "Handler failed"))
-                    self._trim_dlq()
-                    logger.warning(
-                        f"Handler {handler.name} failed: {error} "
-                        f"(trace: {event.trace_id})"
-                    )
-            except Exception as e:
+            if success:
+                self._stats["events_processed"] += 1
+                logger.debug(
+                    f"Handler {handler.name} processed {event.event_type.value} "
+                    f"in {duration_ms:.1f}ms (trace: {event.trace_id})"
+                )
+            else:
                 self._stats["events_failed"] += 1
-                self._dead_letter_queue.append((event, f"Handler exception: {str(e)}"))
+                self._dead_letter_queue.append((event, error or "Handler failed"))
                 self._trim_dlq()
-                logger.error(
-                    f"Handler {handler.name} exception: {e} "
+                logger.warning(
+                    f"Handler {handler.name} failed: {error} "
                     f"(trace: {event.trace_id})"
                 )
-
-    async def _consumer(self) -> None:
-        """Consume events from queue and dispatch."""
-        logger.info("EventBus consumer started")
+        except Exception as e:
+            self._stats["events_failed"] += 1
+            self._dead_letter_queue.append((event, f"Handler exception: {str(e)}"))
+            self._trim_dlq()
+            logger.error(
+                f"Handler {handler.name} exception: {e} "
+                f"(trace: {event.trace_id})"
+            )
+
+    def _latency_for(self, handler_name: str) -> _Histogram:
+        histogram = self._handler_latency.get(handler_name)
+        if histogram is None:
+            histogram = self._handler_latency[handler_name] = _Histogram(_LATENCY_BUCKETS_MS)
+        return histogram
+
+    async def _consumer(self, shard: int = 0) -> None:
+        """Consume events from one shard queue and dispatch in order."""
+        queue = self._shards[shard]
+        logger.info(f"EventBus consumer {shard} started")
 
         while self._running:
             try:
                 # Get next event (with timeout to allow checking _running flag)
                 try:
                     _, event = await asyncio.wait_for(
-                        self._queue.get(),
+                        queue.get(),
                         timeout=1.0
                     )
                 except asyncio.TimeoutError:
                     continue
 
-                await self._dispatch_event(event)
-                self._queue.task_done()
-                self._stats["queue_size"] = self._queue.qsize()
+                try:
+                    await self._dispatch_event(event)
+                finally:
+                    queue.task_done()
+                self._stats["queue_size"] = self._pending()
             except Exception as e:
                 logger.error(f"Consumer error: {e}")
 
@@ -295,26 +429,32 @@ class EventBus:
             return
 
         self._running = True
-        self._consumer_task = asyncio.create_task(self._consumer())
-        logger.info("EventBus started")
+        self._consumer_tasks = [
+            asyncio.create_task(self._consumer(shard)) for shard in range(self.num_workers)
+        ]
+        logger.info(f"EventBus started with {self.num_workers} worker(s)")
 
     async def stop(self, timeout: float = 10.0) -> None:
         """Stop the event bus and wait for pending events."""
         if not self._running:
             return
 
-        logger.info(f"Stopping EventBus, waiting for {self._queue.qsize()} pending events")
+        logger.info(f"Stopping EventBus, waiting for {self._pending()} pending events")
 
         # Wait for pending events or timeout
         try:
-            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            await asyncio.wait_for(
+                asyncio.gather(*(q.join() for q in self._shards)),
+                timeout=timeout,
+            )
         except asyncio.TimeoutError:
-            logger.warning(f"EventBus shutdown timeout after {timeout}s, {self._queue.qsize()} events pending")
+            logger.warning(f"EventBus shutdown timeout after {timeout}s, {self._pending()} events pending")
 
         self._running = False
 
-        if self._consumer_task:
-            await self._consumer_task
+        if self._consumer_tasks:
+            await asyncio.gather(*self._consumer_tasks)
+            self._consumer_tasks = []
 
         logger.info("EventBus stopped")
 
@@ -331,10 +471,17 @@ class EventBus:
             "events_processed": self._stats["events_processed"],
             "events_failed": self._stats["events_failed"],
             "handler_timeouts": self._stats["handler_timeouts"],
-            "queue_size": self._queue.qsize(),
+            "queue_size": self._pending(),
             "dlq_size": len(self._dead_letter_queue),
             "max_queue_size": self.max_queue_size,
             "handler_timeout": self.handler_timeout,
+            "num_workers": self.num_workers,
+            "shard_queue_sizes": [q.qsize() for q in self._shards],
+            "queue_depth": self._queue_depth.to_dict(),
+            "handler_latency_ms": {
+                name: histogram.to_dict()
+                for name, histogram in self._handler_latency.items()
+            },
         }
 
     def get_dead_letter_queue(self) -> List[Dict[str, Any]]:
@@ -0,0 +1,207 @@
+"""
+Exit Intent Store
+=================
+
+SQLite (WAL) storage engine for exit intents.
+
+Each intent is one row keyed by id, with the full payload kept as JSON and
+``status``/``symbol`` promoted to indexed columns. Updating an intent touches
+a single row and the daemon's per-cycle "active intents" query only reads
+active rows, instead of re-parsing every historical intent.
+
+A legacy ``exit_intents.json`` is imported once on first open; the original
+file is kept alongside as ``exit_intents.json.migrated``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS exit_intents (
+    id          TEXT PRIMARY KEY,
+    status      TEXT NOT NULL,
+    symbol      TEXT NOT NULL DEFAULT '',
+    token_mint  TEXT NOT NULL DEFAULT '',
+    position_id TEXT NOT NULL DEFAULT '',
+    updated_at  REAL NOT NULL,
+    data        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_exit_intents_status ON exit_intents(status);
+CREATE INDEX IF NOT EXISTS idx_exit_intents_symbol ON exit_intents(symbol, status);
+CREATE TABLE IF NOT EXISTS exit_intents_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_UPSERT = """
+INSERT INTO exit_intents (id, status, symbol, token_mint, position_id, updated_at, data)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    status = excluded.status,
+    symbol = excluded.symbol,
+    token_mint = excluded.token_mint,
+    position_id = excluded.position_id,
+    updated_at = excluded.updated_at,
+    data = excluded.data
+"""
+
+_MIGRATED_KEY = "legacy_json_migrated"
+
+
+def _row_params(data: Dict[str, Any]) -> tuple:
+    return (
+        str(data["id"]),
+        str(data.get("status") or "active"),
+        str(data.get("symbol") or ""),
+        str(data.get("token_mint") or ""),
+        str(data.get("position_id") or ""),
+        time.time(),
+        json.dumps(data),
+    )
+
+
+class ExitIntentStore:
+    """Row-per-intent SQLite store with status and symbol indexes."""
+
+    def __init__(self, db_path: Path, legacy_json: Optional[Path] = None):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        if legacy_json is not None:
+            self.migrate_legacy_json(Path(legacy_json))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert(self, data: Dict[str, Any]) -> None:
+        """Insert or update a single intent row."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute(_UPSERT, _row_params(data))
+
+    def upsert_many(self, items: List[Dict[str, Any]]) -> None:
+        """Insert or update several intents in one transaction."""
+        if not items:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(_UPSERT, [_row_params(item) for item in items])
+
+    def delete(self, intent_id: str) -> bool:
+        with self._lock:
+            with self._conn:
+                cur = self._conn.execute("DELETE FROM exit_intents WHERE id = ?", (intent_id,))
+        return cur.rowcount > 0
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        result = []
+        for (data,) in rows:
+            try:
+                result.append(json.loads(data))
+            except json.JSONDecodeError:
+                logger.warning("[exit_intent_store] Skipping corrupt intent row")
+        return result
+
+    def get(self, intent_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._query("SELECT data FROM exit_intents WHERE id = ?", (intent_id,))
+        return rows[0] if rows else None
+
+    def by_status(self, status: str) -> List[Dict[str, Any]]:
+        return self._query(
+            "SELECT data FROM exit_intents WHERE status = ? ORDER BY rowid", (status,)
+        )
+
+    def by_symbol(self, symbol: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        if status is None:
+            return self._query(
+                "SELECT data FROM exit_intents WHERE symbol = ? ORDER BY rowid", (symbol,)
+            )
+        return self._query(
+            "SELECT data FROM exit_intents WHERE symbol = ? AND status = ? ORDER BY rowid",
+            (symbol, status),
+        )
+
+    def all(self) -> Dict[str, Dict[str, Any]]:
+        rows = self._query("SELECT data FROM exit_intents ORDER BY rowid")
+        return {str(row["id"]): row for row in rows}
+
+    def count(self, status: Optional[str] = None) -> int:
+        with self._lock:
+            if status is None:
+                row = self._conn.execute("SELECT COUNT(*) FROM exit_intents").fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM exit_intents WHERE status = ?", (status,)
+                ).fetchone()
+        return int(row[0])
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+
+    def migrate_legacy_json(self, path: Path) -> int:
+        """Import a legacy whole-file JSON store once. Returns rows imported."""
+        with self._lock:
+            done = self._conn.execute(
+                "SELECT value FROM exit_intents_meta WHERE key = ?", (_MIGRATED_KEY,)
+            ).fetchone()
+        if done:
+            return 0
+
+        items: List[Dict[str, Any]] = []
+        if path.exists():
+            try:
+                data = json.loads(path.read_text())
+            except (json.JSONDecodeError, IOError) as e:
+                logger.error(f"[exit_intent_store] Legacy intents unreadable, not migrated: {e}")
+                return 0
+            if isinstance(data, list):
+                data = {str(item.get("id") or idx): item for idx, item in enumerate(data)}
+            if isinstance(data, dict):
+                for key, item in data.items():
+                    if isinstance(item, dict):
+                        items.append({**item, "id": item.get("id") or key})
+            try:
+                shutil.copy2(path, path.with_name(path.name + ".migrated"))
+            except OSError as e:
+                logger.warning(f"[exit_intent_store] Could not back up legacy intents: {e}")
+
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(_UPSERT, [_row_params(item) for item in items])
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO exit_intents_meta (key, value) VALUES (?, ?)",
+                    (_MIGRATED_KEY, str(time.time())),
+                )
+        if items:
+            logger.info(f"[exit_intent_store] Migrated {len(items)} intents from {path}")
+        return len(items)
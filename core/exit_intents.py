@@ -3,7 +3,10 @@ Exit Intent System
 ==================
 
 Manages exit strategies (TP ladder, stop loss, time stops) for LUT micro-alpha
-and Jupiter Perps positions. Persists intents to disk for daemon enforcement.
+and Jupiter Perps positions. Persists intents to an indexed SQLite store
+(exit_intents.db) for daemon enforcement; exit_intents.json is kept as a
+snapshot of active intents for file-based readers, rewritten at most once
+per JSON_MIRROR_INTERVAL.
 
 Critical Safety Guarantee:
 - The moment a buy fills, the exit intent MUST be persisted to disk
@@ -27,10 +30,13 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
 import re
+import tempfile
+import threading
 import time
 import uuid
 
@@ -51,6 +57,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from core import strategy_scores
+from core.exit_intent_store import ExitIntentStore
 
 logger = logging.getLogger(__name__)
 
@@ -452,7 +459,7 @@ def create_perps_intent(
 
 
 # ============================================================================
-# Persistence (with file locking for concurrent daemon access)
+# Persistence (SQLite intent store, see core.exit_intent_store)
 # ============================================================================
 
 def _ensure_dir():
@@ -460,26 +467,104 @@ def _ensure_dir():
     TRADING_DIR.mkdir(parents=True, exist_ok=True)
 
 
+_store: Optional[ExitIntentStore] = None
+_store_lock = threading.Lock()
+
+# Keep exit_intents.json as a snapshot of active intents for file-based readers
+JSON_MIRROR_ENABLED = os.getenv("EXIT_INTENTS_JSON_MIRROR", "1").lower() not in ("0", "false", "no")
+# At most one mirror rewrite per interval; later updates are folded into a trailing write
+JSON_MIRROR_INTERVAL = float(os.getenv("EXIT_INTENTS_JSON_MIRROR_INTERVAL", "2.0"))
+
+_mirror_lock = threading.Lock()
+_mirror_pending = False
+_mirror_last_write = 0.0
+_mirror_timer: Optional[threading.Timer] = None
+
+
+def _get_store() -> ExitIntentStore:
+    """Open (or reuse) the intent store next to INTENTS_FILE, migrating legacy JSON."""
+    global _store
+    db_path = INTENTS_FILE.with_suffix(".db")
+    with _store_lock:
+        if _store is None or _store.db_path != db_path:
+            _ensure_dir()
+            if _store is not None:
+                _store.close()
+            _store = ExitIntentStore(db_path, legacy_json=INTENTS_FILE)
+        return _store
+
+
+def _write_json_mirror() -> None:
+    """Atomically rewrite exit_intents.json with the active intents only."""
+    try:
+        store = _get_store()
+        lock_path = INTENTS_FILE.with_name(INTENTS_FILE.name + ".lock")
+        with open(lock_path, "a") as lock:
+            # Daemons take turns, so an older snapshot never replaces a newer one
+            _lock_file(lock, exclusive=True)
+            try:
+                active = {item["id"]: item for item in store.by_status(IntentStatus.ACTIVE.value)}
+                fd, tmp = tempfile.mkstemp(dir=INTENTS_FILE.parent, prefix=INTENTS_FILE.name + ".", suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w") as f:
+                        json.dump(active, f, indent=2)
+                    os.replace(tmp, INTENTS_FILE)
+                except BaseException:
+                    if os.path.exists(tmp):
+                        os.unlink(tmp)
+                    raise
+            finally:
+                _unlock_file(lock)
+    except Exception as e:
+        logger.warning(f"[exit_intents] Failed to write JSON mirror: {e}")
+
+
+def _schedule_json_mirror() -> None:
+    """Mirror the store now, or once the debounce interval since the last write ends."""
+    global _mirror_pending, _mirror_timer
+    if not JSON_MIRROR_ENABLED:
+        return
+    with _mirror_lock:
+        _mirror_pending = True
+        if _mirror_timer is not None:
+            return  # The pending write will include this update
+        wait = _mirror_last_write + JSON_MIRROR_INTERVAL - time.monotonic()
+        if wait > 0:
+            _mirror_timer = threading.Timer(wait, flush_json_mirror)
+            _mirror_timer.daemon = True
+            _mirror_timer.start()
+            return
+    flush_json_mirror()
+
+
+def flush_json_mirror() -> None:
+    """Write any pending update to exit_intents.json now (also runs at exit)."""
+    global _mirror_pending, _mirror_last_write, _mirror_timer
+    with _mirror_lock:
+        if _mirror_timer is not None:
+            _mirror_timer.cancel()
+            _mirror_timer = None
+        if not _mirror_pending:
+            return
+        _mirror_pending = False
+        _mirror_last_write = time.monotonic()
+    _write_json_mirror()
+
+
+atexit.register(flush_json_mirror)
+
+
 def persist_intent(intent: ExitIntent) -> bool:
     """
     Persist exit intent to disk. CRITICAL: Call immediately after entry fills.
 
-    Uses file locking for safe concurrent access from multiple daemons.
+    Writes a single row in the SQLite intent store, which is safe for
+    concurrent access from multiple daemons.
     """
-    _ensure_dir()
-
     try:
-        # Load existing intents
-        intents = _load_all_intents()
-
-        # Update or add
-        intents[intent.id] = intent.to_dict()
-
-        # Write with lock
-        with open(INTENTS_FILE, "w") as f:
-            _lock_file(f, exclusive=True)
-            json.dump(intents, f, indent=2)
-            _unlock_file(f)
+        store = _get_store()
+        store.upsert(intent.to_dict())
+        _schedule_json_mirror()
 
         logger.info(f"[exit_intents] Persisted intent {intent.id} for {intent.symbol}")
         return True
@@ -489,46 +574,55 @@ def persist_intent(intent: ExitIntent) -> bool:
         return False
 
 
+def _parse_intents(rows: List[Dict[str, Any]]) -> List[ExitIntent]:
+    parsed = []
+    for intent_data in rows:
+        try:
+            parsed.append(ExitIntent.from_dict(intent_data))
+        except Exception as e:
+            logger.warning(f"[exit_intents] Failed to parse intent: {e}")
+    return parsed
+
+
 def load_active_intents() -> List[ExitIntent]:
     """Load all active exit intents."""
-    intents = _load_all_intents()
-    active = []
+    try:
+        rows = _get_store().by_status(IntentStatus.ACTIVE.value)
+    except Exception as e:
+        logger.error(f"[exit_intents] Failed to load active intents: {e}")
+        return []
+    return _parse_intents(rows)
 
-    for intent_data in intents.values():
-        if intent_data.get("status") == "active":
-            try:
-                active.append(ExitIntent.from_dict(intent_data))
-            except Exception as e:
-                logger.warning(f"[exit_intents] Failed to parse intent: {e}")
 
-    return active
+def load_intents_by_symbol(symbol: str, active_only: bool = True) -> List[ExitIntent]:
+    """Load intents for a symbol, optionally restricted to active ones."""
+    status = IntentStatus.ACTIVE.value if active_only else None
+    try:
+        rows = _get_store().by_symbol(symbol, status=status)
+    except Exception as e:
+        logger.error(f"[exit_intents] Failed to load intents for {symbol}: {e}")
+        return []
+    return _parse_intents(rows)
 
 
 def load_intent(intent_id: str) -> Optional[ExitIntent]:
     """Load a specific intent by ID."""
-    intents = _load_all_intents()
-    data = intents.get(intent_id)
+    try:
+        data = _get_store().get(intent_id)
+    except Exception as e:
+        logger.error(f"[exit_intents] Failed to load intent {intent_id}: {e}")
+        return None
     if data:
         return ExitIntent.from_dict(data)
     return None
 
 
 def _load_all_intents() -> Dict[str, Dict[str, Any]]:
-    """Load all intents from file."""
-    if not INTENTS_FILE.exists():
-        return {}
-
+    """Load all intents, including completed and cancelled history."""
     try:
-        with open(INTENTS_FILE, "r") as f:
-            _lock_file(f, exclusive=False)
-            data = json.load(f)
-            _unlock_file(f)
-            if isinstance(data, list):
-                return {str(item.get("id") or idx): item for idx, item in enumerate(data)}
-            if isinstance(data, dict):
-                return data
-            return {}
-    except (json.JSONDecodeError, IOError):
+        return _get_store().all()
+    except Exception as e:
+        logger.error(f"[exit_intents] Failed to load intents: {e}")
         return {}
 
 
@@ -80,6 +80,16 @@ from .cost_tracker import (
     track_llm_cost,
 )
 
+# Warm worker pool (long-lived CLI/LLM sessions)
+from .warm_worker import (
+    LLMWorkerError,
+    LLMQueueFull,
+    LLMSession,
+    StubSession,
+    ClaudeCLISession,
+    WarmWorkerPool,
+)
+
 # Expose pricing in a dict shape expected by integration tests:
 # {model: {"input": <usd_per_1m>, "output": <usd_per_1m>}}
 MODEL_PRICING = {
@@ -145,4 +155,12 @@ __all__ = [
     "MODEL_PRICING",
     "get_cost_tracker",
     "track_llm_cost",
+
+    # Warm workers
+    "LLMWorkerError",
+    "LLMQueueFull",
+    "LLMSession",
+    "StubSession",
+    "ClaudeCLISession",
+    "WarmWorkerPool",
 ]
@@ -0,0 +1,483 @@
+"""
+Warm LLM worker pool.
+
+Spawning the Claude CLI per reply pays process start-up, Node boot and
+re-sending the ~9k-char voice bible on every message. WarmWorkerPool keeps
+sessions started ahead of time instead:
+
+- Each session is started with the static system prompt (e.g. the voice
+  bible) once; requests only carry the per-message context
+- A used session is retired after ``turns_per_session`` requests and a
+  replacement is started in the background, so callers never wait on a
+  cold start (turns_per_session=1 keeps every reply in a fresh context)
+- Requests with the same key (e.g. a chat id) run in arrival order;
+  different keys run concurrently, bounded by the pool size
+- Latency, queue wait and queue depth are exposed via get_metrics()
+
+Backends:
+- ClaudeCLISession: long-lived ``claude --print`` process speaking
+  stream-json over stdin/stdout
+- StubSession: calls a local function; stands in for the model in tests
+
+Usage:
+    pool = WarmWorkerPool(lambda: ClaudeCLISession(cli_path, system_prompt=VOICE))
+    reply = await pool.submit(prompt, key=chat_id)
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import platform
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from core.metrics.latency_window import RollingLatencyWindow
+
+logger = logging.getLogger(__name__)
+
+
+class LLMWorkerError(Exception):
+    """A warm worker failed to produce a response."""
+
+
+class LLMQueueFull(LLMWorkerError):
+    """Too many requests are already waiting for a worker."""
+
+
+# =============================================================================
+# Sessions
+# =============================================================================
+
+class LLMSession(ABC):
+    """One warm model session. Subclasses implement _complete, optionally start/close."""
+
+    def __init__(self, system_prompt: str = ""):
+        self.system_prompt = system_prompt
+        self.turns = 0
+
+    async def start(self) -> None:  # noqa: B027 - optional hook, no-op by default
+        """Bring the session up so the first request does not pay for it."""
+
+    @property
+    def alive(self) -> bool:
+        return True
+
+    async def complete(self, prompt: str, timeout: float) -> str:
+        """Send one user message and return the model's reply."""
+        self.turns += 1
+        return await asyncio.wait_for(self._complete(prompt), timeout=timeout)
+
+    @abstractmethod
+    async def _complete(self, prompt: str) -> str:
+        """Send prompt to the model and return its reply."""
+
+    async def close(self) -> None:  # noqa: B027 - optional hook, no-op by default
+        """Release the session."""
+
+
+class StubSession(LLMSession):
+    """Session backed by a local function: fn(system_prompt, prompt) -> reply."""
+
+    def __init__(
+        self,
+        fn: Callable[[str, str], Union[str, Awaitable[str]]],
+        system_prompt: str = "",
+        start_delay: float = 0.0,
+    ):
+        super().__init__(system_prompt)
+        self.fn = fn
+        self.start_delay = start_delay
+        self.closed = False
+
+    async def start(self) -> None:
+        if self.start_delay:
+            await asyncio.sleep(self.start_delay)
+
+    @property
+    def alive(self) -> bool:
+        return not self.closed
+
+    async def _complete(self, prompt: str) -> str:
+        result = self.fn(self.system_prompt, prompt)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class ClaudeCLISession(LLMSession):
+    """Long-lived Claude CLI process using the stream-json protocol.
+
+    The system prompt is passed once at spawn via --system-prompt; each
+    request is one user message line on stdin, answered by a ``result``
+    event on stdout.
+    """
+
+    # Largest single stdout line (stream-json events can carry the full reply)
+    STREAM_LIMIT = 4 * 1024 * 1024
+
+    def __init__(
+        self,
+        cli_path: str,
+        system_prompt: str = "",
+        extra_args: Optional[List[str]] = None,
+        env: Optional[Dict[str, str]] = None,
+    ):
+        super().__init__(system_prompt)
+        self.cli_path = cli_path
+        self.extra_args = extra_args or []
+        self.env = env
+        self._process: Optional[asyncio.subprocess.Process] = None
+
+    def _command(self) -> List[str]:
+        args = [
+            self.cli_path,
+            "--print",
+            "--input-format", "stream-json",
+            "--output-format", "stream-json",
+            "--verbose",
+            "--no-session-persistence",
+        ]
+        if self.system_prompt:
+            args += ["--system-prompt", self.system_prompt]
+        args += self.extra_args
+        if platform.system() == "Windows":
+            # Only add --dangerously-skip-permissions on Windows (blocked on Linux root);
+            # run through cmd.exe for .cmd shims
+            args.insert(2, "--dangerously-skip-permissions")
+            args = ["cmd", "/c"] + args
+        return args
+
+    async def start(self) -> None:
+        self._process = await asyncio.create_subprocess_exec(
+            *self._command(),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=self.env or {**os.environ, "CI": "true"},  # Disable interactive prompts
+            limit=self.STREAM_LIMIT,
+        )
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def _complete(self, prompt: str) -> str:
+        if not self.alive:
+            raise LLMWorkerError("Claude CLI session is not running")
+
+        message = {"type": "user", "message": {"role": "user", "content": prompt}}
+        self._process.stdin.write((json.dumps(message) + "\n").encode("utf-8"))
+        await self._process.stdin.drain()
+
+        while True:
+            line = await self._process.stdout.readline()
+            if not line:
+                raise LLMWorkerError(f"Claude CLI exited (code {self._process.returncode})")
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if event.get("type") != "result":
+                continue
+            if event.get("is_error"):
+                raise LLMWorkerError(f"Claude CLI error: {str(event.get('result', ''))[:200]}")
+            return (event.get("result") or "").strip()
+
+    async def close(self) -> None:
+        process, self._process = self._process, None
+        if process is None or process.returncode is not None:
+            return
+        try:
+            process.stdin.close()
+            await asyncio.wait_for(process.wait(), timeout=2)
+        except (asyncio.TimeoutError, ConnectionError, OSError):
+            process.kill()
+            await process.wait()
+
+
+# =============================================================================
+# Pool
+# =============================================================================
+
+class WarmWorkerPool:
+    """Pool of pre-started LLM sessions with per-key ordering."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], LLMSession],
+        size: int = 2,
+        turns_per_session: int = 1,
+        request_timeout: float = 60.0,
+        max_queue: int = 64,
+        max_start_attempts: int = 3,
+    ):
+        """
+        Initialize worker pool.
+
+        Args:
+            session_factory: Builds a new (unstarted) session
+            size: Concurrent sessions (bounds in-flight requests)
+            turns_per_session: Requests served before a session is replaced
+            request_timeout: Seconds allowed per request, including queue wait
+            max_queue: Requests allowed to wait for a session before rejecting
+            max_start_attempts: Tries per session start (each bounded by
+                request_timeout) before giving up on it
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.session_factory = session_factory
+        self.size = size
+        self.turns_per_session = max(1, turns_per_session)
+        self.request_timeout = request_timeout
+        self.max_queue = max_queue
+        self.max_start_attempts = max(1, max_start_attempts)
+
+        self._idle: Optional[asyncio.Queue] = None
+        self._key_locks: Dict[Any, asyncio.Lock] = {}
+        self._key_waiters: Dict[Any, int] = {}
+        self._spawn_tasks: set = set()
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._start_error: Optional[Exception] = None
+        self._starting = 0
+        self._running = False
+
+        self._queued = 0
+        self._in_flight = 0
+        self.latency = RollingLatencyWindow(window_size=500)
+        self.queue_wait = RollingLatencyWindow(window_size=500)
+        self.counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "rejected": 0,
+            "sessions_started": 0,
+            "session_start_failures": 0,
+        }
+
+    # ==================== LIFECYCLE ====================
+
+    async def start(self) -> None:
+        """Start `size` sessions; later calls are no-ops once one is up.
+
+        Raises:
+            LLMWorkerError: no session could be started; the next call retries
+        """
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._running:
+                return
+            if self._idle is None:
+                self._idle = asyncio.Queue()
+            self._running = True
+            try:
+                await asyncio.gather(*(self._spawn() for _ in range(self.size - self._idle.qsize())))
+            except BaseException:
+                self._running = False
+                raise
+            if self._idle.empty():
+                self._running = False
+                raise LLMWorkerError(
+                    f"No warm LLM session could be started: {self._start_error}"
+                ) from self._start_error
+            logger.info(f"Warm LLM pool ready ({self._idle.qsize()}/{self.size} sessions)")
+
+    async def close(self) -> None:
+        """Stop replacing sessions and close the idle ones."""
+        self._running = False
+        for task in list(self._spawn_tasks):
+            task.cancel()
+        if self._idle is not None:
+            while not self._idle.empty():
+                await self._idle.get_nowait().close()
+
+    async def _spawn(self) -> bool:
+        """Start one session and add it to the idle queue.
+
+        Retries with backoff up to max_start_attempts times; returns False
+        (leaving the error in _start_error) if every attempt failed.
+        """
+        delay = 1.0
+        self._starting += 1
+        try:
+            for attempt in range(1, self.max_start_attempts + 1):
+                if not self._running:
+                    return False
+                session = self.session_factory()
+                try:
+                    await asyncio.wait_for(session.start(), timeout=self.request_timeout)
+                except asyncio.TimeoutError:
+                    self._start_error = LLMWorkerError(
+                        f"session start timed out after {self.request_timeout:.0f}s"
+                    )
+                except Exception as e:
+                    self._start_error = e
+                else:
+                    self._start_error = None
+                    self.counters["sessions_started"] += 1
+                    self._idle.put_nowait(session)
+                    return True
+
+                self.counters["session_start_failures"] += 1
+                await self._close_quietly(session)
+                if attempt == self.max_start_attempts:
+                    logger.error(
+                        f"Warm LLM session failed to start after {attempt} attempts: {self._start_error}"
+                    )
+                    return False
+                logger.warning(
+                    f"Warm LLM session failed to start: {self._start_error}; retrying in {delay:.0f}s"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+            return False
+        finally:
+            self._starting -= 1
+
+    def _replace(self, session: Optional[LLMSession]) -> None:
+        """Retire a session (if any) and start its replacement in the background."""
+        task = asyncio.ensure_future(self._retire(session))
+        self._spawn_tasks.add(task)
+        task.add_done_callback(self._spawn_tasks.discard)
+
+    async def _retire(self, session: Optional[LLMSession]) -> None:
+        if session is not None:
+            await self._close_quietly(session)
+        await self._spawn()
+
+    @staticmethod
+    async def _close_quietly(session: LLMSession) -> None:
+        try:
+            await session.close()
+        except Exception as e:
+            logger.debug(f"Warm LLM session close failed: {e}")
+
+    # ==================== REQUESTS ====================
+
+    async def submit(self, prompt: str, key: Any = None) -> str:
+        """
+        Run a prompt on a warm session.
+
+        Requests sharing `key` complete in submission order.
+
+        Raises:
+            LLMQueueFull: max_queue requests are already waiting
+            LLMWorkerError: the session failed or the request timed out
+        """
+        start = time.perf_counter()
+        deadline = start + self.request_timeout
+        if not self._running:
+            # Startup counts against this request's deadline; raising lets the
+            # caller fall back instead of waiting on a CLI that will not come up
+            await self._wait(self.start(), deadline, "Timed out starting warm LLM sessions")
+        if self._queued >= self.max_queue:
+            self.counters["rejected"] += 1
+            raise LLMQueueFull(f"{self._queued} requests already queued")
+
+        self.counters["submitted"] += 1
+        self._queued += 1
+        waiting = True
+        lock = self._acquire_key(key)
+        try:
+            await self._wait(lock.acquire(), deadline, "Timed out behind earlier requests for this key")
+            try:
+                session = await self._checkout(deadline)
+                self._queued -= 1
+                waiting = False
+                self.queue_wait.record((time.perf_counter() - start) * 1000)
+                return await self._run(session, prompt, deadline, start)
+            finally:
+                lock.release()
+        finally:
+            if waiting:
+                self._queued -= 1
+            self._release_key(key)
+
+    async def _wait(self, awaitable: Awaitable, deadline: float, message: str) -> Any:
+        try:
+            return await asyncio.wait_for(awaitable, timeout=max(deadline - time.perf_counter(), 0.001))
+        except asyncio.TimeoutError as e:
+            self.counters["timeouts"] += 1
+            raise LLMWorkerError(message) from e
+
+    async def _checkout(self, deadline: float) -> LLMSession:
+        if self._idle.empty() and self._start_error is not None:
+            # Sessions are failing to start; don't make callers wait out the
+            # timeout. Keep one bounded start attempt going so the pool recovers.
+            if not self._starting:
+                self._replace(None)
+            raise LLMWorkerError(f"No warm LLM session available: {self._start_error}")
+        session = await self._wait(self._idle.get(), deadline, "Timed out waiting for a warm LLM session")
+        if not session.alive:
+            self._replace(session)
+            if not session.turns:
+                # Exited right after start (bad flags, auth); treat as a start failure
+                self._start_error = LLMWorkerError("session exited before its first request")
+                self.counters["session_start_failures"] += 1
+                raise self._start_error
+            # Died while idle (crash, OOM); take another one
+            return await self._checkout(deadline)
+        return session
+
+    async def _run(self, session: LLMSession, prompt: str, deadline: float, start: float) -> str:
+        self._in_flight += 1
+        healthy = False
+        try:
+            reply = await session.complete(prompt, timeout=max(deadline - time.perf_counter(), 0.001))
+            healthy = True
+            self.counters["completed"] += 1
+            self.latency.record((time.perf_counter() - start) * 1000)
+            return reply
+        except asyncio.TimeoutError as e:
+            self.counters["timeouts"] += 1
+            self.counters["failed"] += 1
+            raise LLMWorkerError(f"LLM request timed out after {self.request_timeout:.0f}s") from e
+        except LLMWorkerError:
+            self.counters["failed"] += 1
+            raise
+        except Exception as e:
+            self.counters["failed"] += 1
+            raise LLMWorkerError(str(e)) from e
+        finally:
+            self._in_flight -= 1
+            if healthy and session.alive and session.turns < self.turns_per_session:
+                self._idle.put_nowait(session)
+            else:
+                self._replace(session)
+
+    def _acquire_key(self, key: Any) -> asyncio.Lock:
+        if key is None:
+            return asyncio.Lock()  # Unkeyed requests are unordered
+        self._key_waiters[key] = self._key_waiters.get(key, 0) + 1
+        return self._key_locks.setdefault(key, asyncio.Lock())
+
+    def _release_key(self, key: Any) -> None:
+        if key is None:
+            return
+        self._key_waiters[key] -= 1
+        if not self._key_waiters[key]:
+            del self._key_waiters[key]
+            del self._key_locks[key]
+
+    # ==================== METRICS ====================
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Pool counters plus latency and queue-wait percentiles (ms)."""
+        return {
+            **self.counters,
+            "size": self.size,
+            "idle_sessions": self._idle.qsize() if self._idle is not None else 0,
+            "queued": self._queued,
+            "in_flight": self._in_flight,
+            "latency_p50_ms": self.latency.p50,
+            "latency_p95_ms": self.latency.p95,
+            "queue_wait_p50_ms": self.queue_wait.p50,
+            "queue_wait_p95_ms": self.queue_wait.p95,
+        }
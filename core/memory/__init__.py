@@ -47,6 +47,10 @@ from core.memory.pg_vector import (
     VectorSearchResult,
     get_pg_vector_store,
 )
+from core.memory.vector_index import (
+    LocalVectorIndex,
+    get_local_vector_index,
+)
 from core.memory.hybrid_search import (
     hybrid_search,
     HybridSearchResult,
@@ -220,6 +224,9 @@ __all__ = [
     "PostgresVectorStore",
     "VectorSearchResult",
     "get_pg_vector_store",
+    # Local vector index (vector_index.py)
+    "LocalVectorIndex",
+    "get_local_vector_index",
     # Hybrid search (hybrid_search.py)
     "hybrid_search",
     "HybridSearchResult",
@@ -2,14 +2,15 @@
 
 RRF (Reciprocal Rank Fusion) merges ranked lists from different sources:
 - FTS5: Fast keyword-based BM25 search (SQLite)
-- Vector: Semantic similarity search (PostgreSQL pgvector)
+- Vector: Semantic similarity search (PostgreSQL pgvector, or the local
+  memory-mapped index in vector_index.py when PostgreSQL is unavailable)
 
 Formula: RRF_score = Σ 1 / (k + rank_i) for each source
 Default k=60 (standard RRF constant)
 
 Benefits:
 - Best of both: keyword precision + semantic understanding
-- Graceful degradation: works with just FTS5 if PostgreSQL unavailable
+- Graceful degradation: local vector index, then FTS5-only if no embeddings
 - Proven effectiveness: used by search engines, RAG systems
 """
 import logging
@@ -18,6 +19,8 @@ from dataclasses import dataclass
 
 from .search import search_facts, TimeFilter, SourceFilter
 from .pg_vector import get_pg_vector_store, VectorSearchResult
+from .vector_index import get_local_vector_index
+from .database import get_db
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +61,8 @@ def hybrid_search(
     Args:
         query: Search query string.
         query_embedding: Optional pre-computed query embedding (1024-dim BGE vector).
-                         If None and PostgreSQL available, will skip vector search.
+                         If None, vector search is skipped. Searched against
+                         PostgreSQL when available, otherwise the local index.
         limit: Maximum results to return.
         time_filter: Temporal filter ('all', 'today', 'week', 'month', 'quarter', 'year').
         source: Filter by source system.
@@ -71,7 +75,8 @@ def hybrid_search(
 
     Returns:
         Dict with 'results' (HybridSearchResult list), 'count', 'query', 'elapsed_ms',
-        'mode' (hybrid|fts-only), 'fts_count', 'vector_count'.
+        'mode' (hybrid|fts-only), 'fts_count', 'vector_count',
+        'vector_backend' (postgres|local|None).
 
     Example:
         # With embedding
@@ -96,8 +101,9 @@ def hybrid_search(
     fts_facts = fts_results["results"]
     fts_count = len(fts_facts)
 
-    # 2. Vector search (if embedding provided and PostgreSQL available)
+    # 2. Vector search (if embedding provided): PostgreSQL, else local index
     vector_results: List[VectorSearchResult] = []
+    vector_backend = None
     pg_store = get_pg_vector_store()
 
     if query_embedding and pg_store.is_available():
@@ -106,6 +112,15 @@ def hybrid_search(
             limit=limit * 2,  # Get more candidates for RRF
             similarity_threshold=0.3,  # Filter low-similarity matches
         )
+        vector_backend = "postgres"
+    elif query_embedding:
+        vector_results = _local_vector_search(
+            query_embedding=query_embedding,
+            limit=limit * 2,
+            similarity_threshold=0.3,
+            exclude_assistant_outputs=exclude_assistant_outputs,
+        )
+        vector_backend = "local" if vector_results else None
 
     vector_count = len(vector_results)
 
@@ -149,9 +164,78 @@ def hybrid_search(
         "mode": mode,
         "fts_count": fts_count,
         "vector_count": vector_count,
+        "vector_backend": vector_backend,
     }
 
 
+def _local_vector_search(
+    query_embedding: List[float],
+    limit: int,
+    similarity_threshold: float,
+    exclude_assistant_outputs: bool,
+) -> List[VectorSearchResult]:
+    """
+    Vector search against the local fact index (no PostgreSQL needed).
+
+    Matches are hydrated from the SQLite facts table so they carry the same
+    metadata as pgvector results. Inactive or deleted facts are dropped.
+
+    Args:
+        query_embedding: Query vector.
+        limit: Maximum results.
+        similarity_threshold: Minimum cosine similarity.
+        exclude_assistant_outputs: Drop facts marked as assistant outputs.
+
+    Returns:
+        List of VectorSearchResult ordered by similarity.
+    """
+    index = get_local_vector_index()
+    if not index.is_available() or len(index) == 0:
+        return []
+
+    try:
+        # Over-fetch: some hits may be inactive facts
+        matches = index.search(query_embedding, limit * 2, similarity_threshold)
+    except ValueError as e:
+        logger.warning(f"Local vector search skipped: {e}")
+        return []
+
+    if not matches:
+        return []
+
+    fact_ids = [fact_id for fact_id, _ in matches]
+    sql = f"""
+        SELECT id, content, context, source, confidence, timestamp
+        FROM facts
+        WHERE id IN ({",".join("?" * len(fact_ids))}) AND is_active = 1
+    """
+    if exclude_assistant_outputs:
+        sql += " AND is_assistant_output = 0"
+
+    conn = get_db()._get_connection()
+    rows = {row["id"]: row for row in conn.execute(sql, fact_ids).fetchall()}
+
+    results = []
+    for fact_id, score in matches:
+        row = rows.get(fact_id)
+        if row is None:
+            continue
+        results.append(VectorSearchResult(
+            content=row["content"],
+            score=score,
+            metadata={
+                "fact_id": row["id"],
+                "context": row["context"],
+                "source": row["source"],
+                "confidence": row["confidence"],
+                "created_at": str(row["timestamp"] or ""),
+            },
+        ))
+        if len(results) >= limit:
+            break
+    return results
+
+
 def _rrf_merge(
     fts_facts: List[Dict[str, Any]],
     vector_results: List[VectorSearchResult],
@@ -3,7 +3,7 @@ Long-term Memory Persistence - Durable storage for memories with semantic retrie
 
 Features:
 - SQLite-based persistent storage
-- Embedding-based semantic search
+- Embedding-based semantic search (local memory-mapped vector index)
 - Memory consolidation and summarization
 - Knowledge graph relationships
 - Importance scoring and decay
@@ -21,6 +21,8 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 import uuid
 
+from core.memory.vector_index import LocalVectorIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -120,6 +122,12 @@ class MemoryStore:
         self.db_path = Path(db_path)
         self._embedding_fn = embedding_fn
         self._conn: Optional[sqlite3.Connection] = None
+        # Vector index lives beside the DB: memory.db -> memory_vectors/
+        self._index: Optional[LocalVectorIndex] = None
+        if str(db_path) != ":memory:":
+            index = LocalVectorIndex(self.db_path.parent / f"{self.db_path.stem}_vectors")
+            if index.is_available():
+                self._index = index
 
     async def initialize(self) -> None:
         """Initialize the database schema."""
@@ -176,8 +184,44 @@ class MemoryStore:
             );
         """)
         self._conn.commit()
+        self._sync_index()
         logger.info(f"Initialized memory store at {self.db_path}")
 
+    def _sync_index(self) -> None:
+        """Rebuild the vector index if it is out of step with the DB."""
+        if self._index is None:
+            return
+
+        indexed = self._conn.execute(
+            "SELECT COUNT(*) FROM memories WHERE embedding IS NOT NULL AND is_archived = 0"
+        ).fetchone()[0]
+        if indexed == len(self._index):
+            return
+
+        logger.info(f"Rebuilding vector index for {self.db_path} ({indexed} embeddings)")
+        self._index.clear()
+        cursor = self._conn.execute(
+            "SELECT id, embedding FROM memories WHERE embedding IS NOT NULL AND is_archived = 0"
+        )
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                break
+            items = []
+            for row in rows:
+                try:
+                    items.append((row["id"], json.loads(row["embedding"].decode())))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+            try:
+                self._index.add_many(items)
+            except ValueError as e:
+                # Mixed embedding dims: fall back to the scan
+                logger.warning(f"Vector index disabled for {self.db_path}: {e}")
+                self._index.clear()
+                self._index = None
+                return
+
     async def close(self) -> None:
         """Close the database connection."""
         if self._conn:
@@ -227,6 +271,15 @@ class MemoryStore:
         ))
         self._conn.commit()
 
+        if self._index is not None:
+            if memory.embedding:
+                try:
+                    self._index.add(memory.id, memory.embedding)
+                except ValueError as e:
+                    logger.warning(f"Embedding for {memory.id} not indexed: {e}")
+            else:
+                self._index.remove(memory.id)
+
         logger.debug(f"Saved memory {memory.id}: {memory.content[:50]}...")
         return memory.id
 
@@ -336,6 +389,9 @@ class MemoryStore:
             logger.error(f"Failed to generate query embedding: {e}")
             return await self.search(query, limit=limit)
 
+        if self._index is not None and len(query_embedding) == self._index.dim:
+            return self._search_index(query_embedding, limit, threshold)
+
         results = []
         cursor = self._conn.execute(
             "SELECT * FROM memories WHERE embedding IS NOT NULL AND is_archived = 0"
@@ -359,6 +415,34 @@ class MemoryStore:
         results.sort(key=lambda r: r.relevance_score, reverse=True)
         return results[:limit]
 
+    def _search_index(
+        self,
+        query_embedding: List[float],
+        limit: int,
+        threshold: float,
+    ) -> List[MemorySearchResult]:
+        """Top-k semantic search via the vector index, hydrated from SQLite."""
+        matches = self._index.search(query_embedding, limit, threshold)
+        if not matches:
+            return []
+
+        ids = [memory_id for memory_id, _ in matches]
+        cursor = self._conn.execute(
+            f"SELECT * FROM memories WHERE id IN ({','.join('?' * len(ids))}) AND is_archived = 0",
+            ids,
+        )
+        memories = {row["id"]: self._row_to_memory(row) for row in cursor.fetchall()}
+
+        return [
+            MemorySearchResult(
+                memory=memories[memory_id],
+                relevance_score=similarity,
+                match_type="semantic",
+            )
+            for memory_id, similarity in matches
+            if memory_id in memories
+        ]
+
     async def get_related(
         self,
         memory_id: str,
@@ -424,6 +508,9 @@ class MemoryStore:
         )
         self._conn.commit()
 
+        if self._index is not None:
+            self._index.remove(memory_id)
+
         return cursor.rowcount > 0
 
     async def archive(self, memory_id: str) -> bool:
@@ -435,6 +522,10 @@ class MemoryStore:
             "UPDATE memories SET is_archived = 1 WHERE id = ?", (memory_id,)
         )
         self._conn.commit()
+
+        if self._index is not None:
+            self._index.remove(memory_id)
+
         return cursor.rowcount > 0
 
     async def consolidate(
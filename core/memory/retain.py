@@ -1,10 +1,14 @@
 """Retain functions for storing facts and preferences in memory."""
+import logging
 import sqlite3
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
 from .database import get_db
 from .markdown_sync import sync_fact_to_markdown, extract_entities_from_text
+from .vector_index import get_local_vector_index
+
+logger = logging.getLogger(__name__)
 
 
 def get_or_create_entity(
@@ -85,6 +89,7 @@ def retain_fact(
     confidence: float = 1.0,
     auto_extract_entities: bool = True,
     is_assistant_output: bool = False,
+    embedding: Optional[List[float]] = None,
 ) -> int:
     """
     Store a fact in both SQLite and daily Markdown log.
@@ -101,6 +106,8 @@ def retain_fact(
         auto_extract_entities: Auto-extract entities from content if none provided.
         is_assistant_output: Whether this fact is from assistant response (for echo chamber prevention).
                             Default False. Set True for LLM responses to exclude from recall.
+        embedding: Optional pre-computed embedding, added to the local vector index
+                   so hybrid_search has semantic recall without PostgreSQL.
 
     Returns:
         The fact ID.
@@ -169,6 +176,13 @@ def retain_fact(
         timestamp=timestamp,
     )
 
+    # 4. Index embedding locally (outside transaction - file I/O)
+    if embedding:
+        try:
+            get_local_vector_index().add(fact_id, embedding)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to index embedding for fact {fact_id}: {e}")
+
     return fact_id
 
 
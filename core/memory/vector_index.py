@@ -0,0 +1,614 @@
+"""Local persistent vector index for semantic search without PostgreSQL.
+
+Stores embeddings beside the SQLite memory DB as:
+- vectors.f32: contiguous float32 matrix (unit-normalized rows), appended
+  incrementally and memory-mapped read-only for search
+- keys.jsonl: append-only log of row adds/deletes (key <-> row mapping)
+- meta.json: dimension and generation (bumped when rows are renumbered)
+- ivf.npz: optional inverted-file layer (k-means centroids + row lists)
+- index.lock: flock sidecar shared by every process using the directory
+
+Search is an exact BLAS dot product over the mapped matrix. When an IVF
+layer is enabled (ivf_lists) and the index is large enough, only the rows
+of the n_probe nearest centroids plus rows added since training are
+scored. Training runs after writes, never inside search.
+
+Several processes may share one directory. Writes hold the lock file
+exclusively and searches hold it shared; before either, the index replays
+log entries other processes appended and reloads everything when the
+generation changes (compact/clear), so it never maps rows it does not
+know about. Without fcntl (Windows) only in-process locking applies.
+
+Graceful fallback: without numpy the index reports unavailable and callers
+keep their previous behaviour.
+"""
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+# Rows per IVF list before training is worthwhile (faiss rule of thumb)
+_MIN_ROWS_PER_LIST = 39
+
+# Rewrite the matrix once this fraction of rows is deleted
+_COMPACT_DELETED_FRACTION = 0.25
+
+
+class LocalVectorIndex:
+    """Append-only, memory-mapped float32 vector index with optional IVF."""
+
+    def __init__(
+        self,
+        directory: Path,
+        ivf_lists: Optional[int] = None,
+        n_probe: int = 8,
+    ):
+        """
+        Open (or create) an index directory.
+
+        Args:
+            directory: Directory holding the index files.
+            ivf_lists: Number of IVF clusters. None keeps search exact.
+            n_probe: Clusters scanned per query when IVF is active.
+        """
+        self.directory = Path(directory)
+        self.ivf_lists = ivf_lists
+        self.n_probe = n_probe
+
+        self._lock = threading.RLock()
+        self._file_lock_depth = 0
+        self._reset()
+
+        if NUMPY_AVAILABLE and self.directory.exists():
+            with self._locked(exclusive=False):
+                self._load()
+
+    def _reset(self) -> None:
+        """Forget all in-memory state (files are untouched)."""
+        self._dim: Optional[int] = None
+        self._generation = 0
+        self._meta_sig = None  # stat of meta.json when last read
+        self._log_offset = 0  # bytes of keys.jsonl applied
+        self._keys: List[Optional[Hashable]] = []  # row -> key (None = deleted)
+        self._rows: Dict[Hashable, int] = {}  # key -> live row
+        self._deleted = 0
+        self._matrix = None  # cached memmap, dropped on append
+        self._alive = None  # cached bool mask
+
+        # IVF state
+        self._centroids = None
+        self._lists: List[Any] = []
+        self._trained_rows = 0
+        self._ivf_sig = None
+
+    # ------------------------------------------------------------------
+    # Paths / persistence
+    # ------------------------------------------------------------------
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.directory / "vectors.f32"
+
+    @property
+    def _log_path(self) -> Path:
+        return self.directory / "keys.jsonl"
+
+    @property
+    def _meta_path(self) -> Path:
+        return self.directory / "meta.json"
+
+    @property
+    def _ivf_path(self) -> Path:
+        return self.directory / "ivf.npz"
+
+    @property
+    def _lock_path(self) -> Path:
+        return self.directory / "index.lock"
+
+    @contextmanager
+    def _locked(self, exclusive: bool = True):
+        """
+        Hold the in-process lock and the directory's lock file.
+
+        Only the outermost call takes the flock (a second flock from this
+        process would wait on itself), so nested calls inherit its mode.
+        """
+        with self._lock:
+            if not HAS_FCNTL or self._file_lock_depth:
+                self._file_lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._file_lock_depth -= 1
+                return
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self._lock_path, "a") as f:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                self._file_lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._file_lock_depth -= 1
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _load(self) -> None:
+        """Read meta, replay the key log and reconcile it with the vector file."""
+        self._reset()
+        self._meta_sig = _file_signature(self._meta_path)
+        if self._meta_sig is None:
+            return
+
+        try:
+            meta = json.loads(self._meta_path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Vector index meta unreadable, starting empty: {e}")
+            return
+        self._generation = int(meta.get("generation", 0))
+        if meta.get("dim") is None:
+            return  # Cleared
+        self._dim = int(meta["dim"])
+
+        self._replay_log()
+
+        # A crash between writing a vector and logging it leaves extra rows,
+        # which are never mapped; the next append truncates them
+        row_bytes = 4 * self._dim
+        stored_rows = self._vectors_path.stat().st_size // row_bytes if self._vectors_path.exists() else 0
+        if stored_rows < len(self._keys):
+            logger.warning("Vector index log ahead of vector file, ignoring unbacked rows")
+            for row in range(stored_rows, len(self._keys)):
+                self._drop_row(row)
+
+        self._load_ivf()
+        logger.debug(f"Loaded vector index {self.directory}: {len(self)} vectors")
+
+    def _replay_log(self) -> None:
+        """Apply complete key-log lines written since the last replay."""
+        try:
+            size = self._log_path.stat().st_size
+        except FileNotFoundError:
+            return
+        if size <= self._log_offset:
+            return
+
+        with open(self._log_path, "rb") as f:
+            f.seek(self._log_offset)
+            data = f.read(size - self._log_offset)
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break  # Torn final line from a crash
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            if entry.get("op") == "add":
+                self._append_key(entry["key"])
+            elif entry.get("op") == "del":
+                self._drop_row(entry["row"])
+            self._log_offset += len(line)
+        self._alive = None
+
+    def _refresh(self) -> None:
+        """
+        Catch up with other processes (caller holds the lock file).
+
+        A rewritten meta.json means rows may have been renumbered, so the
+        index reloads; otherwise only new log lines are applied.
+        """
+        if _file_signature(self._meta_path) != self._meta_sig:
+            self._load()
+            return
+        if self._dim is None:
+            return
+        self._replay_log()
+        if self.ivf_lists and _file_signature(self._ivf_path) != self._ivf_sig:
+            self._load_ivf()
+
+    def _write_meta(self) -> None:
+        tmp = self._meta_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"dim": self._dim, "generation": self._generation}))
+        tmp.replace(self._meta_path)
+        self._meta_sig = _file_signature(self._meta_path)
+
+    def _append_log(self, entries: List[Dict[str, Any]]) -> None:
+        data = "".join(json.dumps(entry) + "\n" for entry in entries).encode("utf-8")
+        with open(self._log_path, "ab") as f:
+            f.truncate(self._log_offset)  # Drop a torn line left by a crash
+            f.write(data)
+        self._log_offset += len(data)
+
+    def _append_key(self, key: Hashable) -> None:
+        key = _normalize_key(key)
+        old_row = self._rows.get(key)
+        if old_row is not None:
+            self._keys[old_row] = None
+            self._deleted += 1
+        self._rows[key] = len(self._keys)
+        self._keys.append(key)
+
+    def _drop_row(self, row: int) -> None:
+        if 0 <= row < len(self._keys) and self._keys[row] is not None:
+            key = self._keys[row]
+            if self._rows.get(key) == row:
+                del self._rows[key]
+            self._keys[row] = None
+            self._deleted += 1
+
+    def _load_ivf(self) -> None:
+        self._centroids = None
+        self._lists = []
+        self._trained_rows = 0
+        self._ivf_sig = _file_signature(self._ivf_path)
+        if not self.ivf_lists or self._ivf_sig is None:
+            return
+        try:
+            data = np.load(self._ivf_path)
+            centroids = data["centroids"]
+            assignments = data["assignments"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"IVF layer unreadable, will retrain: {e}")
+            return
+        if centroids.shape[1] != self._dim or len(assignments) > len(self._keys):
+            return
+        self._set_ivf(centroids, assignments)
+
+    def _set_ivf(self, centroids, assignments) -> None:
+        self._centroids = centroids
+        self._trained_rows = len(assignments)
+        order = np.argsort(assignments, kind="stable")
+        bounds = np.searchsorted(assignments[order], np.arange(len(centroids) + 1))
+        self._lists = [order[bounds[i]:bounds[i + 1]] for i in range(len(centroids))]
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def is_available(self) -> bool:
+        """True if numpy is installed and the index can be used."""
+        return NUMPY_AVAILABLE
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return _normalize_key(key) in self._rows
+
+    @property
+    def dim(self) -> Optional[int]:
+        return self._dim
+
+    def add(self, key: Hashable, embedding: List[float]) -> None:
+        """Add or replace the vector for key."""
+        self.add_many([(key, embedding)])
+
+    def add_many(self, items: Iterable[Tuple[Hashable, List[float]]]) -> int:
+        """
+        Append vectors in one write. Existing keys are replaced.
+
+        Returns:
+            Number of vectors written.
+        """
+        if not NUMPY_AVAILABLE:
+            return 0
+
+        items = list(items)
+        if not items:
+            return 0
+
+        vectors = np.asarray([v for _, v in items], dtype=np.float32)
+        if vectors.ndim != 2:
+            raise ValueError("Embeddings must be equal-length sequences")
+
+        with self._locked():
+            self._refresh()
+            if self._dim is None:
+                self._dim = vectors.shape[1]
+                self._write_meta()
+            elif vectors.shape[1] != self._dim:
+                raise ValueError(f"Embedding dim {vectors.shape[1]} != index dim {self._dim}")
+
+            vectors = _normalize_rows(vectors)
+            entries = [{"op": "add", "key": key} for key, _ in items]
+            with open(self._vectors_path, "ab") as f:
+                # Unlogged rows from a crash are dropped; missing ones become
+                # zero rows, deleted in the log so every process agrees
+                stored_rows = f.tell() // (4 * self._dim)
+                f.truncate(len(self._keys) * 4 * self._dim)
+                f.write(vectors.tobytes())
+            entries[:0] = [{"op": "del", "row": row} for row in range(stored_rows, len(self._keys))]
+            self._append_log(entries)
+            for key, _ in items:
+                self._append_key(key)
+
+            self._matrix = None
+            self._alive = None
+            self._maybe_compact()
+
+        self._maybe_train()
+        return len(items)
+
+    def remove(self, key: Hashable) -> bool:
+        """Delete the vector for key. Returns False if it was not indexed."""
+        if not NUMPY_AVAILABLE:
+            return False
+
+        with self._locked():
+            self._refresh()
+            row = self._rows.get(_normalize_key(key))
+            if row is None:
+                return False
+            self._append_log([{"op": "del", "row": row}])
+            self._drop_row(row)
+            self._alive = None
+            self._maybe_compact()
+            return True
+
+    def search(
+        self,
+        query_embedding: List[float],
+        limit: int = 10,
+        similarity_threshold: float = 0.0,
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Find the most similar vectors by cosine similarity.
+
+        Args:
+            query_embedding: Query vector (same dim as the index).
+            limit: Maximum results to return.
+            similarity_threshold: Minimum cosine similarity.
+
+        Returns:
+            List of (key, similarity) ordered by similarity (highest first).
+        """
+        if not NUMPY_AVAILABLE or limit <= 0 or not self._meta_path.exists():
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+
+        with self._locked(exclusive=False):
+            self._refresh()
+            if not self._rows:
+                return []
+            if query.shape != (self._dim,):
+                raise ValueError(f"Query dim {query.shape} != index dim {self._dim}")
+            if norm == 0:
+                return []
+            query = query / norm
+
+            matrix = self._get_matrix()
+            alive = self._get_alive()
+            candidates = self._candidate_rows(query)
+
+            if candidates is None:
+                scores = matrix @ query
+                scores[~alive] = -np.inf
+                rows = np.arange(len(scores))
+            else:
+                rows = candidates[alive[candidates]]
+                scores = matrix[rows] @ query
+
+            if len(scores) > limit:
+                top = np.argpartition(-scores, limit - 1)[:limit]
+            else:
+                top = np.arange(len(scores))
+            top = top[np.argsort(-scores[top], kind="stable")]
+
+            results = []
+            for i in top:
+                score = float(scores[i])
+                if score < similarity_threshold or score == -np.inf:
+                    break
+                results.append((self._keys[int(rows[i])], score))
+            return results
+
+    def compact(self) -> None:
+        """Rewrite the matrix and log without deleted rows."""
+        if not NUMPY_AVAILABLE:
+            return
+        with self._locked():
+            self._refresh()
+            if not self._deleted:
+                return
+            live = [row for row, key in enumerate(self._keys) if key is not None]
+            vectors = np.array(self._get_matrix()[live]) if live else np.empty((0, self._dim), np.float32)
+            keys = [self._keys[row] for row in live]
+            self._matrix = None
+
+            tmp_vectors = self._vectors_path.with_suffix(".tmp")
+            tmp_log = self._log_path.with_suffix(".tmp")
+            tmp_vectors.write_bytes(vectors.tobytes())
+            log_data = "".join(json.dumps({"op": "add", "key": key}) + "\n" for key in keys).encode("utf-8")
+            tmp_log.write_bytes(log_data)
+            # Rows are renumbered: the new generation makes other processes
+            # reload instead of replaying the old log offsets. Processes that
+            # still map the old vector file keep the replaced inode alive.
+            self._generation += 1
+            self._write_meta()
+            tmp_vectors.replace(self._vectors_path)
+            tmp_log.replace(self._log_path)
+
+            self._keys = keys
+            self._rows = {key: row for row, key in enumerate(keys)}
+            self._log_offset = len(log_data)
+            self._deleted = 0
+            self._alive = None
+            self._drop_ivf()
+            logger.info(f"Compacted vector index {self.directory}: {len(keys)} vectors")
+
+    def clear(self) -> None:
+        """Remove all vectors and index files (meta.json keeps the bumped generation)."""
+        if not NUMPY_AVAILABLE:
+            return
+        with self._locked():
+            self._refresh()
+            generation = self._generation + 1
+            for path in (self._vectors_path, self._log_path, self._ivf_path):
+                if path.exists():
+                    path.unlink()
+            self._reset()
+            self._generation = generation
+            self._write_meta()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index size and layout statistics."""
+        return {
+            "vectors": len(self._rows),
+            "rows": len(self._keys),
+            "deleted": self._deleted,
+            "dim": self._dim,
+            "ivf_lists": len(self._lists) if self._centroids is not None else 0,
+            "ivf_trained_rows": self._trained_rows,
+            "generation": self._generation,
+            "path": str(self.directory),
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _get_matrix(self):
+        if self._matrix is None or len(self._matrix) != len(self._keys):
+            self._matrix = np.memmap(
+                self._vectors_path, dtype=np.float32, mode="r",
+                shape=(len(self._keys), self._dim),
+            )
+        return self._matrix
+
+    def _get_alive(self):
+        if self._alive is None or len(self._alive) != len(self._keys):
+            self._alive = np.fromiter(
+                (key is not None for key in self._keys), dtype=bool, count=len(self._keys)
+            )
+        return self._alive
+
+    def _maybe_compact(self) -> None:
+        if self._deleted and self._deleted >= _COMPACT_DELETED_FRACTION * len(self._keys):
+            self.compact()
+
+    def _candidate_rows(self, query):
+        """Rows to score under IVF, or None for a full scan."""
+        if self._centroids is None:
+            return None
+        nearest = np.argsort(-(self._centroids @ query))[:self.n_probe]
+        parts = [self._lists[c] for c in nearest]
+        # Rows appended after training are not in any list yet
+        parts.append(np.arange(self._trained_rows, len(self._keys)))
+        return np.concatenate(parts)
+
+    def _maybe_train(self) -> None:
+        """(Re)train IVF once big enough, and again after the index doubles (after writes)."""
+        if not self.ivf_lists:
+            return
+        with self._lock:
+            n_rows = len(self._keys)
+            if n_rows < self.ivf_lists * _MIN_ROWS_PER_LIST:
+                return
+            if self._centroids is not None and n_rows < 2 * self._trained_rows:
+                return
+        self.train_ivf()
+
+    def train_ivf(self, n_iter: int = 10, seed: int = 0) -> None:
+        """
+        Cluster the current rows with spherical k-means and persist the layer.
+
+        The clustering runs without holding any lock; the result is
+        discarded if the index was compacted or cleared meanwhile.
+        """
+        if not NUMPY_AVAILABLE or not self.ivf_lists:
+            return
+        with self._locked(exclusive=False):
+            self._refresh()
+            if not self._keys:
+                return
+            generation = self._generation
+            # Rows are append-only within a generation, so this view stays valid
+            matrix = np.asarray(self._get_matrix())
+
+        n_lists = min(self.ivf_lists, len(matrix))
+        rng = np.random.default_rng(seed)
+        centroids = matrix[rng.choice(len(matrix), n_lists, replace=False)].copy()
+
+        for _ in range(n_iter):
+            assignments = np.argmax(matrix @ centroids.T, axis=1)
+            for c in range(n_lists):
+                members = matrix[assignments == c]
+                if len(members):
+                    centroids[c] = members.sum(axis=0)
+            centroids = _normalize_rows(centroids)
+
+        assignments = np.argmax(matrix @ centroids.T, axis=1)
+
+        with self._locked():
+            self._refresh()
+            if self._generation != generation:
+                return
+            tmp = self._ivf_path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                np.savez(f, centroids=centroids, assignments=assignments)
+            tmp.replace(self._ivf_path)
+            self._ivf_sig = _file_signature(self._ivf_path)
+            self._set_ivf(centroids, assignments)
+        logger.info(f"Trained IVF layer for {self.directory}: {n_lists} lists over {len(matrix)} rows")
+
+    def _drop_ivf(self) -> None:
+        self._centroids = None
+        self._lists = []
+        self._trained_rows = 0
+        if self._ivf_path.exists():
+            self._ivf_path.unlink()
+        self._ivf_sig = None
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """(inode, mtime, size) of path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _normalize_key(key: Hashable) -> Hashable:
+    """JSON round-trips keep str/int; normalize lists (from JSON) to tuples."""
+    return tuple(key) if isinstance(key, list) else key
+
+
+def _normalize_rows(vectors):
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32)
+
+
+# Singleton for the facts index beside the memory DB
+_facts_index: Optional[LocalVectorIndex] = None
+
+
+def get_local_vector_index() -> LocalVectorIndex:
+    """Get the local vector index for facts (stored next to the memory DB)."""
+    global _facts_index
+    from .config import get_config
+
+    directory = get_config().memory_root / "vectors" / "facts"
+    if _facts_index is None or _facts_index.directory != directory:
+        _facts_index = LocalVectorIndex(directory, ivf_lists=256)
+    return _facts_index
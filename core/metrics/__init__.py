@@ -5,11 +5,13 @@ This module provides:
 - BotMetrics: Per-bot metrics collection (messages, commands, errors, response times)
 - MetricsAggregator: Aggregate metrics across bots with hourly/daily stats
 - PrometheusExporter: Export metrics in Prometheus format
+- RollingLatencyWindow: Fixed-size latency window with cheap percentile reads
 """
 
 from core.metrics.bot_metrics import BotMetrics, get_bot_metrics, list_all_bots
 from core.metrics.aggregator import MetricsAggregator, HourlyStats, DailyStats
 from core.metrics.exporter import PrometheusExporter
+from core.metrics.latency_window import RollingLatencyWindow
 
 __all__ = [
     "BotMetrics",
@@ -19,4 +21,5 @@ __all__ = [
     "HourlyStats",
     "DailyStats",
     "PrometheusExporter",
+    "RollingLatencyWindow",
 ]
@@ -0,0 +1,104 @@
+"""
+Rolling latency window with cheap percentile reads.
+
+Keeps the last ``window_size`` samples in a fixed-size ring buffer plus a
+sorted mirror of the same samples:
+
+- record(): O(1) ring write, running sum update and one bisect insert/remove
+  in the sorted mirror (a C-level memmove, no full sort)
+- percentile()/p50/p95/p99: O(1) index into the sorted mirror
+- average: O(1) from the running sum
+
+Percentiles are exact over the window, using the same nearest-rank index as
+the previous sort-on-read implementations.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, insort
+from typing import List, Optional
+
+
+class RollingLatencyWindow:
+    """Thread-safe fixed-size latency window (milliseconds)."""
+
+    def __init__(self, window_size: int = 1000):
+        if window_size <= 0:
+            raise ValueError("window_size must be positive")
+        self.window_size = window_size
+        self._ring: List[float] = [0.0] * window_size
+        self._sorted: List[float] = []
+        self._next = 0
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float) -> None:
+        """Record a latency, evicting the oldest once the window is full."""
+        value = float(latency_ms)
+        with self._lock:
+            if self._count == self.window_size:
+                evicted = self._ring[self._next]
+                del self._sorted[bisect_left(self._sorted, evicted)]
+                self._sum -= evicted
+            else:
+                self._count += 1
+            self._ring[self._next] = value
+            self._next = (self._next + 1) % self.window_size
+            insort(self._sorted, value)
+            self._sum += value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sorted.clear()
+            self._next = 0
+            self._count = 0
+            self._sum = 0.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def count(self) -> int:
+        """Number of samples in the window."""
+        return self._count
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Nearest-rank percentile (0-100) over the window."""
+        with self._lock:
+            if not self._count:
+                return None
+            idx = min(int(self._count * p / 100), self._count - 1)
+            return self._sorted[idx]
+
+    @property
+    def p50(self) -> Optional[float]:
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> Optional[float]:
+        return self.percentile(95)
+
+    @property
+    def p99(self) -> Optional[float]:
+        return self.percentile(99)
+
+    @property
+    def average(self) -> Optional[float]:
+        with self._lock:
+            if not self._count:
+                return None
+            return self._sum / self._count
+
+    @property
+    def max(self) -> Optional[float]:
+        with self._lock:
+            return self._sorted[-1] if self._count else None
+
+    def values(self) -> List[float]:
+        """Samples in arrival order (oldest first)."""
+        with self._lock:
+            if self._count < self.window_size:
+                return self._ring[:self._count]
+            return self._ring[self._next:] + self._ring[:self._next]
@@ -1,12 +1,20 @@
 """
 Rate Limiter - Manage API rate limits and request throttling.
-Implements token bucket, sliding window, and adaptive rate limiting.
+Implements token bucket, sliding window, GCRA (leaky bucket) and adaptive rate limiting.
+
+The acquire() hot path takes no global lock: request statistics are kept in
+per-thread counters and only summed when read. acquire_async() queues
+waiters per limit key and wakes them in arrival order at the exact time
+their tokens become available, instead of sleep-polling.
 """
 import asyncio
 import sqlite3
 import threading
 import time
+import weakref
+from bisect import bisect_right
 from collections import defaultdict
+from collections.abc import Mapping
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -117,30 +125,76 @@ class SlidingWindow:
     def __init__(self, limit: int, window_seconds: float):
         self.limit = limit
         self.window_seconds = window_seconds
-        self.requests: List[float] = []
+        self.requests: List[float] = []  # Timestamps, oldest first
         self._lock = threading.Lock()
 
+    @property
+    def capacity(self) -> int:
+        return self.limit
+
     def _cleanup(self):
         """Remove old requests."""
-        now = time.time()
-        cutoff = now - self.window_seconds
-        self.requests = [t for t in self.requests if t > cutoff]
+        cutoff = time.time() - self.window_seconds
+        expired = bisect_right(self.requests, cutoff)
+        if expired:
+            del self.requests[:expired]
 
-    def acquire(self) -> Tuple[bool, float]:
+    def acquire(self, tokens: int = 1) -> Tuple[bool, float]:
         """Try to acquire a slot."""
         with self._lock:
             self._cleanup()
 
-            if len(self.requests) < self.limit:
-                self.requests.append(time.time())
+            if len(self.requests) + tokens <= self.limit:
+                now = time.time()
+                self.requests.extend([now] * tokens)
                 return True, 0
 
-            # Calculate wait time
-            oldest = min(self.requests)
-            wait_time = oldest + self.window_seconds - time.time()
+            if tokens > self.limit:
+                return False, self.window_seconds
+
+            # Calculate wait time until enough slots have expired
+            freeing = self.requests[len(self.requests) + tokens - self.limit - 1]
+            wait_time = freeing + self.window_seconds - time.time()
             return False, max(0, wait_time)
 
 
+class GCRALimiter:
+    """
+    Generic Cell Rate Algorithm (the virtual-scheduling form of a leaky bucket).
+
+    Keeps a single float per key, the theoretical arrival time (TAT) of the
+    next conforming request, and admits bursts of up to ``capacity``.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.emission_interval = 1.0 / rate
+        self.burst_tolerance = capacity * self.emission_interval
+        self.tat = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> Tuple[bool, float]:
+        """Try to acquire tokens. Returns (success, wait_time_seconds)."""
+        increment = tokens * self.emission_interval
+        with self._lock:
+            now = time.monotonic()
+            new_tat = max(self.tat, now) + increment
+            allow_at = new_tat - self.burst_tolerance
+            if allow_at <= now:
+                self.tat = new_tat
+                return True, 0
+        if tokens > self.capacity:
+            return False, self.burst_tolerance
+        return False, allow_at - now
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available for an immediate burst."""
+        backlog = max(0.0, self.tat - time.monotonic())
+        return max(0.0, (self.burst_tolerance - backlog) * self.rate)
+
+
 class AdaptiveLimiter:
     """Adaptive rate limiter that adjusts based on response times."""
 
@@ -187,8 +241,87 @@ class AdaptiveLimiter:
 
         self._bucket = TokenBucket(self.current_rate, int(self.current_rate * 2))
 
-    def acquire(self) -> Tuple[bool, float]:
-        return self._bucket.acquire()
+    @property
+    def capacity(self) -> int:
+        return self._bucket.capacity
+
+    def acquire(self, tokens: int = 1) -> Tuple[bool, float]:
+        return self._bucket.acquire(tokens)
+
+
+class _ShardOwner:
+    """Per-thread handle; its finalizer folds the thread's counts away."""
+    __slots__ = ("__weakref__",)
+
+
+class _LazyStats(Mapping):
+    """
+    Request counters sharded per thread and summed on read.
+
+    Recording touches only the calling thread's shard, so acquire() needs no
+    shared lock. When a thread exits its shard is folded into a base total,
+    so shards don't pile up with thread churn. Reads behave like the old
+    stats dict.
+    """
+
+    _FIELDS = ("total_requests", "allowed_requests", "limited_requests", "total_wait_time_ms")
+
+    def __init__(self):
+        self._local = threading.local()
+        self._base: List[float] = [0, 0, 0, 0]
+        self._shards: Dict[int, List[float]] = {}
+        self._shards_lock = threading.Lock()
+
+    def _new_shard(self) -> List[float]:
+        shard = [0, 0, 0, 0]
+        owner = _ShardOwner()
+        with self._shards_lock:
+            self._shards[id(owner)] = shard
+        # Thread-local storage is dropped when the thread exits, finalizing the owner
+        weakref.finalize(owner, self._fold, self._shards, self._base, self._shards_lock, id(owner))
+        self._local.owner = owner
+        self._local.shard = shard
+        return shard
+
+    @staticmethod
+    def _fold(shards: Dict[int, List[float]], base: List[float], lock: threading.Lock, key: int):
+        with lock:
+            shard = shards.pop(key, None)
+            if shard is not None:
+                for i, value in enumerate(shard):
+                    base[i] += value
+
+    def record(self, allowed: bool, wait_time: float):
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        shard[0] += 1
+        if allowed:
+            shard[1] += 1
+        else:
+            shard[2] += 1
+            shard[3] += wait_time * 1000
+
+    def __getitem__(self, key: str):
+        try:
+            idx = self._FIELDS.index(key)
+        except ValueError:
+            raise KeyError(key) from None
+        with self._shards_lock:
+            return self._base[idx] + sum(shard[idx] for shard in self._shards.values())
+
+    def __iter__(self):
+        return iter(self._FIELDS)
+
+    def __len__(self) -> int:
+        return len(self._FIELDS)
+
+    def snapshot(self) -> Dict[str, float]:
+        """All counters summed in one pass."""
+        with self._shards_lock:
+            totals = [sum(col) for col in zip(self._base, *self._shards.values())]
+        return dict(zip(self._FIELDS, totals))
 
 
 class RateLimiter:
@@ -207,16 +340,17 @@ class RateLimiter:
         self.limiters: Dict[str, Any] = {}
         self.configs: Dict[str, RateLimitConfig] = {}
 
-        # Scoped limiters
+        # Scoped limiters, plus last use per scope for idle eviction
         self.scoped_limiters: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        self._scope_last_used: Dict[str, Dict[str, float]] = defaultdict(dict)
 
-        # Statistics
-        self.stats = {
-            "total_requests": 0,
-            "allowed_requests": 0,
-            "limited_requests": 0,
-            "total_wait_time_ms": 0
-        }
+        # Statistics (per-thread counters, summed on read)
+        self.stats = _LazyStats()
+
+        # FIFO waiter queues for acquire_async, per event loop and limit key
+        self._waiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, Optional[str]], asyncio.Lock]]" = (
+            weakref.WeakKeyDictionary()
+        )
 
         self._lock = threading.Lock()
 
@@ -298,18 +432,14 @@ class RateLimiter:
         self.configs[name] = config
 
         # Create limiter based on strategy
-        if strategy == RateLimitStrategy.TOKEN_BUCKET:
-            self.limiters[name] = TokenBucket(requests_per_second, burst_size)
-        elif strategy == RateLimitStrategy.SLIDING_WINDOW:
-            self.limiters[name] = SlidingWindow(burst_size, 1.0 / requests_per_second * burst_size)
-        elif strategy == RateLimitStrategy.ADAPTIVE:
+        if strategy == RateLimitStrategy.ADAPTIVE:
             self.limiters[name] = AdaptiveLimiter(
                 requests_per_second,
                 requests_per_second * 0.1,
                 requests_per_second * 2
             )
         else:
-            self.limiters[name] = TokenBucket(requests_per_second, burst_size)
+            self.limiters[name] = self._build_limiter(config)
 
         # Save to database
         with self._get_db() as conn:
@@ -325,6 +455,28 @@ class RateLimiter:
 
         return config
 
+    @staticmethod
+    def _build_limiter(config: RateLimitConfig) -> Any:
+        """Create a limiter instance for a config (non-adaptive strategies)."""
+        if config.strategy == RateLimitStrategy.SLIDING_WINDOW:
+            return SlidingWindow(
+                config.burst_size,
+                1.0 / config.requests_per_second * config.burst_size
+            )
+        if config.strategy == RateLimitStrategy.LEAKY_BUCKET:
+            return GCRALimiter(config.requests_per_second, config.burst_size)
+        return TokenBucket(config.requests_per_second, config.burst_size)
+
+    def _resolve(self, name: str, scope_key: Optional[str]) -> Any:
+        """Limiter for a name/scope, or None if unlimited."""
+        config = self.configs.get(name)
+        if not config or not config.enabled:
+            return None
+
+        if config.scope != LimitScope.GLOBAL and scope_key:
+            return self._get_scoped_limiter(name, scope_key, config)
+        return self.limiters.get(name)
+
     def acquire(
         self,
         name: str,
@@ -335,30 +487,12 @@ class RateLimiter:
         Try to acquire rate limit tokens.
         Returns (allowed, wait_time_seconds).
         """
-        config = self.configs.get(name)
-        if not config or not config.enabled:
-            return True, 0
-
-        # Get or create scoped limiter
-        if config.scope != LimitScope.GLOBAL and scope_key:
-            limiter = self._get_scoped_limiter(name, scope_key, config)
-        else:
-            limiter = self.limiters.get(name)
-
+        limiter = self._resolve(name, scope_key)
         if not limiter:
             return True, 0
 
         allowed, wait_time = limiter.acquire(tokens)
-
-        # Update stats
-        with self._lock:
-            self.stats["total_requests"] += 1
-            if allowed:
-                self.stats["allowed_requests"] += 1
-            else:
-                self.stats["limited_requests"] += 1
-                self.stats["total_wait_time_ms"] += wait_time * 1000
-
+        self.stats.record(allowed, wait_time)
         return allowed, wait_time
 
     def _get_scoped_limiter(
@@ -368,39 +502,76 @@ class RateLimiter:
         config: RateLimitConfig
     ) -> Any:
         """Get or create a scoped limiter."""
-        if scope_key not in self.scoped_limiters[name]:
-            if config.strategy == RateLimitStrategy.TOKEN_BUCKET:
-                limiter = TokenBucket(config.requests_per_second, config.burst_size)
-            elif config.strategy == RateLimitStrategy.SLIDING_WINDOW:
-                limiter = SlidingWindow(
-                    config.burst_size,
-                    1.0 / config.requests_per_second * config.burst_size
-                )
-            else:
-                limiter = TokenBucket(config.requests_per_second, config.burst_size)
-
-            self.scoped_limiters[name][scope_key] = limiter
-
-        return self.scoped_limiters[name][scope_key]
+        shard = self.scoped_limiters[name]
+        limiter = shard.get(scope_key)
+        if limiter is None:
+            limiter = shard.setdefault(scope_key, self._build_limiter(config))
+        self._scope_last_used[name][scope_key] = time.monotonic()
+        return limiter
+
+    def _waiter_queue(self, name: str, scope_key: Optional[str]) -> asyncio.Lock:
+        """FIFO queue (asyncio.Lock wakes waiters in order) for a limit key."""
+        loop = asyncio.get_running_loop()
+        queues = self._waiters.get(loop)
+        if queues is None:
+            queues = self._waiters.setdefault(loop, {})
+        key = (name, scope_key)
+        queue = queues.get(key)
+        if queue is None:
+            queue = queues[key] = asyncio.Lock()
+        return queue
 
     async def acquire_async(
         self,
         name: str,
         scope_key: Optional[str] = None,
         tokens: int = 1,
-        wait: bool = True
+        wait: bool = True,
+        timeout: Optional[float] = None
     ) -> bool:
-        """Acquire rate limit, optionally waiting."""
-        allowed, wait_time = self.acquire(name, scope_key, tokens)
+        """
+        Acquire rate limit, optionally waiting.
 
-        if allowed:
+        Waiters for the same limit key are served in arrival order; each
+        sleeps until its tokens are due rather than polling. Returns False
+        if not waiting, if the request can never fit, or on timeout.
+        """
+        limiter = self._resolve(name, scope_key)
+        if not limiter:
             return True
 
-        if wait and wait_time > 0:
-            await asyncio.sleep(wait_time)
-            return self.acquire(name, scope_key, tokens)[0]
-
-        return False
+        queue = self._waiter_queue(name, scope_key)
+        if not queue.locked():
+            allowed, wait_time = limiter.acquire(tokens)
+            self.stats.record(allowed, wait_time)
+            if allowed:
+                return True
+            if not wait or wait_time <= 0:
+                return False
+        elif not wait:
+            return False
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        async def wait_turn() -> bool:
+            async with queue:
+                while True:
+                    allowed, wait_time = limiter.acquire(tokens)
+                    if allowed:
+                        self.stats.record(True, 0)
+                        return True
+                    if limiter.capacity < tokens:
+                        return False
+                    if deadline is not None and time.monotonic() + wait_time > deadline:
+                        return False
+                    await asyncio.sleep(wait_time)
+
+        if deadline is None:
+            return await wait_turn()
+        try:
+            return await asyncio.wait_for(wait_turn(), max(0.0, deadline - time.monotonic()))
+        except asyncio.TimeoutError:
+            return False
 
     def record_response(
         self,
@@ -433,13 +604,24 @@ class RateLimiter:
                 is_limited=limiter.tokens < 1,
                 retry_after=now + timedelta(seconds=config.retry_after_seconds) if limiter.tokens < 1 else None
             )
+        elif isinstance(limiter, GCRALimiter):
+            available = limiter.tokens
+            return RateLimitState(
+                name=name,
+                tokens=available,
+                last_update=now,
+                request_count=0,
+                window_start=now,
+                is_limited=available < 1,
+                retry_after=now + timedelta(seconds=(1 - available) / limiter.rate) if available < 1 else None
+            )
         elif isinstance(limiter, SlidingWindow):
             return RateLimitState(
                 name=name,
                 tokens=limiter.limit - len(limiter.requests),
                 last_update=now,
                 request_count=len(limiter.requests),
-                window_start=datetime.fromtimestamp(min(limiter.requests)) if limiter.requests else now,
+                window_start=datetime.fromtimestamp(limiter.requests[0]) if limiter.requests else now,
                 is_limited=len(limiter.requests) >= limiter.limit,
                 retry_after=None
             )
@@ -453,8 +635,8 @@ class RateLimiter:
             return
 
         if scope_key and name in self.scoped_limiters:
-            if scope_key in self.scoped_limiters[name]:
-                del self.scoped_limiters[name][scope_key]
+            self.scoped_limiters[name].pop(scope_key, None)
+            self._scope_last_used[name].pop(scope_key, None)
         else:
             # Recreate limiter
             self.configure(
@@ -473,23 +655,36 @@ class RateLimiter:
 
     def get_statistics(self) -> Dict:
         """Get rate limiter statistics."""
+        stats = self.stats.snapshot()
+        return {
+            **stats,
+            "limit_rate": stats["limited_requests"] / stats["total_requests"]
+                         if stats["total_requests"] > 0 else 0,
+            "avg_wait_time_ms": stats["total_wait_time_ms"] / stats["limited_requests"]
+                               if stats["limited_requests"] > 0 else 0,
+            "num_limiters": len(self.limiters),
+            "num_scoped_limiters": sum(len(s) for s in self.scoped_limiters.values())
+        }
+
+    def cleanup_scoped(self, max_age_seconds: Optional[float] = None):
+        """
+        Clean up scoped limiters.
+
+        With max_age_seconds, only scopes idle for longer are dropped;
+        otherwise all scoped limiters are cleared.
+        """
         with self._lock:
-            return {
-                **self.stats,
-                "limit_rate": self.stats["limited_requests"] / self.stats["total_requests"]
-                             if self.stats["total_requests"] > 0 else 0,
-                "avg_wait_time_ms": self.stats["total_wait_time_ms"] / self.stats["limited_requests"]
-                                   if self.stats["limited_requests"] > 0 else 0,
-                "num_limiters": len(self.limiters),
-                "num_scoped_limiters": sum(len(s) for s in self.scoped_limiters.values())
-            }
-
-    def cleanup_scoped(self, max_age_seconds: int = 3600):
-        """Clean up old scoped limiters."""
-        # Would track last access time per scoped limiter
-        # For now, just clear all
-        for name in list(self.scoped_limiters.keys()):
-            self.scoped_limiters[name].clear()
+            if max_age_seconds is None:
+                for name in list(self.scoped_limiters.keys()):
+                    self.scoped_limiters[name].clear()
+                    self._scope_last_used[name].clear()
+                return
+
+            cutoff = time.monotonic() - max_age_seconds
+            for name, last_used in self._scope_last_used.items():
+                for scope_key in [k for k, t in last_used.items() if t < cutoff]:
+                    self.scoped_limiters[name].pop(scope_key, None)
+                    del last_used[scope_key]
 
 
 # Pre-configured limiters for common APIs
@@ -500,7 +695,7 @@ def create_default_limiters(limiter: RateLimiter):
         "solana_rpc",
         requests_per_second=10,
         burst_size=20,
-        strategy=RateLimitStrategy.TOKEN_BUCKET
+        strategy=RateLimitStrategy.LEAKY_BUCKET
     )
 
     # Jupiter API
@@ -508,7 +703,7 @@ def create_default_limiters(limiter: RateLimiter):
         "jupiter_api",
         requests_per_second=5,
         burst_size=10,
-        strategy=RateLimitStrategy.TOKEN_BUCKET
+        strategy=RateLimitStrategy.LEAKY_BUCKET
     )
 
     # Birdeye API
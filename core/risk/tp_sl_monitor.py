@@ -11,8 +11,11 @@ REQ-005: Stop-loss and take-profit enforcement
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, Iterable, List, Optional, Protocol
+
+from core.metrics.latency_window import RollingLatencyWindow
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +29,13 @@ except ImportError:
     ShutdownPhase = None
 
 
+# Recent sweeps kept for latency percentiles
+SWEEP_LATENCY_WINDOW = 256
+
+# Sweeps slower than this are logged
+SLOW_SWEEP_WARN_MS = 2000
+
+
 # =============================================================================
 # Default Ladder Exit Configuration
 # =============================================================================
@@ -70,7 +80,13 @@ def create_ladder_exits(
 # =============================================================================
 
 class PriceService(Protocol):
-    """Protocol for price fetching service."""
+    """
+    Protocol for price fetching service.
+
+    Services may also implement get_prices_batch(mints) -> {mint: price}
+    (as MarketDataService does); the monitor then fetches a whole sweep in
+    one call and only falls back to get_token_price for missing mints.
+    """
 
     async def get_token_price(self, token_mint: str) -> float:
         """Get current price for a token."""
@@ -117,6 +133,11 @@ class TPSLMonitor:
     - Triggers exits when TP/SL conditions are met
     - Supports ladder exits (partial exits at price tiers)
 
+    Each sweep deduplicates mints, fetches their prices in one batch call
+    (or in parallel, at most max_concurrency at a time), evaluates every
+    position against that single snapshot, then dispatches triggered exits
+    concurrently. Exits for the same mint run one at a time.
+
     Usage:
         monitor = TPSLMonitor(position_manager=pm, price_service=ps)
         await monitor.start()  # Runs until stop() is called
@@ -128,6 +149,7 @@ class TPSLMonitor:
         price_service: Optional[PriceService] = None,
         exit_executor: Optional[ExitExecutorProtocol] = None,
         poll_interval: int = 10,
+        max_concurrency: int = 16,
     ):
         """
         Initialize TP/SL monitor.
@@ -137,14 +159,27 @@ class TPSLMonitor:
             price_service: Service for fetching token prices
             exit_executor: Service for executing exits
             poll_interval: Seconds between price checks (default 10)
+            max_concurrency: Parallel price requests when the service has
+                no batch endpoint (default 16)
         """
         self.position_manager = position_manager
         self.price_service = price_service
         self.exit_executor = exit_executor
         self.poll_interval = poll_interval
+        self.max_concurrency = max(1, max_concurrency)
         self.running = False
         self._task: Optional[asyncio.Task] = None
 
+        # Exits for one mint are serialized, across sweeps too; locks for
+        # mints without open positions are dropped at the next sweep
+        self._mint_locks: Dict[str, asyncio.Lock] = {}
+
+        # Sweep metrics
+        self._sweep_latency = RollingLatencyWindow(window_size=SWEEP_LATENCY_WINDOW)
+        self._last_sweep: Dict[str, Any] = {}
+        self._sweeps = 0
+        self._exits_dispatched = 0
+
         # Register with shutdown manager
         if SHUTDOWN_MANAGER_AVAILABLE:
             shutdown_mgr = get_shutdown_manager()
@@ -201,33 +236,33 @@ class TPSLMonitor:
             return []
 
         positions = self.position_manager.get_open_positions()
+        self._prune_mint_locks(pos.token_mint for pos in positions or [])
         if not positions:
             return []
 
+        started = time.perf_counter()
+
+        # 1. One price snapshot for the whole sweep
+        prices = await self._fetch_prices(positions)
+        fetched = time.perf_counter()
+
+        # 2. Evaluate every position against the snapshot
         results = []
+        triggered = []
         for pos in positions:
             try:
-                # Get current price
                 if self.price_service:
-                    current_price = await self.price_service.get_token_price(
-                        pos.token_mint
-                    )
+                    current_price = prices[pos.token_mint]
+                    if isinstance(current_price, Exception):
+                        raise current_price
                 else:
                     current_price = pos.current_price
 
                 # Check for triggers
                 result = await self.check_position(pos, current_price)
                 results.append(result)
-
-                # Execute exit if triggered
                 if result["should_exit"] and self.exit_executor:
-                    exit_result = await self.exit_executor.execute_exit(
-                        position=pos,
-                        trigger=result["trigger"],
-                        exit_percent=result["exit_percent"],
-                        ladder_tier=result.get("ladder_tier"),
-                    )
-                    result["exit_result"] = exit_result
+                    triggered.append((pos, result))
 
             except Exception as e:
                 logger.error(
@@ -240,9 +275,126 @@ class TPSLMonitor:
                     "should_exit": False,
                     "trigger": None,
                 })
-
+        evaluated = time.perf_counter()
+
+        # 3. Execute exits concurrently, one at a time per mint
+        if triggered:
+            by_mint: Dict[str, List[Any]] = {}
+            for pos, result in triggered:
+                by_mint.setdefault(pos.token_mint, []).append((pos, result))
+            await asyncio.gather(*(
+                self._dispatch_exits(mint, items) for mint, items in by_mint.items()
+            ))
+        finished = time.perf_counter()
+
+        self._record_sweep(
+            positions=len(positions),
+            mints=len(prices),
+            exits=len(triggered),
+            price_fetch_ms=(fetched - started) * 1000,
+            evaluate_ms=(evaluated - fetched) * 1000,
+            dispatch_ms=(finished - evaluated) * 1000,
+            total_ms=(finished - started) * 1000,
+        )
         return results
 
+    async def _fetch_prices(self, positions: List[Any]) -> Dict[str, Any]:
+        """
+        Fetch one price per distinct mint.
+
+        Returns {mint: price or Exception}. Empty without a price service.
+        """
+        if not self.price_service:
+            return {}
+
+        mints = list(dict.fromkeys(pos.token_mint for pos in positions))
+        prices: Dict[str, Any] = {}
+
+        batch = getattr(type(self.price_service), "get_prices_batch", None)
+        if batch is not None:
+            try:
+                batch_prices = await self.price_service.get_prices_batch(mints)
+                prices.update(
+                    (mint, batch_prices[mint])
+                    for mint in mints
+                    if batch_prices.get(mint)
+                )
+            except Exception as e:
+                logger.warning(f"Batch price fetch failed, falling back to per-mint: {e}")
+
+        missing = [mint for mint in mints if mint not in prices]
+        if missing:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def fetch(mint: str) -> Any:
+                async with semaphore:
+                    return await self.price_service.get_token_price(mint)
+
+            fetched = await asyncio.gather(*(fetch(m) for m in missing), return_exceptions=True)
+            prices.update(zip(missing, fetched))
+
+        return prices
+
+    async def _dispatch_exits(self, mint: str, items: List[Any]) -> None:
+        """Execute the triggered exits for one mint in order."""
+        lock = self._mint_locks.setdefault(mint, asyncio.Lock())
+        async with lock:
+            for pos, result in items:
+                try:
+                    exit_result = await self.exit_executor.execute_exit(
+                        position=pos,
+                        trigger=result["trigger"],
+                        exit_percent=result["exit_percent"],
+                        ladder_tier=result.get("ladder_tier"),
+                    )
+                    result["exit_result"] = exit_result
+                    self._exits_dispatched += 1
+                except Exception as e:
+                    logger.error(
+                        f"Error executing {result['trigger']} exit for position {pos.id}: {e}",
+                        exc_info=True
+                    )
+                    result["exit_error"] = str(e)
+
+    def _prune_mint_locks(self, open_mints: Iterable[str]) -> None:
+        """Drop exit locks for mints that no longer have an open position."""
+        open_mints = set(open_mints)
+        for mint in [
+            mint for mint, lock in self._mint_locks.items()
+            if mint not in open_mints and not lock.locked()
+        ]:
+            del self._mint_locks[mint]
+
+    def _record_sweep(self, **timings: Any) -> None:
+        self._sweeps += 1
+        self._sweep_latency.record(timings["total_ms"])
+        self._last_sweep = {**timings, "at": datetime.now(timezone.utc).isoformat()}
+        if timings["total_ms"] > SLOW_SWEEP_WARN_MS:
+            logger.warning(
+                f"Slow TP/SL sweep: {timings['total_ms']:.0f}ms for {timings['positions']} positions "
+                f"(prices {timings['price_fetch_ms']:.0f}ms, exits {timings['dispatch_ms']:.0f}ms)"
+            )
+
+    def get_sweep_stats(self) -> Dict[str, Any]:
+        """
+        Sweep latency metrics.
+
+        Returns counts, p50/p95/max of recent sweep durations (ms) and the
+        per-phase breakdown of the last sweep.
+        """
+        window = self._sweep_latency
+        return {
+            "sweeps": self._sweeps,
+            "exits_dispatched": self._exits_dispatched,
+            "latency_ms": {
+                "p50": window.p50 or 0.0,
+                "p95": window.p95 or 0.0,
+                "max": window.max or 0.0,
+                "samples": window.count,
+            },
+            "last_sweep": dict(self._last_sweep),
+        }
+
     async def check_position(
         self,
         position: Any,
@@ -0,0 +1,176 @@
+"""
+Screener Cache Store
+====================
+
+Single-file SQLite (WAL) key-value cache used by core.token_screener.
+
+Replaces one pretty-printed JSON file per key with one row per key:
+- Per-entry TTL (optional expiry at write time, plus max age at read time)
+- Batched reads for multi-mint screens
+- Size-bounded eviction of the oldest entries
+- Indexed prefix invalidation ("rugcheck", "market", ...)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 50_000
+
+# Evict at most once per this many writes to keep puts cheap
+_EVICT_EVERY = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key        TEXT PRIMARY KEY,
+    prefix     TEXT NOT NULL,
+    cached_at  REAL NOT NULL,
+    expires_at REAL,
+    payload    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_prefix ON cache_entries(prefix);
+CREATE INDEX IF NOT EXISTS idx_cache_cached_at ON cache_entries(cached_at);
+"""
+
+
+def key_prefix(key: str) -> str:
+    """Category of a cache key ("rugcheck_abc" -> "rugcheck")."""
+    return key.split("_", 1)[0] if "_" in key else "other"
+
+
+class ScreenerCacheStore:
+    """Size-bounded SQLite key-value cache with per-entry TTL."""
+
+    def __init__(self, db_path: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _decode(row, max_age: Optional[float], now: float) -> Optional[Any]:
+        payload, cached_at, expires_at = row
+        if expires_at is not None and now > expires_at:
+            return None
+        if max_age is not None and now - cached_at > max_age:
+            return None
+        try:
+            return json.loads(payload)
+        except json.JSONDecodeError:
+            return None
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """Return the payload for key if present and fresh."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, cached_at, expires_at FROM cache_entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return self._decode(row, max_age, time.time())
+
+    def get_many(self, keys: Iterable[str], max_age: Optional[float] = None) -> Dict[str, Any]:
+        """Fetch several keys in one query. Missing or stale keys are omitted."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Any] = {}
+        if not keys:
+            return found
+
+        now = time.time()
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT key, payload, cached_at, expires_at FROM cache_entries "
+                    f"WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+            for key, *rest in rows:
+                value = self._decode(rest, max_age, now)
+                if value is not None:
+                    found[key] = value
+        return found
+
+    def put(self, key: str, payload: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store payload under key, optionally expiring after ttl_seconds."""
+        now = time.time()
+        expires_at = now + ttl_seconds if ttl_seconds is not None else None
+        encoded = json.dumps(payload, separators=(",", ":"))
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (key, prefix, cached_at, expires_at, payload) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, key_prefix(key), now, expires_at, encoded),
+                )
+            self._writes_since_evict += 1
+            if self._writes_since_evict >= _EVICT_EVERY:
+                self._writes_since_evict = 0
+                self._evict_locked()
+
+    def _evict_locked(self) -> int:
+        """Drop expired entries, then the oldest beyond max_entries."""
+        with self._conn:
+            removed = self._conn.execute(
+                "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at < ?",
+                (time.time(),),
+            ).rowcount
+            excess = self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0] - self.max_entries
+            if excess > 0:
+                removed += self._conn.execute(
+                    "DELETE FROM cache_entries WHERE key IN ("
+                    "SELECT key FROM cache_entries ORDER BY cached_at LIMIT ?)",
+                    (excess,),
+                ).rowcount
+        return removed
+
+    def evict(self) -> int:
+        """Run eviction now. Returns entries removed."""
+        with self._lock:
+            self._writes_since_evict = 0
+            return self._evict_locked()
+
+    def clear(self, prefix: Optional[str] = None) -> int:
+        """Delete all entries, or those in one prefix category."""
+        with self._lock:
+            with self._conn:
+                if prefix is None:
+                    cur = self._conn.execute("DELETE FROM cache_entries")
+                else:
+                    cur = self._conn.execute("DELETE FROM cache_entries WHERE prefix = ?", (prefix,))
+        return cur.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT prefix, COUNT(*), COALESCE(SUM(LENGTH(payload)), 0) "
+                "FROM cache_entries GROUP BY prefix"
+            ).fetchall()
+        categories = {prefix: count for prefix, count, _ in rows}
+        return {
+            "total_entries": sum(categories.values()),
+            "total_size_kb": round(sum(size for _, _, size in rows) / 1024, 2),
+            "categories": categories,
+        }
@@ -16,16 +16,21 @@ Integrates:
 
 Usage:
     from core.signal_aggregator import get_comprehensive_signal, get_momentum_opportunities
+
+    # Concurrent fan-out with per-source timeouts and a global deadline
+    result = await get_comprehensive_signal_async(token_address, deadline=5.0)
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +114,197 @@ def _safe_import(module_name: str):
         return None
 
 
+# A source fetch returns a function that writes its data into a TokenSignal,
+# or None when the source had nothing. Fetching and applying are split so the
+# async path can fetch concurrently yet apply in a fixed order.
+_ApplyFn = Callable[[TokenSignal], None]
+
+# Canonical application order; later sources may override earlier fields
+SIGNAL_SOURCES = (
+    "dexscreener",
+    "dextools",
+    "gmgn_security",
+    "gmgn_smart_money",
+    "lute",
+    "grok_sentiment",
+)
+
+# Per-source timeouts (seconds) for get_comprehensive_signal_async
+DEFAULT_SOURCE_TIMEOUTS: Dict[str, float] = {
+    "dexscreener": 3.0,
+    "dextools": 4.0,
+    "gmgn_security": 4.0,
+    "gmgn_smart_money": 4.0,
+    "lute": 3.0,
+    "grok_sentiment": 8.0,
+}
+DEFAULT_SIGNAL_DEADLINE = 10.0
+
+# Worker threads for the async fan-outs. Fetches that outlive their timeout
+# keep running, but only tie up this pool, never the loop's default executor
+SOURCE_WORKERS = 32
+
+
+def _fetch_dexscreener(token_address: str, chain: str) -> Optional[_ApplyFn]:
+    from core import dexscreener
+    result = dexscreener.get_pairs_by_token(token_address)
+    if not (result.success and result.data):
+        return None
+    pairs = result.data.get("pairs", [])
+    if not pairs:
+        return None
+    pair = pairs[0]
+
+    def apply(signal: TokenSignal) -> None:
+        base = pair.get("baseToken", {})
+        signal.symbol = base.get("symbol", "")
+        signal.name = base.get("name", "")
+        signal.price_usd = float(pair.get("priceUsd", 0) or 0)
+        signal.price_change_5m = float(pair.get("priceChange", {}).get("m5", 0) or 0)
+        signal.price_change_1h = float(pair.get("priceChange", {}).get("h1", 0) or 0)
+        signal.price_change_24h = float(pair.get("priceChange", {}).get("h24", 0) or 0)
+        signal.volume_24h = float(pair.get("volume", {}).get("h24", 0) or 0)
+        signal.volume_1h = float(pair.get("volume", {}).get("h1", 0) or 0)
+        signal.liquidity_usd = float(pair.get("liquidity", {}).get("usd", 0) or 0)
+        signal.sources_used.append("dexscreener")
+
+    return apply
+
+
+def _fetch_dextools(token_address: str, chain: str) -> Optional[_ApplyFn]:
+    from core import dextools
+    result = dextools.get_token_info(token_address, chain=chain)
+    if not (result.success and result.data):
+        return None
+    token = result.data
+
+    def apply(signal: TokenSignal) -> None:
+        signal.dextools_hot_level = getattr(token, 'hot_level', 0)
+        if hasattr(token, 'audit_score') and token.audit_score > 0:
+            signal.security_score = max(signal.security_score, token.audit_score)
+        signal.sources_used.append("dextools")
+
+    return apply
+
+
+def _fetch_gmgn_security(token_address: str, chain: str) -> Optional[_ApplyFn]:
+    from core import gmgn_metrics
+    sec_result = gmgn_metrics.analyze_token_security(token_address, chain="sol" if chain == "solana" else chain)
+    if not (sec_result.success and sec_result.data):
+        return None
+    sec = sec_result.data
+
+    def apply(signal: TokenSignal) -> None:
+        signal.security_score = sec.security_score
+        signal.risk_level = sec.risk_level
+        signal.security_warnings = sec.warnings[:5]
+        signal.sources_used.append("gmgn")
+
+    return apply
+
+
+def _fetch_gmgn_smart_money(token_address: str, chain: str) -> Optional[_ApplyFn]:
+    from core import gmgn_metrics
+    sm_result = gmgn_metrics.get_smart_money_activity(token_address)
+    if not (sm_result.success and sm_result.data):
+        return None
+    sm = sm_result.data
+
+    def apply(signal: TokenSignal) -> None:
+        signal.smart_money_signal = sm.smart_money_signal
+        if sm.insider_buys > 0 or sm.insider_sells > 0:
+            signal.insider_activity = f"{sm.insider_buys} buys, {sm.insider_sells} sells"
+
+    return apply
+
+
+def _fetch_lute(token_address: str, chain: str) -> Optional[_ApplyFn]:
+    from core import lute_momentum
+    result = lute_momentum.get_momentum_signals(chain=chain)
+    if not (result.success and result.data):
+        return None
+    match = next((sig for sig in result.data if sig.get("token_address") == token_address), None)
+    if match is None:
+        return None
+
+    def apply(signal: TokenSignal) -> None:
+        signal.lute_call_count = match.get("call_count", 0)
+        signal.momentum_score = match.get("momentum_score", 0) * 25  # Scale to 0-100
+        signal.sources_used.append("lute")
+
+    return apply
+
+
+def _fetch_grok_sentiment(symbol: str, sentiment_context: str) -> Optional[_ApplyFn]:
+    from core import x_sentiment
+
+    text = f"${symbol} Solana token"
+    if sentiment_context:
+        text = f"{text} {sentiment_context}"
+
+    result = x_sentiment.analyze_sentiment(text, focus="trading")
+    if not result:
+        return None
+
+    def apply(signal: TokenSignal) -> None:
+        signal.sentiment = result.sentiment
+        signal.sentiment_confidence = result.confidence
+        signal.sentiment_topics = result.key_topics[:5]
+        signal.sources_used.append("grok")
+
+    return apply
+
+
+_TOKEN_FETCHERS: Dict[str, Callable[[str, str], Optional[_ApplyFn]]] = {
+    "dexscreener": _fetch_dexscreener,
+    "dextools": _fetch_dextools,
+    "gmgn_security": _fetch_gmgn_security,
+    "gmgn_smart_money": _fetch_gmgn_smart_money,
+    "lute": _fetch_lute,
+}
+
+_source_executor: Optional[ThreadPoolExecutor] = None
+_source_executor_lock = threading.Lock()
+
+
+def _get_source_executor() -> ThreadPoolExecutor:
+    global _source_executor
+    with _source_executor_lock:
+        if _source_executor is None:
+            _source_executor = ThreadPoolExecutor(
+                max_workers=SOURCE_WORKERS,
+                thread_name_prefix="signal-source",
+            )
+        return _source_executor
+
+
+async def _run_fetch(timeout: float, fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a blocking fetch on the source pool.
+
+    ``timeout`` starts once a worker picks the fetch up, so time spent
+    queued behind other fetches does not count against it; callers bound
+    the total wait with their own deadline. A fetch still queued when the
+    caller gives up never starts.
+
+    Raises:
+        asyncio.TimeoutError: the fetch ran longer than ``timeout``
+    """
+    loop = asyncio.get_running_loop()
+    started = asyncio.Event()
+
+    def call() -> Any:
+        loop.call_soon_threadsafe(started.set)
+        return fn(*args)
+
+    future = loop.run_in_executor(_get_source_executor(), call)
+    try:
+        await started.wait()
+        return await asyncio.wait_for(future, timeout)
+    finally:
+        future.cancel()
+
+
 def get_comprehensive_signal(
     token_address: str,
     *,
@@ -121,6 +317,8 @@ def get_comprehensive_signal(
     
     Aggregates data from all available sources and computes
     a unified signal with Grok sentiment integration.
+    Sources are queried one after another; use
+    get_comprehensive_signal_async to fan out with deadlines.
     
     Args:
         token_address: Token contract address
@@ -134,109 +332,25 @@ def get_comprehensive_signal(
     sources_tried = []
     signal = TokenSignal(address=token_address, chain=chain)
     
-    # 1. Get price data from DexScreener (primary)
-    try:
-        from core import dexscreener
-        result = dexscreener.get_pairs_by_token(token_address)
-        sources_tried.append("dexscreener")
-        
-        if result.success and result.data:
-            pairs = result.data.get("pairs", [])
-            if pairs:
-                pair = pairs[0]
-                base = pair.get("baseToken", {})
-                signal.symbol = base.get("symbol", "")
-                signal.name = base.get("name", "")
-                signal.price_usd = float(pair.get("priceUsd", 0) or 0)
-                signal.price_change_5m = float(pair.get("priceChange", {}).get("m5", 0) or 0)
-                signal.price_change_1h = float(pair.get("priceChange", {}).get("h1", 0) or 0)
-                signal.price_change_24h = float(pair.get("priceChange", {}).get("h24", 0) or 0)
-                signal.volume_24h = float(pair.get("volume", {}).get("h24", 0) or 0)
-                signal.volume_1h = float(pair.get("volume", {}).get("h1", 0) or 0)
-                signal.liquidity_usd = float(pair.get("liquidity", {}).get("usd", 0) or 0)
-                signal.sources_used.append("dexscreener")
-    except Exception as e:
-        logger.debug(f"DexScreener failed: {e}")
-    
-    # 2. Get DexTools data (hot level, audit)
-    try:
-        from core import dextools
-        result = dextools.get_token_info(token_address, chain=chain)
-        sources_tried.append("dextools")
-        
-        if result.success and result.data:
-            token = result.data
-            signal.dextools_hot_level = getattr(token, 'hot_level', 0)
-            if hasattr(token, 'audit_score') and token.audit_score > 0:
-                signal.security_score = max(signal.security_score, token.audit_score)
-            signal.sources_used.append("dextools")
-    except Exception as e:
-        logger.debug(f"DexTools failed: {e}")
-    
-    # 3. Get GMGN security and smart money data
-    try:
-        from core import gmgn_metrics
-        
-        # Security check
-        sec_result = gmgn_metrics.analyze_token_security(token_address, chain="sol" if chain == "solana" else chain)
-        sources_tried.append("gmgn_security")
-        
-        if sec_result.success and sec_result.data:
-            sec = sec_result.data
-            signal.security_score = sec.security_score
-            signal.risk_level = sec.risk_level
-            signal.security_warnings = sec.warnings[:5]
-            signal.sources_used.append("gmgn")
-        
-        # Smart money activity
-        sm_result = gmgn_metrics.get_smart_money_activity(token_address)
-        sources_tried.append("gmgn_smart_money")
-        
-        if sm_result.success and sm_result.data:
-            sm = sm_result.data
-            signal.smart_money_signal = sm.smart_money_signal
-            if sm.insider_buys > 0 or sm.insider_sells > 0:
-                signal.insider_activity = f"{sm.insider_buys} buys, {sm.insider_sells} sells"
-    except Exception as e:
-        logger.debug(f"GMGN failed: {e}")
-    
-    # 4. Get Lute momentum signals
-    try:
-        from core import lute_momentum
-        result = lute_momentum.get_momentum_signals(chain=chain)
-        sources_tried.append("lute")
-        
-        if result.success and result.data:
-            for sig in result.data:
-                if sig.get("token_address") == token_address:
-                    signal.lute_call_count = sig.get("call_count", 0)
-                    signal.momentum_score = sig.get("momentum_score", 0) * 25  # Scale to 0-100
-                    signal.sources_used.append("lute")
-                    break
-    except Exception as e:
-        logger.debug(f"Lute momentum failed: {e}")
-    
-    # 5. Get Grok sentiment analysis
+    for name, fetch in _TOKEN_FETCHERS.items():
+        try:
+            sources_tried.append(name)
+            apply = fetch(token_address, chain)
+            if apply:
+                apply(signal)
+        except Exception as e:
+            logger.debug(f"{name} failed: {e}")
+    
+    # Grok sentiment needs the symbol from DexScreener
     if include_sentiment and signal.symbol:
         try:
-            from core import x_sentiment
-            
-            text = f"${signal.symbol} Solana token"
-            if sentiment_context:
-                text = f"{text} {sentiment_context}"
-            
-            result = x_sentiment.analyze_sentiment(text, focus="trading")
             sources_tried.append("grok_sentiment")
-            
-            if result:
-                signal.sentiment = result.sentiment
-                signal.sentiment_confidence = result.confidence
-                signal.sentiment_topics = result.key_topics[:5]
-                signal.sources_used.append("grok")
+            apply = _fetch_grok_sentiment(signal.symbol, sentiment_context)
+            if apply:
+                apply(signal)
         except Exception as e:
             logger.debug(f"Grok sentiment failed: {e}")
     
-    # 6. Calculate aggregated signal
     signal = _calculate_signal(signal)
     
     return SignalResult(
@@ -246,6 +360,101 @@ def get_comprehensive_signal(
     )
 
 
+async def get_comprehensive_signal_async(
+    token_address: str,
+    *,
+    chain: str = "solana",
+    include_sentiment: bool = True,
+    sentiment_context: str = "",
+    sources: Optional[Sequence[str]] = None,
+    base_signal: Optional[TokenSignal] = None,
+    source_timeouts: Optional[Dict[str, float]] = None,
+    deadline: float = DEFAULT_SIGNAL_DEADLINE,
+) -> SignalResult:
+    """
+    Get a comprehensive signal by querying every source concurrently.
+    
+    Each source runs on a bounded worker pool under its own timeout,
+    counted from when the fetch starts, and the whole fan-out is bounded by ``deadline`` seconds. Sources that miss
+    their timeout are dropped, so the result may be partial;
+    ``sources_used`` lists what actually arrived.
+    
+    Grok sentiment starts as soon as a symbol is known: immediately when
+    ``base_signal`` already carries one, otherwise after DexScreener.
+    
+    Args:
+        token_address: Token contract address
+        chain: Blockchain (default: solana)
+        include_sentiment: Whether to include Grok sentiment
+        sentiment_context: Additional context for sentiment analysis
+        sources: Subset of SIGNAL_SOURCES to query (default: all)
+        base_signal: Existing signal to enrich instead of starting empty
+        source_timeouts: Overrides for DEFAULT_SOURCE_TIMEOUTS
+        deadline: Global deadline in seconds for the whole fan-out
+    
+    Returns:
+        SignalResult with TokenSignal
+    """
+    wanted = set(sources) if sources is not None else set(SIGNAL_SOURCES)
+    if not include_sentiment:
+        wanted.discard("grok_sentiment")
+    timeouts = {**DEFAULT_SOURCE_TIMEOUTS, **(source_timeouts or {})}
+    signal = base_signal or TokenSignal(address=token_address, chain=chain)
+    sources_tried: List[str] = []
+    tasks: Dict[str, asyncio.Task] = {}
+
+    async def run_source(name: str, fn, *args) -> Optional[_ApplyFn]:
+        try:
+            return await _run_fetch(timeouts.get(name, deadline), fn, *args)
+        except asyncio.TimeoutError:
+            logger.debug(f"{name} timed out after {timeouts.get(name, deadline)}s")
+        except Exception as e:
+            logger.debug(f"{name} failed: {e}")
+        return None
+
+    for name, fetch in _TOKEN_FETCHERS.items():
+        if name in wanted:
+            sources_tried.append(name)
+            tasks[name] = asyncio.create_task(run_source(name, fetch, token_address, chain))
+
+    if "grok_sentiment" in wanted:
+        async def run_sentiment() -> Optional[_ApplyFn]:
+            symbol = signal.symbol
+            if not symbol and "dexscreener" in tasks:
+                apply_ds = await tasks["dexscreener"]
+                if apply_ds:
+                    probe = TokenSignal(address=token_address)
+                    apply_ds(probe)
+                    symbol = probe.symbol
+            if not symbol:
+                return None
+            return await run_source("grok_sentiment", _fetch_grok_sentiment, symbol, sentiment_context)
+
+        sources_tried.append("grok_sentiment")
+        tasks["grok_sentiment"] = asyncio.create_task(run_sentiment())
+
+    if tasks:
+        done, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+        for task in pending:
+            task.cancel()
+
+    for name in SIGNAL_SOURCES:
+        task = tasks.get(name)
+        if task is None or not task.done() or task.cancelled():
+            continue
+        apply = task.result()
+        if apply:
+            apply(signal)
+
+    signal = _calculate_signal(signal)
+
+    return SignalResult(
+        success=True,
+        data=signal,
+        sources_tried=sources_tried,
+    )
+
+
 def _calculate_signal(signal: TokenSignal) -> TokenSignal:
     """Calculate aggregated signal score and strength."""
     score = 0.0
@@ -351,6 +560,165 @@ def _calculate_signal(signal: TokenSignal) -> TokenSignal:
     return signal
 
 
+def _discover_dexscreener(chain: str, min_liquidity: float, min_volume_24h: float, limit: int):
+    from core import dexscreener
+    return dexscreener.get_momentum_tokens(
+        min_liquidity=min_liquidity,
+        min_volume_24h=min_volume_24h,
+        limit=limit * 2,
+    ) or []
+
+
+def _discover_dextools(chain: str, min_liquidity: float, min_volume_24h: float, limit: int):
+    from core import dextools
+    result = dextools.get_hot_pairs(chain=chain, limit=limit)
+    return result.data if result.success and result.data else []
+
+
+def _discover_lute(chain: str, min_liquidity: float, min_volume_24h: float, limit: int):
+    from core import lute_momentum
+    result = lute_momentum.get_momentum_signals(chain=chain)
+    return result.data if result.success and result.data else []
+
+
+def _merge_candidates(
+    candidates: Dict[str, TokenSignal],
+    chain: str,
+    dexscreener_pairs: List[Any],
+    dextools_pairs: List[Any],
+    lute_signals: List[Dict[str, Any]],
+) -> None:
+    """Merge discovery results into candidates in priority order."""
+    # 1. DexScreener momentum tokens
+    for pair in dexscreener_pairs:
+        addr = pair.base_token_address
+        if addr not in candidates:
+            candidates[addr] = TokenSignal(
+                address=addr,
+                symbol=pair.base_token_symbol,
+                name=pair.base_token_name,
+                chain=chain,
+                price_usd=pair.price_usd,
+                price_change_5m=pair.price_change_5m,
+                price_change_1h=pair.price_change_1h,
+                price_change_24h=pair.price_change_24h,
+                volume_24h=pair.volume_24h,
+                volume_1h=pair.volume_1h,
+                liquidity_usd=pair.liquidity_usd,
+            )
+            candidates[addr].sources_used.append("dexscreener")
+
+    # 2. DexTools hot pairs
+    for pair in dextools_pairs:
+        addr = pair.base_token
+        if addr not in candidates:
+            candidates[addr] = TokenSignal(
+                address=addr,
+                symbol=pair.base_symbol,
+                name="",
+                chain=chain,
+                price_usd=pair.price_usd,
+                price_change_24h=pair.price_change_24h,
+                volume_24h=pair.volume_24h,
+                liquidity_usd=pair.liquidity_usd,
+                dextools_hot_level=pair.hot_level,
+            )
+        else:
+            candidates[addr].dextools_hot_level = pair.hot_level
+        candidates[addr].sources_used.append("dextools")
+
+    # 3. Lute momentum signals
+    for sig in lute_signals:
+        addr = sig.get("token_address", "")
+        if addr and addr not in candidates:
+            candidates[addr] = TokenSignal(
+                address=addr,
+                symbol=sig.get("token_symbol", ""),
+                name="",
+                chain=chain,
+                lute_call_count=sig.get("call_count", 0),
+                momentum_score=sig.get("momentum_score", 0) * 25,
+            )
+        elif addr:
+            candidates[addr].lute_call_count = sig.get("call_count", 0)
+            candidates[addr].momentum_score = sig.get("momentum_score", 0) * 25
+            candidates[addr].sources_used.append("lute")
+
+
+_DISCOVERY_SOURCES = (
+    ("dexscreener", _discover_dexscreener),
+    ("dextools", _discover_dextools),
+    ("lute", _discover_lute),
+)
+
+
+async def get_momentum_opportunities_async(
+    *,
+    chain: str = "solana",
+    min_liquidity: float = 10_000,
+    min_volume_24h: float = 50_000,
+    include_sentiment: bool = True,
+    limit: int = 20,
+    enhance_top: int = 10,
+    max_concurrent_tokens: int = 5,
+    deadline: float = DEFAULT_SIGNAL_DEADLINE,
+) -> SignalResult:
+    """
+    Async get_momentum_opportunities.
+    
+    Discovery sources are queried concurrently, then the top
+    ``enhance_top`` candidates are enriched with security and sentiment
+    through get_comprehensive_signal_async, ``max_concurrent_tokens`` at
+    a time. Each stage is bounded by ``deadline`` seconds.
+    """
+    candidates: Dict[str, TokenSignal] = {}
+    sources_tried = [name for name, _ in _DISCOVERY_SOURCES]
+
+    async def discover(name: str, fn) -> List[Any]:
+        try:
+            return await _run_fetch(deadline, fn, chain, min_liquidity, min_volume_24h, limit)
+        except Exception as e:
+            logger.debug(f"{name} momentum discovery failed: {e!r}")
+            return []
+
+    discovered = await asyncio.gather(*(discover(name, fn) for name, fn in _DISCOVERY_SOURCES))
+    _merge_candidates(candidates, chain, *discovered)
+
+    # Preliminary scores, then keep the best
+    for signal in candidates.values():
+        _calculate_signal(signal)
+    sorted_candidates = sorted(
+        candidates.values(),
+        key=lambda s: s.signal_score,
+        reverse=True,
+    )[:limit]
+
+    # Enhance the top candidates concurrently with security and sentiment
+    slots = asyncio.Semaphore(max(1, max_concurrent_tokens))
+
+    async def enhance(signal: TokenSignal) -> TokenSignal:
+        async with slots:
+            result = await get_comprehensive_signal_async(
+                signal.address,
+                chain=chain,
+                include_sentiment=include_sentiment,
+                sentiment_context="trading",
+                sources=("gmgn_security", "grok_sentiment"),
+                base_signal=signal,
+                deadline=deadline,
+            )
+            return result.data
+
+    enhanced = list(await asyncio.gather(*(enhance(s) for s in sorted_candidates[:enhance_top])))
+    enhanced.extend(sorted_candidates[enhance_top:])
+
+    return SignalResult(
+        success=True,
+        data=enhanced,
+        sources_tried=sources_tried,
+    )
+
+
 def get_momentum_opportunities(
     *,
     chain: str = "solana",
@@ -373,6 +741,9 @@ def get_momentum_opportunities(
     - Minimum volume
     - Security score
     
+    Runs get_momentum_opportunities_async to completion; from inside a
+    running event loop it does so on a helper thread.
+    
     Args:
         chain: Blockchain
         min_liquidity: Minimum liquidity USD
@@ -383,142 +754,19 @@ def get_momentum_opportunities(
     Returns:
         SignalResult with list of TokenSignal
     """
-    candidates: Dict[str, TokenSignal] = {}
-    sources_tried = []
-    
-    # 1. Get DexScreener momentum tokens
-    try:
-        from core import dexscreener
-        pairs = dexscreener.get_momentum_tokens(
-            min_liquidity=min_liquidity,
-            min_volume_24h=min_volume_24h,
-            limit=limit * 2,
-        )
-        sources_tried.append("dexscreener")
-        
-        for pair in pairs or []:
-            addr = pair.base_token_address
-            if addr not in candidates:
-                candidates[addr] = TokenSignal(
-                    address=addr,
-                    symbol=pair.base_token_symbol,
-                    name=pair.base_token_name,
-                    chain=chain,
-                    price_usd=pair.price_usd,
-                    price_change_5m=pair.price_change_5m,
-                    price_change_1h=pair.price_change_1h,
-                    price_change_24h=pair.price_change_24h,
-                    volume_24h=pair.volume_24h,
-                    volume_1h=pair.volume_1h,
-                    liquidity_usd=pair.liquidity_usd,
-                )
-                candidates[addr].sources_used.append("dexscreener")
-    except Exception as e:
-        logger.debug(f"DexScreener momentum failed: {e}")
-    
-    # 2. Get DexTools hot pairs
-    try:
-        from core import dextools
-        result = dextools.get_hot_pairs(chain=chain, limit=limit)
-        sources_tried.append("dextools")
-        
-        if result.success and result.data:
-            for pair in result.data:
-                addr = pair.base_token
-                if addr not in candidates:
-                    candidates[addr] = TokenSignal(
-                        address=addr,
-                        symbol=pair.base_symbol,
-                        name="",
-                        chain=chain,
-                        price_usd=pair.price_usd,
-                        price_change_24h=pair.price_change_24h,
-                        volume_24h=pair.volume_24h,
-                        liquidity_usd=pair.liquidity_usd,
-                        dextools_hot_level=pair.hot_level,
-                    )
-                else:
-                    candidates[addr].dextools_hot_level = pair.hot_level
-                candidates[addr].sources_used.append("dextools")
-    except Exception as e:
-        logger.debug(f"DexTools hot pairs failed: {e}")
-    
-    # 3. Get Lute momentum signals
-    try:
-        from core import lute_momentum
-        result = lute_momentum.get_momentum_signals(chain=chain)
-        sources_tried.append("lute")
-        
-        if result.success and result.data:
-            for sig in result.data:
-                addr = sig.get("token_address", "")
-                if addr and addr not in candidates:
-                    candidates[addr] = TokenSignal(
-                        address=addr,
-                        symbol=sig.get("token_symbol", ""),
-                        name="",
-                        chain=chain,
-                        lute_call_count=sig.get("call_count", 0),
-                        momentum_score=sig.get("momentum_score", 0) * 25,
-                    )
-                elif addr:
-                    candidates[addr].lute_call_count = sig.get("call_count", 0)
-                    candidates[addr].momentum_score = sig.get("momentum_score", 0) * 25
-                    candidates[addr].sources_used.append("lute")
-    except Exception as e:
-        logger.debug(f"Lute momentum failed: {e}")
-    
-    # 4. Calculate preliminary scores
-    for signal in candidates.values():
-        signal = _calculate_signal(signal)
-    
-    # 5. Sort by signal score and take top results
-    sorted_candidates = sorted(
-        candidates.values(),
-        key=lambda s: s.signal_score,
-        reverse=True,
-    )[:limit]
-    
-    # 6. Enhance top candidates with security and sentiment
-    enhanced = []
-    for signal in sorted_candidates[:10]:  # Only top 10 get full enhancement
-        try:
-            # Add security check
-            from core import gmgn_metrics
-            sec_result = gmgn_metrics.analyze_token_security(signal.address)
-            if sec_result.success and sec_result.data:
-                sec = sec_result.data
-                signal.security_score = sec.security_score
-                signal.risk_level = sec.risk_level
-                signal.security_warnings = sec.warnings[:3]
-        except Exception:
-            pass
-        
-        if include_sentiment and signal.symbol:
-            try:
-                from core import x_sentiment
-                result = x_sentiment.analyze_sentiment(
-                    f"${signal.symbol} Solana token trading",
-                    focus="trading"
-                )
-                if result:
-                    signal.sentiment = result.sentiment
-                    signal.sentiment_confidence = result.confidence
-            except Exception:
-                pass
-        
-        # Recalculate with new data
-        signal = _calculate_signal(signal)
-        enhanced.append(signal)
-    
-    # Add remaining candidates without enhancement
-    enhanced.extend(sorted_candidates[10:])
-    
-    return SignalResult(
-        success=True,
-        data=enhanced,
-        sources_tried=sources_tried,
+    coro = get_momentum_opportunities_async(
+        chain=chain,
+        min_liquidity=min_liquidity,
+        min_volume_24h=min_volume_24h,
+        include_sentiment=include_sentiment,
+        limit=limit,
     )
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
 
 
 def get_all_sources_status() -> Dict[str, Any]:
@@ -9,6 +9,7 @@ Prompts #128-135: Signal Processing
 
 from .fusion import (
     SignalFusion,
+    FusionScheduler,
     FusedSignal,
     SignalSource,
     SignalWeight,
@@ -35,6 +36,7 @@ from .signal_aggregator import (
 __all__ = [
     # Fusion
     "SignalFusion",
+    "FusionScheduler",
     "FusedSignal",
     "SignalSource",
     "SignalWeight",
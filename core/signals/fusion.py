@@ -19,6 +19,13 @@ from enum import Enum
 from pathlib import Path
 from collections import defaultdict
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -168,6 +175,32 @@ class FusedSignal:
         }
 
 
+_DIRECTIONS = list(SignalDirection)
+_DIRECTION_INDEX = {direction: i for i, direction in enumerate(_DIRECTIONS)}
+
+
+def _classify(final_value: float):
+    """Map a fused value (-1 to 1) to a direction and strength"""
+    if final_value >= 0.7:
+        return SignalDirection.STRONG_BUY, min(abs(final_value), 1.0)
+    if final_value >= 0.3:
+        return SignalDirection.BUY, min(abs(final_value) * 1.5, 1.0)
+    if final_value <= -0.7:
+        return SignalDirection.STRONG_SELL, min(abs(final_value), 1.0)
+    if final_value <= -0.3:
+        return SignalDirection.SELL, min(abs(final_value) * 1.5, 1.0)
+    return SignalDirection.NEUTRAL, 0.3
+
+
+def _agreement(unique_directions: int) -> float:
+    """Agreement score from the number of distinct directions"""
+    if unique_directions == 1:
+        return 1.0
+    if unique_directions == 2:
+        return 0.7
+    return 0.4
+
+
 class SignalFusion:
     """
     Fuses multiple signal sources into unified trading signals
@@ -199,6 +232,9 @@ class SignalFusion:
         # Signal providers (functions that generate signals)
         self.providers: Dict[SignalSource, Callable] = {}
 
+        # Batch providers: take a list of tokens, return {token: RawSignal}
+        self.batch_providers: Dict[SignalSource, Callable] = {}
+
         self._load()
 
     def _init_default_weights(self):
@@ -315,59 +351,19 @@ class SignalFusion:
         if not signals:
             return None
 
-        # Calculate weighted average
-        weighted_sum = 0.0
-        total_weight = 0.0
-        source_contributions = {}
-        confidences = []
-
-        for source, signal in signals.items():
-            weight = self.weights.get(source, SignalWeight(source=source))
-            numeric_value = signal.to_numeric()
-
-            contribution = numeric_value * weight.current_weight * signal.confidence
-            weighted_sum += contribution
-            total_weight += weight.current_weight
-
-            source_contributions[source.value] = contribution
-            confidences.append(signal.confidence)
-
-        if total_weight == 0:
+        score = self._score_row(signals)
+        if score is None:
             return None
+        return self._build_fused(token, signals, score)
 
-        # Calculate final values
-        final_value = weighted_sum / total_weight
-        avg_confidence = sum(confidences) / len(confidences)
-
-        # Determine direction
-        if final_value >= 0.7:
-            direction = SignalDirection.STRONG_BUY
-            strength = min(abs(final_value), 1.0)
-        elif final_value >= 0.3:
-            direction = SignalDirection.BUY
-            strength = min(abs(final_value) * 1.5, 1.0)
-        elif final_value <= -0.7:
-            direction = SignalDirection.STRONG_SELL
-            strength = min(abs(final_value), 1.0)
-        elif final_value <= -0.3:
-            direction = SignalDirection.SELL
-            strength = min(abs(final_value) * 1.5, 1.0)
-        else:
-            direction = SignalDirection.NEUTRAL
-            strength = 0.3
-
-        # Calculate agreement score
-        directions = [sig.direction for sig in signals.values()]
-        unique_directions = set(directions)
-        if len(unique_directions) == 1:
-            agreement = 1.0
-        elif len(unique_directions) == 2:
-            agreement = 0.7
-        else:
-            agreement = 0.4
-
-        # Adjust confidence based on agreement
-        final_confidence = avg_confidence * (0.7 + 0.3 * agreement)
+    def _build_fused(
+        self,
+        token: str,
+        signals: Dict[SignalSource, RawSignal],
+        score: tuple
+    ) -> FusedSignal:
+        """Build a FusedSignal from a (direction, strength, confidence, agreement, contributions) score"""
+        direction, strength, final_confidence, agreement, source_contributions = score
 
         # Generate interpretation
         interpretation = self._generate_interpretation(
@@ -474,6 +470,181 @@ class SignalFusion:
 
         return signals
 
+    def register_batch_provider(self, source: SignalSource, provider: Callable):
+        """Register a provider that returns {token: RawSignal} for a list of tokens"""
+        self.batch_providers[source] = provider
+        logger.info(f"Registered batch signal provider for {source.value}")
+
+    async def collect_watchlist(
+        self,
+        tokens: List[str],
+        max_concurrency: int = 32,
+    ) -> Dict[str, Dict[SignalSource, RawSignal]]:
+        """
+        Collect signals for a whole watchlist in one round.
+
+        Batch providers are called once with every token; per-token
+        providers run concurrently (at most ``max_concurrency`` calls in
+        flight). Signals are stored as pending without triggering a fusion
+        per arrival; call fuse_watchlist afterwards.
+        """
+        slots = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def call(provider: Callable, arg):
+            if asyncio.iscoroutinefunction(provider):
+                return await provider(arg)
+            return provider(arg)
+
+        async def from_batch(source: SignalSource, provider: Callable) -> Dict[str, RawSignal]:
+            try:
+                return dict(await call(provider, list(tokens)) or {})
+            except Exception as e:
+                logger.error(f"Failed to collect batch signals from {source.value}: {e}")
+                return {}
+
+        async def from_single(source: SignalSource, provider: Callable, token: str):
+            async with slots:
+                try:
+                    return token, await call(provider, token)
+                except Exception as e:
+                    logger.error(f"Failed to collect signal from {source.value}: {e}")
+                    return token, None
+
+        async def from_source(source: SignalSource) -> Dict[str, RawSignal]:
+            if source in self.batch_providers:
+                return await from_batch(source, self.batch_providers[source])
+            provider = self.providers[source]
+            pairs = await asyncio.gather(*(from_single(source, provider, t) for t in tokens))
+            return {token: sig for token, sig in pairs if sig}
+
+        sources = list(dict.fromkeys([*self.batch_providers, *self.providers]))
+        per_source = await asyncio.gather(*(from_source(source) for source in sources))
+
+        collected: Dict[str, Dict[SignalSource, RawSignal]] = defaultdict(dict)
+        for source, by_token in zip(sources, per_source):
+            for token, signal in by_token.items():
+                if signal.is_expired():
+                    continue
+                collected[token][source] = signal
+                self.pending_signals[token][source] = signal
+
+        return dict(collected)
+
+    def fuse_watchlist(self, tokens: List[str]) -> List[FusedSignal]:
+        """
+        Fuse pending signals for many tokens in one pass.
+
+        Builds a token x source matrix and computes the same weighted
+        average, agreement and confidence as _fuse_signals for every row at
+        once. Qualifying signals are stored and their pending signals
+        cleared, as with per-token fusion.
+        """
+        rows: List[str] = []
+        row_signals: List[Dict[SignalSource, RawSignal]] = []
+        for token in dict.fromkeys(tokens):
+            active = {
+                source: sig for source, sig in self.pending_signals.get(token, {}).items()
+                if not sig.is_expired()
+            }
+            if active and len(active) >= self.min_sources:
+                rows.append(token)
+                row_signals.append(active)
+
+        if not rows:
+            return []
+
+        if HAS_NUMPY:
+            scored = self._score_matrix(row_signals)
+        else:
+            scored = [self._score_row(signals) for signals in row_signals]
+
+        emitted = []
+        for token, signals, score in zip(rows, row_signals, scored):
+            if score is None or score[2] < self.min_confidence:
+                continue
+
+            fused = self._build_fused(token, signals, score)
+            self.fused_signals[fused.signal_id] = fused
+            self.pending_signals[token] = {}
+            emitted.append(fused)
+
+        if emitted:
+            logger.info(f"Generated {len(emitted)} fused signals for {len(rows)} tokens")
+        return emitted
+
+    async def run_watchlist_round(self, tokens: List[str], max_concurrency: int = 32) -> List[FusedSignal]:
+        """Collect and fuse signals for a watchlist in one round"""
+        await self.collect_watchlist(tokens, max_concurrency=max_concurrency)
+        return self.fuse_watchlist(tokens)
+
+    def _score_row(self, signals: Dict[SignalSource, RawSignal]):
+        """Scalar scoring of one token (fallback when numpy is unavailable)"""
+        weighted_sum = 0.0
+        total_weight = 0.0
+        contributions = {}
+        for source, signal in signals.items():
+            weight = self.weights.get(source, SignalWeight(source=source)).current_weight
+            contribution = signal.to_numeric() * weight * signal.confidence
+            weighted_sum += contribution
+            total_weight += weight
+            contributions[source.value] = contribution
+
+        if total_weight == 0:
+            return None
+
+        direction, strength = _classify(weighted_sum / total_weight)
+        agreement = _agreement(len({sig.direction for sig in signals.values()}))
+        avg_confidence = sum(sig.confidence for sig in signals.values()) / len(signals)
+        confidence = avg_confidence * (0.7 + 0.3 * agreement)
+        return direction, strength, confidence, agreement, contributions
+
+    def _score_matrix(self, row_signals: List[Dict[SignalSource, RawSignal]]):
+        """Vectorized scoring over a token x source matrix"""
+        sources = list(SignalSource)
+        col = {source: i for i, source in enumerate(sources)}
+        n_rows, n_cols = len(row_signals), len(sources)
+
+        numeric = np.zeros((n_rows, n_cols))
+        conf = np.zeros((n_rows, n_cols))
+        present = np.zeros((n_rows, n_cols), dtype=bool)
+        direction_seen = np.zeros((n_rows, len(_DIRECTIONS)), dtype=bool)
+        for r, signals in enumerate(row_signals):
+            for source, signal in signals.items():
+                c = col[source]
+                numeric[r, c] = signal.to_numeric()
+                conf[r, c] = signal.confidence
+                present[r, c] = True
+                direction_seen[r, _DIRECTION_INDEX[signal.direction]] = True
+
+        weights = np.array([
+            self.weights.get(source, SignalWeight(source=source)).current_weight
+            for source in sources
+        ])
+        weight_matrix = np.where(present, weights, 0.0)
+
+        contrib = numeric * weight_matrix * conf
+        total_weight = weight_matrix.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            final_value = np.where(total_weight != 0, contrib.sum(axis=1) / total_weight, 0.0)
+        counts = present.sum(axis=1)
+        avg_conf = conf.sum(axis=1) / counts
+
+        unique = direction_seen.sum(axis=1)
+        agreement = np.select([unique == 1, unique == 2], [1.0, 0.7], default=0.4)
+        confidence = avg_conf * (0.7 + 0.3 * agreement)
+
+        scored = []
+        for r, signals in enumerate(row_signals):
+            if total_weight[r] == 0:
+                scored.append(None)
+                continue
+            direction, strength = _classify(float(final_value[r]))
+            contributions = {source.value: float(contrib[r, col[source]]) for source in signals}
+            scored.append((
+                direction, strength, float(confidence[r]), float(agreement[r]), contributions
+            ))
+        return scored
+
     async def get_signal(self, token: str) -> Optional[FusedSignal]:
         """Get the most recent valid fused signal for a token"""
         valid_signals = [
@@ -488,21 +659,30 @@ class SignalFusion:
 
     async def record_outcome(self, signal_id: str, was_profitable: bool):
         """Record the outcome of a signal for accuracy tracking"""
-        signal = self.fused_signals.get(signal_id)
-        if not signal:
-            return
+        await self.record_outcomes({signal_id: was_profitable})
 
-        signal.outcome = "profitable" if was_profitable else "loss"
+    async def record_outcomes(self, outcomes: Dict[str, bool]):
+        """Record several signal outcomes, persisting weights once"""
+        updated = False
 
-        # Update source weights based on contributions
-        for source_name, contribution in signal.source_signals.items():
-            source = SignalSource(source_name)
-            if source in self.weights:
-                # A source contributed positively if its direction matched the outcome
-                source_was_right = (contribution > 0) == was_profitable
-                self.weights[source].update_accuracy(source_was_right)
+        for signal_id, was_profitable in outcomes.items():
+            signal = self.fused_signals.get(signal_id)
+            if not signal:
+                continue
 
-        self._save()
+            signal.outcome = "profitable" if was_profitable else "loss"
+
+            # Update source weights based on contributions
+            for source_name, contribution in signal.source_signals.items():
+                source = SignalSource(source_name)
+                if source in self.weights:
+                    # A source contributed positively if its direction matched the outcome
+                    source_was_right = (contribution > 0) == was_profitable
+                    self.weights[source].update_accuracy(source_was_right)
+                    updated = True
+
+        if updated:
+            self._save()
 
     def get_weight_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get statistics for all signal source weights"""
@@ -519,6 +699,71 @@ class SignalFusion:
         ]
 
 
+class FusionScheduler:
+    """
+    Runs SignalFusion rounds over a shared watchlist on a fixed interval.
+
+    Each round collects signals for every watched token in one batched
+    pass and fuses them together, instead of fusing per token on arrival.
+    """
+
+    def __init__(
+        self,
+        fusion: Optional[SignalFusion] = None,
+        interval_seconds: float = 60.0,
+        max_concurrency: int = 32,
+    ):
+        self.fusion = fusion or get_signal_fusion()
+        self.interval_seconds = interval_seconds
+        self.max_concurrency = max_concurrency
+        self.watchlist: List[str] = []
+        self.last_round: List[FusedSignal] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def watch(self, tokens: List[str]):
+        """Add tokens to the watchlist"""
+        self.watchlist = list(dict.fromkeys([*self.watchlist, *tokens]))
+
+    def unwatch(self, tokens: List[str]):
+        """Remove tokens from the watchlist"""
+        dropped = set(tokens)
+        self.watchlist = [t for t in self.watchlist if t not in dropped]
+
+    async def run_once(self) -> List[FusedSignal]:
+        """Run one collection + fusion round over the current watchlist"""
+        if not self.watchlist:
+            return []
+        self.last_round = await self.fusion.run_watchlist_round(
+            list(self.watchlist), max_concurrency=self.max_concurrency
+        )
+        return self.last_round
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Fusion round failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self):
+        """Start the background round loop on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        """Stop the background round loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
 # Singleton instance
 _signal_fusion: Optional[SignalFusion] = None
 
@@ -46,6 +46,8 @@ except ImportError:
     load_solana_rpc_endpoints = None
     ConfigRpcEndpoint = None
 
+from core.metrics.latency_window import RollingLatencyWindow
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -115,59 +117,11 @@ class HealthCheckResult:
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
-class LatencyStats:
+class LatencyStats(RollingLatencyWindow):
     """Tracks latency statistics with rolling window."""
-    window_size: int = DEFAULT_WINDOW_SIZE
-    _latencies: List[float] = field(default_factory=list)
-    _lock: threading.Lock = field(default_factory=threading.Lock)
-
-    def record(self, latency_ms: float) -> None:
-        """Record a latency measurement."""
-        with self._lock:
-            self._latencies.append(latency_ms)
-            # Maintain rolling window
-            if len(self._latencies) > self.window_size:
-                self._latencies = self._latencies[-self.window_size:]
-
-    @property
-    def count(self) -> int:
-        """Number of recorded latencies."""
-        with self._lock:
-            return len(self._latencies)
-
-    def _percentile(self, p: float) -> Optional[float]:
-        """Calculate percentile from recorded latencies."""
-        with self._lock:
-            if not self._latencies:
-                return None
-            sorted_latencies = sorted(self._latencies)
-            idx = int(len(sorted_latencies) * p / 100)
-            idx = min(idx, len(sorted_latencies) - 1)
-            return sorted_latencies[idx]
-
-    @property
-    def p50(self) -> Optional[float]:
-        """Median latency (50th percentile)."""
-        return self._percentile(50)
-
-    @property
-    def p95(self) -> Optional[float]:
-        """95th percentile latency."""
-        return self._percentile(95)
 
-    @property
-    def p99(self) -> Optional[float]:
-        """99th percentile latency."""
-        return self._percentile(99)
-
-    @property
-    def average(self) -> Optional[float]:
-        """Average latency."""
-        with self._lock:
-            if not self._latencies:
-                return None
-            return sum(self._latencies) / len(self._latencies)
+    def __init__(self, window_size: int = DEFAULT_WINDOW_SIZE):
+        super().__init__(window_size=window_size)
 
 
 class HealthScore:
@@ -152,6 +152,11 @@ class StatePaths:
         """Circuit breaker state for X CLI."""
         return self.bots_dir / "circuit_breaker_state.json"
 
+    @property
+    def buy_tracker_state(self) -> Path:
+        """Buy tracker seen signatures and poll cursors."""
+        return self.bots_dir / "buy_tracker_state.json"
+
     @property
     def agent_registry_state(self) -> Path:
         """Agent registry state."""
@@ -27,11 +27,12 @@ import logging
 import os
 import time
 import uuid
-from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
+from core.metrics.latency_window import RollingLatencyWindow
+
 logger = logging.getLogger(__name__)
 
 # Import shutdown manager for graceful cleanup
@@ -234,7 +235,7 @@ class GeyserClient:
         self._messages_received: int = 0
         self._bytes_received: int = 0
         self._reconnect_count: int = 0
-        self._latencies: deque = deque(maxlen=100)
+        self._latencies = RollingLatencyWindow(window_size=100)
         self._connected_at: Optional[float] = None
 
         # Circuit breaker
@@ -678,7 +679,7 @@ class GeyserClient:
 
     def _record_latency(self, latency_ms: float) -> None:
         """Record a latency measurement."""
-        self._latencies.append(latency_ms)
+        self._latencies.record(latency_ms)
 
     def _record_failure(self) -> None:
         """Record a failure for circuit breaker."""
@@ -710,9 +711,7 @@ class GeyserClient:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get connection statistics."""
-        avg_latency = None
-        if self._latencies:
-            avg_latency = sum(self._latencies) / len(self._latencies)
+        avg_latency = self._latencies.average
 
         uptime = 0.0
         if self._connected_at and self.state == GeyserConnectionState.CONNECTED:
@@ -726,6 +725,7 @@ class GeyserClient:
             "reconnect_count": self._reconnect_count,
             "subscriptions": len(self._subscriptions),
             "avg_latency_ms": avg_latency,
+            "p95_latency_ms": self._latencies.p95,
             "uptime_seconds": uptime,
             "circuit_open": self._circuit_open,
             "failure_count": self._failure_count,
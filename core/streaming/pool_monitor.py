@@ -20,12 +20,16 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import struct
+import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 from core.streaming.geyser_client import (
     GeyserClient,
@@ -70,6 +74,9 @@ class DEXType(Enum):
         return mapping[self]
 
 
+_PROGRAM_DEX_TYPES: Dict[str, DEXType] = {dex.program_id: dex for dex in DEXType}
+
+
 class PoolEventType(Enum):
     """Types of pool events."""
 
@@ -81,9 +88,9 @@ class PoolEventType(Enum):
     POOL_CLOSED = "pool_closed"
 
 
-@dataclass
+@dataclass(slots=True)
 class PoolState:
-    """Current state of a liquidity pool."""
+    """Current state of a liquidity pool (slotted: one per tracked pool)."""
 
     address: str
     dex_type: DEXType
@@ -224,6 +231,42 @@ class PoolMonitorConfig:
     emit_all_swaps: bool = False  # If true, emit events for all swaps
 
 
+def _layout(*fields: Tuple[int, str]) -> struct.Struct:
+    """
+    Precompile a little-endian account layout from (offset, format) fields.
+
+    The gaps between fields become pad bytes, so an account is decoded by
+    one unpack_from over the raw buffer, without slicing or copying it.
+    Offsets are absolute; unpack_from must start at the first field's.
+    """
+    base = pos = fields[0][0]
+    fmt = "<"
+    for offset, code in fields:
+        if offset < pos:
+            raise ValueError(f"field at {offset} overlaps the previous one (ends at {pos})")
+        if offset > pos:
+            fmt += f"{offset - pos}x"
+        fmt += code
+        pos = base + struct.calcsize(fmt)
+    return struct.Struct(fmt)
+
+# Anchor account discriminator: sha256("account:Whirlpool")[:8]
+_WHIRLPOOL_DISCRIMINATOR = hashlib.sha256(b"account:Whirlpool").digest()[:8]
+
+
+@lru_cache(maxsize=65536)
+def encode_pubkey(pubkey_bytes: bytes) -> str:
+    """
+    Base58-encode a raw pubkey, cached and interned.
+
+    Pool accounts repeat the same mints (SOL, USDC, ...) on every update,
+    so caching skips the base58 work and interning shares one string per
+    mint across all tracked PoolStates.
+    """
+    import base58
+    return sys.intern(base58.b58encode(pubkey_bytes).decode("ascii"))
+
+
 class RaydiumPoolParser:
     """Parser for Raydium AMM V4 pool accounts."""
 
@@ -265,6 +308,14 @@ class RaydiumPoolParser:
 
     MIN_ACCOUNT_SIZE = 752
 
+    # coin_mint, pc_mint, pool_total_deposit_coin, pool_total_deposit_pc
+    _FIELDS = _layout(
+        (COIN_MINT_OFFSET, "32s"),
+        (PC_MINT_OFFSET, "32s"),
+        (POOL_TOTAL_DEPOSIT_COIN_OFFSET, "Q"),
+        (POOL_TOTAL_DEPOSIT_PC_OFFSET, "Q"),
+    )
+
     def parse(
         self,
         pubkey: str,
@@ -276,34 +327,75 @@ class RaydiumPoolParser:
             return None
 
         try:
-            # Extract key fields using struct unpacking
-            coin_mint = self._read_pubkey(data, self.COIN_MINT_OFFSET)
-            pc_mint = self._read_pubkey(data, self.PC_MINT_OFFSET)
-
-            # Read reserves
-            coin_reserve = struct.unpack_from("<Q", data, self.POOL_TOTAL_DEPOSIT_COIN_OFFSET)[0]
-            pc_reserve = struct.unpack_from("<Q", data, self.POOL_TOTAL_DEPOSIT_PC_OFFSET)[0]
-
-            # LP supply would need to be fetched from LP mint account
-            # For now, estimate from reserves
-            lp_supply = int((coin_reserve * pc_reserve) ** 0.5) if coin_reserve and pc_reserve else 0
-
-            return PoolState(
-                address=pubkey,
-                dex_type=DEXType.RAYDIUM,
-                token_a_mint=coin_mint,
-                token_b_mint=pc_mint,
-                token_a_reserve=coin_reserve,
-                token_b_reserve=pc_reserve,
-                lp_supply=lp_supply,
-                fee_rate_bps=25,  # Standard Raydium fee
-                slot=slot,
+            coin_mint, pc_mint, coin_reserve, pc_reserve = self._FIELDS.unpack_from(
+                data, self.COIN_MINT_OFFSET
+            )
+            return self._pool_state(
+                pubkey, slot, encode_pubkey(coin_mint), encode_pubkey(pc_mint), coin_reserve, pc_reserve
             )
 
         except Exception as e:
             logger.debug(f"Failed to parse Raydium pool {pubkey}: {e}")
             return None
 
+    def parse_batch(self, updates: Sequence[AccountUpdate]) -> List[Optional[PoolState]]:
+        """
+        Decode many AMM V4 accounts in one pass (e.g. re-sync after reconnect).
+
+        The layout and offsets are bound once for the batch, and each
+        distinct mint in it is base58-encoded once.
+        """
+        unpack_from = self._FIELDS.unpack_from
+        offset = self.COIN_MINT_OFFSET
+        min_size = self.MIN_ACCOUNT_SIZE
+        pool_state = self._pool_state
+        mints: Dict[bytes, str] = {}
+
+        states: List[Optional[PoolState]] = []
+        for update in updates:
+            data = update.data
+            if len(data) < min_size:
+                states.append(None)
+                continue
+            try:
+                coin_raw, pc_raw, coin_reserve, pc_reserve = unpack_from(data, offset)
+                coin_mint = mints.get(coin_raw)
+                if coin_mint is None:
+                    coin_mint = mints[coin_raw] = encode_pubkey(coin_raw)
+                pc_mint = mints.get(pc_raw)
+                if pc_mint is None:
+                    pc_mint = mints[pc_raw] = encode_pubkey(pc_raw)
+                states.append(pool_state(update.pubkey, update.slot, coin_mint, pc_mint, coin_reserve, pc_reserve))
+            except Exception as e:
+                logger.debug(f"Failed to parse Raydium pool {update.pubkey}: {e}")
+                states.append(None)
+        return states
+
+    @staticmethod
+    def _pool_state(
+        pubkey: str,
+        slot: int,
+        coin_mint: str,
+        pc_mint: str,
+        coin_reserve: int,
+        pc_reserve: int,
+    ) -> PoolState:
+        # LP supply would need to be fetched from LP mint account
+        # For now, estimate from reserves
+        lp_supply = int((coin_reserve * pc_reserve) ** 0.5) if coin_reserve and pc_reserve else 0
+
+        return PoolState(
+            address=pubkey,
+            dex_type=DEXType.RAYDIUM,
+            token_a_mint=coin_mint,
+            token_b_mint=pc_mint,
+            token_a_reserve=coin_reserve,
+            token_b_reserve=pc_reserve,
+            lp_supply=lp_supply,
+            fee_rate_bps=25,  # Standard Raydium fee
+            slot=slot,
+        )
+
     def parse_clmm(
         self,
         pubkey: str,
@@ -335,16 +427,30 @@ class RaydiumPoolParser:
 
     def _read_pubkey(self, data: bytes, offset: int) -> str:
         """Read a 32-byte pubkey and convert to base58 string."""
-        import base58
-        pubkey_bytes = data[offset : offset + 32]
-        return base58.b58encode(pubkey_bytes).decode("ascii")
+        return encode_pubkey(bytes(data[offset : offset + 32]))
 
 
 class OrcaPoolParser:
     """Parser for Orca Whirlpool accounts."""
 
+    # Whirlpool account layout offsets
+    DISCRIMINATOR_OFFSET = 0
+    CORE_OFFSET = 45  # fee_rate .. tick_current_index
+    TOKEN_MINT_A_OFFSET = 101
+    TOKEN_MINT_B_OFFSET = 181
+
     MIN_ACCOUNT_SIZE = 653
 
+    # discriminator; fee_rate u16, protocol_fee_rate u16, liquidity u128,
+    # sqrt_price u128, tick_current_index i32 (u128s as lo/hi u64 pairs);
+    # token_mint_a; token_mint_b
+    _FIELDS = _layout(
+        (DISCRIMINATOR_OFFSET, "8s"),
+        (CORE_OFFSET, "HHQQQQi"),
+        (TOKEN_MINT_A_OFFSET, "32s"),
+        (TOKEN_MINT_B_OFFSET, "32s"),
+    )
+
     def parse(
         self,
         pubkey: str,
@@ -356,28 +462,80 @@ class OrcaPoolParser:
             return None
 
         try:
-            # Whirlpool account layout:
-            # 8 bytes discriminator
-            # ... pool data
-
-            # Simplified parsing
-            return PoolState(
-                address=pubkey,
-                dex_type=DEXType.ORCA_WHIRLPOOL,
-                token_a_mint="",
-                token_b_mint="",
-                token_a_reserve=0,
-                token_b_reserve=0,
-                lp_supply=0,
-                fee_rate_bps=30,  # Standard Orca fee
-                slot=slot,
-                extra_data={"is_clmm": True},
+            fields = self._FIELDS.unpack_from(data, self.DISCRIMINATOR_OFFSET)
+            # Program subscriptions also deliver tick arrays, positions, configs
+            if fields[0] != _WHIRLPOOL_DISCRIMINATOR:
+                return None
+            return self._pool_state(
+                pubkey, slot, fields, encode_pubkey(fields[8]), encode_pubkey(fields[9])
             )
 
         except Exception as e:
             logger.debug(f"Failed to parse Orca Whirlpool {pubkey}: {e}")
             return None
 
+    def parse_batch(self, updates: Sequence[AccountUpdate]) -> List[Optional[PoolState]]:
+        """
+        Decode many Whirlpool accounts in one pass.
+
+        As with RaydiumPoolParser.parse_batch, the layout is bound once and
+        each distinct mint in the batch is base58-encoded once.
+        """
+        unpack_from = self._FIELDS.unpack_from
+        offset = self.DISCRIMINATOR_OFFSET
+        min_size = self.MIN_ACCOUNT_SIZE
+        pool_state = self._pool_state
+        mints: Dict[bytes, str] = {}
+
+        states: List[Optional[PoolState]] = []
+        for update in updates:
+            data = update.data
+            if len(data) < min_size:
+                states.append(None)
+                continue
+            try:
+                fields = unpack_from(data, offset)
+                if fields[0] != _WHIRLPOOL_DISCRIMINATOR:
+                    states.append(None)
+                    continue
+                mint_a = mints.get(fields[8])
+                if mint_a is None:
+                    mint_a = mints[fields[8]] = encode_pubkey(fields[8])
+                mint_b = mints.get(fields[9])
+                if mint_b is None:
+                    mint_b = mints[fields[9]] = encode_pubkey(fields[9])
+                states.append(pool_state(update.pubkey, update.slot, fields, mint_a, mint_b))
+            except Exception as e:
+                logger.debug(f"Failed to parse Orca Whirlpool {update.pubkey}: {e}")
+                states.append(None)
+        return states
+
+    @staticmethod
+    def _pool_state(pubkey: str, slot: int, fields: tuple, mint_a: str, mint_b: str) -> PoolState:
+        (
+            _discriminator, fee_rate, _protocol_fee_rate,
+            liquidity_lo, liquidity_hi,
+            sqrt_price_lo, sqrt_price_hi,
+            tick, _mint_a, _mint_b,
+        ) = fields
+
+        # Reserves live in the token vault accounts, not the pool account
+        return PoolState(
+            address=pubkey,
+            dex_type=DEXType.ORCA_WHIRLPOOL,
+            token_a_mint=mint_a,
+            token_b_mint=mint_b,
+            token_a_reserve=0,
+            token_b_reserve=0,
+            lp_supply=0,
+            fee_rate_bps=fee_rate // 100,  # fee_rate is in hundredths of a bp
+            slot=slot,
+            current_tick=tick,
+            sqrt_price_x64=sqrt_price_lo | (sqrt_price_hi << 64),
+            liquidity=liquidity_lo | (liquidity_hi << 64),
+            extra_data={"is_clmm": True},
+        )
+
 
 class JupiterPoolParser:
     """Parser for Jupiter Limit Order accounts."""
@@ -392,6 +550,10 @@ class JupiterPoolParser:
         # Jupiter uses various pool types
         return None
 
+    def parse_batch(self, updates: Sequence[AccountUpdate]) -> List[Optional[PoolState]]:
+        """Decode many Jupiter accounts."""
+        return [None] * len(updates)
+
 
 class PoolMonitor:
     """
@@ -408,8 +570,8 @@ class PoolMonitor:
         self.geyser_client = geyser_client
         self.config = config
 
-        # State
-        self._pool_states: Dict[str, PoolState] = {}
+        # State, least recently updated first (O(1) touch and evict)
+        self._pool_states: "OrderedDict[str, PoolState]" = OrderedDict()
         self._subscription_ids: List[str] = []
         self._running = False
 
@@ -423,6 +585,7 @@ class PoolMonitor:
         # Metrics
         self._updates_processed: int = 0
         self._events_emitted: int = 0
+        self._pools_evicted: int = 0
 
     def _init_parsers(self) -> None:
         """Initialize pool parsers for enabled DEXes."""
@@ -503,6 +666,41 @@ class PoolMonitor:
         if not state:
             return
 
+        await self._apply_pool_state(update, state)
+
+    async def handle_account_updates(self, updates: Sequence[AccountUpdate]) -> int:
+        """
+        Handle a batch of account updates (e.g. a re-sync snapshot).
+
+        Updates are grouped by DEX and decoded with each parser's batch
+        decoder, then applied in their original order.
+
+        Returns:
+            Number of updates that decoded to a pool state.
+        """
+        self._updates_processed += len(updates)
+
+        by_dex: Dict[DEXType, List[int]] = {}
+        for i, update in enumerate(updates):
+            dex_type = self._get_dex_type(update.owner)
+            if dex_type and dex_type in self._parsers:
+                by_dex.setdefault(dex_type, []).append(i)
+
+        states: List[Optional[PoolState]] = [None] * len(updates)
+        for dex_type, indices in by_dex.items():
+            batch = [updates[i] for i in indices]
+            for i, state in zip(indices, self._parse_pool_states(batch, dex_type)):
+                states[i] = state
+
+        decoded = 0
+        for update, state in zip(updates, states):
+            if state:
+                decoded += 1
+                await self._apply_pool_state(update, state)
+        return decoded
+
+    async def _apply_pool_state(self, update: AccountUpdate, state: PoolState) -> None:
+        """Diff a decoded state against the tracked one and emit events."""
         # Check if this is a new pool
         is_new = update.pubkey not in self._pool_states
 
@@ -569,28 +767,18 @@ class PoolMonitor:
                     )
                 )
 
-        # Update state
+        # Update state and mark most recently updated
         self._pool_states[update.pubkey] = state
+        self._pool_states.move_to_end(update.pubkey)
 
-        # Enforce max pools limit
-        if len(self._pool_states) > self.config.max_pools_tracked:
-            # Remove oldest pools
-            oldest = sorted(
-                self._pool_states.items(), key=lambda x: x[1].timestamp
-            )[: len(self._pool_states) - self.config.max_pools_tracked]
-            for addr, _ in oldest:
-                del self._pool_states[addr]
+        # Enforce max pools limit by evicting least recently updated
+        while len(self._pool_states) > self.config.max_pools_tracked:
+            self._pool_states.popitem(last=False)
+            self._pools_evicted += 1
 
     def _get_dex_type(self, owner: str) -> Optional[DEXType]:
         """Determine DEX type from program owner."""
-        mapping = {
-            RAYDIUM_AMM_V4_PROGRAM: DEXType.RAYDIUM,
-            RAYDIUM_CLMM_PROGRAM: DEXType.RAYDIUM_CLMM,
-            ORCA_WHIRLPOOL_PROGRAM: DEXType.ORCA_WHIRLPOOL,
-            JUPITER_LIMIT_V2_PROGRAM: DEXType.JUPITER,
-            METEORA_DLMM_PROGRAM: DEXType.METEORA,
-        }
-        return mapping.get(owner)
+        return _PROGRAM_DEX_TYPES.get(owner)
 
     def _parse_pool_state(
         self, update: AccountUpdate, dex_type: DEXType
@@ -605,6 +793,16 @@ class PoolMonitor:
         else:
             return parser.parse(update.pubkey, update.data, update.slot)
 
+    def _parse_pool_states(
+        self, updates: Sequence[AccountUpdate], dex_type: DEXType
+    ) -> List[Optional[PoolState]]:
+        """Parse a batch of updates for one DEX."""
+        parser = self._parsers[dex_type]
+
+        if dex_type == DEXType.RAYDIUM_CLMM:
+            return [parser.parse_clmm(u.pubkey, u.data, u.slot) for u in updates]
+        return parser.parse_batch(updates)
+
     async def _emit_event(self, event: PoolEvent) -> None:
         """Emit pool event to all callbacks."""
         self._events_emitted += 1
@@ -624,6 +822,7 @@ class PoolMonitor:
             "pools_tracked": len(self._pool_states),
             "updates_processed": self._updates_processed,
             "events_emitted": self._events_emitted,
+            "pools_evicted": self._pools_evicted,
             "enabled_dexes": [d.value for d in self.config.enabled_dexes],
             "subscriptions": len(self._subscription_ids),
         }
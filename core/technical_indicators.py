@@ -1,12 +1,19 @@
 """
 Technical Indicators - Comprehensive TA library.
+
+SMA, EMA, RSI, ATR, ADX, MACD, Bollinger Bands and OBV are maintained as
+incremental streams: the first call for a (symbol, indicator, period)
+bootstraps from history, after which add_candle updates the stream in
+O(1) and reads are O(1). Values match the from-scratch definitions below.
 """
 
 import logging
+from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
 import math
 from collections import deque
 
@@ -67,6 +74,264 @@ class TechnicalAnalysis:
     summary: str
 
 
+class _RollingSum:
+    """Sum of the last `window` values, resummed every window pushes to bound drift."""
+
+    __slots__ = ("window", "values", "total", "_pushes")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values: deque = deque(maxlen=window)
+        self.total = 0.0
+        self._pushes = 0
+
+    def push(self, value: float) -> None:
+        if len(self.values) == self.window:
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+
+        self._pushes += 1
+        if self._pushes >= self.window:
+            self.total = sum(self.values)
+            self._pushes = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class _Stream(ABC):
+    """Incrementally maintained indicator."""
+
+    @abstractmethod
+    def update(self, candle: "OHLCV", prev: Optional["OHLCV"]) -> None:
+        """Fold the newest candle into the indicator state."""
+
+
+class _SMAStream(_Stream):
+    def __init__(self, period: int):
+        self.period = period
+        self.closes = _RollingSum(period)
+
+    def update(self, candle, prev):
+        self.closes.push(candle.close)
+
+    def value(self) -> float:
+        if len(self.closes) < self.period:
+            return 0
+        return self.closes.total / self.period
+
+
+class _WindowedEMAStream(_Stream):
+    """
+    EMA seeded with the SMA of the first `period` values of the last
+    `window` closes, then smoothed over the rest of the window.
+
+    Once the window is full the value is split into the (lagged) seed sum
+    and a weighted tail sum, both updated in O(1) per close.
+    """
+
+    def __init__(self, period: int, window: int):
+        self.period = period
+        self.window = window
+        self.m = 2 / (period + 1)
+        self.closes: deque = deque(maxlen=window)
+        self._ema = 0.0  # Recursive EMA while the window is filling
+        self._seed_sum = 0.0
+        self._tail = 0.0
+        self._seed_decay = (1 - self.m) ** (window - period)
+        self._leave_weight = self.m * (1 - self.m) ** (window - 1 - period)
+        self._pushes = 0
+
+    def update(self, candle, prev):
+        x = candle.close
+        closes = self.closes
+        period, m = self.period, self.m
+
+        if len(closes) == self.window:
+            if self.window > period:
+                y_p = closes[period]
+                self._seed_sum += y_p - closes[0]
+                self._tail = (1 - m) * (self._tail - self._leave_weight * y_p) + m * x
+            else:
+                self._seed_sum += x - closes[0]
+            closes.append(x)
+
+            self._pushes += 1
+            if self._pushes >= self.window:
+                self._resum()
+            return
+
+        closes.append(x)
+        if len(closes) == period:
+            self._ema = sum(closes) / period
+        elif len(closes) > period:
+            self._ema = (x * m) + (self._ema * (1 - m))
+        if len(closes) == self.window:
+            self._resum()
+
+    def _resum(self) -> None:
+        values = list(self.closes)
+        period, m = self.period, self.m
+        self._seed_sum = sum(values[:period])
+        tail = 0.0
+        for price in values[period:]:
+            tail = (price * m) + (tail * (1 - m))
+        self._tail = tail
+        self._pushes = 0
+
+    def value(self) -> float:
+        n = len(self.closes)
+        if n < self.period:
+            return 0
+        if n < self.window:
+            return self._ema
+        return self._seed_decay * (self._seed_sum / self.period) + self._tail
+
+
+class _RSIStream(_Stream):
+    def __init__(self, period: int):
+        self.period = period
+        self.gains = _RollingSum(period)
+        self.losses = _RollingSum(period)
+
+    def update(self, candle, prev):
+        if prev is None:
+            return
+        change = candle.close - prev.close
+        if change > 0:
+            self.gains.push(change)
+            self.losses.push(0)
+        else:
+            self.gains.push(0)
+            self.losses.push(abs(change))
+
+    def value(self) -> float:
+        if len(self.gains) < self.period:
+            return 50  # Neutral default
+        avg_gain = self.gains.total / self.period
+        avg_loss = self.losses.total / self.period
+        if avg_loss == 0:
+            return 100
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+
+
+def _true_range(candle: "OHLCV", prev: "OHLCV") -> float:
+    return max(
+        candle.high - candle.low,
+        abs(candle.high - prev.close),
+        abs(candle.low - prev.close)
+    )
+
+
+class _ATRStream(_Stream):
+    def __init__(self, period: int):
+        self.period = period
+        self.true_ranges = _RollingSum(period)
+
+    def update(self, candle, prev):
+        if prev is not None:
+            self.true_ranges.push(_true_range(candle, prev))
+
+    def value(self) -> float:
+        count = len(self.true_ranges)
+        if count == 0:
+            return 0
+        return self.true_ranges.total / count
+
+
+class _ADXStream(_Stream):
+    def __init__(self, period: int):
+        self.period = period
+        self.true_ranges = _RollingSum(period)
+        self.plus_dm = _RollingSum(period)
+        self.minus_dm = _RollingSum(period)
+
+    def update(self, candle, prev):
+        if prev is None:
+            return
+        up = candle.high - prev.high
+        down = prev.low - candle.low
+        self.true_ranges.push(_true_range(candle, prev))
+        self.plus_dm.push(max(up if up > down else 0, 0))
+        self.minus_dm.push(max(down if down > up else 0, 0))
+
+    def value(self) -> float:
+        period = self.period
+        if len(self.true_ranges) < period:
+            return 0
+        atr = self.true_ranges.total / period
+        plus_di = (self.plus_dm.total / period) / atr * 100 if atr > 0 else 0
+        minus_di = (self.minus_dm.total / period) / atr * 100 if atr > 0 else 0
+        return abs(plus_di - minus_di) / (plus_di + minus_di) * 100 if (plus_di + minus_di) > 0 else 0
+
+
+class _BollingerStream(_Stream):
+    """Sliding-window mean and variance (Welford add/remove)."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.closes: deque = deque(maxlen=period)
+        self.mean = 0.0
+        self.m2 = 0.0
+        self._pushes = 0
+
+    def update(self, candle, prev):
+        x = candle.close
+        closes = self.closes
+        if len(closes) == self.period:
+            old = closes[0]
+            n = len(closes) - 1
+            if n:
+                delta = old - self.mean
+                self.mean -= delta / n
+                self.m2 -= delta * (old - self.mean)
+            else:
+                self.mean = self.m2 = 0.0
+        closes.append(x)
+        n = len(closes)
+        delta = x - self.mean
+        self.mean += delta / n
+        self.m2 += delta * (x - self.mean)
+
+        self._pushes += 1
+        if self._pushes >= self.period:
+            self.mean = sum(closes) / n
+            self.m2 = sum((p - self.mean) ** 2 for p in closes)
+            self._pushes = 0
+
+    def value(self, std_dev: float) -> Dict[str, float]:
+        if len(self.closes) < self.period:
+            return {'upper': 0, 'middle': 0, 'lower': 0, 'bandwidth': 0}
+        sma = self.mean
+        std = math.sqrt(max(self.m2, 0.0) / self.period)
+        upper = sma + (std_dev * std)
+        lower = sma - (std_dev * std)
+        bandwidth = ((upper - lower) / sma) * 100 if sma > 0 else 0
+        return {'upper': upper, 'middle': sma, 'lower': lower, 'bandwidth': bandwidth}
+
+
+class _OBVStream(_Stream):
+    """OBV over the retained history (pairs drop out with the oldest candle)."""
+
+    def __init__(self, max_history: int):
+        self.flows = _RollingSum(max(1, max_history - 1))
+
+    def update(self, candle, prev):
+        if prev is None:
+            return
+        if candle.close > prev.close:
+            self.flows.push(candle.volume)
+        elif candle.close < prev.close:
+            self.flows.push(-candle.volume)
+        else:
+            self.flows.push(0)
+
+    def value(self) -> float:
+        return self.flows.total if len(self.flows) else 0
+
+
 class TechnicalIndicators:
     """
     Technical indicators calculator.
@@ -86,16 +351,60 @@ class TechnicalIndicators:
         analysis = ta.analyze("SOL")
     """
 
-    def __init__(self, max_history: int = 500):
+    def __init__(self, max_history: int = 500, incremental: bool = True):
+        """
+        Args:
+            max_history: Candles retained per symbol.
+            incremental: Maintain core indicators as O(1) streams. When False,
+                every call recomputes from the candle history.
+        """
         self._candles: Dict[str, deque] = {}
         self._max_history = max_history
+        self.incremental = incremental
+        self._streams: Dict[str, Dict[Tuple, _Stream]] = {}
 
     def add_candle(self, symbol: str, candle: OHLCV):
         """Add a candle to history."""
         symbol = symbol.upper()
         if symbol not in self._candles:
             self._candles[symbol] = deque(maxlen=self._max_history)
-        self._candles[symbol].append(candle)
+        candles = self._candles[symbol]
+        prev = candles[-1] if candles else None
+        candles.append(candle)
+
+        streams = self._streams.get(symbol)
+        if streams:
+            for stream in streams.values():
+                stream.update(candle, prev)
+
+    def _stream(self, symbol: str, key: Tuple, window: int, factory) -> Optional[_Stream]:
+        """
+        Get (or bootstrap from history) the stream for an indicator.
+
+        Returns None when streaming is disabled or the indicator needs more
+        than max_history candles, in which case callers recompute.
+        """
+        if not self.incremental or window > self._max_history:
+            return None
+
+        symbol = symbol.upper()
+        streams = self._streams.setdefault(symbol, {})
+        stream = streams.get(key)
+        if stream is None:
+            stream = factory()
+            prev = None
+            for candle in self._candles.get(symbol, ()):
+                stream.update(candle, prev)
+                prev = candle
+            streams[key] = stream
+        return stream
+
+    def _tail(self, symbol: str, periods: int) -> List[OHLCV]:
+        """Last `periods` candles, oldest first, without copying the history."""
+        candles = self._candles.get(symbol.upper(), ())
+        tail = list(islice(reversed(candles), periods))
+        tail.reverse()
+        return tail
 
     def add_candles(self, symbol: str, candles: List[OHLCV]):
         """Add multiple candles."""
@@ -104,40 +413,32 @@ class TechnicalIndicators:
 
     def get_closes(self, symbol: str, periods: int = None) -> List[float]:
         """Get closing prices."""
-        candles = self._candles.get(symbol.upper(), [])
-        closes = [c.close for c in candles]
-        if periods:
-            closes = closes[-periods:]
-        return closes
+        candles = self._tail(symbol, periods) if periods else self._candles.get(symbol.upper(), [])
+        return [c.close for c in candles]
 
     def get_highs(self, symbol: str, periods: int = None) -> List[float]:
         """Get high prices."""
-        candles = self._candles.get(symbol.upper(), [])
-        highs = [c.high for c in candles]
-        if periods:
-            highs = highs[-periods:]
-        return highs
+        candles = self._tail(symbol, periods) if periods else self._candles.get(symbol.upper(), [])
+        return [c.high for c in candles]
 
     def get_lows(self, symbol: str, periods: int = None) -> List[float]:
         """Get low prices."""
-        candles = self._candles.get(symbol.upper(), [])
-        lows = [c.low for c in candles]
-        if periods:
-            lows = lows[-periods:]
-        return lows
+        candles = self._tail(symbol, periods) if periods else self._candles.get(symbol.upper(), [])
+        return [c.low for c in candles]
 
     def get_volumes(self, symbol: str, periods: int = None) -> List[float]:
         """Get volumes."""
-        candles = self._candles.get(symbol.upper(), [])
-        volumes = [c.volume for c in candles]
-        if periods:
-            volumes = volumes[-periods:]
-        return volumes
+        candles = self._tail(symbol, periods) if periods else self._candles.get(symbol.upper(), [])
+        return [c.volume for c in candles]
 
     # Moving Averages
 
     def sma(self, symbol: str, period: int = 20) -> float:
         """Simple Moving Average."""
+        stream = self._stream(symbol, ('sma', period), period, lambda: _SMAStream(period))
+        if stream is not None:
+            return stream.value()
+
         closes = self.get_closes(symbol, period)
         if len(closes) < period:
             return 0
@@ -145,6 +446,13 @@ class TechnicalIndicators:
 
     def ema(self, symbol: str, period: int = 20) -> float:
         """Exponential Moving Average."""
+        stream = self._stream(
+            symbol, ('ema', period, period * 2), period * 2,
+            lambda: _WindowedEMAStream(period, period * 2),
+        )
+        if stream is not None:
+            return stream.value()
+
         closes = self.get_closes(symbol, period * 2)
         if len(closes) < period:
             return 0
@@ -169,7 +477,7 @@ class TechnicalIndicators:
 
     def vwap(self, symbol: str, period: int = 20) -> float:
         """Volume Weighted Average Price."""
-        candles = list(self._candles.get(symbol.upper(), []))[-period:]
+        candles = self._tail(symbol, period)
         if not candles:
             return 0
 
@@ -182,6 +490,10 @@ class TechnicalIndicators:
 
     def rsi(self, symbol: str, period: int = 14) -> float:
         """Relative Strength Index."""
+        stream = self._stream(symbol, ('rsi', period), period + 1, lambda: _RSIStream(period))
+        if stream is not None:
+            return stream.value()
+
         closes = self.get_closes(symbol, period + 1)
         if len(closes) < period + 1:
             return 50  # Neutral default
@@ -235,7 +547,7 @@ class TechnicalIndicators:
 
     def cci(self, symbol: str, period: int = 20) -> float:
         """Commodity Channel Index."""
-        candles = list(self._candles.get(symbol.upper(), []))[-period:]
+        candles = self._tail(symbol, period)
         if len(candles) < period:
             return 0
 
@@ -292,13 +604,26 @@ class TechnicalIndicators:
 
     def macd(self, symbol: str, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, float]:
         """MACD (Moving Average Convergence Divergence)."""
-        closes = self.get_closes(symbol, slow + signal)
-        if len(closes) < slow:
-            return {'macd': 0, 'signal': 0, 'histogram': 0}
+        window = slow + signal
+        fast_stream = self._stream(
+            symbol, ('ema', fast, window), window, lambda: _WindowedEMAStream(fast, window)
+        )
+        if fast_stream is not None:
+            slow_stream = self._stream(
+                symbol, ('ema', slow, window), window, lambda: _WindowedEMAStream(slow, window)
+            )
+            if len(slow_stream.closes) < slow:
+                return {'macd': 0, 'signal': 0, 'histogram': 0}
+            fast_ema = fast_stream.value()
+            slow_ema = slow_stream.value()
+        else:
+            closes = self.get_closes(symbol, window)
+            if len(closes) < slow:
+                return {'macd': 0, 'signal': 0, 'histogram': 0}
 
-        # Calculate EMAs
-        fast_ema = self._calculate_ema(closes, fast)
-        slow_ema = self._calculate_ema(closes, slow)
+            # Calculate EMAs
+            fast_ema = self._calculate_ema(closes, fast)
+            slow_ema = self._calculate_ema(closes, slow)
 
         macd_line = fast_ema - slow_ema
 
@@ -330,6 +655,10 @@ class TechnicalIndicators:
 
     def bollinger_bands(self, symbol: str, period: int = 20, std_dev: float = 2) -> Dict[str, float]:
         """Bollinger Bands."""
+        stream = self._stream(symbol, ('bb', period), period, lambda: _BollingerStream(period))
+        if stream is not None:
+            return stream.value(std_dev)
+
         closes = self.get_closes(symbol, period)
         if len(closes) < period:
             return {'upper': 0, 'middle': 0, 'lower': 0, 'bandwidth': 0}
@@ -351,7 +680,11 @@ class TechnicalIndicators:
 
     def atr(self, symbol: str, period: int = 14) -> float:
         """Average True Range."""
-        candles = list(self._candles.get(symbol.upper(), []))[-period - 1:]
+        stream = self._stream(symbol, ('atr', period), period + 1, lambda: _ATRStream(period))
+        if stream is not None:
+            return stream.value()
+
+        candles = self._tail(symbol, period + 1)
         if len(candles) < 2:
             return 0
 
@@ -392,6 +725,12 @@ class TechnicalIndicators:
 
     def obv(self, symbol: str) -> float:
         """On-Balance Volume."""
+        stream = self._stream(
+            symbol, ('obv',), self._max_history, lambda: _OBVStream(self._max_history)
+        )
+        if stream is not None:
+            return stream.value()
+
         candles = list(self._candles.get(symbol.upper(), []))
         if len(candles) < 2:
             return 0
@@ -427,7 +766,11 @@ class TechnicalIndicators:
 
     def adx(self, symbol: str, period: int = 14) -> float:
         """Average Directional Index."""
-        candles = list(self._candles.get(symbol.upper(), []))[-period * 2:]
+        stream = self._stream(symbol, ('adx', period), period * 2, lambda: _ADXStream(period))
+        if stream is not None:
+            return stream.value()
+
+        candles = self._tail(symbol, period * 2)
         if len(candles) < period + 1:
             return 0
 
@@ -466,7 +809,7 @@ class TechnicalIndicators:
 
     def supertrend(self, symbol: str, period: int = 10, multiplier: float = 3) -> Dict[str, Any]:
         """SuperTrend indicator."""
-        candles = list(self._candles.get(symbol.upper(), []))[-period * 2:]
+        candles = self._candles.get(symbol.upper(), ())
         if len(candles) < period:
             return {'value': 0, 'direction': 'neutral'}
 
@@ -488,7 +831,7 @@ class TechnicalIndicators:
 
     def pivot_points(self, symbol: str) -> Dict[str, float]:
         """Calculate pivot points."""
-        candles = list(self._candles.get(symbol.upper(), []))
+        candles = self._candles.get(symbol.upper())
         if not candles:
             return {}
 
@@ -563,8 +906,8 @@ class TechnicalIndicators:
     def analyze(self, symbol: str) -> TechnicalAnalysis:
         """Perform complete technical analysis."""
         symbol = symbol.upper()
-        closes = self.get_closes(symbol)
-        if not closes:
+        candles = self._candles.get(symbol)
+        if not candles:
             return TechnicalAnalysis(
                 symbol=symbol,
                 timestamp=datetime.now(timezone.utc).isoformat(),
@@ -578,8 +921,9 @@ class TechnicalIndicators:
                 summary="Insufficient data"
             )
 
-        current_price = closes[-1]
+        current_price = candles[-1].close
         indicators = {}
+        now = datetime.now(timezone.utc).isoformat()
 
         # RSI
         rsi_val = self.rsi(symbol)
@@ -598,7 +942,7 @@ class TechnicalIndicators:
             value=rsi_val,
             signal=rsi_signal,
             interpretation=f"RSI at {rsi_val:.1f}",
-            timestamp=datetime.now(timezone.utc).isoformat()
+            timestamp=now
         )
 
         # MACD
@@ -614,7 +958,7 @@ class TechnicalIndicators:
             value=macd_data['macd'],
             signal=macd_signal,
             interpretation=f"MACD: {macd_data['macd']:.4f}, Histogram: {macd_data['histogram']:.4f}",
-            timestamp=datetime.now(timezone.utc).isoformat()
+            timestamp=now
         )
 
         # Moving Averages
@@ -633,7 +977,7 @@ class TechnicalIndicators:
             value=sma_20,
             signal=ma_signal,
             interpretation=f"SMA(20): {sma_20:.4f}",
-            timestamp=datetime.now(timezone.utc).isoformat()
+            timestamp=now
         )
 
         # Bollinger Bands
@@ -649,7 +993,7 @@ class TechnicalIndicators:
             value=bb['bandwidth'],
             signal=bb_signal,
             interpretation=f"Price vs BB: Lower={bb['lower']:.4f}, Upper={bb['upper']:.4f}",
-            timestamp=datetime.now(timezone.utc).isoformat()
+            timestamp=now
         )
 
         # ADX
@@ -659,7 +1003,7 @@ class TechnicalIndicators:
             value=adx_val,
             signal=SignalType.NEUTRAL,
             interpretation=f"Trend strength: {'Strong' if adx_val > 25 else 'Weak'}",
-            timestamp=datetime.now(timezone.utc).isoformat()
+            timestamp=now
         )
 
         # Determine overall trend
@@ -691,7 +1035,7 @@ class TechnicalIndicators:
 
         return TechnicalAnalysis(
             symbol=symbol,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=now,
             price=current_price,
             trend=trend,
             overall_signal=overall_signal,
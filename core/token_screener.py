@@ -20,18 +20,27 @@ Usage:
     screener = TokenScreener()
     criteria = ScreeningCriteria(min_market_cap=50000, min_liquidity=10000)
     results = screener.screen_tokens(["mint1", "mint2"], criteria)
+
+    # Concurrent batch, streaming results as they complete
+    async for result in screener.iter_screen_tokens(mints, criteria):
+        ...
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from core.screener_cache import ScreenerCacheStore
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +53,9 @@ CACHE_TTL_MARKET = 300     # 5 minutes for market data
 CACHE_TTL_SOCIAL = 1800    # 30 minutes for social data
 CACHE_TTL_SCREENING = 600  # 10 minutes for full screening results
 
+CACHE_DB_NAME = "cache.db"
+CACHE_MAX_ENTRIES = 50_000  # Oldest entries are evicted beyond this
+
 
 class RiskLevel(Enum):
     """Risk classification levels."""
@@ -384,77 +396,133 @@ def _cache_key(prefix: str, mint: str) -> str:
     return f"{prefix}_{mint[:16]}"
 
 
-def _cache_path(key: str) -> Path:
-    """Get cache file path."""
-    return CACHE_DIR / f"{key}.json"
+_cache_store: Optional[ScreenerCacheStore] = None
+_cache_store_lock = threading.Lock()
+
+
+def _get_cache_store(create: bool = True) -> Optional[ScreenerCacheStore]:
+    """Open (or reuse) the cache database inside CACHE_DIR.
+
+    With ``create=False`` returns None instead of creating a missing cache.
+    """
+    global _cache_store
+    db_path = CACHE_DIR / CACHE_DB_NAME
+    with _cache_store_lock:
+        if _cache_store is not None and _cache_store.db_path == db_path:
+            return _cache_store
+        if not create and not db_path.exists():
+            return None
+        _ensure_cache_dir()
+        if _cache_store is not None:
+            _cache_store.close()
+        _cache_store = ScreenerCacheStore(db_path, max_entries=CACHE_MAX_ENTRIES)
+        _remove_legacy_cache_files()
+        return _cache_store
+
+
+def _remove_legacy_cache_files() -> None:
+    """Delete per-key JSON files left by the old one-file-per-entry cache."""
+    removed = 0
+    for f in CACHE_DIR.glob("*_*.json"):
+        try:
+            f.unlink()
+            removed += 1
+        except OSError:
+            pass
+    if removed:
+        logger.info(f"Removed {removed} legacy screener cache files")
 
 
 def _read_cache(key: str, ttl_seconds: int) -> Optional[Dict[str, Any]]:
     """Read from cache if valid."""
-    path = _cache_path(key)
-    if not path.exists():
-        return None
     try:
-        data = json.loads(path.read_text())
-        cached_at = data.get("cached_at", 0)
-        if time.time() - cached_at > ttl_seconds:
-            return None
-        return data.get("payload")
-    except (json.JSONDecodeError, IOError):
+        return _get_cache_store().get(key, max_age=ttl_seconds)
+    except Exception as e:
+        logger.debug(f"Cache read failed for {key}: {e}")
         return None
 
 
-def _write_cache(key: str, payload: Any) -> None:
-    """Write to cache."""
-    _ensure_cache_dir()
-    path = _cache_path(key)
-    path.write_text(json.dumps({
-        "cached_at": time.time(),
-        "payload": payload,
-    }, indent=2))
+def _read_cache_many(keys: List[str], ttl_seconds: int) -> Dict[str, Dict[str, Any]]:
+    """Read several keys in one round trip. Stale or missing keys are omitted."""
+    try:
+        return _get_cache_store().get_many(keys, max_age=ttl_seconds)
+    except Exception as e:
+        logger.debug(f"Batched cache read failed: {e}")
+        return {}
+
+
+def _write_cache(key: str, payload: Any, ttl_seconds: Optional[int] = None) -> None:
+    """Write to cache, optionally with an entry-level expiry."""
+    try:
+        _get_cache_store().put(key, payload, ttl_seconds=ttl_seconds)
+    except Exception as e:
+        logger.debug(f"Cache write failed for {key}: {e}")
 
 
 def clear_cache(prefix: Optional[str] = None) -> int:
-    """Clear cache files.
+    """Clear cache entries.
 
     Args:
         prefix: Optional prefix to filter (e.g., "rugcheck", "market")
 
     Returns:
-        Number of files deleted
+        Number of entries deleted
     """
-    count = 0
-    if not CACHE_DIR.exists():
-        return count
-
-    pattern = f"{prefix}_*.json" if prefix else "*.json"
-    for f in CACHE_DIR.glob(pattern):
-        try:
-            f.unlink()
-            count += 1
-        except Exception:
-            pass
-    return count
+    store = _get_cache_store(create=False)
+    if store is None:
+        return 0
+    return store.clear(prefix)
 
 
 def get_cache_stats() -> Dict[str, Any]:
     """Get cache statistics."""
-    if not CACHE_DIR.exists():
-        return {"total_files": 0, "total_size_kb": 0, "categories": {}}
+    store = _get_cache_store(create=False)
+    if store is None:
+        return {"total_files": 0, "total_entries": 0, "total_size_kb": 0, "categories": {}}
 
-    stats: Dict[str, int] = {}
-    total_size = 0
+    stats = store.stats()
+    # total_files kept for callers written against the per-file cache
+    stats["total_files"] = stats["total_entries"]
+    return stats
 
-    for f in CACHE_DIR.glob("*.json"):
-        total_size += f.stat().st_size
-        prefix = f.stem.split("_")[0] if "_" in f.stem else "other"
-        stats[prefix] = stats.get(prefix, 0) + 1
 
-    return {
-        "total_files": sum(stats.values()),
-        "total_size_kb": round(total_size / 1024, 2),
-        "categories": stats,
-    }
+@dataclass
+class ProviderLimit:
+    """Concurrency and request spacing for one screening data provider."""
+    max_concurrency: int = 4
+    min_interval_s: float = 0.0  # Minimum gap between request starts
+
+
+# Per-provider limits for async batch screening. "market" also covers the
+# DexScreener symbol lookup (public limit ~300 req/min).
+DEFAULT_PROVIDER_LIMITS: Dict[str, ProviderLimit] = {
+    "rugcheck": ProviderLimit(max_concurrency=4, min_interval_s=0.1),
+    "market": ProviderLimit(max_concurrency=8, min_interval_s=0.2),
+    "social": ProviderLimit(max_concurrency=4, min_interval_s=0.1),
+    "holders": ProviderLimit(max_concurrency=4, min_interval_s=0.05),
+}
+
+
+class _ProviderGate:
+    """Bounds concurrent calls to a blocking fetcher and spaces their starts."""
+
+    def __init__(self, limit: ProviderLimit):
+        self._slots = asyncio.Semaphore(max(1, limit.max_concurrency))
+        self._interval = max(0.0, limit.min_interval_s)
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def run(self, executor: ThreadPoolExecutor, fn, *args):
+        async with self._slots:
+            if self._interval > 0:
+                async with self._lock:
+                    now = time.monotonic()
+                    start = max(now, self._next_start)
+                    self._next_start = start + self._interval
+                if start > now:
+                    await asyncio.sleep(start - now)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, partial(fn, *args))
 
 
 class TokenScreener:
@@ -551,7 +619,7 @@ class TokenScreener:
 
             # Cache result
             if use_cache:
-                _write_cache(cache_key, result.to_dict())
+                _write_cache(cache_key, result.to_dict(), CACHE_TTL_RUGCHECK)
 
         except ImportError:
             logger.warning("rugcheck module not available")
@@ -608,7 +676,7 @@ class TokenScreener:
                     result.source = "dexscreener"
 
                     if use_cache:
-                        _write_cache(cache_key, result.to_dict())
+                        _write_cache(cache_key, result.to_dict(), CACHE_TTL_MARKET)
                     return result
         except ImportError:
             logger.debug("dexscreener module not available")
@@ -631,7 +699,7 @@ class TokenScreener:
                 result.source = "dextools"
 
                 if use_cache:
-                    _write_cache(cache_key, result.to_dict())
+                    _write_cache(cache_key, result.to_dict(), CACHE_TTL_MARKET)
                 return result
         except ImportError:
             logger.debug("dextools module not available")
@@ -650,7 +718,7 @@ class TokenScreener:
                     result.source = "birdeye"
 
                     if use_cache:
-                        _write_cache(cache_key, result.to_dict())
+                        _write_cache(cache_key, result.to_dict(), CACHE_TTL_MARKET)
         except ImportError:
             logger.debug("birdeye module not available")
         except Exception as e:
@@ -727,7 +795,7 @@ class TokenScreener:
         result.social_score = min(100.0, score)
 
         if use_cache:
-            _write_cache(cache_key, result.to_dict())
+            _write_cache(cache_key, result.to_dict(), CACHE_TTL_SOCIAL)
 
         return result
 
@@ -797,7 +865,7 @@ class TokenScreener:
         result.distribution_score = max(0.0, score)
 
         if use_cache:
-            _write_cache(cache_key, result.to_dict())
+            _write_cache(cache_key, result.to_dict(), CACHE_TTL_MARKET)
 
         return result
 
@@ -1037,49 +1105,78 @@ class TokenScreener:
         """
         criteria = criteria or ScreeningCriteria()
 
-        # Check for cached full result
-        cache_key = _cache_key("screening", mint)
         if use_cache:
-            cached = _read_cache(cache_key, CACHE_TTL_SCREENING)
-            if cached:
-                result = ScreeningResult(mint=cached.get("mint", mint))
-                result.symbol = cached.get("symbol", "")
-                result.name = cached.get("name", "")
-                if cached.get("rugcheck"):
-                    result.rugcheck = RugcheckData(**cached["rugcheck"])
-                if cached.get("market"):
-                    result.market = MarketData(**cached["market"])
-                if cached.get("social"):
-                    result.social = SocialMetrics(**cached["social"])
-                if cached.get("holders"):
-                    result.holders = HolderData(**cached["holders"])
-                result.risk_score = cached.get("risk_score", 100.0)
-                result.risk_level = RiskLevel(cached.get("risk_level", "critical"))
-                result.opportunity_score = cached.get("opportunity_score", 0.0)
-                result.age_hours = cached.get("age_hours", 0.0)
-                result.timestamp = cached.get("timestamp", time.time())
-
-                # Re-check criteria (might have changed)
-                passed, failed = self.check_criteria(result, criteria)
-                result.passed_criteria = passed
-                result.failed_reasons = failed
-
-                return result
+            cached = self._load_cached_screening(mint, criteria)
+            if cached is not None:
+                return cached
 
         # Fetch all data
         rugcheck = self.fetch_rugcheck_data(mint, use_cache)
         market = self.fetch_market_data(mint, use_cache)
         social = self.fetch_social_metrics(mint, use_cache)
         holders = self.fetch_holder_data(mint, use_cache)
+        symbol, name = self._fetch_symbol_name(mint)
 
-        # Create result
-        result = ScreeningResult(mint=mint)
-        result.rugcheck = rugcheck
-        result.market = market
-        result.social = social
-        result.holders = holders
+        return self._build_result(
+            mint, criteria, rugcheck, market, social, holders, symbol, name, use_cache
+        )
+
+    def _load_cached_screening(
+        self,
+        mint: str,
+        criteria: ScreeningCriteria,
+    ) -> Optional[ScreeningResult]:
+        """Rebuild a cached full screening result, re-checking criteria."""
+        cached = _read_cache(_cache_key("screening", mint), CACHE_TTL_SCREENING)
+        if not cached:
+            return None
+        return self._result_from_cache(mint, cached, criteria)
+
+    def _prefetch_cached_screenings(
+        self,
+        mints: List[str],
+        criteria: ScreeningCriteria,
+    ) -> Dict[str, ScreeningResult]:
+        """Load cached screening results for many mints in one cache query."""
+        keys = {_cache_key("screening", mint): mint for mint in mints}
+        cached = _read_cache_many(list(keys), CACHE_TTL_SCREENING)
+        return {
+            keys[key]: self._result_from_cache(keys[key], payload, criteria)
+            for key, payload in cached.items()
+        }
 
-        # Try to get symbol/name from market data source
+    def _result_from_cache(
+        self,
+        mint: str,
+        cached: Dict[str, Any],
+        criteria: ScreeningCriteria,
+    ) -> ScreeningResult:
+        result = ScreeningResult(mint=cached.get("mint", mint))
+        result.symbol = cached.get("symbol", "")
+        result.name = cached.get("name", "")
+        if cached.get("rugcheck"):
+            result.rugcheck = RugcheckData(**cached["rugcheck"])
+        if cached.get("market"):
+            result.market = MarketData(**cached["market"])
+        if cached.get("social"):
+            result.social = SocialMetrics(**cached["social"])
+        if cached.get("holders"):
+            result.holders = HolderData(**cached["holders"])
+        result.risk_score = cached.get("risk_score", 100.0)
+        result.risk_level = RiskLevel(cached.get("risk_level", "critical"))
+        result.opportunity_score = cached.get("opportunity_score", 0.0)
+        result.age_hours = cached.get("age_hours", 0.0)
+        result.timestamp = cached.get("timestamp", time.time())
+
+        # Re-check criteria (might have changed)
+        passed, failed = self.check_criteria(result, criteria)
+        result.passed_criteria = passed
+        result.failed_reasons = failed
+
+        return result
+
+    def _fetch_symbol_name(self, mint: str) -> Tuple[str, str]:
+        """Look up symbol/name from the market data source."""
         try:
             from core import dexscreener
             ds_result = dexscreener.get_pairs_by_token(mint)
@@ -1087,10 +1184,31 @@ class TokenScreener:
                 pairs = ds_result.data.get("pairs", [])
                 if pairs:
                     base = pairs[0].get("baseToken", {})
-                    result.symbol = base.get("symbol", "")
-                    result.name = base.get("name", "")
+                    return base.get("symbol", ""), base.get("name", "")
         except Exception:
             pass
+        return "", ""
+
+    def _build_result(
+        self,
+        mint: str,
+        criteria: ScreeningCriteria,
+        rugcheck: RugcheckData,
+        market: MarketData,
+        social: SocialMetrics,
+        holders: HolderData,
+        symbol: str,
+        name: str,
+        use_cache: bool,
+    ) -> ScreeningResult:
+        """Score fetched data, check criteria and cache the screening result."""
+        result = ScreeningResult(mint=mint)
+        result.rugcheck = rugcheck
+        result.market = market
+        result.social = social
+        result.holders = holders
+        result.symbol = symbol
+        result.name = name
 
         # Calculate scores
         result.risk_score, result.risk_level = self.calculate_risk_score(
@@ -1107,7 +1225,7 @@ class TokenScreener:
 
         # Cache result
         if use_cache:
-            _write_cache(cache_key, result.to_dict())
+            _write_cache(_cache_key("screening", mint), result.to_dict(), CACHE_TTL_SCREENING)
 
         return result
 
@@ -1140,6 +1258,131 @@ class TokenScreener:
                 ))
         return results
 
+    async def iter_screen_tokens(
+        self,
+        mints: List[str],
+        criteria: Optional[ScreeningCriteria] = None,
+        use_cache: bool = True,
+        max_concurrent_tokens: int = 16,
+        provider_limits: Optional[Dict[str, ProviderLimit]] = None,
+    ) -> AsyncIterator[ScreeningResult]:
+        """Screen tokens concurrently, yielding results as they complete.
+
+        All four data sources for a token are fetched in parallel, and up to
+        ``max_concurrent_tokens`` tokens are in flight at once. Each provider
+        is gated by its own concurrency and request-spacing limit.
+
+        Args:
+            mints: List of token mint addresses
+            criteria: Optional screening criteria
+            use_cache: Whether to use cached data
+            max_concurrent_tokens: Tokens screened at the same time
+            provider_limits: Overrides for DEFAULT_PROVIDER_LIMITS
+
+        Yields:
+            ScreeningResults in completion order
+        """
+        if not mints:
+            return
+
+        criteria = criteria or ScreeningCriteria()
+
+        # Cached screenings come back from one batched read and stream first
+        pending = list(mints)
+        if use_cache:
+            cached = self._prefetch_cached_screenings(pending, criteria)
+            for result in cached.values():
+                yield result
+            pending = [mint for mint in pending if mint not in cached]
+            if not pending:
+                return
+
+        limits = {**DEFAULT_PROVIDER_LIMITS, **(provider_limits or {})}
+        gates = {provider: _ProviderGate(limit) for provider, limit in limits.items()}
+        token_slots = asyncio.Semaphore(max(1, max_concurrent_tokens))
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, sum(limit.max_concurrency for limit in limits.values())),
+            thread_name_prefix="screener",
+        )
+
+        async def screen_one(mint: str) -> ScreeningResult:
+            async with token_slots:
+                try:
+                    return await self._screen_token_async(mint, criteria, use_cache, gates, executor)
+                except Exception as e:
+                    logger.warning(f"Failed to screen {mint}: {e}")
+                    return ScreeningResult(
+                        mint=mint,
+                        failed_reasons=[f"screening_error: {str(e)[:50]}"]
+                    )
+
+        tasks = [asyncio.ensure_future(screen_one(mint)) for mint in pending]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            executor.shutdown(wait=False)
+
+    async def _screen_token_async(
+        self,
+        mint: str,
+        criteria: ScreeningCriteria,
+        use_cache: bool,
+        gates: Dict[str, "_ProviderGate"],
+        executor: ThreadPoolExecutor,
+    ) -> ScreeningResult:
+        """Async counterpart of screen_token (cache already checked) with gated, parallel fetches."""
+        rugcheck, market, social, holders, (symbol, name) = await asyncio.gather(
+            gates["rugcheck"].run(executor, self.fetch_rugcheck_data, mint, use_cache),
+            gates["market"].run(executor, self.fetch_market_data, mint, use_cache),
+            gates["social"].run(executor, self.fetch_social_metrics, mint, use_cache),
+            gates["holders"].run(executor, self.fetch_holder_data, mint, use_cache),
+            gates["market"].run(executor, self._fetch_symbol_name, mint),
+        )
+        return self._build_result(
+            mint, criteria, rugcheck, market, social, holders, symbol, name, use_cache
+        )
+
+    async def screen_tokens_async(
+        self,
+        mints: List[str],
+        criteria: Optional[ScreeningCriteria] = None,
+        use_cache: bool = True,
+        max_concurrent_tokens: int = 16,
+        provider_limits: Optional[Dict[str, ProviderLimit]] = None,
+    ) -> List[ScreeningResult]:
+        """Screen multiple tokens concurrently.
+
+        Returns:
+            List of ScreeningResults in the same order as ``mints``
+        """
+        by_mint: Dict[str, ScreeningResult] = {}
+        async for result in self.iter_screen_tokens(
+            mints, criteria, use_cache, max_concurrent_tokens, provider_limits
+        ):
+            by_mint[result.mint] = result
+        return [by_mint[mint] for mint in mints if mint in by_mint]
+
+    async def stream_rankings(
+        self,
+        mints: List[str],
+        criteria: Optional[ScreeningCriteria] = None,
+        by: str = "opportunity",
+        passed_only: bool = True,
+        limit: int = 10,
+        use_cache: bool = True,
+        max_concurrent_tokens: int = 16,
+    ) -> AsyncIterator[List[ScreeningResult]]:
+        """Yield the updated top-``limit`` ranking each time a token finishes."""
+        results: List[ScreeningResult] = []
+        async for result in self.iter_screen_tokens(
+            mints, criteria, use_cache, max_concurrent_tokens
+        ):
+            results.append(result)
+            yield self.rank_tokens(results, by=by, passed_only=passed_only, limit=limit)
+
     def rank_tokens(
         self,
         results: List[ScreeningResult],
@@ -1295,6 +1538,14 @@ def batch_screen(
     return get_screener().screen_tokens(mints, criteria)
 
 
+async def batch_screen_async(
+    mints: List[str],
+    criteria: Optional[ScreeningCriteria] = None,
+) -> List[ScreeningResult]:
+    """Screen multiple tokens concurrently."""
+    return await get_screener().screen_tokens_async(mints, criteria)
+
+
 if __name__ == "__main__":
     import logging
     logging.basicConfig(level=logging.INFO)
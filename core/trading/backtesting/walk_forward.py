@@ -8,14 +8,23 @@ Implements rolling window backtesting to simulate real trading conditions:
 4. Stitch together OOS equity curves
 
 This tests parameter stability and prevents overfitting.
+
+Windows are independent until their equity curves are stitched, so the
+in-sample grids and out-of-sample runs can be spread over a process pool
+(n_jobs); compounding and stitching stay sequential.
 """
 
+import bisect
+import functools
+import inspect
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Callable, Optional, Tuple
 import statistics
 
+from core.backtesting.parallel import TaskPool, task_rng, worker_count
+
 from .metrics import PerformanceMetrics, calculate_all_metrics, Trade
 
 logger = logging.getLogger(__name__)
@@ -75,6 +84,12 @@ class WalkForwardTester:
         test_months: Length of test window (default 6 months)
         step_months: How far to roll forward (default 6 = test_months)
         compound: Whether to compound equity across windows
+        n_jobs: Worker processes for optimization and test runs
+            (1 = in-process, <= 0 = all CPUs). strategy_func must be
+            picklable on platforms without fork.
+        seed: Base seed. A strategy_func that accepts an `rng` keyword gets
+            its own random.Random per call, seeded from (seed, window,
+            grid index), so results do not depend on n_jobs
     """
 
     def __init__(
@@ -84,12 +99,16 @@ class WalkForwardTester:
         step_months: int = 6,
         compound: bool = True,
         initial_capital: float = 1_000_000,
+        n_jobs: int = 1,
+        seed: int = 0,
     ):
         self.train_months = train_months
         self.test_months = test_months
         self.step_months = step_months
         self.compound = compound
         self.initial_capital = initial_capital
+        self.n_jobs = n_jobs
+        self.seed = seed
 
     def run(
         self,
@@ -114,60 +133,41 @@ class WalkForwardTester:
         if len(dates) < 365:
             raise ValueError("Insufficient data for walk-forward testing")
 
+        prices = [data[d] for d in dates]
+        specs = self._window_specs(dates)
+        combos = list(_param_combinations(param_grid))
+
         windows = []
         stitched_equity = [self.initial_capital]
         current_capital = self.initial_capital
         all_test_trades = []
         param_history = []
 
-        # Calculate window boundaries
-        start_date = dates[0]
-        end_date = dates[-1]
-        train_days = self.train_months * 30
-        test_days = self.test_months * 30
-        step_days = self.step_months * 30
-
-        window_id = 0
-        current_start = start_date
-
-        while True:
-            # Define window boundaries
-            train_end = current_start + timedelta(days=train_days)
-            test_start = train_end
-            test_end = test_start + timedelta(days=test_days)
-
-            # Check if we have enough data
-            if test_end > end_date:
-                break
+        workers = worker_count(self.n_jobs, len(specs) * max(1, len(combos)))
+        with TaskPool(workers, _StrategyRunner, prices, strategy_func) as pool:
+            # Optimize every window's training data in one batch
+            train_results = pool.map(_score_window, [
+                (self.seed, w, i, params, spec['train'], spec['train_start'], spec['train_end'], optimize_metric)
+                for w, spec in enumerate(specs)
+                for i, params in enumerate(combos)
+            ])
 
-            logger.info(f"Window {window_id}: Train {current_start.date()} - {train_end.date()}, "
-                       f"Test {test_start.date()} - {test_end.date()}")
-
-            # Extract data for windows
-            train_dates = [d for d in dates if current_start <= d < train_end]
-            test_dates = [d for d in dates if test_start <= d < test_end]
-
-            if len(train_dates) < 100 or len(test_dates) < 20:
-                current_start += timedelta(days=step_days)
-                continue
-
-            train_prices = [data[d] for d in train_dates]
-            test_prices = [data[d] for d in test_dates]
-
-            # Optimize on training data
-            best_params, train_metrics = self._optimize_params(
-                prices=train_prices,
-                strategy_func=strategy_func,
-                param_grid=param_grid,
-                optimize_metric=optimize_metric,
-                start_date=current_start,
-                end_date=train_end,
-            )
-
-            param_history.append(best_params)
+            best = [
+                _pick_best(combos, train_results[w * len(combos):(w + 1) * len(combos)])
+                for w in range(len(specs))
+            ]
 
             # Test with optimal params
-            test_trades, test_equity_raw = strategy_func(test_prices, best_params)
+            test_results = pool.map(_run_window, [
+                (self.seed, w, -1, best[w][0], spec['test'])
+                for w, spec in enumerate(specs)
+            ])
+
+        for window_id, spec in enumerate(specs):
+            best_params, train_metrics = best[window_id]
+            test_trades, test_equity_raw = test_results[window_id]
+            test_start, test_end = spec['test_start'], spec['test_end']
+            param_history.append(best_params)
 
             # Adjust equity for compounding
             if self.compound and test_equity_raw:
@@ -190,8 +190,8 @@ class WalkForwardTester:
             # Create window result
             window = WalkForwardWindow(
                 window_id=window_id,
-                train_start=current_start,
-                train_end=train_end,
+                train_start=spec['train_start'],
+                train_end=spec['train_end'],
                 test_start=test_start,
                 test_end=test_end,
                 optimal_params=best_params,
@@ -208,8 +208,6 @@ class WalkForwardTester:
                 current_capital = test_equity[-1]
 
             all_test_trades.extend(test_trades)
-            window_id += 1
-            current_start += timedelta(days=step_days)
 
         # Calculate aggregated metrics
         if windows and all_test_trades:
@@ -261,6 +259,45 @@ class WalkForwardTester:
 
         return result
 
+    def _window_specs(self, dates: List[datetime]) -> List[Dict[str, Any]]:
+        """Train/test boundaries and row ranges of every usable window."""
+        specs = []
+        start_date = dates[0]
+        end_date = dates[-1]
+        train_days = self.train_months * 30
+        test_days = self.test_months * 30
+        step_days = self.step_months * 30
+
+        current_start = start_date
+        while True:
+            # Define window boundaries
+            train_end = current_start + timedelta(days=train_days)
+            test_start = train_end
+            test_end = test_start + timedelta(days=test_days)
+
+            # Check if we have enough data
+            if test_end > end_date:
+                break
+
+            train = (bisect.bisect_left(dates, current_start), bisect.bisect_left(dates, train_end))
+            test = (bisect.bisect_left(dates, test_start), bisect.bisect_left(dates, test_end))
+
+            if train[1] - train[0] >= 100 and test[1] - test[0] >= 20:
+                logger.info(f"Window {len(specs)}: Train {current_start.date()} - {train_end.date()}, "
+                           f"Test {test_start.date()} - {test_end.date()}")
+                specs.append({
+                    'train_start': current_start,
+                    'train_end': train_end,
+                    'test_start': test_start,
+                    'test_end': test_end,
+                    'train': train,
+                    'test': test,
+                })
+
+            current_start += timedelta(days=step_days)
+
+        return specs
+
     def _optimize_params(
         self,
         prices: List[float],
@@ -271,54 +308,11 @@ class WalkForwardTester:
         end_date: datetime,
     ) -> Tuple[Dict[str, Any], PerformanceMetrics]:
         """Find optimal parameters on training data."""
-        best_params = {}
-        best_score = float('-inf')
-        best_metrics = PerformanceMetrics()
-
-        # Generate all parameter combinations
-        param_names = list(param_grid.keys())
-        param_values = list(param_grid.values())
-
-        def generate_combinations(idx=0, current={}):
-            if idx == len(param_names):
-                yield current.copy()
-                return
-
-            for value in param_values[idx]:
-                current[param_names[idx]] = value
-                yield from generate_combinations(idx + 1, current)
-
-        for params in generate_combinations():
-            try:
-                trades, equity = strategy_func(prices, params)
-
-                if not trades or not equity:
-                    continue
-
-                metrics = calculate_all_metrics(
-                    trades, equity, start_date, end_date, equity[0]
-                )
-
-                # Get optimization score
-                if optimize_metric == 'sharpe':
-                    score = metrics.sharpe_ratio
-                elif optimize_metric == 'sortino':
-                    score = metrics.sortino_ratio
-                elif optimize_metric == 'calmar':
-                    score = metrics.calmar_ratio
-                else:
-                    score = metrics.sharpe_ratio
-
-                if score > best_score:
-                    best_score = score
-                    best_params = params.copy()
-                    best_metrics = metrics
-
-            except Exception as e:
-                logger.warning(f"Error testing params {params}: {e}")
-                continue
-
-        return best_params, best_metrics
+        combos = list(_param_combinations(param_grid))
+        return _pick_best(combos, [
+            _score_params(prices, strategy_func, params, optimize_metric, start_date, end_date)
+            for params in combos
+        ])
 
     def _analyze_param_stability(
         self,
@@ -360,3 +354,108 @@ class WalkForwardTester:
             'params': stability,
             'windows_tested': len(param_history),
         }
+
+
+def _param_combinations(param_grid: Dict[str, List[Any]]):
+    """Yield every parameter combination in grid order."""
+    param_names = list(param_grid.keys())
+    param_values = list(param_grid.values())
+
+    def generate_combinations(idx=0, current={}):
+        if idx == len(param_names):
+            yield current.copy()
+            return
+
+        for value in param_values[idx]:
+            current[param_names[idx]] = value
+            yield from generate_combinations(idx + 1, current)
+
+    yield from generate_combinations()
+
+
+def _pick_best(
+    combos: List[Dict[str, Any]],
+    scores: List[Optional[Tuple[float, PerformanceMetrics]]],
+) -> Tuple[Dict[str, Any], PerformanceMetrics]:
+    """Highest-scoring combination; the first one wins ties."""
+    best_params = {}
+    best_score = float('-inf')
+    best_metrics = PerformanceMetrics()
+
+    for params, scored in zip(combos, scores):
+        if scored is not None and scored[0] > best_score:
+            best_score, best_metrics = scored
+            best_params = params.copy()
+
+    return best_params, best_metrics
+
+
+def _score_params(
+    prices: List[float],
+    strategy_func: Callable,
+    params: Dict[str, Any],
+    optimize_metric: str,
+    start_date: datetime,
+    end_date: datetime,
+) -> Optional[Tuple[float, PerformanceMetrics]]:
+    """Backtest one combination; None if it produced no trades or failed."""
+    try:
+        trades, equity = strategy_func(prices, params)
+
+        if not trades or not equity:
+            return None
+
+        metrics = calculate_all_metrics(
+            trades, equity, start_date, end_date, equity[0]
+        )
+
+        # Get optimization score
+        if optimize_metric == 'sharpe':
+            score = metrics.sharpe_ratio
+        elif optimize_metric == 'sortino':
+            score = metrics.sortino_ratio
+        elif optimize_metric == 'calmar':
+            score = metrics.calmar_ratio
+        else:
+            score = metrics.sharpe_ratio
+
+        return score, metrics
+
+    except Exception as e:
+        logger.warning(f"Error testing params {params}: {e}")
+        return None
+
+
+class _StrategyRunner:
+    """Per-process state: the price series and the strategy function."""
+
+    def __init__(self, prices: List[float], strategy_func: Callable):
+        self.prices = prices
+        self.strategy_func = strategy_func
+        try:
+            self._takes_rng = 'rng' in inspect.signature(strategy_func).parameters
+        except (TypeError, ValueError):
+            self._takes_rng = False
+
+    def strategy(self, seed: int, window: int, index: int) -> Callable:
+        """strategy_func, bound to the task's own rng if it accepts one."""
+        if not self._takes_rng:
+            return self.strategy_func
+        return functools.partial(self.strategy_func, rng=task_rng(seed, window, index))
+
+
+def _score_window(runner: _StrategyRunner, task) -> Optional[Tuple[float, PerformanceMetrics]]:
+    seed, window, index, params, (lo, hi), start_date, end_date, optimize_metric = task
+    return _score_params(
+        runner.prices[lo:hi],
+        runner.strategy(seed, window, index),
+        params,
+        optimize_metric,
+        start_date,
+        end_date,
+    )
+
+
+def _run_window(runner: _StrategyRunner, task) -> Tuple[List[Trade], List[float]]:
+    seed, window, index, params, (lo, hi) = task
+    return runner.strategy(seed, window, index)(runner.prices[lo:hi], params)
@@ -29,8 +29,6 @@ CORE MODULES
 - scripts/monitor_positions.py: Position monitoring daemon
 """
 
-import json
-from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 
@@ -45,7 +43,7 @@ You are Jarvis, an AI trading assistant with full access to the LifeOS trading i
 
 ### 1. Position Management
 You can check and manage active trading positions:
-- View current positions via exit_intents.json
+- View current positions via the exit intent store (core/exit_intents.py)
 - Monitor P&L, entry prices, and current values
 - Track take profit and stop loss levels
 - Execute sells when conditions are met
@@ -66,14 +64,19 @@ Via xAI/Grok integration:
 
 ### 4. Trading Commands
 You can execute these trading operations:
-- CHECK POSITIONS: Read ~/.lifeos/trading/exit_intents.json
+- CHECK POSITIONS: core.exit_intents.load_active_intents()
 - GET PRICE: Call DexScreener API for token mint
 - GET SENTIMENT: Call Grok with X search for token
 - EXECUTE SELL: Trigger Jupiter swap via scripts/savage_swap.py
 
 ## POSITION FILE FORMAT
 
-Exit intents are stored in: ~/.lifeos/trading/exit_intents.json
+Exit intents are stored in: ~/.lifeos/trading/exit_intents.db (SQLite)
+
+~/.lifeos/trading/exit_intents.json is a read-only snapshot of the active
+intents, rewritten from the database; edits made to it are overwritten and
+never enforced. Change intents through core.exit_intents (persist_intent,
+update_intent, cancel_intent). Each intent looks like:
 
 ```json
 {
@@ -138,7 +141,7 @@ When asked about trading decisions:
 ## COMMANDS YOU UNDERSTAND
 
 User says: "Check my positions"
-→ Read exit_intents.json, fetch current prices, show P&L
+→ Load active intents (core.exit_intents.load_active_intents), fetch current prices, show P&L
 
 User says: "What's the sentiment on FARTCOIN?"
 → Call Grok X search, analyze mentions and sentiment
@@ -147,7 +150,7 @@ User says: "Should I sell OIL?"
 → Check price, sentiment, liquidity, transaction ratios, give recommendation
 
 User says: "Set a stop loss at $X"
-→ Update exit_intents.json with new stop loss price
+→ Load the intent, set stop_loss.price, save it with core.exit_intents.update_intent
 
 User says: "Monitor positions"
 → Run scripts/monitor_positions.py or check manually
@@ -226,11 +229,10 @@ def get_trading_tools() -> List[Dict]:
 
 
 def load_current_positions() -> List[Dict]:
-    """Load current positions from exit intents file."""
-    exit_file = Path.home() / '.lifeos' / 'trading' / 'exit_intents.json'
-    if exit_file.exists():
-        return json.loads(exit_file.read_text())
-    return []
+    """Load active positions from the exit intent store."""
+    from core.exit_intents import load_active_intents
+
+    return [intent.to_dict() for intent in load_active_intents()]
 
 
 def get_position_summary() -> str:
@@ -254,7 +256,7 @@ def get_position_summary() -> str:
 QUICK_REFERENCE = """
 JARVIS TRADING QUICK REF
 ========================
-POSITIONS: ~/.lifeos/trading/exit_intents.json
+POSITIONS: core.exit_intents (~/.lifeos/trading/exit_intents.db; the .json is read-only)
 PRICES: api.dexscreener.com/latest/dex/tokens/{mint}
 SENTIMENT: api.x.ai/v1/responses (grok-4, x_search tool)
 
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Pool account decode replay benchmark.
+
+Replays recorded Raydium AMM V4 / Orca Whirlpool account snapshots through
+the streaming parsers and the PoolMonitor batch path, and compares against
+the legacy per-field decoder (one struct.unpack_from per field, uncached
+base58). This is the workload of a full re-sync after a Geyser reconnect.
+
+Snapshot format (JSONL, one account per line):
+    {"pubkey": "...", "owner": "<program id>", "slot": 123, "data": "<base64>"}
+
+Usage:
+    python scripts/benchmark_pool_decode.py --record snapshots.jsonl --accounts 20000
+    python scripts/benchmark_pool_decode.py --snapshots snapshots.jsonl
+"""
+import argparse
+import asyncio
+import base64
+import json
+import random
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.streaming.geyser_client import AccountUpdate
+from core.streaming.pool_monitor import (
+    ORCA_WHIRLPOOL_PROGRAM,
+    RAYDIUM_AMM_V4_PROGRAM,
+    SOL_MINT,
+    USDC_MINT,
+    USDT_MINT,
+    DEXType,
+    OrcaPoolParser,
+    PoolMonitor,
+    PoolMonitorConfig,
+    RaydiumPoolParser,
+    _WHIRLPOOL_DISCRIMINATOR,
+)
+
+
+def load_snapshots(path: Path) -> List[AccountUpdate]:
+    """Load recorded account snapshots."""
+    updates = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            updates.append(AccountUpdate(
+                pubkey=record["pubkey"],
+                slot=record["slot"],
+                lamports=record.get("lamports", 0),
+                owner=record["owner"],
+                data=base64.b64decode(record["data"]),
+                executable=False,
+                rent_epoch=0,
+                write_version=record.get("write_version", 0),
+            ))
+    return updates
+
+
+def record_snapshots(updates: List[AccountUpdate], path: Path) -> None:
+    """Write account snapshots in the replay format."""
+    with open(path, "w", encoding="utf-8") as f:
+        for u in updates:
+            f.write(json.dumps({
+                "pubkey": u.pubkey,
+                "owner": u.owner,
+                "slot": u.slot,
+                "lamports": u.lamports,
+                "write_version": u.write_version,
+                "data": base64.b64encode(u.data).decode("ascii"),
+            }) + "\n")
+
+
+def synthesize_snapshots(n_accounts: int, seed: int = 0) -> List[AccountUpdate]:
+    """
+    Build realistic-looking pool accounts: most pools quote against a few
+    common mints, as on mainnet.
+    """
+    import base58
+
+    rng = random.Random(seed)
+    quote_mints = [base58.b58decode(m) for m in (SOL_MINT, USDC_MINT, USDT_MINT)]
+    base_mints = [rng.randbytes(32) for _ in range(max(1, n_accounts // 4))]
+
+    updates = []
+    for i in range(n_accounts):
+        if i % 2 == 0:
+            owner = RAYDIUM_AMM_V4_PROGRAM
+            data = bytearray(RaydiumPoolParser.MIN_ACCOUNT_SIZE)
+            data[RaydiumPoolParser.COIN_MINT_OFFSET:RaydiumPoolParser.COIN_MINT_OFFSET + 32] = rng.choice(base_mints)
+            data[RaydiumPoolParser.PC_MINT_OFFSET:RaydiumPoolParser.PC_MINT_OFFSET + 32] = rng.choice(quote_mints)
+            struct.pack_into(
+                "<QQ", data, RaydiumPoolParser.POOL_TOTAL_DEPOSIT_COIN_OFFSET,
+                rng.randrange(1, 10**15), rng.randrange(1, 10**12),
+            )
+        else:
+            owner = ORCA_WHIRLPOOL_PROGRAM
+            data = bytearray(OrcaPoolParser.MIN_ACCOUNT_SIZE)
+            data[:8] = _WHIRLPOOL_DISCRIMINATOR
+            struct.pack_into(
+                "<HHQQQQi", data, OrcaPoolParser.CORE_OFFSET,
+                3000, 300, rng.getrandbits(64), 0, rng.getrandbits(64), 0,
+                rng.randrange(-400000, 400000),
+            )
+            data[OrcaPoolParser.TOKEN_MINT_A_OFFSET:OrcaPoolParser.TOKEN_MINT_A_OFFSET + 32] = rng.choice(base_mints)
+            data[OrcaPoolParser.TOKEN_MINT_B_OFFSET:OrcaPoolParser.TOKEN_MINT_B_OFFSET + 32] = rng.choice(quote_mints)
+
+        updates.append(AccountUpdate(
+            pubkey=base58.b58encode(rng.randbytes(32)).decode("ascii"),
+            slot=250_000_000 + i,
+            lamports=6_124_800,
+            owner=owner,
+            data=bytes(data),
+            executable=False,
+            rent_epoch=0,
+            write_version=i,
+        ))
+    return updates
+
+
+def legacy_decode(update: AccountUpdate):
+    """Per-field decoder as it was before batching (baseline)."""
+    import base58
+
+    data = update.data
+    if update.owner == RAYDIUM_AMM_V4_PROGRAM:
+        coin_mint = base58.b58encode(data[236:268]).decode("ascii")
+        pc_mint = base58.b58encode(data[268:300]).decode("ascii")
+        coin_reserve = struct.unpack_from("<Q", data, 460)[0]
+        pc_reserve = struct.unpack_from("<Q", data, 468)[0]
+        return coin_mint, pc_mint, coin_reserve, pc_reserve
+    fee_rate = struct.unpack_from("<H", data, 45)[0]
+    liquidity = int.from_bytes(data[49:65], "little")
+    sqrt_price = int.from_bytes(data[65:81], "little")
+    tick = struct.unpack_from("<i", data, 81)[0]
+    mint_a = base58.b58encode(data[101:133]).decode("ascii")
+    mint_b = base58.b58encode(data[181:213]).decode("ascii")
+    return fee_rate, liquidity, sqrt_price, tick, mint_a, mint_b
+
+
+def _time(name: str, fn: Callable[[], object], n_accounts: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<32} {best * 1000:>10.1f} ms {n_accounts / best:>14,.0f} accounts/s")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay pool account snapshots through the decoders")
+    parser.add_argument("--snapshots", type=Path, help="Recorded snapshots (JSONL)")
+    parser.add_argument("--record", type=Path, help="Write synthesized snapshots here and exit")
+    parser.add_argument("--accounts", type=int, default=20000, help="Synthesized account count")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions (best is reported)")
+    args = parser.parse_args()
+
+    if args.record:
+        record_snapshots(synthesize_snapshots(args.accounts), args.record)
+        print(f"Recorded {args.accounts} snapshots to {args.record}")
+        return
+
+    updates = load_snapshots(args.snapshots) if args.snapshots else synthesize_snapshots(args.accounts)
+    n = len(updates)
+    raydium = [u for u in updates if u.owner == RAYDIUM_AMM_V4_PROGRAM]
+    orca = [u for u in updates if u.owner == ORCA_WHIRLPOOL_PROGRAM]
+
+    print("=" * 72)
+    print(f"POOL DECODE REPLAY: {n} accounts ({len(raydium)} Raydium, {len(orca)} Orca)")
+    print("=" * 72)
+
+    raydium_parser = RaydiumPoolParser()
+    orca_parser = OrcaPoolParser()
+
+    baseline = _time("legacy per-field decode", lambda: [legacy_decode(u) for u in updates], n, args.repeat)
+    batched = _time(
+        "batched decode",
+        lambda: (raydium_parser.parse_batch(raydium), orca_parser.parse_batch(orca)),
+        n, args.repeat,
+    )
+
+    def replay() -> None:
+        monitor = PoolMonitor(
+            None,
+            PoolMonitorConfig(
+                enabled_dexes=[DEXType.RAYDIUM, DEXType.ORCA_WHIRLPOOL],
+                max_pools_tracked=max(1, n),
+            ),
+        )
+        asyncio.run(monitor.handle_account_updates(updates))
+
+    _time("PoolMonitor re-sync replay", replay, n, args.repeat)
+    print("-" * 72)
+    print(f"decode speedup: {baseline / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
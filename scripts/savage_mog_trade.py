@@ -16,12 +16,16 @@ This script:
 3. Generates Jupiter swap transaction
 """
 
-import json
+import sys
 import time
 import uuid
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core import exit_intents
+
 # Trade Parameters - SAVAGE MODE
 TRADE_CONFIG = {
     "strategy": "LUT_MICRO_ALPHA",
@@ -129,25 +133,13 @@ def create_exit_intent(config: dict) -> dict:
     return intent
 
 def persist_intent(intent: dict) -> bool:
-    """Persist exit intent to disk BEFORE trade execution."""
-    trading_dir = Path.home() / ".lifeos" / "trading"
-    trading_dir.mkdir(parents=True, exist_ok=True)
-    intents_file = trading_dir / "exit_intents.json"
-    
-    # Load existing intents
-    intents = []
-    if intents_file.exists():
-        try:
-            intents = json.loads(intents_file.read_text())
-        except json.JSONDecodeError:
-            intents = []
-    
-    # Add new intent
-    intents.append(intent)
-    
-    # Persist
-    intents_file.write_text(json.dumps(intents, indent=2))
-    return True
+    """
+    Persist exit intent to the intent store BEFORE trade execution.
+
+    The exit daemon reads only the SQLite store; exit_intents.json is a
+    read-only mirror of it, so intents must not be written there directly.
+    """
+    return exit_intents.persist_intent(exit_intents.ExitIntent.from_dict(intent))
 
 def print_trade_summary(config: dict, intent: dict):
     """Print trade execution summary."""
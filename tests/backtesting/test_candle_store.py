@@ -0,0 +1,183 @@
+"""
+Tests for the memory-mapped candle store.
+
+Windows must be zero-copy views over the column files, appends must be
+idempotent over overlapping history, and engines loading from the store
+must produce the same results as loading the equivalent dicts.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+np = pytest.importorskip("numpy")
+
+from core.backtesting.backtest_engine import AdvancedBacktestEngine, BacktestConfig
+from core.backtesting.candle_store import CandleStore
+from core.backtester import BacktestEngine
+
+
+def _candles(n: int, start_day: int = 0) -> List[Dict[str, Any]]:
+    data = []
+    for i in range(start_day, start_day + n):
+        price = 100.0 + ((i * 7) % 11 - 5) * 0.8 + i * 0.1
+        data.append({
+            'timestamp': (datetime(2024, 1, 1) + timedelta(days=i)).isoformat(),
+            'open': price * 0.995,
+            'high': price * 1.01,
+            'low': price * 0.99,
+            'close': price,
+            'volume': 1000.0 + i,
+        })
+    return data
+
+
+@pytest.fixture
+def store(tmp_path) -> CandleStore:
+    return CandleStore(tmp_path / "candles")
+
+
+class TestCandleStore:
+    """Append, range slicing and persistence."""
+
+    def test_round_trip(self, store):
+        data = _candles(30)
+        assert store.append_records("sol", "1d", data) == 30
+
+        window = store.window("SOL", "1d")
+
+        assert window.to_records() == data
+        assert isinstance(window['close'], np.memmap)
+
+    def test_range_slicing(self, store):
+        store.append_records("SOL", "1d", _candles(60))
+
+        window = store.window("SOL", "1d", "2024-01-10", "2024-01-20")
+
+        timestamps = window.iso_timestamps()
+        assert timestamps[0] == "2024-01-10T00:00:00"
+        assert timestamps[-1] == "2024-01-20T00:00:00"
+        assert len(window) == 11
+        assert len(store.window("SOL", "1d", start="2024-02-25")) == 5
+        assert len(store.window("SOL", "1d", "2025-01-01", "2025-02-01")) == 0
+
+    def test_window_is_zero_copy(self, store):
+        store.append_records("SOL", "1d", _candles(20))
+
+        full = store.window("SOL", "1d")
+        part = store.window("SOL", "1d", "2024-01-05", "2024-01-08")
+
+        assert np.shares_memory(full['close'], part['close'])
+        assert not part['close'].flags.writeable
+
+    def test_to_columnar_reads_columns_lazily(self, store):
+        data = _candles(20)
+        store.append_records("SOL", "1d", data)
+
+        columns = store.window("SOL", "1d").to_columnar()
+
+        assert isinstance(columns.close, np.memmap)
+        assert not isinstance(columns.timestamps, list)
+        assert columns.timestamps[-1] == data[-1]['timestamp']
+        assert list(columns.timestamps[2:5]) == [d['timestamp'] for d in data[2:5]]
+        assert np.shares_memory(columns.timestamps.epoch_ms, store.window("SOL", "1d").timestamps)
+
+    def test_overlapping_append_is_idempotent(self, store):
+        store.append_records("SOL", "1d", _candles(20))
+
+        # Days 10..29: only 20..29 are new
+        assert store.append_records("SOL", "1d", _candles(20, start_day=10)) == 10
+        assert store.append_records("SOL", "1d", _candles(20, start_day=10)) == 0
+
+        assert store.window("SOL", "1d").to_records() == _candles(30)
+
+    def test_unsorted_duplicates_last_wins(self, store):
+        rows = _candles(3)
+        dup = dict(rows[1], close=999.0)
+        store.append_records("SOL", "1d", [rows[2], rows[1], rows[0], dup])
+
+        assert store.window("SOL", "1d")['close'].tolist() == [rows[0]['close'], 999.0, rows[2]['close']]
+
+    def test_persists_and_discards_torn_append(self, tmp_path):
+        first = CandleStore(tmp_path / "candles")
+        first.append_records("SOL", "1h", _candles(10))
+
+        # Simulate a crash after writing a column but before committing meta
+        with open(tmp_path / "candles" / "SOL" / "1h" / "close.f8", "ab") as f:
+            f.write(np.ones(3).tobytes())
+
+        reopened = CandleStore(tmp_path / "candles")
+        assert reopened.count("SOL", "1h") == 10
+        assert reopened.append_records("SOL", "1h", _candles(2, start_day=10)) == 2
+        assert reopened.window("SOL", "1h").to_records() == _candles(12)
+        assert reopened.series() == [("SOL", "1h")]
+
+    def test_column_set_is_fixed(self, store):
+        store.append("BTC-USD", "1h", [0, 1000], {'price': [1.0, 2.0]})
+        with pytest.raises(ValueError):
+            store.append("BTC-USD", "1h", [2000], {'close': [1.0]})
+        with pytest.raises(ValueError):
+            store.window("BTC-USD", "1h").to_columnar()
+
+    def test_delete(self, store):
+        store.append_records("SOL", "1d", _candles(5))
+        assert store.delete("SOL", "1d")
+        assert not store.has("SOL", "1d")
+        assert store.series() == []
+
+
+class TestEngineIntegration:
+    """Engines loading from the store match loading from dicts."""
+
+    def _strategy(self, engine, candle):
+        if engine.sma(5) > engine.sma(15):
+            engine.buy(0.5)
+        else:
+            engine.close_position("cross")
+
+    @pytest.mark.parametrize("columnar", [True, False])
+    def test_advanced_engine_from_store(self, store, tmp_path, columnar):
+        data = _candles(120)
+        store.append_records("SOL", "1d", data)
+        config = BacktestConfig(
+            symbol="SOL", start_date="2024-01-15", end_date="2024-04-10", initial_capital=1000,
+        )
+
+        from_dicts = AdvancedBacktestEngine(results_dir=tmp_path, columnar=columnar)
+        from_dicts.load_data("SOL", data)
+        from_store = AdvancedBacktestEngine(results_dir=tmp_path, columnar=columnar)
+        from_store.load_from_store(store, "SOL", "1d", "2024-01-10")
+
+        expected = from_dicts.run(self._strategy, config)
+        result = from_store.run(self._strategy, config)
+
+        assert result.metrics.total_trades == expected.metrics.total_trades
+        assert result.metrics.total_return == pytest.approx(expected.metrics.total_return)
+        assert [t.timestamp for t in result.trades] == [t.timestamp for t in expected.trades]
+
+    def test_load_from_store_builds_candles_on_access(self, store, tmp_path):
+        data = _candles(30)
+        store.append_records("SOL", "1d", data)
+
+        engine = AdvancedBacktestEngine(results_dir=tmp_path, columnar=True)
+        engine.load_from_store(store, "SOL", "1d")
+        candles = engine.get_data("SOL")
+
+        assert not isinstance(candles, list)
+        assert len(candles) == 30
+        assert candles[-1].timestamp == data[-1]['timestamp']
+        assert candles[3].close == data[3]['close']
+        assert [c.volume for c in candles[10:13]] == [d['volume'] for d in data[10:13]]
+        assert [c.timestamp for c in candles] == [d['timestamp'] for d in data]
+
+    def test_simple_engine_from_store(self, store, tmp_path):
+        data = _candles(40)
+        store.append_records("SOL", "1d", data)
+
+        engine = BacktestEngine(db_path=tmp_path / "bt.db")
+        engine.load_data_from_store(store, "SOL", "1d", end="2024-01-31")
+
+        loaded = engine._data["SOL"]
+        assert len(loaded) == 31
+        assert loaded[0].timestamp == data[0]['timestamp']
+        assert loaded[-1].close == data[30]['close']
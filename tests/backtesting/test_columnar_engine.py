@@ -0,0 +1,163 @@
+"""
+Tests for the columnar (NumPy-backed) mode of AdvancedBacktestEngine.
+
+Columnar indicators must match the row-mode accessors bar for bar,
+including warm-up values, so strategies trade identically in both modes.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+pytest.importorskip("numpy")
+
+from core.backtesting.backtest_engine import AdvancedBacktestEngine, BacktestConfig
+from core.backtesting.columnar import ColumnarOHLCV, IndicatorCache, date_range_bounds
+
+
+@pytest.fixture
+def price_data() -> List[Dict[str, Any]]:
+    """Zig-zag price series with flat stretches (exercises RSI=100 paths)."""
+    base_price = 100.0
+    data = []
+    for i in range(180):
+        if 40 <= i < 60:
+            change = 0.004  # monotonic run: no losses in the RSI window
+        else:
+            change = ((i * 7) % 11 - 5) * 0.006
+        base_price = base_price * (1 + change)
+        data.append({
+            'timestamp': (datetime(2024, 1, 1) + timedelta(days=i)).isoformat(),
+            'open': base_price * 0.996,
+            'high': base_price * (1.01 + (i % 3) * 0.005),
+            'low': base_price * (0.99 - (i % 4) * 0.004),
+            'close': base_price,
+            'volume': 1000 + i,
+        })
+    return data
+
+
+def _config(**overrides) -> BacktestConfig:
+    params = dict(
+        symbol='SOL',
+        start_date='2024-01-01',
+        end_date='2024-12-31',
+        initial_capital=10000,
+    )
+    params.update(overrides)
+    return BacktestConfig(**params)
+
+
+def _record_indicators(engine: AdvancedBacktestEngine, config: BacktestConfig) -> List[Dict]:
+    rows = []
+
+    def probe(eng, candle):
+        bb = eng.bollinger_bands(20, 2)
+        rows.append({
+            'close': eng.close(),
+            'close_3': eng.close(3),
+            'high_1': eng.high(1),
+            'low': eng.low(),
+            'volume': eng.volume(),
+            'sma5': eng.sma(5),
+            'sma20': eng.sma(20),
+            'ema9': eng.ema(9),
+            'ema26': eng.ema(26),
+            'rsi14': eng.rsi(14),
+            'rsi3': eng.rsi(3),
+            'atr14': eng.atr(14),
+            'macd': eng.macd()['macd'],
+            'bb_upper': bb['upper'],
+            'bb_middle': bb['middle'],
+            'bb_lower': bb['lower'],
+        })
+
+    engine.run(probe, config, 'probe')
+    return rows
+
+
+class TestColumnarIndicators:
+    """Columnar indicator series match row-mode values."""
+
+    def test_indicator_parity(self, price_data, tmp_path):
+        row_engine = AdvancedBacktestEngine(results_dir=tmp_path)
+        col_engine = AdvancedBacktestEngine(results_dir=tmp_path, columnar=True)
+        row_engine.load_data('SOL', price_data)
+        col_engine.load_data('SOL', price_data)
+
+        expected = _record_indicators(row_engine, _config())
+        actual = _record_indicators(col_engine, _config())
+
+        assert len(expected) == len(actual) == 180
+        for bar, (exp, act) in enumerate(zip(expected, actual)):
+            for key, value in exp.items():
+                assert act[key] == pytest.approx(value, rel=1e-9, abs=1e-9), (bar, key)
+
+    def test_date_range_slice_parity(self, price_data, tmp_path):
+        config = _config(start_date='2024-02-10', end_date='2024-04-20')
+        row_engine = AdvancedBacktestEngine(results_dir=tmp_path)
+        col_engine = AdvancedBacktestEngine(results_dir=tmp_path, columnar=True)
+        row_engine.load_data('SOL', price_data)
+        col_engine.load_data('SOL', price_data)
+
+        expected = _record_indicators(row_engine, config)
+        actual = _record_indicators(col_engine, config)
+
+        assert len(expected) == len(actual)
+        assert actual[-1]['sma20'] == pytest.approx(expected[-1]['sma20'])
+        assert actual[-1]['rsi14'] == pytest.approx(expected[-1]['rsi14'])
+
+    def test_series_computed_once_per_key(self, price_data, tmp_path):
+        engine = AdvancedBacktestEngine(results_dir=tmp_path, columnar=True)
+        engine.load_data('SOL', price_data)
+
+        def strategy(eng, candle):
+            eng.sma(20)
+            eng.sma(20)
+            eng.rsi(14)
+
+        engine.run(strategy, _config(), 'cache')
+        assert sorted(engine._indicators.cached_keys()) == [('rsi', 14), ('sma', 20)]
+
+    def test_precompute_rejects_unknown_indicator(self, price_data):
+        from core.backtesting.backtest_engine import OHLCV
+
+        candles = [OHLCV(**d) for d in price_data]
+        cache = IndicatorCache(ColumnarOHLCV.from_candles(candles))
+        cache.precompute({'sma': [10], 'atr': [14]})
+        assert ('atr', 14) in cache.cached_keys()
+        with pytest.raises(ValueError):
+            cache.precompute({'vwap': [10]})
+
+    def test_date_range_bounds(self):
+        timestamps = [f"2024-01-0{d}T00:00:00" for d in range(1, 10)]
+        assert date_range_bounds(timestamps, '2024-01-03', '2024-01-05') == (2, 5)
+        assert date_range_bounds(timestamps, '2025-01-01', '2025-12-31') is None
+
+
+class TestColumnarBacktest:
+    """Strategies produce identical trades in row and columnar modes."""
+
+    def test_trade_parity(self, price_data, tmp_path):
+        def crossover(eng, candle):
+            if eng.sma(5) > eng.sma(20) and eng.rsi(14) < 70 and eng.is_flat():
+                eng.buy(0.5, "cross up")
+            elif eng.sma(5) < eng.sma(20) and eng.is_long():
+                eng.sell_all("cross down")
+
+        results = []
+        for columnar in (False, True):
+            engine = AdvancedBacktestEngine(results_dir=tmp_path, columnar=columnar)
+            engine.load_data('SOL', price_data)
+            results.append(engine.run(crossover, _config(), 'crossover'))
+
+        row_result, col_result = results
+        assert row_result.metrics.total_trades > 0
+        assert [t.timestamp for t in col_result.trades] == [t.timestamp for t in row_result.trades]
+        assert col_result.final_capital == pytest.approx(row_result.final_capital)
+
+    def test_empty_date_range_raises(self, price_data, tmp_path):
+        engine = AdvancedBacktestEngine(results_dir=tmp_path, columnar=True)
+        engine.load_data('SOL', price_data)
+        with pytest.raises(ValueError):
+            engine.run(lambda e, c: None, _config(start_date='2030-01-01', end_date='2030-12-31'))
@@ -0,0 +1,124 @@
+"""
+Tests for the batched (NumPy) Monte Carlo engine.
+
+Without shuffling or variance every simulation is deterministic, so the
+batched and pure-Python engines must agree exactly; with randomness they
+must agree in distribution.
+"""
+
+import pytest
+from typing import Any, Dict, List
+
+pytest.importorskip("numpy")
+
+from core.backtesting.monte_carlo import MonteCarloSimulator, MonteCarloResult
+
+
+@pytest.fixture
+def trades() -> List[Dict[str, Any]]:
+    return [{'pnl': 10 if i % 3 != 0 else -15} for i in range(60)]
+
+
+class TestBatchedSimulation:
+    """MonteCarloSimulator.run_simulation in vectorized mode."""
+
+    def test_deterministic_matches_python_engine(self, trades):
+        batched = MonteCarloSimulator(seed=1).run_simulation(trades, 50, 1000)
+        python = MonteCarloSimulator(seed=1, vectorized=False).run_simulation(trades, 50, 1000)
+
+        assert batched.returns == pytest.approx(python.returns)
+        assert batched.final_capitals == pytest.approx(python.final_capitals)
+        assert batched.p50 == pytest.approx(python.p50)
+
+    def test_ruin_is_absorbing(self):
+        # Capital hits zero on the second trade and must stay there
+        trades = [{'pnl': -600}, {'pnl': -600}, {'pnl': 5000}]
+        result = MonteCarloSimulator(seed=3).run_simulation(trades, 20, 1000)
+
+        assert result.final_capitals == [0.0] * 20
+        assert result.ruined_simulations == 20
+        assert result.probability_of_ruin() == 1.0
+        assert result.to_dict()['prob_ruin'] == 1.0
+
+    def test_chunking_does_not_change_results(self, trades):
+        kwargs = dict(n_simulations=100, initial_capital=500, shuffle_trades=True,
+                      exit_price_variance=0.1)
+        single = MonteCarloSimulator(seed=7).run_simulation(trades, **kwargs)
+        chunked = MonteCarloSimulator(seed=7, chunk_size=100).run_simulation(trades, **kwargs)
+        small = MonteCarloSimulator(seed=7, chunk_size=9).run_simulation(trades, **kwargs)
+
+        assert chunked.returns == single.returns
+        assert len(small.returns) == 100
+        assert small.ruined_simulations + sum(1 for c in small.final_capitals if c > 0) == 100
+
+    def test_seed_reproducible(self, trades):
+        kwargs = dict(n_simulations=200, shuffle_trades=True, entry_timing_variance=0.05)
+        first = MonteCarloSimulator(seed=42).run_simulation(trades, **kwargs)
+        second = MonteCarloSimulator(seed=42).run_simulation(trades, **kwargs)
+        assert first.returns == second.returns
+
+    def test_variance_distribution_matches_python_engine(self, trades):
+        kwargs = dict(n_simulations=4000, initial_capital=1000, exit_price_variance=0.2)
+        batched = MonteCarloSimulator(seed=5).run_simulation(trades, **kwargs)
+        python = MonteCarloSimulator(seed=5, vectorized=False).run_simulation(trades, **kwargs)
+
+        assert batched.mean_return == pytest.approx(python.mean_return, abs=0.1)
+        assert batched.std_return == pytest.approx(python.std_return, rel=0.1)
+
+
+class TestVectorizedResultStats:
+    """Vectorized MonteCarloResult risk statistics match their definitions."""
+
+    def test_stats_match_list_definitions(self):
+        returns = [float(x) for x in [-30, -12, -12, -5, 0, 3, 3, 8, 15, 40]]
+        result = MonteCarloResult(
+            n_simulations=10, initial_capital=100, mean_return=1.0, std_return=18.0,
+            median_return=1.5, p10=-12, p25=-12, p50=3, p75=8, p90=40,
+            min_return=-30, max_return=40, returns=returns, final_capitals=[],
+        )
+
+        assert result.probability_of_loss(0.12) == len([r for r in returns if r < -12]) / 10
+        assert result.probability_of_profit(0.03) == len([r for r in returns if r > 3]) / 10
+        var = result.value_at_risk(0.80)
+        assert var == sorted(returns)[int(10 * 0.2)]
+        tail = [r for r in returns if r <= var]
+        assert result.expected_shortfall(0.80) == pytest.approx(sum(tail) / len(tail))
+
+        histogram = result.get_distribution()['histogram']
+        assert sum(b['count'] for b in histogram) == 9  # max value sits on the open upper edge
+        for b in histogram:
+            assert b['count'] == len([r for r in returns if b['bin_start'] <= r < b['bin_end']])
+
+
+class TestBatchedPathSimulation:
+    """MonteCarloSimulator.run_path_simulation in vectorized mode."""
+
+    def test_paths_shape_and_floor(self, trades):
+        result = MonteCarloSimulator(seed=2).run_path_simulation(trades, 30, 100)
+
+        assert len(result['paths']) == 30
+        assert all(len(p) == len(trades) + 1 for p in result['paths'])
+        assert all(p[0] == 100 for p in result['paths'])
+        assert all(v >= 0 for p in result['paths'] for v in p)
+
+    def test_capital_floors_at_zero(self):
+        trades = [{'pnl': -5000}]
+        result = MonteCarloSimulator(seed=2).run_path_simulation(trades, 5, 1000)
+
+        assert all(p == [1000, 0.0] for p in result['paths'])
+        assert result['max_drawdowns']['max'] == pytest.approx(100.0)
+
+    def test_skip_paths(self, trades):
+        result = MonteCarloSimulator(seed=2).run_path_simulation(
+            trades, 50, 1000, include_paths=False
+        )
+        assert result['paths'] == []
+        assert result['max_drawdowns']['max'] >= result['max_drawdowns']['median']
+
+    def test_drawdowns_match_python_engine(self, trades):
+        batched = MonteCarloSimulator(seed=9).run_path_simulation(trades, 3000, 200)
+        python = MonteCarloSimulator(seed=9, vectorized=False).run_path_simulation(trades, 3000, 200)
+
+        assert batched['max_drawdowns']['mean'] == pytest.approx(
+            python['max_drawdowns']['mean'], rel=0.1
+        )
@@ -0,0 +1,132 @@
+"""
+Tests for parallel and pruned grid search in ParameterOptimizer.
+"""
+
+import math
+import pytest
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from core.backtesting.parameter_optimizer import ParameterOptimizer
+
+
+@pytest.fixture
+def price_data() -> List[Dict[str, Any]]:
+    data = []
+    for i in range(200):
+        base_price = 100 + 15 * math.sin(i / 6) + 5 * math.sin(i / 2.3) + i * 0.05
+        data.append({
+            'timestamp': (datetime(2024, 1, 1) + timedelta(days=i)).isoformat(),
+            'open': base_price * 0.995,
+            'high': base_price * 1.02,
+            'low': base_price * 0.98,
+            'close': base_price,
+            'volume': 1000000,
+        })
+    return data
+
+
+def rsi_strategy_factory(params):
+    def strategy(engine, candle):
+        if engine.is_flat() and engine.rsi() < params['oversold']:
+            engine.buy(1.0)
+        elif engine.is_long() and engine.rsi() > params['overbought']:
+            engine.sell_all()
+    return strategy
+
+
+def _optimizer() -> ParameterOptimizer:
+    optimizer = ParameterOptimizer()
+    optimizer.add_parameter('oversold', [20, 25, 30, 35, 40])
+    optimizer.add_parameter('overbought', [60, 65, 70, 75, 80])
+    return optimizer
+
+
+class TestParallelGridSearch:
+    """Parallel grid search matches the sequential sweep."""
+
+    def test_parallel_matches_sequential(self, price_data):
+        sequential = _optimizer().grid_search(price_data, 'SOL', rsi_strategy_factory)
+        parallel = _optimizer().grid_search(price_data, 'SOL', rsi_strategy_factory, n_jobs=2)
+
+        assert len({r['score'] for r in sequential['all_results']}) > 1
+        assert parallel['best_params'] == sequential['best_params']
+        assert parallel['best_score'] == pytest.approx(sequential['best_score'])
+        assert parallel['best_metrics'] is not None
+        assert [r['params'] for r in parallel['all_results']] == \
+            [r['params'] for r in sequential['all_results']]
+        assert [r['score'] for r in parallel['all_results']] == \
+            pytest.approx([r['score'] for r in sequential['all_results']])
+
+    def test_results_stream_to_callback(self, price_data):
+        seen = []
+        result = _optimizer().grid_search(
+            price_data, 'SOL', rsi_strategy_factory, n_jobs=2, on_result=seen.append
+        )
+        assert len(seen) == 25
+        assert sorted(r['index'] for r in seen) == list(range(25))
+        assert all('_metrics' not in r for r in result['all_results'])
+
+    def test_iter_grid_search_yields_entries(self, price_data):
+        entries = list(_optimizer().iter_grid_search(price_data, 'SOL', rsi_strategy_factory))
+        assert len(entries) == 25
+        assert all('score' in e and 'params' in e for e in entries)
+        assert all('_metrics' not in e for e in entries)
+
+    def test_constraints_respected_in_parallel(self, price_data):
+        optimizer = _optimizer()
+        optimizer.add_constraint(lambda p: p['overbought'] - p['oversold'] >= 40)
+        result = optimizer.grid_search(price_data, 'SOL', rsi_strategy_factory, n_jobs=2)
+
+        assert result['total_combinations'] == 25
+        assert result['valid_combinations'] == len(result['all_results'])
+        assert all(r['params']['overbought'] - r['params']['oversold'] >= 40
+                   for r in result['all_results'])
+
+    def test_failed_combination_is_isolated(self, price_data):
+        def breaking_factory(params):
+            if params['oversold'] != 20:
+                return rsi_strategy_factory(params)
+
+            def strategy(engine, candle):
+                engine._data.clear()
+                engine._position = None
+                raise RuntimeError("bad combination")
+            return strategy
+
+        clean = _optimizer().grid_search(price_data, 'SOL', rsi_strategy_factory)
+        result = _optimizer().grid_search(price_data, 'SOL', breaking_factory)
+
+        failed = [r for r in result['all_results'] if 'error' in r]
+        assert len(failed) == 5
+        assert all(r['params']['oversold'] == 20 for r in failed)
+        assert [r['score'] for r in result['all_results'] if 'error' not in r] == pytest.approx(
+            [r['score'] for r in clean['all_results'] if r['params']['oversold'] != 20]
+        )
+
+
+class TestGridPruning:
+    """Coarse-to-fine pruning of dominated regions."""
+
+    def test_pruning_skips_weak_regions(self, price_data):
+        full = _optimizer().grid_search(price_data, 'SOL', rsi_strategy_factory)
+        pruned = _optimizer().grid_search(
+            price_data, 'SOL', rsi_strategy_factory, prune_margin=0.0
+        )
+
+        assert len(pruned['all_results']) == 25
+        assert pruned['pruned_combinations'] > 0
+        assert pruned['pruned_combinations'] == sum(1 for r in pruned['all_results'] if r.get('pruned'))
+        assert pruned['best_score'] == pytest.approx(full['best_score'])
+
+    def test_no_pruning_with_infinite_margin(self, price_data):
+        result = _optimizer().grid_search(
+            price_data, 'SOL', rsi_strategy_factory, prune_margin=float('inf')
+        )
+        assert result['pruned_combinations'] == 0
+
+    def test_is_dominated(self):
+        scores = {(0, 0): 1.0, (0, 2): 5.0, (2, 0): 0.5}
+        assert ParameterOptimizer._is_dominated((1, 0), {(0, 0): 1.0, (2, 0): 0.5}, 5.0, 1.0)
+        assert not ParameterOptimizer._is_dominated((0, 1), scores, 5.0, 1.0)
+        assert not ParameterOptimizer._is_dominated((4, 4), scores, 5.0, 1.0)
@@ -0,0 +1,215 @@
+"""
+Tests for parallel walk-forward analysis.
+
+Folds run on a process pool must produce exactly the sequential results,
+including strategies that draw from their per-task rng.
+"""
+
+import math
+import random
+import pytest
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from core.backtesting.parallel import SharedCandles
+from core.backtesting.parameter_optimizer import ParameterOptimizer
+from core.backtesting.walk_forward import (
+    WalkForwardAnalyzer,
+    _FoldRunner,
+    _WindowTask,
+    _run_window,
+    _window_state,
+)
+from core.trading.backtesting.metrics import Trade
+from core.trading.backtesting.walk_forward import WalkForwardTester
+
+
+@pytest.fixture
+def price_data() -> List[Dict[str, Any]]:
+    data = []
+    for i in range(300):
+        base_price = 100 + 15 * math.sin(i / 6) + 5 * math.sin(i / 2.3) + i * 0.05
+        data.append({
+            'timestamp': (datetime(2024, 1, 1) + timedelta(days=i)).isoformat(),
+            'open': base_price * 0.995,
+            'high': base_price * 1.02,
+            'low': base_price * 0.98,
+            'close': base_price,
+            'volume': 1000000,
+        })
+    return data
+
+
+def rsi_strategy_factory(params):
+    def strategy(engine, candle):
+        if engine.is_flat() and engine.rsi() < params['oversold']:
+            engine.buy(1.0)
+        elif engine.is_long() and engine.rsi() > params['overbought']:
+            engine.sell_all()
+    return strategy
+
+
+def random_strategy(engine, candle):
+    if engine.is_flat() and engine.rng.random() < 0.1:
+        engine.buy(1.0)
+    elif engine.is_long() and engine.rng.random() < 0.2:
+        engine.sell_all()
+
+
+GRID = {'oversold': [25, 30, 35, 40], 'overbought': [60, 65, 70, 75]}
+
+
+def _periods(result):
+    return [
+        (p.train_start, p.test_end, p.best_params,
+         p.train_performance['sharpe_ratio'], p.test_performance['total_return_pct'])
+        for p in result.periods
+    ]
+
+
+class TestParallelWalkForwardAnalyzer:
+    """WalkForwardAnalyzer with n_jobs > 1."""
+
+    def test_optimized_parallel_matches_sequential(self, price_data):
+        sequential = WalkForwardAnalyzer().run_optimized_walk_forward(
+            price_data, rsi_strategy_factory, 'SOL', GRID, n_splits=4
+        )
+        parallel = WalkForwardAnalyzer(n_jobs=3).run_optimized_walk_forward(
+            price_data, rsi_strategy_factory, 'SOL', GRID, n_splits=4
+        )
+
+        assert len(sequential.periods) == 4
+        assert all(p.best_params for p in sequential.periods)
+        assert _periods(parallel) == _periods(sequential)
+        assert parallel.robustness_ratio == pytest.approx(sequential.robustness_ratio)
+        assert parallel.to_dict()['periods'][0]['best_params'] == sequential.periods[0].best_params
+
+    def test_best_params_maximize_train_metric(self, price_data):
+        result = WalkForwardAnalyzer().run_optimized_walk_forward(
+            price_data, rsi_strategy_factory, 'SOL', GRID, n_splits=3, metric='total_return_pct'
+        )
+        first = result.periods[0]
+
+        optimizer = ParameterOptimizer()
+        for name, values in GRID.items():
+            optimizer.add_parameter(name, values)
+        train = price_data[:int(100 * 0.7)]
+        grid = optimizer.grid_search(train, 'SOL', rsi_strategy_factory, metric='total_return_pct')
+
+        assert first.best_params == grid['best_params']
+        assert first.train_performance['total_return_pct'] == pytest.approx(grid['best_score'])
+
+    def test_constraints_from_optimizer(self, price_data):
+        optimizer = ParameterOptimizer()
+        for name, values in GRID.items():
+            optimizer.add_parameter(name, values)
+        optimizer.add_constraint(lambda p: p['overbought'] - p['oversold'] >= 40)
+
+        result = WalkForwardAnalyzer().run_optimized_walk_forward(
+            price_data, rsi_strategy_factory, 'SOL', optimizer, n_splits=3
+        )
+
+        assert all(p.best_params['overbought'] - p.best_params['oversold'] >= 40 for p in result.periods)
+
+    def test_grid_combinations_get_fresh_engines(self, price_data):
+        def factory(params):
+            if params['oversold'] != 25:
+                return rsi_strategy_factory(params)
+
+            def strategy(engine, candle):
+                engine._data.clear()  # Must not reach the next combination
+            return strategy
+
+        runner = _FoldRunner(
+            symbol='SOL', initial_capital=10000, strategy_name='rsi', seed=0, strategy_factory=factory
+        )
+        state = _window_state(runner, SharedCandles(price_data, share=False))
+        _run_window(state, _WindowTask(0, 'train', 0, {'oversold': 25, 'overbought': 60}, 0, 100))
+        after = _run_window(state, _WindowTask(0, 'train', 1, {'oversold': 30, 'overbought': 60}, 0, 100))
+
+        assert after['metrics'] is not None
+        assert after['score'] != float('-inf')
+
+    def test_seeded_random_strategy_is_reproducible(self, price_data):
+        sequential = WalkForwardAnalyzer(seed=7).run_walk_forward(
+            price_data, random_strategy, 'SOL', n_splits=4
+        )
+        parallel = WalkForwardAnalyzer(seed=7, n_jobs=2).run_walk_forward(
+            price_data, random_strategy, 'SOL', n_splits=4
+        )
+        other_seed = WalkForwardAnalyzer(seed=8).run_walk_forward(
+            price_data, random_strategy, 'SOL', n_splits=4
+        )
+
+        assert _periods(parallel) == _periods(sequential)
+        assert _periods(other_seed) != _periods(sequential)
+
+    def test_global_random_state_untouched(self, price_data):
+        random.seed(123)
+        expected = random.random()
+
+        random.seed(123)
+        WalkForwardAnalyzer(seed=7).run_walk_forward(price_data, random_strategy, 'SOL', n_splits=4)
+
+        assert random.random() == expected
+
+
+def _prices() -> Dict[datetime, float]:
+    start = datetime(2020, 1, 1)
+    return {
+        start + timedelta(days=i): 100 + 20 * math.sin(i / 15) + i * 0.02
+        for i in range(900)
+    }
+
+
+def momentum_strategy(prices: List[float], params: Dict[str, Any], rng=random):
+    """Long when price is above its lookback mean; noisy exits via rng."""
+    lookback = params['lookback']
+    equity = [10000.0]
+    trades = []
+    entry = None
+    t0 = datetime(2020, 1, 1)
+    for i in range(lookback, len(prices)):
+        mean = sum(prices[i - lookback:i]) / lookback
+        pnl = 0.0
+        if entry is None and prices[i] > mean:
+            entry = i
+        elif entry is not None and (prices[i] < mean or rng.random() < 0.02):
+            pnl = (prices[i] - prices[entry]) / prices[entry] * equity[-1]
+            trades.append(Trade(
+                entry_time=t0 + timedelta(days=entry), exit_time=t0 + timedelta(days=i),
+                entry_price=prices[entry], exit_price=prices[i], direction='long',
+                size=1.0, pnl=pnl, pnl_pct=pnl / equity[-1] * 100,
+            ))
+            entry = None
+        equity.append(equity[-1] + pnl)
+    return trades, equity
+
+
+class TestParallelWalkForwardTester:
+    """WalkForwardTester with n_jobs > 1."""
+
+    def test_parallel_matches_sequential(self):
+        kwargs = dict(train_months=12, test_months=3, step_months=3, initial_capital=10000)
+        grid = {'lookback': [5, 10, 20, 40]}
+
+        sequential = WalkForwardTester(**kwargs).run(_prices(), momentum_strategy, grid)
+        parallel = WalkForwardTester(n_jobs=2, **kwargs).run(_prices(), momentum_strategy, grid)
+
+        assert len(sequential.windows) >= 3
+        assert [w.optimal_params for w in parallel.windows] == [w.optimal_params for w in sequential.windows]
+        assert parallel.stitched_equity == pytest.approx(sequential.stitched_equity)
+        assert parallel.aggregated_metrics.sharpe_ratio == pytest.approx(
+            sequential.aggregated_metrics.sharpe_ratio
+        )
+
+    def test_rng_is_seeded_per_task(self):
+        kwargs = dict(train_months=12, test_months=3, step_months=3, initial_capital=10000)
+        grid = {'lookback': [5, 10]}
+
+        first = WalkForwardTester(seed=3, **kwargs).run(_prices(), momentum_strategy, grid)
+        again = WalkForwardTester(seed=3, **kwargs).run(_prices(), momentum_strategy, grid)
+        other = WalkForwardTester(seed=4, **kwargs).run(_prices(), momentum_strategy, grid)
+
+        assert again.stitched_equity == first.stitched_equity
+        assert other.stitched_equity != first.stitched_equity
@@ -8,6 +8,7 @@ Tests:
 - Backpressure handling
 - Dead letter queue
 - Trace ID propagation
+- Sharded workers, concurrent fan-out and per-handler limits
 """
 
 import pytest
@@ -317,5 +318,122 @@ async def test_multiple_handlers_for_event():
     assert len(handler2.handled_events) == 1
 
 
+class ConcurrencyTrackingHandler(SimpleHandler):
+    """Handler that records its peak concurrency."""
+
+    def __init__(self, name: str, delay: float = 0.0):
+        super().__init__(name, delay=delay)
+        self.active = 0
+        self.peak = 0
+
+    async def handle(self, event: Event):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            return await super().handle(event)
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_slow_shard_does_not_block_other_shards():
+    """A slow handler only stalls events routed to its own shard."""
+    bus = EventBus(max_queue_size=100, handler_timeout=5.0, num_workers=2)
+    slow = SimpleHandler("notifier", delay=0.5)
+    fast = SimpleHandler("signals")
+
+    bus.register_handler(slow, [EventType.TWEET_POSTED])
+    bus.register_handler(fast, [EventType.BUY_SIGNAL])
+    await bus.start()
+
+    await bus.emit(Event(EventType.TWEET_POSTED, {"id": 0}, shard_key=0))
+    for i in range(3):
+        await bus.emit(Event(EventType.BUY_SIGNAL, {"id": i}, shard_key=1))
+
+    await asyncio.sleep(0.2)
+    assert len(fast.handled_events) == 3
+    assert len(slow.handled_events) == 0
+
+    await bus.stop()
+    assert len(slow.handled_events) == 1
+
+
+@pytest.mark.asyncio
+async def test_ordering_preserved_per_key():
+    """Events with the same shard key are handled in emission order."""
+    bus = EventBus(max_queue_size=100, handler_timeout=5.0, num_workers=4)
+    handler = SimpleHandler("ordered", delay=0.001)
+
+    bus.register_handler(handler, [EventType.TRADE_EXECUTED])
+    await bus.start()
+
+    for i in range(40):
+        await bus.emit(Event(EventType.TRADE_EXECUTED, {"key": i % 4, "seq": i}, shard_key=i % 4))
+
+    await bus.stop()
+
+    assert len(handler.handled_events) == 40
+    for key in range(4):
+        seqs = [e.data["seq"] for e in handler.handled_events if e.data["key"] == key]
+        assert seqs == sorted(seqs)
+
+
+@pytest.mark.asyncio
+async def test_handlers_fan_out_concurrently():
+    """Independent handlers of one event run concurrently."""
+    bus = EventBus(max_queue_size=100, handler_timeout=5.0)
+    handlers = [SimpleHandler(f"h{i}", delay=0.2) for i in range(3)]
+    for handler in handlers:
+        bus.register_handler(handler, [EventType.POSITION_CLOSED])
+    await bus.start()
+
+    await bus.emit(Event(EventType.POSITION_CLOSED, {"id": 1}))
+
+    # Sequential dispatch would need 0.6s
+    await asyncio.sleep(0.4)
+    assert all(len(h.handled_events) == 1 for h in handlers)
+    await bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_per_handler_concurrency_limit():
+    """max_concurrency caps parallel calls to a handler across shards."""
+    bus = EventBus(max_queue_size=100, handler_timeout=5.0, num_workers=4)
+    handler = ConcurrencyTrackingHandler("limited", delay=0.05)
+
+    bus.register_handler(handler, [EventType.BUY_SIGNAL], max_concurrency=2)
+    await bus.start()
+
+    for i in range(8):
+        await bus.emit(Event(EventType.BUY_SIGNAL, {"id": i}, shard_key=i))
+    await bus.stop()
+
+    assert len(handler.handled_events) == 8
+    assert handler.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_histogram_stats():
+    """get_stats exposes queue-depth and handler-latency histograms."""
+    bus = EventBus(max_queue_size=100, handler_timeout=5.0, num_workers=2)
+    handler = SimpleHandler("timed", delay=0.01)
+
+    bus.register_handler(handler, [EventType.TRADE_EXECUTED])
+    await bus.start()
+    for i in range(5):
+        await bus.emit(Event(EventType.TRADE_EXECUTED, {"id": i}))
+    await bus.stop()
+
+    stats = bus.get_stats()
+    assert stats["num_workers"] == 2
+    assert len(stats["shard_queue_sizes"]) == 2
+    assert stats["queue_depth"]["count"] == 5
+
+    latency = stats["handler_latency_ms"]["timed"]
+    assert latency["count"] == 5
+    assert latency["p50"] >= 10
+    assert sum(latency["buckets"].values()) == 5
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,161 @@
+"""
+Tests for the two-tier LLMResponseCache.
+
+Tests:
+- canonicalize_prompt templates and slots
+- Semantic tier is opt-in and hits on prompts differing only in noise
+- Embedding similarity scoped by prompt prefix
+- Per-tier TTL and LRU bounds
+- SQLite persistence across instances and batched last_used updates
+"""
+
+import time
+
+import pytest
+
+from core.cache.api_cache import LLMResponseCache, canonicalize_prompt
+
+
+PREFIX = "You are JARVIS, a trading assistant. Market context: calm.\n\n"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = LLMResponseCache(cache_dir=str(tmp_path))
+    yield c
+    c.close()
+
+
+def bag_of_words(text):
+    """Toy embedder: word counts over a tiny vocabulary."""
+    vocab = ["sol", "btc", "bullish", "bearish", "price", "sentiment", "today", "now"]
+    words = text.lower().replace("?", "").split()
+    return [float(words.count(w)) for w in vocab]
+
+
+class TestCanonicalizePrompt:
+    """Tests for prompt normalization."""
+
+    def test_whitespace_case_and_clock_times(self):
+        a = canonicalize_prompt("Sentiment for  $sol at 2026-01-25T10:00:00Z?")
+        b = canonicalize_prompt("sentiment for $SOL at 2026-01-25T18:30:00Z?")
+        assert a == b
+        assert a[0] == "sentiment for <ticker> at <date><time>?"
+        assert a[1] == ("$SOL", "2026-01-25")
+
+    def test_dates_and_numbers_kept(self):
+        a = canonicalize_prompt("Sentiment for $WIF on 2024-01-05 given 24h change -12.41%")
+        b = canonicalize_prompt("Sentiment for $WIF on 2025-03-09 given 24h change -12.41%")
+        c = canonicalize_prompt("Sentiment for $WIF on 2024-01-05 given 24h change -12.43%")
+        assert len({a, b, c}) == 3
+
+    def test_number_rounding_opt_in(self):
+        assert canonicalize_prompt("price 142.31", 3)[1] == canonicalize_prompt("price 142.29", 3)[1]
+        assert canonicalize_prompt("price 142", 3)[1] != canonicalize_prompt("price 151", 3)[1]
+        assert canonicalize_prompt("price 1,234.5")[1] == ("1234.5",)
+
+    def test_addresses_and_urls_are_slots(self):
+        mint = "So11111111111111111111111111111111111111112"
+        template, slots = canonicalize_prompt(f"Analyze {mint} see https://x.com/a/1")
+        assert template == "analyze <addr> see <url>"
+        assert slots == (mint, "https://x.com/a/1")
+
+
+class TestSemanticTier:
+    """Tests for normalized-template and embedding lookups."""
+
+    def test_semantic_tier_opt_in(self, cache):
+        cache.cache_llm_response("SOL outlook at 10:00 UTC", "bullish", model="grok")
+        assert cache.get_cached_response("SOL outlook at 11:15 UTC", model="grok", semantic=True) is None
+
+        cache.cache_llm_response("SOL outlook at 10:00 UTC", "bullish", model="grok", semantic=True)
+        assert cache.get_cached_response("SOL outlook at 11:15 UTC", model="grok") is None
+        assert cache.get_cached_response("SOL outlook at 11:15 UTC", model="grok", semantic=True) == "bullish"
+
+    def test_normalized_hit(self, tmp_path):
+        cache = LLMResponseCache(cache_dir=str(tmp_path), number_precision=4)
+        cache.cache_llm_response(PREFIX + "SOL outlook at 10:00 UTC, price 142.31", "bullish", model="grok", semantic=True)
+
+        assert cache.get_cached_response(
+            PREFIX + "SOL  outlook at 11:15 UTC, price 142.29", model="grok", semantic=True) == "bullish"
+        assert cache.get_cached_response(
+            PREFIX + "SOL outlook at 11:15 UTC, price 120", model="grok", semantic=True) is None
+
+        stats = cache.get_stats()
+        assert stats.semantic_hits == 1
+        assert stats.by_model["grok"]["semantic_hits"] == 1
+        cache.close()
+
+    def test_embedding_hit_scoped_by_prefix(self, tmp_path):
+        cache = LLMResponseCache(cache_dir=str(tmp_path), embedder=bag_of_words, similarity_threshold=0.9)
+        cache.cache_llm_response(PREFIX + "SOL sentiment today?", "bullish", model="grok", prefix=PREFIX, semantic=True)
+
+        def lookup(prompt, prefix=PREFIX):
+            return cache.get_cached_response(prompt, model="grok", prefix=prefix, semantic=True)
+
+        assert lookup(PREFIX + "sentiment SOL now today?") is None
+        assert lookup(PREFIX + "today SOL sentiment") == "bullish"
+        assert lookup("Other prefix. today SOL sentiment", prefix="Other prefix. ") is None
+        assert lookup(PREFIX + "BTC bearish today?") is None
+        cache.close()
+
+    def test_hash_keys_skip_semantic_tier(self, cache):
+        cache.cache_llm_response("abcdef0123456789", "r", model="grok", semantic=True)
+        assert not cache._semantic.get("grok")
+
+
+class TestTiersAndPersistence:
+    """Tests for TTL, LRU eviction and SQLite persistence."""
+
+    def test_semantic_ttl_shorter_than_exact(self, tmp_path):
+        cache = LLMResponseCache(cache_dir=str(tmp_path), semantic_ttl=0.1)
+        cache.cache_llm_response("price 100 at 10:00", "r", model="grok", semantic=True)
+        time.sleep(0.2)
+
+        assert cache.get_cached_response("price 100 at 10:05", model="grok", semantic=True) is None
+        assert cache.get_cached_response("price 100 at 10:00", model="grok", semantic=True) == "r"
+        cache.close()
+
+    def test_lru_eviction(self, tmp_path):
+        cache = LLMResponseCache(cache_dir=str(tmp_path), max_size=2, semantic_max_size=1, persist=False)
+        for prompt in ("first prompt", "second prompt"):
+            cache.cache_llm_response(prompt, prompt[0], model="grok", semantic=True)
+        cache.get_cached_response("first prompt", model="grok", semantic=True)
+        cache.cache_llm_response("third prompt", "t", model="grok", semantic=True)
+
+        assert cache.get_cached_response("second prompt", model="grok", semantic=True) is None
+        assert cache.get_cached_response("first prompt", model="grok", semantic=True) == "f"
+
+    def test_persisted_across_instances(self, tmp_path):
+        first = LLMResponseCache(cache_dir=str(tmp_path), embedder=bag_of_words)
+        first.cache_llm_response(
+            "SOL sentiment today", {"score": 75}, model="grok", metadata={"tokens": 10}, semantic=True)
+        first.close()
+
+        second = LLMResponseCache(cache_dir=str(tmp_path), embedder=bag_of_words)
+        response, metadata = second.get_cached_response("SOL sentiment today", model="grok", include_metadata=True)
+        assert response == {"score": 75}
+        assert metadata == {"tokens": 10}
+        assert second.get_cached_response("today SOL sentiment", model="grok", semantic=True) == {"score": 75}
+        second.close()
+
+    def test_hits_do_not_write_until_flushed(self, cache):
+        cache.cache_llm_response("prompt", "r", model="grok")
+        cache._conn.execute("UPDATE llm_cache SET last_used = 0")
+
+        for _ in range(5):
+            assert cache.get_cached_response("prompt", model="grok") == "r"
+        assert cache._conn.execute("SELECT MAX(last_used) FROM llm_cache").fetchone()[0] == 0
+
+        cache._flush_touches()
+        assert cache._conn.execute("SELECT MIN(last_used) FROM llm_cache").fetchone()[0] > 0
+
+    def test_clear_model_clears_disk(self, tmp_path):
+        cache = LLMResponseCache(cache_dir=str(tmp_path))
+        cache.cache_llm_response("prompt", "r", model="grok")
+        assert cache.clear_model("grok") == 1
+        cache.close()
+
+        reopened = LLMResponseCache(cache_dir=str(tmp_path))
+        assert reopened.get_cached_response("prompt", model="grok") is None
+        reopened.close()
@@ -0,0 +1,59 @@
+"""
+Unit tests for RollingLatencyWindow.
+Tests ring-buffer eviction and percentile reads against a sorted window.
+"""
+
+import random
+
+import pytest
+
+from core.metrics.latency_window import RollingLatencyWindow
+
+
+def _reference_percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * p / 100), len(ordered) - 1)]
+
+
+class TestRollingLatencyWindow:
+    """Test RollingLatencyWindow behaviour."""
+
+    def test_empty_window(self):
+        window = RollingLatencyWindow(window_size=10)
+        assert window.count == 0
+        assert window.p50 is None
+        assert window.average is None
+        assert window.max is None
+
+    def test_matches_sorted_window(self):
+        """Percentiles match sorting the last window_size samples."""
+        rng = random.Random(7)
+        window = RollingLatencyWindow(window_size=50)
+        samples = []
+        for _ in range(500):
+            value = rng.choice([rng.uniform(1, 500), 42.0])  # Include duplicates
+            window.record(value)
+            samples.append(value)
+            recent = samples[-50:]
+            for p in (50, 95, 99):
+                assert window.percentile(p) == _reference_percentile(recent, p)
+            assert window.average == pytest.approx(sum(recent) / len(recent))
+
+    def test_eviction_keeps_arrival_order(self):
+        window = RollingLatencyWindow(window_size=3)
+        for value in (1.0, 2.0, 3.0, 4.0, 5.0):
+            window.record(value)
+        assert window.count == 3
+        assert window.values() == [3.0, 4.0, 5.0]
+        assert window.max == 5.0
+
+    def test_clear(self):
+        window = RollingLatencyWindow(window_size=3)
+        window.record(1.0)
+        window.clear()
+        assert len(window) == 0
+        assert window.p99 is None
+
+    def test_rejects_empty_window(self):
+        with pytest.raises(ValueError):
+            RollingLatencyWindow(window_size=0)
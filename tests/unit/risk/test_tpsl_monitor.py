@@ -653,6 +653,216 @@ class TestMonitoringLoop:
         mock_executor.execute_exit.assert_called_once()
 
 
+# =============================================================================
+# Test: Batched Price Sweep
+# =============================================================================
+
+def _position(pos_id: str, mint: str, entry: float = 1.0):
+    from bots.treasury.trading.types import Position, TradeDirection, TradeStatus
+
+    return Position(
+        id=pos_id,
+        token_mint=mint,
+        token_symbol=mint.upper(),
+        direction=TradeDirection.LONG,
+        entry_price=entry,
+        current_price=entry,
+        amount=100.0,
+        amount_usd=100.0 * entry,
+        take_profit_price=entry * 1.5,
+        stop_loss_price=entry * 0.8,
+        status=TradeStatus.OPEN,
+        opened_at=datetime.now(timezone.utc).isoformat(),
+    )
+
+
+class BatchPriceService:
+    """Price service with a batch endpoint that omits unknown mints."""
+
+    def __init__(self, prices: Dict[str, float], batch_known: Optional[set] = None):
+        self.prices = prices
+        self.batch_known = batch_known if batch_known is not None else set(prices)
+        self.batch_calls: List[List[str]] = []
+        self.single_calls: List[str] = []
+
+    async def get_prices_batch(self, mints: List[str]) -> Dict[str, float]:
+        self.batch_calls.append(list(mints))
+        return {m: self.prices[m] for m in mints if m in self.batch_known}
+
+    async def get_token_price(self, token_mint: str) -> float:
+        self.single_calls.append(token_mint)
+        return self.prices[token_mint]
+
+
+class TestBatchedSweep:
+    """Sweep engine: dedup, one snapshot, concurrent exits."""
+
+    @pytest.mark.asyncio
+    async def test_batch_endpoint_called_once_with_unique_mints(self):
+        from core.risk.tp_sl_monitor import TPSLMonitor
+
+        positions = [_position(f"p{i}", f"mint{i % 3}") for i in range(9)]
+        service = BatchPriceService({"mint0": 1.0, "mint1": 1.6, "mint2": 0.5}, batch_known={"mint0", "mint1"})
+        pm = MagicMock()
+        pm.get_open_positions = MagicMock(return_value=positions)
+
+        monitor = TPSLMonitor(position_manager=pm, price_service=service)
+        results = await monitor.check_all_positions()
+
+        assert service.batch_calls == [["mint0", "mint1", "mint2"]]
+        assert service.single_calls == ["mint2"]  # Missing from the batch
+        assert [r["position_id"] for r in results] == [p.id for p in positions]
+        assert [r["trigger"] for r in results[:3]] == [None, "tp", "sl"]
+
+    @pytest.mark.asyncio
+    async def test_per_mint_fallback_is_concurrent_and_bounded(self):
+        from core.risk.tp_sl_monitor import TPSLMonitor
+
+        active = 0
+        peak = 0
+
+        async def get_token_price(mint):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return 1.0
+
+        positions = [_position(f"p{i}", f"mint{i}") for i in range(20)]
+        pm = MagicMock()
+        pm.get_open_positions = MagicMock(return_value=positions)
+        service = AsyncMock()
+        service.get_token_price = AsyncMock(side_effect=get_token_price)
+
+        monitor = TPSLMonitor(position_manager=pm, price_service=service, max_concurrency=5)
+        results = await monitor.check_all_positions()
+
+        assert len(results) == 20
+        assert service.get_token_price.call_count == 20
+        assert peak == 5
+
+    @pytest.mark.asyncio
+    async def test_price_error_isolated_to_its_positions(self):
+        from core.risk.tp_sl_monitor import TPSLMonitor
+
+        async def get_token_price(mint):
+            if mint == "bad":
+                raise RuntimeError("rpc down")
+            return 1.0
+
+        positions = [_position("a", "good"), _position("b", "bad"), _position("c", "bad")]
+        pm = MagicMock()
+        pm.get_open_positions = MagicMock(return_value=positions)
+        service = AsyncMock()
+        service.get_token_price = AsyncMock(side_effect=get_token_price)
+
+        results = await TPSLMonitor(position_manager=pm, price_service=service).check_all_positions()
+
+        assert "error" not in results[0]
+        assert results[1]["error"] == "rpc down"
+        assert results[2]["error"] == "rpc down"
+        assert service.get_token_price.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_exits_concurrent_across_mints_serial_per_mint(self):
+        from core.risk.tp_sl_monitor import TPSLMonitor
+
+        in_flight: Dict[str, int] = {}
+        overlap_same_mint = False
+        peak_total = 0
+
+        async def execute_exit(position, trigger, exit_percent, ladder_tier=None):
+            nonlocal overlap_same_mint, peak_total
+            mint = position.token_mint
+            if in_flight.get(mint):
+                overlap_same_mint = True
+            in_flight[mint] = in_flight.get(mint, 0) + 1
+            peak_total = max(peak_total, sum(in_flight.values()))
+            await asyncio.sleep(0.02)
+            in_flight[mint] -= 1
+            return {"success": True}
+
+        positions = [_position(f"p{i}", f"mint{i % 4}") for i in range(8)]
+        pm = MagicMock()
+        pm.get_open_positions = MagicMock(return_value=positions)
+        service = BatchPriceService({f"mint{i}": 0.5 for i in range(4)})  # All hit SL
+        executor = AsyncMock()
+        executor.execute_exit = AsyncMock(side_effect=execute_exit)
+
+        monitor = TPSLMonitor(position_manager=pm, price_service=service, exit_executor=executor)
+        results = await monitor.check_all_positions()
+
+        assert executor.execute_exit.call_count == 8
+        assert all(r["exit_result"] == {"success": True} for r in results)
+        assert not overlap_same_mint
+        assert peak_total == 4
+
+    @pytest.mark.asyncio
+    async def test_exit_failure_recorded_on_result(self):
+        from core.risk.tp_sl_monitor import TPSLMonitor
+
+        pm = MagicMock()
+        pm.get_open_positions = MagicMock(return_value=[_position("a", "m1"), _position("b", "m2")])
+        service = BatchPriceService({"m1": 0.5, "m2": 0.5})
+        executor = AsyncMock()
+        executor.execute_exit = AsyncMock(side_effect=[RuntimeError("swap failed"), {"success": True}])
+
+        results = await TPSLMonitor(
+            position_manager=pm, price_service=service, exit_executor=executor
+        ).check_all_positions()
+
+        assert {r.get("exit_error") for r in results} == {"swap failed", None}
+        assert executor.execute_exit.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sweep_stats(self):
+        from core.risk.tp_sl_monitor import TPSLMonitor
+
+        pm = MagicMock()
+        pm.get_open_positions = MagicMock(return_value=[_position("a", "m1"), _position("b", "m1")])
+        monitor = TPSLMonitor(position_manager=pm, price_service=BatchPriceService({"m1": 1.0}))
+
+        assert monitor.get_sweep_stats()["sweeps"] == 0
+        await monitor.check_all_positions()
+        await monitor.check_all_positions()
+
+        stats = monitor.get_sweep_stats()
+        assert stats["sweeps"] == 2
+        assert stats["latency_ms"]["samples"] == 2
+        assert stats["latency_ms"]["max"] >= stats["latency_ms"]["p50"] >= 0
+        assert stats["last_sweep"]["positions"] == 2
+        assert stats["last_sweep"]["mints"] == 1
+        assert stats["last_sweep"]["exits"] == 0
+        assert {"price_fetch_ms", "evaluate_ms", "dispatch_ms", "total_ms"} <= set(stats["last_sweep"])
+
+    @pytest.mark.asyncio
+    async def test_mint_locks_dropped_once_positions_close(self):
+        from core.risk.tp_sl_monitor import TPSLMonitor
+
+        positions = [_position("a", "m1"), _position("b", "m2")]
+        pm = MagicMock()
+        pm.get_open_positions = MagicMock(side_effect=lambda: list(positions))
+        executor = AsyncMock()
+        executor.execute_exit = AsyncMock(return_value={"success": True})
+        monitor = TPSLMonitor(
+            position_manager=pm,
+            price_service=BatchPriceService({"m1": 0.5, "m2": 0.5}),
+            exit_executor=executor,
+        )
+
+        await monitor.check_all_positions()
+        assert set(monitor._mint_locks) == {"m1", "m2"}
+
+        positions.pop()  # m2 closed
+        await monitor.check_all_positions()
+        assert set(monitor._mint_locks) == {"m1"}
+
+        positions.clear()
+        await monitor.check_all_positions()
+        assert monitor._mint_locks == {}
+
+
 # =============================================================================
 # Test: Notification on Exit
 # =============================================================================
@@ -641,3 +641,215 @@ class TestPoolMonitorMetrics:
 
         assert len(pools) == 2
         assert "Pool1" in [p["address"] for p in pools]
+
+
+class TestPoolMonitorEviction:
+    """Tests for LRU eviction and compact pool state."""
+
+    @staticmethod
+    def _state(address: str, slot: int) -> "PoolState":
+        return PoolState(
+            address=address,
+            dex_type=DEXType.RAYDIUM,
+            token_a_mint="A",
+            token_b_mint="B",
+            token_a_reserve=1000,
+            token_b_reserve=1000,
+            lp_supply=1000,
+            fee_rate_bps=25,
+            slot=slot,
+        )
+
+    async def _update(self, monitor, address: str, slot: int) -> None:
+        with patch.object(monitor, "_parse_pool_state", return_value=self._state(address, slot)):
+            await monitor._handle_account_update(AccountUpdate(
+                pubkey=address,
+                slot=slot,
+                lamports=1000000,
+                owner=RAYDIUM_AMM_V4,
+                data=bytes(752),
+                executable=False,
+                rent_epoch=100,
+                write_version=slot,
+            ))
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_updated(self):
+        """Should evict the pool that has gone longest without an update."""
+        mock_client = MagicMock(spec=GeyserClient)
+        monitor = PoolMonitor(mock_client, PoolMonitorConfig(max_pools_tracked=3))
+
+        for slot, address in enumerate(["P1", "P2", "P3"]):
+            await self._update(monitor, address, slot)
+        await self._update(monitor, "P1", 10)  # Touch P1
+        await self._update(monitor, "P4", 11)
+
+        assert list(monitor._pool_states) == ["P3", "P1", "P4"]
+        assert monitor.get_stats()["pools_evicted"] == 1
+        assert monitor.get_pool_state("P2") is None
+
+    def test_pool_state_is_slotted(self):
+        """PoolState should not carry a per-instance __dict__."""
+        state = self._state("P1", 1)
+        assert not hasattr(state, "__dict__")
+
+    def test_pubkey_encoding_cached_and_interned(self):
+        """Mints decoded from different accounts share one string."""
+        parser = RaydiumPoolParser()
+        raw = bytes(range(32))
+        first = parser._read_pubkey(bytearray(b"\x00" * 8 + raw), 8)
+        second = parser._read_pubkey(b"\xff" * 4 + raw, 4)
+
+        assert first == "1thX6LZfHDZZKUs92febYZhYRcXddmzfzF2NvTkPNE"
+        assert first is second
+
+
+def _whirlpool_data(fee_rate: int, liquidity: int, sqrt_price: int, tick: int,
+                    mint_a: bytes, mint_b: bytes) -> bytes:
+    """Build a Whirlpool account buffer with the real field layout."""
+    import hashlib
+    import struct
+
+    data = bytearray(653)
+    data[:8] = hashlib.sha256(b"account:Whirlpool").digest()[:8]
+    struct.pack_into(
+        "<HHQQQQi", data, 45, fee_rate, 300,
+        liquidity & (2**64 - 1), liquidity >> 64,
+        sqrt_price & (2**64 - 1), sqrt_price >> 64, tick,
+    )
+    data[101:133] = mint_a
+    data[181:213] = mint_b
+    return bytes(data)
+
+
+def _raydium_data(coin_mint: bytes, pc_mint: bytes, coin: int, pc: int) -> bytes:
+    """Build a Raydium AMM V4 account buffer with mints and reserves set."""
+    import struct
+
+    data = bytearray(752)
+    data[236:268] = coin_mint
+    data[268:300] = pc_mint
+    struct.pack_into("<QQ", data, 460, coin, pc)
+    return bytes(data)
+
+
+class TestBatchDecoding:
+    """Tests for batched pool account decoding."""
+
+    def test_whirlpool_fields_decoded(self):
+        """Should decode fee, liquidity, sqrt price, tick and mints."""
+        data = _whirlpool_data(3000, 2**70 + 5, 2**65 + 7, -1234, bytes(range(32)), bytes([1]) * 32)
+
+        state = OrcaPoolParser().parse("Whirl", data, 10)
+
+        assert state.fee_rate_bps == 30
+        assert state.liquidity == 2**70 + 5
+        assert state.sqrt_price_x64 == 2**65 + 7
+        assert state.current_tick == -1234
+        assert state.token_a_mint == "1thX6LZfHDZZKUs92febYZhYRcXddmzfzF2NvTkPNE"
+
+    def test_layouts_follow_offsets(self):
+        """Struct layouts are derived from the parsers' offset constants."""
+        from core.streaming.pool_monitor import _layout
+
+        assert OrcaPoolParser._FIELDS.format == "<8s37xHHQQQQi16x32s48x32s"
+        assert RaydiumPoolParser._FIELDS.format == "<32s32s160xQQ"
+        for parser, start in ((OrcaPoolParser, OrcaPoolParser.DISCRIMINATOR_OFFSET),
+                              (RaydiumPoolParser, RaydiumPoolParser.COIN_MINT_OFFSET)):
+            assert start + parser._FIELDS.size <= parser.MIN_ACCOUNT_SIZE
+
+        with pytest.raises(ValueError):
+            _layout((0, "32s"), (16, "Q"))
+
+    def test_whirlpool_rejects_other_account_types(self):
+        """Tick arrays and other program accounts are not pools."""
+        assert OrcaPoolParser().parse("TickArray", bytes(9988), 10) is None
+
+    def test_batch_matches_single_decode(self):
+        """parse_batch should equal per-account parse, in order."""
+        parser = RaydiumPoolParser()
+        updates = [
+            AccountUpdate(
+                pubkey=f"Pool{i}", slot=i, lamports=0, owner=RAYDIUM_AMM_V4,
+                data=_raydium_data(bytes([i]) * 32, bytes([9]) * 32, 1000 + i, 5000 - i),
+                executable=False, rent_epoch=0, write_version=i,
+            )
+            for i in range(5)
+        ] + [AccountUpdate(
+            pubkey="Short", slot=9, lamports=0, owner=RAYDIUM_AMM_V4, data=b"short",
+            executable=False, rent_epoch=0, write_version=9,
+        )]
+
+        batch = parser.parse_batch(updates)
+        single = [parser.parse(u.pubkey, u.data, u.slot) for u in updates]
+
+        assert batch[-1] is None
+        for a, b in zip(batch[:-1], single[:-1]):
+            assert (a.address, a.token_a_mint, a.token_b_mint, a.token_a_reserve, a.token_b_reserve) == \
+                (b.address, b.token_a_mint, b.token_b_mint, b.token_a_reserve, b.token_b_reserve)
+        assert batch[2].token_a_reserve == 1002
+
+    def test_whirlpool_batch_matches_single_decode(self):
+        """Orca parse_batch should equal per-account parse, skipping non-pool accounts."""
+        parser = OrcaPoolParser()
+        datas = [
+            _whirlpool_data(100 * i, 2**64 + i, 2**66 + i, -i, bytes([i]) * 32, bytes([7]) * 32)
+            for i in range(4)
+        ] + [bytes(9988), b"short"]
+        updates = [
+            AccountUpdate(
+                pubkey=f"Whirl{i}", slot=i, lamports=0, owner=ORCA_WHIRLPOOL,
+                data=data, executable=False, rent_epoch=0, write_version=i,
+            )
+            for i, data in enumerate(datas)
+        ]
+
+        batch = parser.parse_batch(updates)
+        single = [parser.parse(u.pubkey, u.data, u.slot) for u in updates]
+
+        assert batch[-2:] == [None, None]
+        for a, b in zip(batch[:-2], single[:-2]):
+            assert (a.address, a.token_a_mint, a.token_b_mint, a.fee_rate_bps,
+                    a.liquidity, a.sqrt_price_x64, a.current_tick) == \
+                (b.address, b.token_a_mint, b.token_b_mint, b.fee_rate_bps,
+                 b.liquidity, b.sqrt_price_x64, b.current_tick)
+        assert batch[3].current_tick == -3
+        assert batch[1].token_b_mint is batch[2].token_b_mint
+
+    def test_decodes_from_memoryview(self):
+        """Decoding should work directly on a memoryview without copying."""
+        data = _raydium_data(bytes([3]) * 32, bytes([4]) * 32, 7, 8)
+        state = RaydiumPoolParser().parse("Pool", memoryview(data), 1)
+        assert (state.token_a_reserve, state.token_b_reserve) == (7, 8)
+
+    @pytest.mark.asyncio
+    async def test_monitor_batch_resync(self):
+        """handle_account_updates should decode mixed DEX batches and emit NEW_POOL."""
+        mock_client = MagicMock(spec=GeyserClient)
+        monitor = PoolMonitor(mock_client, PoolMonitorConfig())
+        events = []
+        monitor.on_pool_event(events.append)
+
+        updates = [
+            AccountUpdate(
+                pubkey="Ray", slot=1, lamports=0, owner=RAYDIUM_AMM_V4,
+                data=_raydium_data(bytes([1]) * 32, bytes([2]) * 32, 100, 200),
+                executable=False, rent_epoch=0, write_version=1,
+            ),
+            AccountUpdate(
+                pubkey="Whirl", slot=2, lamports=0,
+                owner="whirLbMiicVdio4qvUfM5KAg6Ct8VwpYzGff3uctyCc",
+                data=_whirlpool_data(3000, 1, 1, 0, bytes([1]) * 32, bytes([2]) * 32),
+                executable=False, rent_epoch=0, write_version=2,
+            ),
+            AccountUpdate(
+                pubkey="Other", slot=3, lamports=0, owner="Unknown111",
+                data=b"", executable=False, rent_epoch=0, write_version=3,
+            ),
+        ]
+
+        decoded = await monitor.handle_account_updates(updates)
+
+        assert decoded == 2
+        assert [e.pool_address for e in events] == ["Ray", "Whirl"]
+        assert monitor.get_stats()["updates_processed"] == 3
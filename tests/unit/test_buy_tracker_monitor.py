@@ -300,7 +300,7 @@ class TestSignatureDeduplication:
             token_address="TOKEN",
             helius_api_key="key",
         )
-        monitor._processed_signatures = ["sig1", "sig2", "sig3"]
+        monitor._processed_signatures = dict.fromkeys(["sig1", "sig2", "sig3"])
 
         assert monitor._is_already_processed("sig2") is True
 
@@ -310,7 +310,7 @@ class TestSignatureDeduplication:
             token_address="TOKEN",
             helius_api_key="key",
         )
-        monitor._processed_signatures = ["sig1", "sig2"]
+        monitor._processed_signatures = dict.fromkeys(["sig1", "sig2"])
 
         assert monitor._is_already_processed("sig3") is False
 
@@ -331,11 +331,11 @@ class TestSignatureDeduplication:
             token_address="TOKEN",
             helius_api_key="key",
         )
-        monitor._processed_signatures = ["existing_sig"]
+        monitor._processed_signatures = dict.fromkeys(["existing_sig"])
 
         monitor._mark_as_processed("existing_sig")
 
-        assert monitor._processed_signatures.count("existing_sig") == 1
+        assert list(monitor._processed_signatures) == ["existing_sig"]
 
     def test_mark_as_processed_trims_old_signatures(self):
         """Test mark_as_processed trims old signatures when exceeding max."""
@@ -344,7 +344,7 @@ class TestSignatureDeduplication:
             helius_api_key="key",
         )
         # Fill up to max
-        monitor._processed_signatures = [f"sig_{i}" for i in range(500)]
+        monitor._processed_signatures = dict.fromkeys(f"sig_{i}" for i in range(500))
 
         # Add one more
         monitor._mark_as_processed("new_sig_overflow")
@@ -1449,12 +1449,14 @@ class TestTransactionPolling:
             call_count = [0]
             original_running = monitor._running
 
-            async def stop_after_first():
+            async def stop_after_first(*args, **kwargs):
                 call_count[0] += 1
                 if call_count[0] >= 1:
                     monitor._running = False
-                    return []
-                return mock_sigs.return_value
+                return [
+                    {"signature": "existing1"},
+                    {"signature": "existing2"},
+                ]
 
             mock_sigs.side_effect = stop_after_first
 
@@ -1466,5 +1468,164 @@ class TestTransactionPolling:
         assert "existing2" in monitor._processed_signatures
 
 
+class TestPollPipeline:
+    """Tests for concurrent polling, signature cursors and batched fetches."""
+
+    @staticmethod
+    def _buy_tx(signature, buyer, lamports=500000000):
+        return {
+            "signature": signature,
+            "feePayer": buyer,
+            "tokenTransfers": [
+                {"mint": "TOKEN", "toUserAccount": buyer, "fromUserAccount": "LP", "tokenAmount": 100.0}
+            ],
+            "nativeTransfers": [
+                {"fromUserAccount": buyer, "toUserAccount": "LP", "amount": lamports}
+            ],
+        }
+
+    @pytest.fixture
+    def monitor(self):
+        monitor = TransactionMonitor(
+            token_address="TOKEN",
+            helius_api_key="key",
+            pair_address="PAIR_MAIN_ADDRESS_0000000000000000",
+            additional_pairs=[("alt", "PAIR_ALT_ADDRESS_00000000000000000")],
+        )
+        monitor._sol_price_usd = 100.0
+        monitor.on_buy = AsyncMock()
+        return monitor
+
+    @pytest.mark.asyncio
+    async def test_first_poll_primes_without_alerts(self, monitor):
+        """Existing history is marked processed and a cursor is stored per pair."""
+        addresses = list(monitor._pair_names)
+        monitor._get_recent_signatures = AsyncMock(side_effect=lambda addr, **kw: [
+            {"signature": f"{addr[:9]}_new"}, {"signature": f"{addr[:9]}_old"},
+        ])
+        monitor._fetch_transactions = AsyncMock()
+
+        new_count, skipped = await monitor._poll_round(addresses)
+
+        assert (new_count, skipped) == (0, 4)
+        monitor._fetch_transactions.assert_not_called()
+        assert monitor._signature_cursors[addresses[0]] == "PAIR_MAIN_new"
+
+    @pytest.mark.asyncio
+    async def test_new_signatures_fetched_in_one_batch(self, monitor):
+        """New signatures from all pairs are fetched together and alerted oldest first."""
+        addresses = list(monitor._pair_names)
+        monitor._primed_addresses.update(addresses)
+        monitor._signature_cursors = {addr: "cursor" for addr in addresses}
+        pages = {
+            addresses[0]: [{"signature": "m2"}, {"signature": "m1"}, {"signature": "failed", "err": {"x": 1}}],
+            addresses[1]: [{"signature": "a1"}],
+        }
+        monitor._get_recent_signatures = AsyncMock(side_effect=lambda addr, **kw: pages[addr])
+        monitor._fetch_transactions = AsyncMock(return_value=({
+            "m1": self._buy_tx("m1", "BUYER1"),
+            "m2": self._buy_tx("m2", "BUYER2"),
+            "a1": self._buy_tx("a1", "BUYER3"),
+        }, set()))
+
+        new_count, _ = await monitor._poll_round(addresses)
+
+        assert new_count == 3
+        monitor._fetch_transactions.assert_awaited_once_with(["m1", "m2", "a1"])
+        assert [c.args[0].signature for c in monitor.on_buy.await_args_list] == ["m1", "m2", "a1"]
+        assert monitor.on_buy.await_args_list[2].args[0].lp_pair_name == "alt"
+        assert "failed" in monitor._processed_signatures
+        assert all(c.kwargs["until"] == "cursor" for c in monitor._get_recent_signatures.await_args_list)
+        assert monitor._signature_cursors[addresses[0]] == "m2"
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_retried_next_round(self, monitor):
+        """Signatures from a failed batch are not marked, and the cursor stops before them."""
+        address = "PAIR_MAIN_ADDRESS_0000000000000000"
+        monitor._primed_addresses.add(address)
+        monitor._signature_cursors[address] = "s0"
+        page = [{"signature": "s3"}, {"signature": "s2"}, {"signature": "s1"}]
+        monitor._get_recent_signatures = AsyncMock(return_value=page)
+        monitor.TX_BATCH_SIZE = 1
+
+        async def flaky_batch(sigs):
+            return None if sigs == ["s2"] else {sig: self._buy_tx(sig, "BUYER") for sig in sigs}
+
+        monitor._fetch_transaction_batch = AsyncMock(side_effect=flaky_batch)
+
+        new_count, _ = await monitor._poll_round([address])
+
+        assert new_count == 2
+        assert "s2" not in monitor._processed_signatures
+        assert {"s1", "s3"} <= set(monitor._processed_signatures)
+        assert monitor._signature_cursors[address] == "s1"
+
+        # Next round: only the failed signature is fetched again
+        monitor._fetch_transaction_batch = AsyncMock(side_effect=lambda sigs: {s: self._buy_tx(s, "BUYER") for s in sigs})
+        new_count, _ = await monitor._poll_round([address])
+
+        assert new_count == 1
+        monitor._fetch_transaction_batch.assert_awaited_once_with(["s2"])
+        assert monitor._signature_cursors[address] == "s3"
+        assert [c.args[0].signature for c in monitor.on_buy.await_args_list] == ["s1", "s3", "s2"]
+
+    @pytest.mark.asyncio
+    async def test_poll_address_pages_back_to_cursor(self, monitor):
+        """A burst larger than one page is walked back with `before`."""
+        monitor.SIGNATURE_PAGE_LIMIT = 2
+        monitor._signature_cursors["ADDR"] = "s0"
+        pages = [[{"signature": "s5"}, {"signature": "s4"}],
+                 [{"signature": "s3"}, {"signature": "s2"}],
+                 [{"signature": "s1"}]]
+        monitor._get_recent_signatures = AsyncMock(side_effect=pages)
+
+        signatures = await monitor._poll_address("ADDR")
+
+        assert [s["signature"] for s in signatures] == ["s5", "s4", "s3", "s2", "s1"]
+        assert monitor._get_recent_signatures.await_args_list[1].kwargs["before"] == "s4"
+        assert monitor._signature_cursors["ADDR"] == "s0"  # Advanced only after the round is handled
+
+    @pytest.mark.asyncio
+    async def test_fetch_transactions_splits_batches(self, monitor):
+        """Signatures are fetched TX_BATCH_SIZE at a time."""
+        monitor.TX_BATCH_SIZE = 2
+        monitor._fetch_transaction_batch = AsyncMock(
+            side_effect=lambda sigs: {sig: {"signature": sig} for sig in sigs}
+        )
+
+        transactions, failed = await monitor._fetch_transactions(["a", "b", "c"])
+
+        assert set(transactions) == {"a", "b", "c"}
+        assert not failed
+        assert monitor._fetch_transaction_batch.await_count == 2
+
+    def test_state_persists_across_restarts(self, tmp_path):
+        """Seen signatures and cursors are restored from the state file."""
+        state_path = tmp_path / "buy_tracker_state.json"
+        monitor = TransactionMonitor(token_address="TOKEN", helius_api_key="key", state_path=state_path)
+        monitor._mark_as_processed("sig1")
+        monitor._signature_cursors["ADDR"] = "sig1"
+        monitor._save_state()
+
+        restored = TransactionMonitor(token_address="TOKEN", helius_api_key="key", state_path=state_path)
+
+        assert restored._is_already_processed("sig1")
+        assert restored._signature_cursors == {"ADDR": "sig1"}
+        assert "ADDR" in restored._primed_addresses
+
+    def test_stale_state_reprimes_cursors(self, tmp_path):
+        """Cursors older than STATE_MAX_AGE_SECONDS are not resumed."""
+        state_path = tmp_path / "buy_tracker_state.json"
+        state_path.write_text(json.dumps({
+            "signatures": ["sig1"], "cursors": {"ADDR": "sig1"}, "saved_at": 0,
+        }))
+
+        restored = TransactionMonitor(token_address="TOKEN", helius_api_key="key", state_path=state_path)
+
+        assert restored._is_already_processed("sig1")
+        assert restored._signature_cursors == {}
+        assert "ADDR" not in restored._primed_addresses
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
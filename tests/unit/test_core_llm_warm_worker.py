@@ -0,0 +1,248 @@
+"""
+Unit tests for core/llm/warm_worker.py
+
+Covers:
+- Sessions are pre-started and receive the static system prompt
+- Per-key ordering and pool-size concurrency bound
+- Session retirement/replacement after turns_per_session
+- Queue limit, timeouts and failing sessions
+- Metrics
+"""
+
+import asyncio
+
+import pytest
+
+from core.llm.warm_worker import (
+    LLMQueueFull,
+    LLMWorkerError,
+    StubSession,
+    WarmWorkerPool,
+)
+
+
+def make_pool(fn, **kwargs):
+    sessions = []
+
+    def factory():
+        session = StubSession(fn, system_prompt="VOICE")
+        sessions.append(session)
+        return session
+
+    return WarmWorkerPool(factory, **kwargs), sessions
+
+
+async def echo(system_prompt, prompt):
+    await asyncio.sleep(0.01)
+    return f"{system_prompt}:{prompt}"
+
+
+class TestWarmWorkerPool:
+    """Test warm session pooling."""
+
+    @pytest.mark.asyncio
+    async def test_start_prewarms_sessions(self):
+        pool, sessions = make_pool(echo, size=3)
+        await pool.start()
+
+        assert len(sessions) == 3
+        assert pool.get_metrics()["idle_sessions"] == 3
+        assert await pool.submit("hi") == "VOICE:hi"
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_same_key_runs_in_order(self):
+        finished = []
+
+        async def record(system_prompt, prompt):
+            # Earlier prompts sleep longer: only key ordering keeps them in sequence
+            await asyncio.sleep(0.05 - int(prompt) * 0.01)
+            finished.append(prompt)
+            return prompt
+
+        pool, _ = make_pool(record, size=4)
+        await pool.start()
+        await asyncio.gather(*(pool.submit(str(i), key=42) for i in range(4)))
+
+        assert finished == ["0", "1", "2", "3"]
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_size(self):
+        active = 0
+        peak = 0
+
+        async def track(system_prompt, prompt):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return prompt
+
+        pool, _ = make_pool(track, size=2)
+        await pool.start()
+        replies = await asyncio.gather(*(pool.submit(str(i), key=i) for i in range(6)))
+
+        assert replies == [str(i) for i in range(6)]
+        assert peak == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_session_replaced_after_turns(self):
+        pool, sessions = make_pool(echo, size=1, turns_per_session=2)
+        await pool.start()
+
+        for i in range(3):
+            await pool.submit(str(i))
+        await asyncio.sleep(0.01)  # Replacement starts in the background
+
+        assert sessions[0].closed
+        assert sessions[0].turns == 2
+        assert sessions[1].turns == 1
+        assert pool.counters["sessions_started"] == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_queue_full_rejects(self):
+        gate = asyncio.Event()
+
+        async def blocked(system_prompt, prompt):
+            await gate.wait()
+            return prompt
+
+        pool, _ = make_pool(blocked, size=1, max_queue=2)
+        await pool.start()
+        pending = [asyncio.ensure_future(pool.submit(str(i))) for i in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(LLMQueueFull):
+            await pool.submit("overflow")
+        assert pool.counters["rejected"] == 1
+
+        gate.set()
+        assert await asyncio.gather(*pending) == ["0", "1"]
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_replaces_session(self):
+        async def slow(system_prompt, prompt):
+            await asyncio.sleep(1)
+            return prompt
+
+        pool, sessions = make_pool(slow, size=1, request_timeout=0.05)
+        await pool.start()
+
+        with pytest.raises(LLMWorkerError):
+            await pool.submit("hi")
+        await asyncio.sleep(0.01)
+
+        assert pool.counters["timeouts"] == 1
+        assert sessions[0].closed
+        assert len(sessions) == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_session_error_wrapped(self):
+        def broken(system_prompt, prompt):
+            raise RuntimeError("boom")
+
+        pool, _ = make_pool(broken, size=1)
+        await pool.start()
+
+        with pytest.raises(LLMWorkerError, match="boom"):
+            await pool.submit("hi")
+        assert pool.counters["failed"] == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_metrics(self):
+        pool, _ = make_pool(echo, size=2)
+        await pool.start()
+        await asyncio.gather(*(pool.submit(str(i)) for i in range(4)))
+
+        metrics = pool.get_metrics()
+        assert metrics["submitted"] == 4
+        assert metrics["completed"] == 4
+        assert metrics["queued"] == 0
+        assert metrics["in_flight"] == 0
+        assert metrics["latency_p50_ms"] >= 10
+        assert not pool._key_locks
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_failing_start_fails_fast(self):
+        class BrokenSession(StubSession):
+            async def start(self):
+                raise OSError("claude: not found")
+
+        pool = WarmWorkerPool(lambda: BrokenSession(echo), size=1, request_timeout=5)
+        warmup = asyncio.ensure_future(pool.start())
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(LLMWorkerError, match="not found"):
+            await asyncio.wait_for(pool.submit("hi"), timeout=1)
+        assert pool.counters["session_start_failures"] >= 1
+
+        await pool.close()
+        warmup.cancel()
+
+    @pytest.mark.asyncio
+    async def test_start_gives_up_after_max_attempts(self):
+        class BrokenSession(StubSession):
+            async def start(self):
+                raise OSError("claude: not found")
+
+        pool = WarmWorkerPool(lambda: BrokenSession(echo), size=2, max_start_attempts=1)
+
+        with pytest.raises(LLMWorkerError, match="not found"):
+            await asyncio.wait_for(pool.submit("hi"), timeout=1)
+        assert pool.counters["session_start_failures"] == 2
+        assert not pool._running
+
+        # The next request tries again instead of reusing the failed start
+        with pytest.raises(LLMWorkerError, match="not found"):
+            await asyncio.wait_for(pool.submit("hi"), timeout=1)
+        assert pool.counters["session_start_failures"] == 4
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_hanging_start_bounded_by_request_timeout(self):
+        pool = WarmWorkerPool(
+            lambda: StubSession(echo, start_delay=10), size=1, request_timeout=0.05
+        )
+
+        with pytest.raises(LLMWorkerError, match="starting"):
+            await asyncio.wait_for(pool.submit("hi"), timeout=1)
+        assert pool.counters["timeouts"] == 1
+        assert not pool._running
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_respawn_gives_up_and_recovers(self):
+        healthy = True
+
+        class FlakySession(StubSession):
+            async def start(self):
+                if not healthy:
+                    raise OSError("claude crashed")
+
+        pool = WarmWorkerPool(lambda: FlakySession(echo), size=1, max_start_attempts=1)
+        assert await pool.submit("a") == ":a"
+
+        healthy = False
+        await asyncio.sleep(0.01)
+        assert not pool._starting
+        with pytest.raises(LLMWorkerError, match="crashed"):
+            await asyncio.wait_for(pool.submit("b"), timeout=1)
+
+        await asyncio.sleep(0.01)
+        assert pool.counters["session_start_failures"] == 2
+
+        # A failing request kicks off one bounded start attempt in the background
+        healthy = True
+        with pytest.raises(LLMWorkerError):
+            await pool.submit("c")
+        await asyncio.sleep(0.01)
+        assert await asyncio.wait_for(pool.submit("d"), timeout=1) == ":d"
+        await pool.close()
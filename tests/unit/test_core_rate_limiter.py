@@ -38,6 +38,10 @@ Tests cover:
    - Limit tracking
    - Statistics retrieval
 
+8. GCRA and Async Waiters
+   - O(1) state bursts and wait times
+   - FIFO wake-up of queued acquire_async callers
+
 Target: 60%+ coverage with 40-60 tests
 """
 
@@ -59,6 +63,7 @@ from core.rate_limiter import (
     RateLimiter,
     TokenBucket,
     SlidingWindow,
+    GCRALimiter,
     AdaptiveLimiter,
     RateLimitConfig,
     RateLimitState,
@@ -1055,6 +1060,121 @@ class TestEdgeCases:
         assert allowed
 
 
+# =============================================================================
+# GCRA and Async Waiter Tests
+# =============================================================================
+
+class TestGCRALimiter:
+    """Tests for the GCRA (leaky bucket) limiter."""
+
+    def test_allows_burst_then_limits(self):
+        limiter = GCRALimiter(rate=10.0, capacity=5)
+        assert all(limiter.acquire()[0] for _ in range(5))
+
+        allowed, wait_time = limiter.acquire()
+        assert allowed is False
+        assert 0.05 <= wait_time <= 0.1 + 1e-6
+
+    def test_recovers_at_rate(self):
+        limiter = GCRALimiter(rate=10.0, capacity=5)
+        for _ in range(5):
+            limiter.acquire()
+        limiter.tat -= 0.2  # 0.2 seconds later = 2 tokens
+
+        assert limiter.acquire()[0]
+        assert limiter.acquire()[0]
+        assert not limiter.acquire()[0]
+
+    def test_tokens_available(self):
+        limiter = GCRALimiter(rate=10.0, capacity=5)
+        assert limiter.tokens == pytest.approx(5.0)
+        limiter.acquire(2)
+        assert limiter.tokens == pytest.approx(3.0, abs=0.01)
+
+    def test_leaky_bucket_strategy_uses_gcra(self, rate_limiter):
+        rate_limiter.configure("gcra", requests_per_second=10.0, burst_size=3,
+                               strategy=RateLimitStrategy.LEAKY_BUCKET)
+        assert isinstance(rate_limiter.limiters["gcra"], GCRALimiter)
+        assert rate_limiter.get_state("gcra").tokens == pytest.approx(3.0, abs=0.01)
+
+
+class TestRateLimiterHotPath:
+    """Tests for sharded stats, sliding window tokens and async waiters."""
+
+    def test_sliding_window_via_rate_limiter(self, rate_limiter):
+        """RateLimiter passes tokens through to SlidingWindow."""
+        rate_limiter.configure("sliding", requests_per_second=10.0, burst_size=3,
+                               strategy=RateLimitStrategy.SLIDING_WINDOW)
+        assert rate_limiter.acquire("sliding", tokens=2)[0]
+        assert not rate_limiter.acquire("sliding", tokens=2)[0]
+        assert rate_limiter.acquire("sliding")[0]
+
+    def test_stats_aggregate_across_threads(self, rate_limiter):
+        rate_limiter.configure("busy", requests_per_second=1e6, burst_size=1_000_000)
+
+        def worker():
+            for _ in range(500):
+                rate_limiter.acquire("busy")
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert rate_limiter.stats["total_requests"] == 2000
+        assert rate_limiter.get_statistics()["allowed_requests"] == 2000
+        assert not rate_limiter.stats._shards  # Exited threads folded into the base total
+
+    def test_stats_mapping_contract(self, rate_limiter):
+        stats = rate_limiter.stats
+        assert stats.get("unknown") is None
+        assert "unknown" not in stats
+        assert "total_requests" in stats
+        with pytest.raises(KeyError):
+            stats["unknown"]
+
+    def test_cleanup_scoped_by_idle_age(self, configured_limiter):
+        configured_limiter.acquire("user_api", scope_key="old")
+        configured_limiter._scope_last_used["user_api"]["old"] -= 120
+        configured_limiter.acquire("user_api", scope_key="fresh")
+
+        configured_limiter.cleanup_scoped(max_age_seconds=60)
+
+        assert list(configured_limiter.scoped_limiters["user_api"]) == ["fresh"]
+
+    @pytest.mark.asyncio
+    async def test_async_waiters_served_in_order(self, rate_limiter):
+        rate_limiter.configure("queue", requests_per_second=50.0, burst_size=1,
+                               strategy=RateLimitStrategy.LEAKY_BUCKET)
+        rate_limiter.acquire("queue")
+        order = []
+
+        async def waiter(i):
+            assert await rate_limiter.acquire_async("queue")
+            order.append(i)
+
+        start = time.monotonic()
+        await asyncio.gather(*(waiter(i) for i in range(5)))
+
+        assert order == [0, 1, 2, 3, 4]
+        assert time.monotonic() - start >= 0.08  # 5 slots at 50/s
+
+    @pytest.mark.asyncio
+    async def test_async_timeout(self, rate_limiter):
+        rate_limiter.configure("slow", requests_per_second=1.0, burst_size=1)
+        rate_limiter.acquire("slow")
+
+        assert await rate_limiter.acquire_async("slow", timeout=0.05) is False
+
+    @pytest.mark.asyncio
+    async def test_async_oversized_request_fails(self, rate_limiter):
+        rate_limiter.configure("small", requests_per_second=10.0, burst_size=2,
+                               strategy=RateLimitStrategy.LEAKY_BUCKET)
+
+        assert await rate_limiter.acquire_async("small", tokens=5) is False
+
+
 # =============================================================================
 # RUN CONFIGURATION
 # =============================================================================
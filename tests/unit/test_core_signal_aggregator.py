@@ -0,0 +1,161 @@
+"""
+Tests for core/signal_aggregator.py - concurrent signal fan-out.
+
+Tests cover:
+1. Sources are queried concurrently, not back to back
+2. Slow sources are dropped by their timeout and by the global deadline
+3. Sentiment waits for the DexScreener symbol
+4. Fetches run on the bounded source pool; queue time is not timed
+5. Momentum opportunities enhance candidates concurrently
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core import signal_aggregator
+from core.signal_aggregator import (
+    get_comprehensive_signal,
+    get_comprehensive_signal_async,
+    get_momentum_opportunities_async,
+)
+
+
+def _source(delay=0.0, used=None, **fields):
+    """Fake fetcher that sleeps, then applies fields to the signal."""
+    def fetch(*args):
+        time.sleep(delay)
+
+        def apply(signal):
+            for key, value in fields.items():
+                setattr(signal, key, value)
+            if used:
+                signal.sources_used.append(used)
+        return apply
+    return fetch
+
+
+@pytest.fixture
+def fake_sources(monkeypatch):
+    fetchers = {
+        "dexscreener": _source(0.1, "dexscreener", symbol="BONK", price_usd=1.0),
+        "dextools": _source(0.1, "dextools", dextools_hot_level=3),
+        "gmgn_security": _source(0.1, "gmgn", security_score=80.0),
+        "gmgn_smart_money": _source(0.1, smart_money_signal="bullish"),
+        "lute": _source(0.1, "lute", lute_call_count=2),
+    }
+    monkeypatch.setattr(signal_aggregator, "_TOKEN_FETCHERS", fetchers)
+    monkeypatch.setattr(
+        signal_aggregator, "_fetch_grok_sentiment",
+        _source(0.1, "grok", sentiment="positive"),
+    )
+    return fetchers
+
+
+class TestComprehensiveSignalAsync:
+    """Concurrent fan-out with deadlines."""
+
+    @pytest.mark.asyncio
+    async def test_sources_run_concurrently(self, fake_sources):
+        start = time.monotonic()
+        result = await get_comprehensive_signal_async("mint")
+        elapsed = time.monotonic() - start
+
+        signal = result.data
+        assert set(signal.sources_used) == {"dexscreener", "dextools", "gmgn", "lute", "grok"}
+        assert signal.sentiment == "positive"
+        assert signal.smart_money_signal == "bullish"
+        assert elapsed < 0.45  # Sequential would be 0.6s (DexScreener then sentiment is 0.2s)
+
+    @pytest.mark.asyncio
+    async def test_slow_source_dropped_by_timeout(self, fake_sources):
+        fake_sources["dextools"] = _source(1.0, "dextools", dextools_hot_level=3)
+
+        result = await get_comprehensive_signal_async(
+            "mint", source_timeouts={"dextools": 0.2}
+        )
+
+        assert "dextools" not in result.data.sources_used
+        assert "dextools" in result.sources_tried
+        assert result.data.dextools_hot_level == 0
+
+    @pytest.mark.asyncio
+    async def test_global_deadline_returns_partial(self, fake_sources):
+        fake_sources["lute"] = _source(1.0, "lute", lute_call_count=2)
+
+        start = time.monotonic()
+        result = await get_comprehensive_signal_async("mint", include_sentiment=False, deadline=0.3)
+
+        assert time.monotonic() - start < 0.8
+        assert "lute" not in result.data.sources_used
+        assert "dexscreener" in result.data.sources_used
+
+    @pytest.mark.asyncio
+    async def test_sentiment_skipped_without_symbol(self, fake_sources):
+        fake_sources["dexscreener"] = lambda *args: None
+
+        result = await get_comprehensive_signal_async("mint")
+
+        assert "grok" not in result.data.sources_used
+
+    @pytest.mark.asyncio
+    async def test_fetches_run_on_source_pool(self, fake_sources):
+        threads = []
+
+        def fetch(*args):
+            threads.append(threading.current_thread().name)
+            return None
+
+        fake_sources["lute"] = fetch
+        await get_comprehensive_signal_async("mint", include_sentiment=False)
+
+        assert threads and threads[0].startswith("signal-source")
+
+    @pytest.mark.asyncio
+    async def test_timeout_excludes_time_queued(self, fake_sources, monkeypatch):
+        pool = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(signal_aggregator, "_source_executor", pool)
+
+        # One worker: each 0.1s fetch waits behind the others, but only its
+        # own run time counts against the 0.3s timeout
+        result = await get_comprehensive_signal_async(
+            "mint",
+            include_sentiment=False,
+            source_timeouts={name: 0.3 for name in fake_sources},
+        )
+        pool.shutdown()
+
+        assert set(result.data.sources_used) == {"dexscreener", "dextools", "gmgn", "lute"}
+
+    def test_sync_matches_async_fields(self, fake_sources):
+        signal = get_comprehensive_signal("mint").data
+        assert signal.symbol == "BONK"
+        assert signal.security_score == 80.0
+        assert "grok" in signal.sources_used
+
+
+class TestMomentumOpportunitiesAsync:
+    """Batched enhancement of discovered candidates."""
+
+    @pytest.mark.asyncio
+    async def test_top_candidates_enhanced_concurrently(self, fake_sources, monkeypatch):
+        lute = [
+            {"token_address": f"mint{i}", "token_symbol": f"T{i}", "call_count": 1, "momentum_score": 1}
+            for i in range(6)
+        ]
+        monkeypatch.setattr(signal_aggregator, "_DISCOVERY_SOURCES", (
+            ("dexscreener", lambda *args: []),
+            ("dextools", lambda *args: []),
+            ("lute", lambda *args: lute),
+        ))
+
+        start = time.monotonic()
+        result = await get_momentum_opportunities_async(enhance_top=6, max_concurrent_tokens=6)
+        elapsed = time.monotonic() - start
+
+        assert len(result.data) == 6
+        assert all(s.security_score == 80.0 for s in result.data)
+        assert all(s.sentiment == "positive" for s in result.data)
+        assert elapsed < 0.6  # Sequential enhancement would take 6 x 0.2s
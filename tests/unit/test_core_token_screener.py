@@ -15,7 +15,7 @@ Tests cover:
 5. Cache Management - TTL, invalidation, batch optimization
 """
 
-import json
+import threading
 import time
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -38,8 +38,8 @@ from core.token_screener import (
     # Cache functions
     _ensure_cache_dir,
     _cache_key,
-    _cache_path,
     _read_cache,
+    _read_cache_many,
     _write_cache,
     clear_cache,
     get_cache_stats,
@@ -219,10 +219,13 @@ def strict_criteria():
 
 @pytest.fixture(autouse=True)
 def reset_global_screener():
-    """Reset global screener instance before each test."""
+    """Reset global screener and cache store before each test."""
     token_screener._screener = None
     yield
     token_screener._screener = None
+    if token_screener._cache_store is not None:
+        token_screener._cache_store.close()
+        token_screener._cache_store = None
 
 
 # =============================================================================
@@ -583,11 +586,13 @@ class TestCacheFunctions:
         key = _cache_key("test", long_mint)
         assert len(key) < 30  # Prefix + 16 chars
 
-    def test_cache_path(self, temp_cache_dir, monkeypatch):
-        """Should return correct path."""
+    def test_cache_is_single_file(self, temp_cache_dir, monkeypatch):
+        """Entries should live in one database, not one file per key."""
         monkeypatch.setattr(token_screener, "CACHE_DIR", temp_cache_dir)
-        path = _cache_path("test_key")
-        assert path == temp_cache_dir / "test_key.json"
+        for i in range(20):
+            _write_cache(f"market_mint{i}", {"i": i})
+        assert (temp_cache_dir / token_screener.CACHE_DB_NAME).exists()
+        assert len(list(temp_cache_dir.glob("*.json"))) == 0
 
     def test_write_and_read_cache(self, temp_cache_dir, monkeypatch):
         """Cache round-trip should work."""
@@ -608,15 +613,26 @@ class TestCacheFunctions:
         monkeypatch.setattr(token_screener, "CACHE_DIR", temp_cache_dir)
 
         # Write cache with old timestamp
-        cache_file = temp_cache_dir / "expired_key.json"
-        cache_file.write_text(json.dumps({
-            "payload": {"old": "data"},
-            "cached_at": time.time() - 7200,  # 2 hours ago
-        }))
+        with patch("core.screener_cache.time.time", return_value=time.time() - 7200):
+            _write_cache("expired_key", {"old": "data"})  # 2 hours ago
 
         result = _read_cache("expired_key", ttl_seconds=3600)
         assert result is None
 
+    def test_cache_entry_ttl(self, temp_cache_dir, monkeypatch):
+        """Per-entry TTL should expire the entry regardless of read TTL."""
+        monkeypatch.setattr(token_screener, "CACHE_DIR", temp_cache_dir)
+        _write_cache("short_key", {"a": 1}, ttl_seconds=-1)
+        assert _read_cache("short_key", ttl_seconds=3600) is None
+
+    def test_read_cache_many(self, temp_cache_dir, monkeypatch):
+        """Batched reads should return only fresh, present keys."""
+        monkeypatch.setattr(token_screener, "CACHE_DIR", temp_cache_dir)
+        _write_cache("market_a", {"v": "a"})
+        _write_cache("market_b", {"v": "b"})
+        result = _read_cache_many(["market_a", "market_b", "market_missing"], ttl_seconds=3600)
+        assert result == {"market_a": {"v": "a"}, "market_b": {"v": "b"}}
+
     def test_cache_missing_file(self, temp_cache_dir, monkeypatch):
         """Should return None for missing cache."""
         monkeypatch.setattr(token_screener, "CACHE_DIR", temp_cache_dir)
@@ -626,11 +642,37 @@ class TestCacheFunctions:
     def test_cache_invalid_json(self, temp_cache_dir, monkeypatch):
         """Should return None for invalid JSON."""
         monkeypatch.setattr(token_screener, "CACHE_DIR", temp_cache_dir)
-        cache_file = temp_cache_dir / "invalid.json"
-        cache_file.write_text("not valid json")
+        store = token_screener._get_cache_store()
+        with store._conn:
+            store._conn.execute(
+                "INSERT INTO cache_entries (key, prefix, cached_at, payload) VALUES (?, ?, ?, ?)",
+                ("invalid", "other", time.time(), "not valid json"),
+            )
         result = _read_cache("invalid", ttl_seconds=3600)
         assert result is None
 
+    def test_cache_size_bounded(self, temp_cache_dir):
+        """Eviction should keep the newest max_entries entries."""
+        from core.screener_cache import ScreenerCacheStore
+
+        store = ScreenerCacheStore(temp_cache_dir / "bounded.db", max_entries=5)
+        for i in range(8):
+            with patch("core.screener_cache.time.time", return_value=1000.0 + i):
+                store.put(f"market_{i}", {"i": i})
+        store.evict()
+
+        assert store.stats()["total_entries"] == 5
+        assert store.get("market_0") is None
+        assert store.get("market_7") == {"i": 7}
+        store.close()
+
+    def test_legacy_json_files_removed(self, temp_cache_dir, monkeypatch):
+        """Opening the store should clean up the old per-key files."""
+        monkeypatch.setattr(token_screener, "CACHE_DIR", temp_cache_dir)
+        (temp_cache_dir / "market_old.json").write_text("{}")
+        _write_cache("market_new", {"v": 1})
+        assert not (temp_cache_dir / "market_old.json").exists()
+
     def test_clear_cache_all(self, temp_cache_dir, monkeypatch):
         """Should clear all cache files."""
         monkeypatch.setattr(token_screener, "CACHE_DIR", temp_cache_dir)
@@ -642,7 +684,7 @@ class TestCacheFunctions:
 
         count = clear_cache()
         assert count == 3
-        assert len(list(temp_cache_dir.glob("*.json"))) == 0
+        assert get_cache_stats()["total_entries"] == 0
 
     def test_clear_cache_by_prefix(self, temp_cache_dir, monkeypatch):
         """Should clear cache files by prefix."""
@@ -655,7 +697,7 @@ class TestCacheFunctions:
 
         count = clear_cache(prefix="rugcheck")
         assert count == 2
-        assert len(list(temp_cache_dir.glob("*.json"))) == 1
+        assert get_cache_stats()["categories"] == {"market": 1}
 
     def test_clear_cache_nonexistent_dir(self, monkeypatch):
         """Should handle non-existent cache directory."""
@@ -836,6 +878,39 @@ class TestFetchRugcheckData:
         assert result.is_safe is True
         assert result.risk_score == 20.0
 
+    @patch("core.rugcheck.fetch_report")
+    @patch("core.rugcheck.evaluate_safety")
+    @patch("core.rugcheck.best_lock_stats")
+    def test_fetched_rugcheck_entry_expires(
+        self,
+        mock_lock_stats,
+        mock_safety,
+        mock_fetch,
+        sample_mint,
+        temp_cache_dir,
+        monkeypatch,
+    ):
+        """Fetched data should be cached with the rugcheck TTL and then evicted."""
+        monkeypatch.setattr(token_screener, "CACHE_DIR", temp_cache_dir)
+        mock_fetch.return_value = {"rugged": False}
+        mock_safety.return_value = {"ok": True, "issues": [], "details": {}}
+        mock_lock_stats.return_value = {"best_lp_locked_pct": 95.0}
+
+        result = TokenScreener().fetch_rugcheck_data(sample_mint, use_cache=True)
+        assert result is not None
+        mock_fetch.assert_called_once()
+
+        store = token_screener._get_cache_store()
+        key = _cache_key("rugcheck", sample_mint)
+        cached_at, expires_at = store._conn.execute(
+            "SELECT cached_at, expires_at FROM cache_entries WHERE key = ?", (key,)
+        ).fetchone()
+        assert expires_at == pytest.approx(cached_at + token_screener.CACHE_TTL_RUGCHECK)
+
+        with patch("core.screener_cache.time.time", return_value=expires_at + 1):
+            assert store.get(key) is None
+            assert store.evict() == 1
+
     def test_fetch_rugcheck_module_unavailable(self, sample_mint, temp_cache_dir, monkeypatch):
         """Should handle missing rugcheck module."""
         monkeypatch.setattr(token_screener, "CACHE_DIR", temp_cache_dir)
@@ -1816,6 +1891,99 @@ class TestScreenTokens:
         assert any("screening_error" in r for r in bad_result.failed_reasons)
 
 
+class TestScreenTokensAsync:
+    """Tests for concurrent async batch screening."""
+
+    @staticmethod
+    def _slow_fetchers(screener, delay=0.05):
+        def slow(value):
+            def fetch(mint, use_cache=True):
+                time.sleep(delay)
+                return value
+            return fetch
+
+        screener.fetch_rugcheck_data = slow(RugcheckData(is_safe=True, lp_locked_pct=90.0))
+        screener.fetch_market_data = slow(MarketData(liquidity_usd=50_000, volume_24h=20_000))
+        screener.fetch_social_metrics = slow(SocialMetrics(has_twitter=True, social_score=30.0))
+        screener.fetch_holder_data = slow(HolderData(total_holders=500, distribution_score=80.0))
+        screener._fetch_symbol_name = lambda mint: (mint.upper(), mint)
+
+    @pytest.mark.asyncio
+    async def test_fetches_run_concurrently(self):
+        """Sources and tokens should overlap instead of running back to back."""
+        screener = TokenScreener()
+        self._slow_fetchers(screener)
+        limits = {name: token_screener.ProviderLimit(max_concurrency=10) for name in
+                  ("rugcheck", "market", "social", "holders")}
+
+        start = time.monotonic()
+        results = await screener.screen_tokens_async(
+            [f"mint{i}" for i in range(10)], use_cache=False, provider_limits=limits
+        )
+        elapsed = time.monotonic() - start
+
+        assert [r.mint for r in results] == [f"mint{i}" for i in range(10)]
+        assert all(r.symbol == r.mint.upper() for r in results)
+        assert elapsed < 0.5  # Sequential cost is 10 tokens x 4 sources x 50ms = 2s
+
+    @pytest.mark.asyncio
+    async def test_provider_concurrency_limit(self):
+        """No provider should exceed its max_concurrency."""
+        screener = TokenScreener()
+        self._slow_fetchers(screener, delay=0.0)
+        in_flight = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def tracked(mint, use_cache=True):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            time.sleep(0.02)
+            with lock:
+                in_flight["now"] -= 1
+            return HolderData()
+
+        screener.fetch_holder_data = tracked
+        limits = {"holders": token_screener.ProviderLimit(max_concurrency=2)}
+        await screener.screen_tokens_async(
+            [f"mint{i}" for i in range(8)], use_cache=False, provider_limits=limits
+        )
+
+        assert in_flight["peak"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_errors_become_failed_results(self):
+        """A failing token should not abort the batch."""
+        screener = TokenScreener()
+        self._slow_fetchers(screener, delay=0.0)
+
+        def boom(mint, use_cache=True):
+            if mint == "bad":
+                raise RuntimeError("Fetch failed")
+            return RugcheckData()
+
+        screener.fetch_rugcheck_data = boom
+        results = [r async for r in screener.iter_screen_tokens(["good", "bad"], use_cache=False)]
+
+        bad = [r for r in results if r.mint == "bad"][0]
+        assert len(results) == 2
+        assert any("screening_error" in reason for reason in bad.failed_reasons)
+
+    @pytest.mark.asyncio
+    async def test_stream_rankings_grow(self):
+        """Each completed token should produce an updated ranking."""
+        screener = TokenScreener()
+        self._slow_fetchers(screener, delay=0.0)
+
+        rankings = [
+            ranking async for ranking in screener.stream_rankings(
+                ["a", "b", "c"], passed_only=False, use_cache=False
+            )
+        ]
+
+        assert [len(r) for r in rankings] == [1, 2, 3]
+
+
 # =============================================================================
 # Test TokenScreener - Token Ranking
 # =============================================================================
@@ -0,0 +1,169 @@
+"""
+Unit tests for the SQLite exit intent store.
+
+Tests:
+- Single-row upserts and status/symbol queries
+- One-time migration of legacy exit_intents.json
+- core.exit_intents persistence through the store and debounced JSON mirror
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from core import exit_intents
+from core.exit_intent_store import ExitIntentStore
+
+
+def _intent(intent_id, status="active", symbol="SOL"):
+    return {"id": intent_id, "status": status, "symbol": symbol, "token_mint": "M"}
+
+
+class TestExitIntentStore:
+    """Row-per-intent storage."""
+
+    def test_upsert_and_status_query(self, tmp_path):
+        store = ExitIntentStore(tmp_path / "intents.db")
+        store.upsert_many([_intent("a"), _intent("b", status="completed"), _intent("c")])
+
+        assert [i["id"] for i in store.by_status("active")] == ["a", "c"]
+
+        store.upsert(_intent("a", status="completed"))
+        assert [i["id"] for i in store.by_status("active")] == ["c"]
+        assert store.get("a")["status"] == "completed"
+        assert store.count() == 3
+
+    def test_update_keeps_insertion_order(self, tmp_path):
+        store = ExitIntentStore(tmp_path / "intents.db")
+        store.upsert_many([_intent("a"), _intent("b")])
+        store.upsert({**_intent("a"), "notes": "touched"})
+        assert list(store.all()) == ["a", "b"]
+
+    def test_by_symbol(self, tmp_path):
+        store = ExitIntentStore(tmp_path / "intents.db")
+        store.upsert_many([
+            _intent("a", symbol="SOL"),
+            _intent("b", symbol="BONK"),
+            _intent("c", symbol="SOL", status="cancelled"),
+        ])
+        assert [i["id"] for i in store.by_symbol("SOL")] == ["a", "c"]
+        assert [i["id"] for i in store.by_symbol("SOL", status="active")] == ["a"]
+
+    def test_legacy_migration_runs_once(self, tmp_path):
+        legacy = tmp_path / "exit_intents.json"
+        legacy.write_text(json.dumps({"a": _intent("a"), "b": _intent("b", status="completed")}))
+
+        store = ExitIntentStore(tmp_path / "exit_intents.db", legacy_json=legacy)
+        assert store.count() == 2
+        assert (tmp_path / "exit_intents.json.migrated").exists()
+        store.close()
+
+        legacy.write_text(json.dumps({"z": _intent("z")}))
+        store = ExitIntentStore(tmp_path / "exit_intents.db", legacy_json=legacy)
+        assert store.get("z") is None
+
+    def test_legacy_list_layout(self, tmp_path):
+        legacy = tmp_path / "exit_intents.json"
+        legacy.write_text(json.dumps([_intent("a"), _intent("b")]))
+        store = ExitIntentStore(tmp_path / "exit_intents.db", legacy_json=legacy)
+        assert set(store.all()) == {"a", "b"}
+
+
+@pytest.fixture
+def intents_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(exit_intents, "TRADING_DIR", tmp_path)
+    monkeypatch.setattr(exit_intents, "INTENTS_FILE", tmp_path / "exit_intents.json")
+    monkeypatch.setattr(exit_intents, "_store", None)
+    monkeypatch.setattr(exit_intents, "_mirror_pending", False)
+    monkeypatch.setattr(exit_intents, "_mirror_last_write", 0.0)
+    yield tmp_path
+    if exit_intents._mirror_timer is not None:
+        exit_intents._mirror_timer.cancel()
+        exit_intents._mirror_timer = None
+    if exit_intents._store is not None:
+        exit_intents._store.close()
+
+
+class TestExitIntentsPersistence:
+    """core.exit_intents on top of the store."""
+
+    def _spot(self, position_id, symbol="SOL"):
+        return exit_intents.create_spot_intent(
+            position_id=position_id,
+            token_mint="So11111111111111111111111111111111111111112",
+            symbol=symbol,
+            entry_price=100.0,
+            quantity=1.0,
+        )
+
+    def test_persist_update_and_load_active(self, intents_dir):
+        first = self._spot("p1")
+        second = self._spot("p2", symbol="BONK")
+        assert exit_intents.persist_intent(first)
+        assert exit_intents.persist_intent(second)
+
+        assert exit_intents.cancel_intent(first.id, "manual")
+        active = exit_intents.load_active_intents()
+        assert [i.id for i in active] == [second.id]
+        assert exit_intents.load_intent(first.id).status == "cancelled"
+        assert [i.id for i in exit_intents.load_intents_by_symbol("BONK")] == [second.id]
+
+    def test_json_mirror_holds_active_only(self, intents_dir):
+        first = self._spot("p1")
+        second = self._spot("p2")
+        exit_intents.persist_intent(first)
+        exit_intents.persist_intent(second)
+        exit_intents.cancel_intent(first.id)
+        exit_intents.flush_json_mirror()
+
+        mirror = json.loads((intents_dir / "exit_intents.json").read_text())
+        assert list(mirror) == [second.id]
+        assert not list(intents_dir.glob("*.tmp"))
+
+    def test_json_mirror_debounced(self, intents_dir, monkeypatch):
+        monkeypatch.setattr(exit_intents, "JSON_MIRROR_INTERVAL", 0.1)
+        writes = []
+        real_write = exit_intents._write_json_mirror
+        monkeypatch.setattr(exit_intents, "_write_json_mirror", lambda: (writes.append(1), real_write()))
+
+        intents = [self._spot(f"p{i}") for i in range(5)]
+        for intent in intents:
+            exit_intents.persist_intent(intent)
+        assert len(writes) == 1
+
+        time.sleep(0.3)
+        assert len(writes) == 2
+        mirror = json.loads((intents_dir / "exit_intents.json").read_text())
+        assert sorted(mirror) == sorted(i.id for i in intents)
+
+    def test_concurrent_mirror_writers(self, intents_dir):
+        exit_intents.persist_intent(self._spot("p1"))
+        threads = [threading.Thread(target=exit_intents._write_json_mirror) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(json.loads((intents_dir / "exit_intents.json").read_text())) == 1
+        assert not list(intents_dir.glob("*.tmp"))
+
+    def test_migrates_existing_json(self, intents_dir):
+        legacy = self._spot("old").to_dict()
+        (intents_dir / "exit_intents.json").write_text(json.dumps({legacy["id"]: legacy}))
+
+        assert [i.id for i in exit_intents.load_active_intents()] == [legacy["id"]]
+        assert (intents_dir / "exit_intents.db").exists()
+
+    def test_script_intents_go_through_store(self, intents_dir):
+        from core.trading_knowledge import load_current_positions
+        from scripts import savage_mog_trade
+
+        intent = savage_mog_trade.create_exit_intent(savage_mog_trade.TRADE_CONFIG)
+        assert savage_mog_trade.persist_intent(intent)
+        exit_intents.flush_json_mirror()
+
+        assert [i.id for i in exit_intents.load_active_intents()] == [intent["id"]]
+        assert list(json.loads((intents_dir / "exit_intents.json").read_text())) == [intent["id"]]
+        assert [p["id"] for p in load_current_positions()] == [intent["id"]]
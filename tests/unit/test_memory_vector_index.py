@@ -0,0 +1,276 @@
+"""Tests for the local memory-mapped vector index.
+
+Tests:
+1. LocalVectorIndex add/search/upsert/remove and persistence
+2. Crash recovery and compaction
+3. IVF layer recall against exact search
+4. MemoryStore.search_semantic via the index
+5. hybrid_search local fallback when PostgreSQL is unavailable
+"""
+import asyncio
+import pytest
+from typing import List
+from unittest.mock import patch
+
+np = pytest.importorskip("numpy")
+
+from core.memory import hybrid_search, retain_fact, get_db
+from core.memory.persistence import LongTermMemory, MemoryStore, MemoryType
+from core.memory.vector_index import LocalVectorIndex
+
+
+def _unit(seed: int, dim: int = 16) -> List[float]:
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=dim).tolist()
+
+
+@pytest.fixture
+def index(tmp_path):
+    return LocalVectorIndex(tmp_path / "idx")
+
+
+class TestLocalVectorIndex:
+    """Core index behaviour."""
+
+    def test_exact_match_ranks_first(self, index):
+        index.add_many([(i, _unit(i)) for i in range(50)])
+
+        results = index.search(_unit(7), limit=3)
+
+        assert results[0][0] == 7
+        assert results[0][1] == pytest.approx(1.0, abs=1e-5)
+        assert len(results) == 3
+        assert results[0][1] >= results[1][1] >= results[2][1]
+
+    def test_threshold_filters(self, index):
+        index.add_many([(i, _unit(i)) for i in range(20)])
+        results = index.search(_unit(3), limit=20, similarity_threshold=0.99)
+        assert [key for key, _ in results] == [3]
+
+    def test_upsert_and_remove(self, index):
+        index.add("a", [1.0, 0.0])
+        index.add("b", [0.0, 1.0])
+        index.add("a", [0.0, 1.0])  # Replace
+
+        assert len(index) == 2
+        assert {key for key, _ in index.search([0.0, 1.0], limit=5, similarity_threshold=0.9)} == {"a", "b"}
+
+        assert index.remove("b")
+        assert not index.remove("b")
+        assert [key for key, _ in index.search([0.0, 1.0], limit=5)] == ["a"]
+
+    def test_persists_across_reopen(self, tmp_path):
+        first = LocalVectorIndex(tmp_path / "idx")
+        first.add_many([(f"m{i}", _unit(i)) for i in range(10)])
+        first.remove("m4")
+
+        reopened = LocalVectorIndex(tmp_path / "idx")
+
+        assert len(reopened) == 9
+        assert "m4" not in reopened
+        assert reopened.search(_unit(5), limit=1)[0][0] == "m5"
+
+    def test_dim_mismatch_raises(self, index):
+        index.add(1, [1.0, 0.0, 0.0])
+        with pytest.raises(ValueError):
+            index.add(2, [1.0, 0.0])
+        with pytest.raises(ValueError):
+            index.search([1.0, 0.0])
+
+    def test_recovers_from_unlogged_vector(self, tmp_path):
+        index = LocalVectorIndex(tmp_path / "idx")
+        index.add_many([(i, _unit(i)) for i in range(5)])
+
+        # Simulate a crash after the vector write but before the log write
+        with open(tmp_path / "idx" / "vectors.f32", "ab") as f:
+            f.write(np.ones(16, dtype=np.float32).tobytes())
+
+        reopened = LocalVectorIndex(tmp_path / "idx")
+        assert len(reopened) == 5
+        reopened.add(5, _unit(5))
+        assert reopened.search(_unit(5), limit=1)[0][0] == 5
+
+    def test_compaction_after_many_deletes(self, index):
+        index.add_many([(i, _unit(i)) for i in range(40)])
+        for i in range(0, 40, 2):
+            index.remove(i)
+
+        stats = index.get_stats()
+        assert stats["vectors"] == 20
+        assert stats["rows"] < 40  # Compacted
+        assert index.search(_unit(9), limit=1)[0][0] == 9
+
+
+class TestIVFLayer:
+    """Approximate search via inverted lists."""
+
+    def test_ivf_recall(self, tmp_path):
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(8, 32))
+        vectors = np.repeat(centers, 100, axis=0) + 0.1 * rng.normal(size=(800, 32))
+
+        exact = LocalVectorIndex(tmp_path / "exact")
+        approx = LocalVectorIndex(tmp_path / "ivf", ivf_lists=8, n_probe=2)
+        items = [(i, v.tolist()) for i, v in enumerate(vectors)]
+        exact.add_many(items)
+        approx.add_many(items)
+
+        hits = 0
+        for q in range(0, 800, 40):
+            truth = {k for k, _ in exact.search(vectors[q].tolist(), limit=10)}
+            found = {k for k, _ in approx.search(vectors[q].tolist(), limit=10)}
+            hits += len(truth & found)
+
+        assert approx.get_stats()["ivf_lists"] == 8
+        assert hits / (20 * 10) >= 0.9
+
+    def test_rows_added_after_training_are_searchable(self, tmp_path):
+        index = LocalVectorIndex(tmp_path / "ivf", ivf_lists=2, n_probe=1)
+        index.add_many([(i, _unit(i)) for i in range(100)])  # Trains
+        assert index.get_stats()["ivf_trained_rows"] == 100
+        index.add("late", _unit(999))
+
+        assert index.search(_unit(999), limit=1)[0][0] == "late"
+
+
+    def test_search_never_trains(self, tmp_path):
+        index = LocalVectorIndex(tmp_path / "ivf", ivf_lists=2, n_probe=1)
+        index.add_many([(i, _unit(i)) for i in range(100)])
+
+        with patch.object(LocalVectorIndex, "train_ivf", side_effect=AssertionError):
+            assert index.search(_unit(3), limit=1)[0][0] == 3
+
+
+def _add_range(directory, start, stop):
+    index = LocalVectorIndex(directory)
+    for i in range(start, stop):
+        index.add(i, _unit(i))
+
+
+class TestSharedDirectory:
+    """Several processes using one index directory."""
+
+    def test_sees_other_writers(self, tmp_path):
+        first = LocalVectorIndex(tmp_path / "idx")
+        second = LocalVectorIndex(tmp_path / "idx")
+        first.add_many([(i, _unit(i)) for i in range(10)])
+
+        assert second.search(_unit(4), limit=1)[0][0] == 4
+        second.add("new", _unit(50))
+        second.remove(4)
+        assert first.search(_unit(50), limit=1)[0][0] == "new"
+        assert 4 not in [key for key, _ in first.search(_unit(4), limit=11)]
+
+    def test_reloads_after_other_compacts(self, tmp_path):
+        first = LocalVectorIndex(tmp_path / "idx")
+        first.add_many([(i, _unit(i)) for i in range(40)])
+        second = LocalVectorIndex(tmp_path / "idx")
+        assert second.search(_unit(30), limit=1)[0][0] == 30
+
+        for i in range(0, 40, 2):
+            first.remove(i)  # Compacts, renumbering rows
+        assert first.get_stats()["generation"] >= 1
+
+        assert second.search(_unit(31), limit=1)[0][0] == 31
+        assert second.get_stats()["rows"] == first.get_stats()["rows"]
+        second.add("after", _unit(77))
+        assert first.search(_unit(77), limit=1)[0][0] == "after"
+
+        second.clear()
+        assert first.search(_unit(31), limit=1) == []
+
+    def test_concurrent_process_appends_stay_aligned(self, tmp_path):
+        import multiprocessing
+
+        ctx = multiprocessing.get_context("fork")
+        procs = [ctx.Process(target=_add_range, args=(tmp_path / "idx", k * 60, (k + 1) * 60)) for k in range(3)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+        assert all(p.exitcode == 0 for p in procs)
+
+        index = LocalVectorIndex(tmp_path / "idx")
+        assert len(index) == 180
+        for i in range(0, 180, 7):
+            key, score = index.search(_unit(i), limit=1)[0]
+            assert key == i
+            assert score == pytest.approx(1.0, abs=1e-5)
+
+
+class TestMemoryStoreIndex:
+    """MemoryStore semantic search backed by the index."""
+
+    def test_semantic_search_uses_index(self, tmp_path):
+        embeddings = {"alpha": _unit(1), "beta": _unit(2), "gamma": _unit(3)}
+        store = MemoryStore(tmp_path / "memory.db", embedding_fn=lambda text: embeddings[text])
+
+        async def run():
+            await store.initialize()
+            ids = {}
+            for text in embeddings:
+                ids[text] = await store.save(LongTermMemory(content=text, memory_type=MemoryType.FACT))
+            await store.archive(ids["gamma"])
+
+            with patch.object(MemoryStore, "_cosine_similarity", side_effect=AssertionError):
+                results = await store.search_semantic("beta", threshold=0.5)
+                archived = await store.search_semantic("gamma", threshold=0.99)
+            await store.close()
+            return results, archived
+
+        results, archived = asyncio.run(run())
+
+        assert results[0].memory.content == "beta"
+        assert results[0].relevance_score == pytest.approx(1.0, abs=1e-5)
+        assert archived == []
+
+    def test_index_backfilled_from_existing_rows(self, tmp_path):
+        embeddings = {"alpha": _unit(1), "beta": _unit(2)}
+        db_path = tmp_path / "memory.db"
+
+        async def run():
+            store = MemoryStore(db_path, embedding_fn=lambda text: embeddings[text])
+            await store.initialize()
+            for text in embeddings:
+                await store.save(LongTermMemory(content=text, memory_type=MemoryType.FACT))
+            await store.close()
+
+            # Lose the index; it should be rebuilt from the embedding blobs
+            LocalVectorIndex(tmp_path / "memory_vectors").clear()
+
+            reopened = MemoryStore(db_path, embedding_fn=lambda text: embeddings[text])
+            await reopened.initialize()
+            results = await reopened.search_semantic("alpha", threshold=0.9)
+            await reopened.close()
+            return results
+
+        results = asyncio.run(run())
+        assert [r.memory.content for r in results] == ["alpha"]
+
+
+class TestHybridLocalFallback:
+    """hybrid_search uses the local index when PostgreSQL is unavailable."""
+
+    @patch('core.memory.pg_vector.PostgresVectorStore.is_available', return_value=False)
+    def test_vector_results_from_local_index(self, _mock_available, tmp_path):
+        conn = get_db()._get_connection()
+        conn.execute("DELETE FROM facts")
+        conn.commit()
+
+        index = LocalVectorIndex(tmp_path / "facts")
+        target = retain_fact(content="semantic only match about liquidity pools", source="test")
+        other = retain_fact(content="unrelated note", source="test")
+        index.add(target, _unit(11))
+        index.add(other, _unit(12))
+
+        try:
+            with patch('core.memory.hybrid_search.get_local_vector_index', return_value=index):
+                results = hybrid_search("nonexistentkeyword", query_embedding=_unit(11), limit=5)
+        finally:
+            conn.execute("DELETE FROM facts")
+            conn.commit()
+
+        assert results["mode"] == "hybrid"
+        assert results["vector_backend"] == "local"
+        assert results["results"][0].fact_id == target
+        assert results["results"][0].vector_similarity == pytest.approx(1.0, abs=1e-5)
@@ -16,6 +16,7 @@ Tests cover:
 - Outcome recording and weight adjustment
 - Provider registration and collection
 - Edge cases and error handling
+- Watchlist collection, batched fusion and the fusion scheduler
 
 Target: 60%+ coverage with comprehensive unit tests.
 """
@@ -36,6 +37,7 @@ from core.signals.fusion import (
     RawSignal,
     FusedSignal,
     SignalFusion,
+    FusionScheduler,
     get_signal_fusion,
 )
 
@@ -1143,5 +1145,125 @@ class TestFusionIntegration:
             assert fused.token == token
 
 
+# =============================================================================
+# Watchlist Round Tests
+# =============================================================================
+
+class TestWatchlistRounds:
+    """Tests for batched watchlist collection and fusion."""
+
+    @pytest.fixture
+    def fusion(self, tmp_path):
+        """Create a fusion instance for watchlist testing."""
+        return SignalFusion(
+            storage_path=str(tmp_path / "watchlist_fusion.json"),
+            min_sources_for_signal=2,
+            min_confidence=0.3,
+        )
+
+    @staticmethod
+    def _signal(source, token, direction=SignalDirection.BUY, confidence=0.8):
+        return RawSignal(
+            source=source, token=token, direction=direction, strength=0.8, confidence=confidence
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_provider_called_once(self, fusion):
+        """Batch providers get the whole watchlist; per-token providers run per token."""
+        tokens = [f"T{i}" for i in range(20)]
+        batch_calls = []
+
+        def whale_batch(batch):
+            batch_calls.append(list(batch))
+            return {t: self._signal(SignalSource.WHALE, t) for t in batch}
+
+        async def technical(token):
+            return self._signal(SignalSource.TECHNICAL, token)
+
+        fusion.register_batch_provider(SignalSource.WHALE, whale_batch)
+        fusion.register_provider(SignalSource.TECHNICAL, technical)
+
+        collected = await fusion.collect_watchlist(tokens, max_concurrency=4)
+
+        assert batch_calls == [tokens]
+        assert set(collected) == set(tokens)
+        assert all(len(by_source) == 2 for by_source in collected.values())
+        assert fusion.fused_signals == {}  # No fusion per arrival
+
+    @pytest.mark.asyncio
+    async def test_failing_provider_isolated(self, fusion):
+        """A failing provider does not drop other sources."""
+        def broken(batch):
+            raise RuntimeError("provider down")
+
+        fusion.register_batch_provider(SignalSource.WHALE, broken)
+        fusion.register_provider(SignalSource.TECHNICAL, lambda t: self._signal(SignalSource.TECHNICAL, t))
+
+        collected = await fusion.collect_watchlist(["SOL"])
+
+        assert list(collected["SOL"]) == [SignalSource.TECHNICAL]
+
+    @pytest.mark.asyncio
+    async def test_fuse_watchlist_matches_single_fusion(self, fusion):
+        """Batched fusion produces the same values as per-token fusion."""
+        signals = {
+            SignalSource.TECHNICAL: self._signal(SignalSource.TECHNICAL, "SOL", SignalDirection.STRONG_BUY, 0.9),
+            SignalSource.WHALE: self._signal(SignalSource.WHALE, "SOL", SignalDirection.BUY, 0.7),
+            SignalSource.SENTIMENT: self._signal(SignalSource.SENTIMENT, "SOL", SignalDirection.SELL, 0.6),
+        }
+        expected = await fusion._fuse_signals("SOL", signals)
+        fusion.pending_signals["SOL"] = dict(signals)
+
+        [fused] = fusion.fuse_watchlist(["SOL"])
+
+        assert fused.direction == expected.direction
+        assert fused.strength == pytest.approx(expected.strength)
+        assert fused.confidence == pytest.approx(expected.confidence)
+        assert fused.agreement_score == expected.agreement_score
+        assert fused.source_signals == pytest.approx(expected.source_signals)
+        assert fused.risk_level == expected.risk_level
+        assert fusion.pending_signals["SOL"] == {}
+
+    def test_fuse_watchlist_skips_thin_tokens(self, fusion):
+        """Tokens below min_sources stay pending."""
+        fusion.pending_signals["SOL"][SignalSource.TECHNICAL] = self._signal(SignalSource.TECHNICAL, "SOL")
+
+        assert fusion.fuse_watchlist(["SOL", "UNKNOWN"]) == []
+        assert SignalSource.TECHNICAL in fusion.pending_signals["SOL"]
+
+    @pytest.mark.asyncio
+    async def test_record_outcomes_saves_once(self, fusion):
+        """Outcome batches persist weights in a single write."""
+        for token in ("SOL", "BTC"):
+            fusion.pending_signals[token][SignalSource.TECHNICAL] = self._signal(SignalSource.TECHNICAL, token)
+            fusion.pending_signals[token][SignalSource.WHALE] = self._signal(SignalSource.WHALE, token)
+        fused = fusion.fuse_watchlist(["SOL", "BTC"])
+
+        with patch.object(fusion, "_save") as save:
+            await fusion.record_outcomes({sig.signal_id: True for sig in fused})
+            await fusion.record_outcomes({"FSIG-MISSING": True})
+
+        save.assert_called_once()
+        assert fusion.weights[SignalSource.TECHNICAL].signals_count == 2
+
+    @pytest.mark.asyncio
+    async def test_scheduler_round(self, fusion):
+        """The scheduler fuses the whole watchlist per round."""
+        fusion.register_batch_provider(
+            SignalSource.WHALE, lambda batch: {t: self._signal(SignalSource.WHALE, t) for t in batch}
+        )
+        fusion.register_batch_provider(
+            SignalSource.ON_CHAIN, lambda batch: {t: self._signal(SignalSource.ON_CHAIN, t) for t in batch}
+        )
+        scheduler = FusionScheduler(fusion, interval_seconds=0.01)
+        scheduler.watch(["SOL", "BTC", "SOL"])
+        scheduler.unwatch(["BTC"])
+
+        fused = await scheduler.run_once()
+
+        assert scheduler.watchlist == ["SOL"]
+        assert [sig.token for sig in fused] == ["SOL"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
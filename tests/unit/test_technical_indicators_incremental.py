@@ -0,0 +1,123 @@
+"""Tests for incremental (streaming) indicators in TechnicalIndicators.
+
+Tests:
+1. Streamed values match the from-scratch definitions at every bar
+2. Streams bootstrapped mid-history match
+3. History eviction (max_history) is respected
+4. Periods longer than the retained history fall back to recompute
+"""
+import math
+import random
+
+import pytest
+
+from core.technical_indicators import OHLCV, TechnicalIndicators
+
+
+def _candles(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    price = 50.0
+    candles = []
+    for i in range(n):
+        price *= math.exp(rng.gauss(0, 0.03))
+        close = price if i % 6 else candles[-1].close if candles else price  # Flat bars
+        candles.append(OHLCV(
+            timestamp=str(i),
+            open=price * 0.995,
+            high=max(price, close) * (1 + rng.random() * 0.02),
+            low=min(price, close) * (1 - rng.random() * 0.02),
+            close=close,
+            volume=rng.uniform(0, 1000),
+        ))
+    return candles
+
+
+CALLS = [
+    ("sma", (20,)), ("sma", (50,)), ("ema", (12,)), ("ema", (3,)),
+    ("rsi", (14,)), ("atr", (14,)), ("adx", (14,)), ("obv", ()),
+    ("macd", ()), ("bollinger_bands", ()), ("supertrend", ()),
+]
+
+
+def _assert_same(a, b, context):
+    if isinstance(a, dict):
+        assert a.keys() == b.keys(), context
+        for key in a:
+            if isinstance(a[key], str):
+                assert a[key] == b[key], context
+            else:
+                assert a[key] == pytest.approx(b[key], rel=1e-9, abs=1e-9), (context, key)
+    else:
+        assert a == pytest.approx(b, rel=1e-9, abs=1e-9), context
+
+
+class TestIncrementalParity:
+    """Streaming indicators agree with full recomputation."""
+
+    def test_every_bar_matches_recompute(self):
+        streaming = TechnicalIndicators(max_history=100)
+        reference = TechnicalIndicators(max_history=100, incremental=False)
+
+        for i, candle in enumerate(_candles(400)):
+            streaming.add_candle("sol", candle)
+            reference.add_candle("sol", candle)
+            for name, args in CALLS:
+                _assert_same(
+                    getattr(streaming, name)("SOL", *args),
+                    getattr(reference, name)("SOL", *args),
+                    (i, name, args),
+                )
+
+    def test_bootstrap_from_existing_history(self):
+        candles = _candles(300)
+        streaming = TechnicalIndicators()
+        reference = TechnicalIndicators(incremental=False)
+        streaming.add_candles("BONK", candles[:150])
+        reference.add_candles("BONK", candles[:150])
+
+        # First read bootstraps the streams; later candles update them
+        assert streaming.rsi("BONK") == pytest.approx(reference.rsi("BONK"))
+        streaming.add_candles("BONK", candles[150:])
+        reference.add_candles("BONK", candles[150:])
+
+        for name, args in CALLS:
+            _assert_same(
+                getattr(streaming, name)("BONK", *args),
+                getattr(reference, name)("BONK", *args),
+                (name, args),
+            )
+
+    def test_analyze_matches_recompute(self):
+        streaming = TechnicalIndicators()
+        reference = TechnicalIndicators(incremental=False)
+        for candle in _candles(120):
+            streaming.add_candle("JUP", candle)
+            reference.add_candle("JUP", candle)
+            streaming.analyze("JUP")
+
+        a, b = streaming.analyze("JUP"), reference.analyze("JUP")
+        assert a.trend == b.trend
+        assert a.overall_signal == b.overall_signal
+        for key in a.indicators:
+            assert a.indicators[key].value == pytest.approx(b.indicators[key].value, rel=1e-9, abs=1e-9)
+
+
+class TestStreamBounds:
+    """History limits are honoured by streams."""
+
+    def test_period_longer_than_history_falls_back(self):
+        ta = TechnicalIndicators(max_history=30)
+        ta.add_candles("SOL", _candles(60))
+
+        assert ta.sma("SOL", 40) == 0  # Only 30 candles retained
+        assert ("sma", 40) not in ta._streams.get("SOL", {})
+
+    def test_obv_drops_evicted_candles(self):
+        streaming = TechnicalIndicators(max_history=10)
+        reference = TechnicalIndicators(max_history=10, incremental=False)
+        streaming.obv("SOL")  # Register before any data
+
+        for candle in _candles(50):
+            streaming.add_candle("SOL", candle)
+            reference.add_candle("SOL", candle)
+            assert streaming.obv("SOL") == pytest.approx(reference.obv("SOL"), abs=1e-9)
@@ -0,0 +1,142 @@
+"""
+Unit tests for tg_bot/services/chart_renderer.py
+
+Covers:
+- Content-addressed cache keys
+- In-memory LRU and on-disk PNG cache
+- Single-flight rendering for concurrent identical requests
+- Error propagation to shared waiters
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tg_bot.services.chart_renderer import ChartRenderer, chart_key
+
+
+PNG = b'\x89PNG\r\n\x1a\nfake'
+
+
+@pytest.fixture
+def renderer(tmp_path):
+    """Renderer whose pool is replaced by a slow fake render."""
+    r = ChartRenderer(memory_items=2, cache_dir=tmp_path / "charts")
+
+    async def fake_render(chart, kwargs):
+        await asyncio.sleep(0.05)
+        return PNG + chart.encode()
+
+    r._render_on_pool = AsyncMock(side_effect=fake_render)
+    yield r
+    r.shutdown()
+
+
+@pytest.fixture
+def sample_times():
+    base = datetime(2026, 1, 25, 10, 0, 0)
+    return [base + timedelta(hours=i) for i in range(3)]
+
+
+class TestChartKey:
+    """Test content addressing of chart inputs."""
+
+    def test_same_inputs_same_key(self, sample_times):
+        a = chart_key("generate_price_chart", {"symbol": "SOL", "prices": [1.0, 2.0], "times": sample_times})
+        b = chart_key("generate_price_chart", {"times": list(sample_times), "prices": [1.0, 2.0], "symbol": "SOL"})
+        assert a == b
+
+    def test_different_inputs_different_key(self, sample_times):
+        a = chart_key("generate_price_chart", {"symbol": "SOL", "prices": [1.0, 2.0], "times": sample_times})
+        b = chart_key("generate_price_chart", {"symbol": "SOL", "prices": [1.0, 2.5], "times": sample_times})
+        c = chart_key("generate_portfolio_chart", {"symbol": "SOL", "prices": [1.0, 2.0], "times": sample_times})
+        assert len({a, b, c}) == 3
+
+    def test_unsupported_input_rejected(self):
+        with pytest.raises(TypeError):
+            chart_key("generate_trade_distribution", {"pnl_values": object()})
+
+
+class TestChartRenderer:
+    """Test caching and request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_render_once(self, renderer, sample_times):
+        charts = await asyncio.gather(*(
+            renderer.generate_price_chart(symbol="SOL", prices=[1.0, 2.0, 3.0], times=sample_times)
+            for _ in range(10)
+        ))
+
+        assert renderer._render_on_pool.await_count == 1
+        assert renderer.stats["shared"] == 9
+        assert all(c.getvalue() == PNG + b"generate_price_chart" for c in charts)
+        assert len({id(c) for c in charts}) == 10  # Each caller gets its own buffer
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_hit(self, renderer):
+        await renderer.generate_trade_distribution(pnl_values=[1.0, -2.0])
+        await renderer.generate_trade_distribution(pnl_values=[1.0, -2.0])
+
+        assert renderer._render_on_pool.await_count == 1
+        assert renderer.stats["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_oldest(self, renderer):
+        for pnl in ([1.0], [2.0], [3.0]):
+            await renderer.generate_trade_distribution(pnl_values=pnl)
+
+        assert len(renderer._memory) == 2
+        assert chart_key("generate_trade_distribution", {"pnl_values": [1.0]}) not in renderer._memory
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_survives_restart(self, renderer, tmp_path):
+        await renderer.generate_position_allocation(positions={"SOL": 60.0, "BTC": 40.0})
+        await asyncio.sleep(0.1)  # Disk write runs in the default executor
+        assert list((tmp_path / "charts").glob("*.png"))
+
+        fresh = ChartRenderer(cache_dir=tmp_path / "charts")
+        fresh._render_on_pool = AsyncMock()
+        chart = await fresh.generate_position_allocation(positions={"BTC": 40.0, "SOL": 60.0})
+
+        fresh._render_on_pool.assert_not_called()
+        assert fresh.stats["disk_hits"] == 1
+        assert chart.getvalue() == PNG + b"generate_position_allocation"
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_all_waiters(self, renderer):
+        async def boom(chart, kwargs):
+            await asyncio.sleep(0.05)
+            raise RuntimeError("render failed")
+
+        renderer._render_on_pool.side_effect = boom
+
+        results = await asyncio.gather(
+            renderer.generate_trade_distribution(pnl_values=[1.0]),
+            renderer.generate_trade_distribution(pnl_values=[1.0]),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert renderer.stats["errors"] == 1
+        assert not renderer._inflight
+
+    @pytest.mark.asyncio
+    async def test_cancelled_first_caller_does_not_cancel_waiters(self, renderer):
+        first = asyncio.ensure_future(renderer.generate_trade_distribution(pnl_values=[1.0]))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(renderer.generate_trade_distribution(pnl_values=[1.0]))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        chart = await second
+
+        assert first.cancelled()
+        assert chart.getvalue() == PNG + b"generate_trade_distribution"
+        assert renderer._render_on_pool.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_chart_type(self, renderer):
+        with pytest.raises(ValueError):
+            await renderer.render("generate_nothing")
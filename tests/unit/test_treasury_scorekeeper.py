@@ -0,0 +1,191 @@
+"""
+Unit tests for Scorekeeper dirty-row persistence.
+
+Tests:
+- Field assignment marks Position/TradeRecord dirty
+- Only changed rows are written on save
+- Order removal deletes the row
+- Write-behind coalesces bursts into one transaction
+- Mutations wait for an in-flight flush
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+
+from bots.treasury import scorekeeper as sk_module
+from bots.treasury.scorekeeper import Position, Scorekeeper, TradeRecord
+from core.database.pool import ConnectionPool
+
+
+@pytest.fixture
+def scorekeeper(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "core.db"))
+    with patch.object(sk_module, "get_core_db", return_value=pool), \
+         patch.object(sk_module, "DATA_DIR", tmp_path), \
+         patch.object(sk_module, "SCOREKEEPER_FILE", tmp_path / "missing.json"), \
+         patch.object(sk_module, "ORDERS_FILE", tmp_path / "missing_orders.json"), \
+         patch.object(Scorekeeper, "_instance", None):
+        keeper = Scorekeeper()
+        keeper.extract_learnings_from_closed_position = lambda position: []
+        yield keeper, pool
+        keeper.set_write_behind(0)
+    pool.close_all()
+
+
+def _open(keeper, position_id, mint="MINT"):
+    return keeper.open_position(
+        position_id=position_id,
+        symbol="TKN",
+        token_mint=mint,
+        entry_price=1.0,
+        entry_amount_sol=1.0,
+        entry_amount_tokens=100.0,
+        take_profit_price=2.0,
+        stop_loss_price=0.5,
+    )
+
+
+class TestChangeTracking:
+    """Dirty flags on dataclass rows."""
+
+    def test_assignment_marks_dirty(self):
+        pos = Position("p", "S", "M", 1.0, 1.0, 1.0, 2.0, 0.5)
+        assert pos.is_dirty
+        pos.mark_clean()
+        assert not pos.is_dirty
+        pos.status = "closed_tp"
+        assert pos.is_dirty
+
+    def test_to_dict_excludes_tracking_state(self):
+        trade = TradeRecord("t", "S", "M", "buy", 1.0, 1.0, 1.0, "ts")
+        assert "_dirty" not in trade.to_dict()
+
+
+class TestDirtyRowPersistence:
+    """Saves upsert only what changed."""
+
+    def test_round_trip(self, scorekeeper):
+        keeper, pool = scorekeeper
+        _open(keeper, "p1")
+        keeper.close_position("p1", exit_price=2.0, exit_amount_sol=2.0, close_type="tp")
+
+        with pool.connection() as conn:
+            row = conn.execute("SELECT status, pnl_sol FROM positions WHERE id = 'p1'").fetchone()
+            trades = conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0]
+            score = conn.execute("SELECT winning_trades FROM scorecard").fetchone()[0]
+        assert row["status"] == "closed_tp"
+        assert row["pnl_sol"] == pytest.approx(1.0)
+        assert trades == 2
+        assert score == 1
+
+    def test_only_dirty_rows_written(self, scorekeeper):
+        keeper, _ = scorekeeper
+        for i in range(5):
+            _open(keeper, f"p{i}")
+
+        written = []
+        original = keeper._write_rows
+
+        def spy(positions, trades, *args):
+            written.append(([p.id for p in positions], [t.id for t in trades]))
+            return original(positions, trades, *args)
+
+        with patch.object(keeper, "_write_rows", side_effect=spy):
+            _open(keeper, "p5")
+
+        assert written == [(["p5"], ["buy_p5"])]
+
+    def test_clean_save_is_noop(self, scorekeeper):
+        keeper, _ = scorekeeper
+        _open(keeper, "p1")
+        with patch.object(keeper, "_write_rows") as write:
+            keeper.flush()
+        write.assert_not_called()
+
+    def test_remove_order_deletes_row(self, scorekeeper):
+        keeper, pool = scorekeeper
+        keeper.save_order("o1", {"side": "tp"})
+        keeper.save_order("o2", {"side": "sl"})
+        keeper.remove_order("o1")
+
+        with pool.connection() as conn:
+            ids = [r["order_id"] for r in conn.execute("SELECT order_id FROM treasury_orders")]
+        assert ids == ["o2"]
+
+    def test_failed_write_requeues_rows(self, scorekeeper):
+        keeper, pool = scorekeeper
+        with patch.object(keeper, "_write_rows", side_effect=RuntimeError("database is locked")):
+            _open(keeper, "p1")
+        assert keeper.positions["p1"].is_dirty
+
+        keeper.flush()
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM positions").fetchone()[0] == 1
+
+
+class TestWriteBehind:
+    """Coalesced transactions."""
+
+    def test_burst_coalesced(self, scorekeeper):
+        keeper, pool = scorekeeper
+        keeper.set_write_behind(0.05)
+
+        with patch.object(keeper, "_write_rows", wraps=keeper._write_rows) as write:
+            for i in range(10):
+                _open(keeper, f"p{i}")
+            write.assert_not_called()
+
+            deadline = time.monotonic() + 2.0
+            while not write.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+            with keeper._save_lock:  # Wait for the in-flight flush to finish
+                pass
+
+        assert write.call_count == 1
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM positions").fetchone()[0] == 10
+
+    def test_explicit_flush_cancels_timer(self, scorekeeper):
+        keeper, pool = scorekeeper
+        keeper.set_write_behind(60)
+        _open(keeper, "p1")
+        keeper.flush()
+
+        assert keeper._flush_timer is None
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM positions").fetchone()[0] == 1
+
+    def test_mutations_wait_for_in_flight_flush(self, scorekeeper):
+        keeper, pool = scorekeeper
+        _open(keeper, "p0")
+        keeper.positions["p0"].stop_loss_price = 0.4
+
+        entered, release = threading.Event(), threading.Event()
+        real_write = keeper._write_rows
+
+        def slow_write(*args):
+            entered.set()
+            release.wait(2.0)
+            real_write(*args)
+
+        with patch.object(keeper, "_write_rows", side_effect=slow_write):
+            flusher = threading.Thread(target=keeper.flush)
+            flusher.start()
+            assert entered.wait(2.0)
+
+            opener = threading.Thread(target=_open, args=(keeper, "p1"))
+            opener.start()
+            opener.join(0.1)
+            assert opener.is_alive()  # Blocked until the flush has written its snapshot
+            assert "p1" not in keeper.positions
+
+            release.set()
+            flusher.join(2.0)
+            opener.join(2.0)
+        assert not opener.is_alive()
+
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM positions").fetchone()[0] == 2
@@ -0,0 +1,153 @@
+"""
+Unit tests for the TP/SL trigger book and LimitOrderManager's use of it.
+
+Tests:
+- TriggerBook crossing semantics, ordering, cancellation
+- One price request per mint per poll
+- Pushed prices trigger orders without polling
+"""
+
+import random
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from bots.treasury.jupiter import LimitOrderManager, SwapResult
+from bots.treasury.trigger_book import STOP_LOSS, TAKE_PROFIT, TriggerBook
+
+
+class TestTriggerBook:
+    """Sorted threshold book."""
+
+    def test_crossing_thresholds(self):
+        book = TriggerBook()
+        book.add("tp1", "M", TAKE_PROFIT, 1.5)
+        book.add("tp2", "M", TAKE_PROFIT, 2.0)
+        book.add("sl1", "M", STOP_LOSS, 0.8)
+        book.add("sl2", "M", STOP_LOSS, 0.5)
+
+        assert book.on_price("M", 1.0) == []
+        assert book.on_price("M", 1.5) == [("tp1", TAKE_PROFIT)]  # Inclusive
+        assert book.on_price("M", 0.4) == [("sl1", STOP_LOSS), ("sl2", STOP_LOSS)]
+        assert book.on_price("M", 0.4) == []  # Fired orders are gone
+        assert len(book) == 1
+        assert "tp2" in book
+
+    def test_mints_are_independent(self):
+        book = TriggerBook()
+        book.add("a", "A", TAKE_PROFIT, 1.0)
+        book.add("b", "B", TAKE_PROFIT, 1.0)
+
+        assert book.on_price("A", 5.0) == [("a", TAKE_PROFIT)]
+        assert book.mints() == ["B"]
+
+    def test_remove_and_replace(self):
+        book = TriggerBook()
+        book.add("x", "M", STOP_LOSS, 0.9)
+        book.add("y", "M", STOP_LOSS, 0.9)
+        assert book.remove("x")
+        assert not book.remove("x")
+
+        book.add("y", "M", TAKE_PROFIT, 3.0)  # Replaces the stop-loss
+        assert book.on_price("M", 0.1) == []
+        assert book.on_price("M", 3.0) == [("y", TAKE_PROFIT)]
+        assert book.mints() == []
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(3)
+        book = TriggerBook()
+        orders = {}
+        for i in range(500):
+            kind = rng.choice([TAKE_PROFIT, STOP_LOSS])
+            target = round(rng.uniform(0.5, 1.5), 2)
+            book.add(str(i), "M", kind, target)
+            orders[str(i)] = (kind, target)
+
+        for price in [1.0, 1.1, 0.9, 1.3, 0.6, 1.49]:
+            expected = {
+                oid for oid, (kind, target) in orders.items()
+                if (kind == TAKE_PROFIT and price >= target) or (kind == STOP_LOSS and price <= target)
+            }
+            fired = {oid for oid, _ in book.on_price("M", price)}
+            assert fired == expected
+            for oid in fired:
+                del orders[oid]
+
+    def test_rejects_unknown_type(self):
+        with pytest.raises(ValueError):
+            TriggerBook().add("x", "M", "TRAILING", 1.0)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    jupiter = MagicMock()
+    jupiter.get_quote = AsyncMock(return_value=MagicMock(output_amount_ui=1.0))
+    jupiter.execute_swap = AsyncMock(return_value=SwapResult(success=True, signature="sig"))
+    with patch.object(LimitOrderManager, "ORDERS_FILE", tmp_path / "limit_orders.json"):
+        yield LimitOrderManager(jupiter, MagicMock())
+
+
+class TestLimitOrderManagerBook:
+    """LimitOrderManager polling and pushed prices."""
+
+    @pytest.mark.asyncio
+    async def test_one_price_request_per_mint(self, manager):
+        manager.jupiter.get_token_price = AsyncMock(return_value=1.0)
+        for i in range(10):
+            await manager.create_take_profit("MintA", 100, 2.0 + i)
+            await manager.create_stop_loss("MintB", 100, 0.5)
+
+        await manager._check_orders()
+
+        assert sorted(c.args[0] for c in manager.jupiter.get_token_price.call_args_list) == ["MintA", "MintB"]
+        assert all(o['status'] == 'ACTIVE' for o in manager.orders.values())
+
+    @pytest.mark.asyncio
+    async def test_pushed_price_executes_crossed_orders(self, manager):
+        tp = await manager.create_take_profit("MintA", 100, 2.0)
+        far = await manager.create_take_profit("MintA", 100, 9.0)
+        sl = await manager.create_stop_loss("MintA", 100, 0.5)
+
+        executed = await manager.on_price("MintA", 2.5)
+
+        assert executed == [tp]
+        assert manager.orders[tp]['status'] == 'COMPLETED'
+        assert manager.orders[tp]['triggered_price'] == 2.5
+        assert manager.orders[far]['status'] == 'ACTIVE'
+        assert manager.orders[sl]['status'] == 'ACTIVE'
+        assert await manager.on_price("MintA", 2.5) == []
+
+    @pytest.mark.asyncio
+    async def test_cancelled_orders_never_fire(self, manager):
+        sl = await manager.create_stop_loss("MintA", 100, 0.5)
+        await manager.cancel_order(sl)
+
+        assert await manager.on_price("MintA", 0.1) == []
+        manager.jupiter.execute_swap.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_book_rebuilt_from_disk(self, manager):
+        tp = await manager.create_take_profit("MintA", 100, 2.0)
+        sl = await manager.create_stop_loss("MintA", 100, 0.5)
+        await manager.cancel_order(sl)
+
+        with patch.object(LimitOrderManager, "ORDERS_FILE", manager.ORDERS_FILE):
+            reloaded = LimitOrderManager(manager.jupiter, MagicMock())
+
+        assert await reloaded.on_price("MintA", 0.1) == []
+        assert await reloaded.on_price("MintA", 3.0) == [tp]
+
+    @pytest.mark.asyncio
+    async def test_price_failure_skips_only_that_mint(self, manager):
+        async def get_token_price(mint):
+            if mint == "Bad":
+                raise RuntimeError("api down")
+            return 5.0
+
+        manager.jupiter.get_token_price = AsyncMock(side_effect=get_token_price)
+        bad = await manager.create_take_profit("Bad", 100, 2.0)
+        good = await manager.create_take_profit("Good", 100, 2.0)
+
+        await manager._check_orders()
+
+        assert manager.orders[bad]['status'] == 'ACTIVE'
+        assert manager.orders[good]['status'] == 'COMPLETED'
@@ -451,6 +451,79 @@ class TestNoveltyDetection:
         assert is_similar is False
 
 
+class TestNearDuplicateIndex:
+    """Tests for the MinHash/LSH near-duplicate index behind novelty checks."""
+
+    def test_store_indexes_tweet(self, memory, temp_db):
+        """Test storing a tweet writes features, LSH buckets and cashtags."""
+        memory.store_tweet("t1", "$WIF momentum continues on strong volume", "trending_token", ["WIF"])
+
+        conn = sqlite3.connect(str(temp_db))
+        features = conn.execute("SELECT COUNT(*) FROM tweet_dedup_features").fetchone()[0]
+        bands = conn.execute("SELECT COUNT(*) FROM tweet_dedup_lsh WHERE tweet_id = 't1'").fetchone()[0]
+        tokens = conn.execute("SELECT token FROM tweet_dedup_tokens WHERE tweet_id = 't1'").fetchall()
+        conn.close()
+
+        assert features == 1
+        assert bands > 0
+        assert tokens == [("WIF",)]
+
+    def test_lsh_finds_near_duplicate(self, memory):
+        """Test reworded tweets are found through shared LSH buckets."""
+        memory.store_tweet(
+            "t1", "Agents shipping code while humans sleep is the real alpha here", "agentic", []
+        )
+        for i in range(20):
+            memory.store_tweet(f"noise{i}", f"Unrelated update number {i} about weather", "misc", [])
+
+        is_similar, similar = memory.is_similar_to_recent(
+            "Agents shipping code while humans sleep is the real alpha now", hours=24
+        )
+
+        assert is_similar is True
+        assert similar.startswith("Agents shipping code")
+
+    def test_low_threshold_scans_window(self, memory):
+        """Test thresholds below the LSH floor still compare every recent tweet."""
+        memory.store_tweet("t1", "alpha beta gamma delta epsilon", "misc", [])
+
+        is_similar, _ = memory.is_similar_to_recent("alpha zeta eta theta iota", hours=24, threshold=0.1)
+
+        assert is_similar is True
+
+    def test_backfill_existing_tweets(self, temp_db):
+        """Test tweets stored before the index existed are indexed on startup."""
+        XMemory(db_path=temp_db)
+        conn = sqlite3.connect(str(temp_db))
+        conn.execute("DROP TABLE tweet_dedup_features")
+        conn.execute(
+            "INSERT INTO tweets (tweet_id, content, category, cashtags, posted_at) VALUES (?, ?, ?, ?, ?)",
+            ("old", "$BONK at $0.002 breaking out", "trending_token", "[]",
+             datetime.now(timezone.utc).isoformat()),
+        )
+        conn.commit()
+        conn.close()
+
+        memory = XMemory(db_path=temp_db)
+        is_similar, _ = memory.is_similar_to_recent("$BONK at $0.002 again", hours=24)
+
+        assert is_similar is True
+
+    def test_index_respects_time_window(self, memory, temp_db):
+        """Test indexed tweets outside the window are ignored."""
+        memory.store_tweet("t1", "$WIF at $0.50 looking good", "trending_token", ["WIF"])
+        old = (datetime.now(timezone.utc) - timedelta(hours=72)).isoformat()
+        conn = sqlite3.connect(str(temp_db))
+        conn.execute("UPDATE tweets SET posted_at = ? WHERE tweet_id = 't1'", (old,))
+        conn.commit()
+        conn.close()
+
+        is_similar, _ = memory.is_similar_to_recent("$WIF at $0.50 looking good", hours=48)
+
+        assert is_similar is False
+        assert memory.calculate_content_freshness("$WIF at $0.50 looking good") == 1.0
+
+
 # =============================================================================
 # Context Tracking Tests
 # =============================================================================
@@ -13,7 +13,7 @@ from io import BytesIO
 from telegram import InputMediaPhoto
 from telegram.ext import ContextTypes
 
-from .chart_generator import ChartGenerator
+from .chart_renderer import get_chart_renderer
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +31,7 @@ class ChartIntegration:
         """
         self.trader = trader_instance
         self.dashboard = dashboard
-        self.chart_gen = ChartGenerator()
+        self.renderer = get_chart_renderer()  # Renders off the event loop, cached
 
     # ==================== DASHBOARD WITH CHARTS ====================
 
@@ -270,7 +270,7 @@ class ChartIntegration:
             }
 
             # Generate heatmap
-            heatmap = self.chart_gen.generate_sentiment_heatmap(
+            heatmap = await self.renderer.generate_sentiment_heatmap(
                 symbols=list(sentiment_data.keys()),
                 sentiment_scores=sentiment_data,
                 time_period="24h",
@@ -298,7 +298,7 @@ class ChartIntegration:
             dates = [datetime.utcnow() - timedelta(days=i) for i in range(30, 0, -1)]
             values = [10000 + i * 150 for i in range(30)]
 
-            return self.chart_gen.generate_portfolio_chart(values, dates)
+            return await self.renderer.generate_portfolio_chart(net_values=values, dates=dates)
         except Exception as e:
             logger.warning(f"Portfolio chart generation failed: {e}")
             return None
@@ -317,7 +317,7 @@ class ChartIntegration:
             if not allocation:
                 return None
 
-            return self.chart_gen.generate_position_allocation(allocation)
+            return await self.renderer.generate_position_allocation(positions=allocation)
         except Exception as e:
             logger.warning(f"Allocation chart generation failed: {e}")
             return None
@@ -329,7 +329,7 @@ class ChartIntegration:
             dates = [datetime.utcnow() - timedelta(days=i) for i in range(30, 0, -1)]
             values = [10000 + i * 150 for i in range(30)]
 
-            return self.chart_gen.generate_drawdown_chart(values, dates)
+            return await self.renderer.generate_drawdown_chart(net_values=values, dates=dates)
         except Exception as e:
             logger.warning(f"Drawdown chart generation failed: {e}")
             return None
@@ -345,7 +345,7 @@ class ChartIntegration:
             if not position:
                 return None
 
-            return self.chart_gen.generate_price_chart(
+            return await self.renderer.generate_price_chart(
                 symbol=symbol,
                 prices=prices,
                 times=times,
@@ -362,7 +362,7 @@ class ChartIntegration:
             # TODO: Fetch closed trades
             pnl_values = [100, 250, -50, 120, 300, -75, 85, 220, -30, 150]
 
-            return self.chart_gen.generate_trade_distribution(pnl_values)
+            return await self.renderer.generate_trade_distribution(pnl_values=pnl_values)
         except Exception as e:
             logger.warning(f"Trade distribution chart generation failed: {e}")
             return None
@@ -384,7 +384,7 @@ class ChartIntegration:
                 for p in positions
             ]
 
-            return self.chart_gen.generate_risk_return_plot(position_data)
+            return await self.renderer.generate_risk_return_plot(positions=position_data)
         except Exception as e:
             logger.warning(f"Risk/return chart generation failed: {e}")
             return None
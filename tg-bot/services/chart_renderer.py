@@ -0,0 +1,364 @@
+"""
+Chart Renderer - off-loop chart rendering for async Telegram handlers.
+
+ChartGenerator runs matplotlib synchronously; a single render can hold the
+event loop for hundreds of milliseconds. ChartRenderer wraps it so handlers
+can simply ``await`` a chart:
+
+- Figures render in a warm process pool whose workers import matplotlib
+  (Agg backend) and build a ChartGenerator once at startup
+- Output PNGs are content-addressed: the key is a SHA-256 of the chart type
+  and its canonicalized inputs, cached in an in-memory LRU and on disk
+- Concurrent requests for the same chart (e.g. a whole group asking for the
+  same price chart) share one in-flight render
+
+Usage:
+    renderer = get_chart_renderer()
+    png = await renderer.generate_price_chart(symbol="SOL", prices=p, times=t)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.state_paths import STATE_PATHS
+
+logger = logging.getLogger(__name__)
+
+# Bump when chart styling/layout changes so stale PNGs are not served from disk
+RENDER_VERSION = 1
+
+CHART_TYPES = frozenset({
+    "generate_price_chart",
+    "generate_portfolio_chart",
+    "generate_position_allocation",
+    "generate_drawdown_chart",
+    "generate_trade_distribution",
+    "generate_risk_return_plot",
+    "generate_sentiment_heatmap",
+})
+
+DEFAULT_CACHE_DIR = STATE_PATHS.data_dir / "chart_cache"
+
+
+# =============================================================================
+# Worker process
+# =============================================================================
+
+_worker_generator = None
+
+
+def _init_worker():
+    """Preload matplotlib and the chart generator once per worker."""
+    global _worker_generator
+    import matplotlib
+    matplotlib.use("Agg")
+    from .chart_generator import ChartGenerator
+    _worker_generator = ChartGenerator()
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _render_in_worker(chart: str, kwargs: Dict[str, Any]) -> bytes:
+    """Render one chart and return the PNG bytes."""
+    if _worker_generator is None:
+        _init_worker()
+    return getattr(_worker_generator, chart)(**kwargs).getvalue()
+
+
+# =============================================================================
+# Cache keys
+# =============================================================================
+
+def _canonical(value: Any) -> Any:
+    """JSON fallback for chart inputs (datetimes, numpy arrays/scalars)."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Unsupported chart input: {type(value).__name__}")
+
+
+def chart_key(chart: str, kwargs: Dict[str, Any]) -> str:
+    """Content address of a chart: hash of its type, inputs and render version."""
+    payload = json.dumps(
+        [RENDER_VERSION, chart, kwargs],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=_canonical,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# =============================================================================
+# Renderer
+# =============================================================================
+
+class ChartRenderer:
+    """Render ChartGenerator charts off the event loop, with PNG caching."""
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        memory_items: int = 128,
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+        max_disk_items: int = 2000,
+    ):
+        """
+        Initialize chart renderer.
+
+        Args:
+            max_workers: Rendering processes
+            memory_items: PNGs kept in the in-memory LRU
+            cache_dir: On-disk PNG cache directory (None disables it)
+            max_disk_items: PNGs kept on disk before the oldest are pruned
+        """
+        self.max_workers = max_workers
+        self.memory_items = memory_items
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_disk_items = max_disk_items
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._disk_writes = 0
+
+        self.stats = {
+            "renders": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "shared": 0,
+            "errors": 0,
+        }
+
+    # ==================== LIFECYCLE ====================
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: never fork a process that is running an event loop and threads
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return self._pool
+
+    async def start(self):
+        """Start all workers now so the first chart does not pay for imports."""
+        loop = asyncio.get_running_loop()
+        pool = self._ensure_pool()
+        pids = await asyncio.gather(*(
+            loop.run_in_executor(pool, _ping) for _ in range(self.max_workers)
+        ))
+        logger.info(f"Chart renderer ready ({len(set(pids))} worker processes)")
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    # ==================== RENDERING ====================
+
+    async def render(self, chart: str, **kwargs) -> BytesIO:
+        """
+        Render a chart, reusing a cached or in-flight PNG for identical inputs.
+
+        Args:
+            chart: ChartGenerator method name (see CHART_TYPES)
+            **kwargs: Arguments for that method
+
+        Returns:
+            BytesIO PNG image (a fresh buffer per caller)
+        """
+        if chart not in CHART_TYPES:
+            raise ValueError(f"Unknown chart type: {chart}")
+
+        key = chart_key(chart, kwargs)
+
+        png = self._memory.get(key)
+        if png is not None:
+            self._memory.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return BytesIO(png)
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["shared"] += 1
+        else:
+            # Own task: cancelling any one caller must not cancel the shared render
+            task = asyncio.ensure_future(self._render_and_remember(key, chart, kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())  # Retrieved even with no waiters left
+
+        return BytesIO(await asyncio.shield(task))
+
+    async def _render_and_remember(self, key: str, chart: str, kwargs: Dict[str, Any]) -> bytes:
+        try:
+            png = await self._load_or_render(key, chart, kwargs)
+            self._remember(key, png)
+            return png
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _load_or_render(self, key: str, chart: str, kwargs: Dict[str, Any]) -> bytes:
+        loop = asyncio.get_running_loop()
+
+        if self.cache_dir is not None:
+            png = await loop.run_in_executor(None, self._read_disk, key)
+            if png is not None:
+                self.stats["disk_hits"] += 1
+                return png
+
+        try:
+            png = await self._render_on_pool(chart, kwargs)
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+        self.stats["renders"] += 1
+
+        if self.cache_dir is not None:
+            loop.run_in_executor(None, self._write_disk, key, png)
+        return png
+
+    async def _render_on_pool(self, chart: str, kwargs: Dict[str, Any]) -> bytes:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._ensure_pool(), _render_in_worker, chart, kwargs)
+        except BrokenProcessPool:
+            # A worker died (OOM, segfault in a backend); restart the pool once
+            logger.warning("Chart worker pool broke; restarting")
+            self.shutdown()
+            return await loop.run_in_executor(self._ensure_pool(), _render_in_worker, chart, kwargs)
+
+    # ==================== CACHES ====================
+
+    def _remember(self, key: str, png: bytes):
+        self._memory[key] = png
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.png"
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        path = self._disk_path(key)
+        try:
+            png = path.read_bytes()
+            os.utime(path)  # Recently used files survive pruning
+            return png
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, png: bytes):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_dir / f".{key}.{os.getpid()}.tmp"
+            tmp.write_bytes(png)
+            os.replace(tmp, self._disk_path(key))
+        except OSError as e:
+            logger.debug(f"Chart cache write failed: {e}")
+            return
+
+        self._disk_writes += 1
+        if self._disk_writes % 100 == 0:
+            self._prune_disk()
+
+    def _prune_disk(self):
+        """Drop the least recently used PNGs beyond max_disk_items."""
+        try:
+            files = sorted(self.cache_dir.glob("*.png"), key=lambda p: p.stat().st_mtime)
+            for path in files[:max(0, len(files) - self.max_disk_items)]:
+                path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Chart cache prune failed: {e}")
+
+    # ==================== CHART TYPES ====================
+
+    async def generate_price_chart(
+        self,
+        *,
+        symbol: str,
+        prices: List[float],
+        times: List[datetime],
+        ma_short: Optional[List[float]] = None,
+        ma_long: Optional[List[float]] = None,
+        entry_price: Optional[float] = None,
+        exit_price: Optional[float] = None,
+    ) -> BytesIO:
+        """Price chart with moving averages and entry/exit markers."""
+        return await self.render(
+            "generate_price_chart", symbol=symbol, prices=prices, times=times,
+            ma_short=ma_short, ma_long=ma_long, entry_price=entry_price, exit_price=exit_price,
+        )
+
+    async def generate_portfolio_chart(
+        self,
+        *,
+        net_values: List[float],
+        dates: List[datetime],
+        benchmark: Optional[List[float]] = None,
+    ) -> BytesIO:
+        """Portfolio performance chart."""
+        return await self.render(
+            "generate_portfolio_chart", net_values=net_values, dates=dates, benchmark=benchmark,
+        )
+
+    async def generate_position_allocation(self, *, positions: Dict[str, float]) -> BytesIO:
+        """Pie chart of position allocation."""
+        return await self.render("generate_position_allocation", positions=positions)
+
+    async def generate_drawdown_chart(self, *, net_values: List[float], dates: List[datetime]) -> BytesIO:
+        """Drawdown analysis chart."""
+        return await self.render("generate_drawdown_chart", net_values=net_values, dates=dates)
+
+    async def generate_trade_distribution(self, *, pnl_values: List[float]) -> BytesIO:
+        """Histogram of trade P&L distribution."""
+        return await self.render("generate_trade_distribution", pnl_values=pnl_values)
+
+    async def generate_risk_return_plot(self, *, positions: List[Dict[str, Any]]) -> BytesIO:
+        """Risk/return scatter plot."""
+        return await self.render("generate_risk_return_plot", positions=positions)
+
+    async def generate_sentiment_heatmap(
+        self,
+        *,
+        symbols: List[str],
+        sentiment_scores: Dict[str, Dict[str, float]],
+        time_period: str = "24h",
+    ) -> BytesIO:
+        """Sentiment heatmap across multiple sources."""
+        return await self.render(
+            "generate_sentiment_heatmap", symbols=symbols,
+            sentiment_scores=sentiment_scores, time_period=time_period,
+        )
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_renderer_instance: Optional[ChartRenderer] = None
+
+
+def get_chart_renderer() -> ChartRenderer:
+    """Get singleton chart renderer instance."""
+    global _renderer_instance
+    if _renderer_instance is None:
+        _renderer_instance = ChartRenderer()
+    return _renderer_instance
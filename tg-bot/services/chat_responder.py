@@ -33,6 +33,7 @@ from tg_bot.services.memory_service import (
     store_conversation_fact,
 )
 from core.async_utils import fire_and_forget
+from core.llm.warm_worker import ClaudeCLISession, LLMWorkerError, WarmWorkerPool
 from tg_bot.services.supermemory_context import get_supermemory_bridge
 
 # Voice bible - canonical brand guide (lazy-loaded to avoid circular imports)
@@ -50,6 +51,12 @@ logger = logging.getLogger(__name__)
 # Memory integration toggle
 TELEGRAM_MEMORY_ENABLED = os.getenv("TELEGRAM_MEMORY_ENABLED", "true").lower() == "true"
 
+# Warm Claude CLI sessions for chat replies (0 = spawn the CLI per reply)
+CLI_WARM_WORKERS = int(os.getenv("TG_CLI_WARM_WORKERS", "2"))
+
+# Combined CLI prompt budget (voice bible + chat context + message)
+CLI_PROMPT_MAX_CHARS = 10000
+
 # Persistent memory import (lazy-loaded to avoid circular imports)
 _persistent_memory = None
 
@@ -290,6 +297,7 @@ class ChatResponder:
         self._last_mood = "neutral"
         self._session_learnings = []  # Things learned this session
         self._cli_path = "claude"  # CLI path - CLI ONLY mode
+        self._cli_pool: Optional[WarmWorkerPool] = None
 
     def _get_cli_path(self) -> Optional[str]:
         """Get the resolved CLI path that actually works."""
@@ -322,6 +330,71 @@ class ChatResponder:
         """Check if Claude CLI is available."""
         return bool(self._get_cli_path())
 
+    def _get_cli_pool(self) -> Optional[WarmWorkerPool]:
+        """Warm CLI sessions started with the voice bible as system prompt.
+
+        Returns None when disabled (TG_CLI_WARM_WORKERS=0) or the CLI is missing.
+        """
+        if self._cli_pool is None and CLI_WARM_WORKERS > 0:
+            cli_path = self._get_cli_path()
+            if cli_path:
+                self._cli_pool = WarmWorkerPool(
+                    lambda: ClaudeCLISession(cli_path, system_prompt=JARVIS_VOICE_BIBLE),
+                    size=CLI_WARM_WORKERS,
+                    request_timeout=60.0,
+                )
+                fire_and_forget(self._cli_pool.start(), name="tg_cli_pool_warmup")
+        return self._cli_pool
+
+    def get_cli_pool_metrics(self) -> Dict:
+        """Latency/queue metrics of the warm CLI pool (empty if not running)."""
+        return self._cli_pool.get_metrics() if self._cli_pool else {}
+
+    def _build_cli_prompt(self, system_prompt: str, user_prompt: str, static_prefix: str = "") -> str:
+        """
+        Combine prompts for the CLI (which doesn't have separate system prompt).
+
+        Args:
+            system_prompt: System instructions
+            user_prompt: User message
+            static_prefix: Leading part of system_prompt the session already
+                holds as its system prompt; dropped here but still counted
+                against the prompt budget
+        """
+        if static_prefix and system_prompt.startswith(static_prefix):
+            system_prompt = system_prompt[len(static_prefix):].lstrip()
+        else:
+            static_prefix = ""
+        max_chars = CLI_PROMPT_MAX_CHARS - len(static_prefix)
+
+        combined_prompt = f"""You are JARVIS. Follow these instructions:
+
+{system_prompt}
+
+User message:
+{user_prompt}
+
+Respond briefly (under 200 words) in character as JARVIS:"""
+
+        # Truncate if too long - increased limit to preserve full personality
+        # JARVIS_VOICE_BIBLE is ~8600 chars, need higher limit to avoid cutting personality
+        if len(combined_prompt) > max_chars:
+            # Smart truncation: keep core personality, truncate conversation context
+            voice_bible_marker = "TELEGRAM CHAT CONTEXT"
+            if voice_bible_marker in combined_prompt:
+                parts = combined_prompt.split(voice_bible_marker, 1)
+                # Keep voice bible intact, truncate context if needed
+                context_part = voice_bible_marker + parts[1] if len(parts) > 1 else ""
+                if len(parts[0]) + len(context_part) > max_chars:
+                    # Truncate context part only
+                    max_context = max_chars - len(parts[0]) - 500  # Leave room
+                    context_part = context_part[:max_context] + "\n\n[context truncated]"
+                combined_prompt = parts[0] + context_part
+            else:
+                # Fallback: simple truncation
+                combined_prompt = combined_prompt[:max_chars]
+        return combined_prompt
+
     def _run_cli_for_chat(self, system_prompt: str, user_prompt: str) -> Optional[str]:
         """
         Run Claude CLI for chat generation.
@@ -342,33 +415,7 @@ class ChatResponder:
             return None
 
         try:
-            # Combine prompts for CLI (which doesn't have separate system prompt)
-            combined_prompt = f"""You are JARVIS. Follow these instructions:
-
-{system_prompt}
-
-User message:
-{user_prompt}
-
-Respond briefly (under 200 words) in character as JARVIS:"""
-
-            # Truncate if too long - increased limit to preserve full personality
-            # JARVIS_VOICE_BIBLE is ~8600 chars, need higher limit to avoid cutting personality
-            if len(combined_prompt) > 10000:
-                # Smart truncation: keep core personality, truncate conversation context
-                voice_bible_marker = "TELEGRAM CHAT CONTEXT"
-                if voice_bible_marker in combined_prompt:
-                    parts = combined_prompt.split(voice_bible_marker, 1)
-                    # Keep voice bible intact, truncate context if needed
-                    context_part = voice_bible_marker + parts[1] if len(parts) > 1 else ""
-                    if len(parts[0]) + len(context_part) > 10000:
-                        # Truncate context part only
-                        max_context = 10000 - len(parts[0]) - 500  # Leave room
-                        context_part = context_part[:max_context] + "\n\n[context truncated]"
-                    combined_prompt = parts[0] + context_part
-                else:
-                    # Fallback: simple truncation
-                    combined_prompt = combined_prompt[:10000]
+            combined_prompt = self._build_cli_prompt(system_prompt, user_prompt)
 
             # Build command
             cmd_args = [
@@ -1174,6 +1221,7 @@ Never mention Claude or Anthropic.
             active_participants=active_participants,
             recent_context=recent_context,
             moderation_context=moderation_ctx,
+            chat_id=chat_id,
         )
         if reply:
             # VOICE BIBLE VALIDATION: Ensure response adheres to Jarvis personality
@@ -1315,6 +1363,7 @@ Never mention Claude or Anthropic.
         active_participants: Optional[List[str]] = None,
         recent_context: Optional[List[Dict]] = None,
         moderation_context: str = "",
+        chat_id: int = 0,
     ) -> str:
         # Build prompts first (needed for both CLI and API)
         system_prompt = self._system_prompt(
@@ -1332,6 +1381,21 @@ Never mention Claude or Anthropic.
         # CLI ONLY - no API fallback (per user requirement)
         if self._cli_available():
             logger.info("Using Claude CLI for chat response (CLI-only mode)")
+
+            # Warm session first: voice bible is already loaded, no process spawn
+            pool = self._get_cli_pool()
+            if pool is not None:
+                try:
+                    cli_result = await pool.submit(
+                        self._build_cli_prompt(system_prompt, user_prompt, JARVIS_VOICE_BIBLE),
+                        key=chat_id or None,
+                    )
+                    if cli_result:
+                        logger.info("Chat response generated via warm Claude CLI session")
+                        return self._clean_reply(cli_result)
+                except LLMWorkerError as exc:
+                    logger.warning(f"Warm Claude CLI session failed ({exc}); spawning CLI")
+
             loop = asyncio.get_event_loop()
             cli_result = await loop.run_in_executor(
                 None,
@@ -1386,3 +1450,5 @@ Never mention Claude or Anthropic.
     async def close(self) -> None:
         if self._session and not self._session.closed:
             await self._session.close()
+        if self._cli_pool:
+            await self._cli_pool.close()
@@ -208,9 +208,9 @@ class SignalService:
         # 1. Try core signal aggregator first (has everything)
         if self._core_available.get("signal_aggregator"):
             try:
-                from core.signal_aggregator import get_comprehensive_signal as core_signal
+                from core.signal_aggregator import get_comprehensive_signal_async as core_signal
 
-                result = core_signal(
+                result = await core_signal(
                     token_address,
                     include_sentiment=include_sentiment and self.config.has_grok(),
                 )
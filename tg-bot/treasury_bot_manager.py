@@ -25,6 +25,7 @@ from tg_bot.services.treasury_bot import TreasuryBot
 from tg_bot.services.treasury_dashboard import TreasuryDashboard
 from tg_bot.services.chart_generator import ChartGenerator
 from tg_bot.services.chart_integration import ChartIntegration
+from tg_bot.services.chart_renderer import get_chart_renderer
 from tg_bot.services.alert_system import AlertSystem
 from tg_bot.services.market_intelligence import MarketIntelligence
 from tg_bot.services.help_reference import HelpReference
@@ -66,6 +67,7 @@ class TreasuryBotManager:
         # Initialize services
         self.dashboard = TreasuryDashboard(trading_engine)
         self.chart_gen = ChartGenerator()
+        self.chart_renderer = get_chart_renderer()
         self.chart_integration = ChartIntegration(trading_engine, self.dashboard)
         self.alerts = AlertSystem(trading_engine)
         self.alerts.set_admin_ids(admin_ids)
@@ -117,6 +119,12 @@ class TreasuryBotManager:
             await self.app.initialize()
             await self.app.start()
 
+            # Warm the chart workers so the first /dashboard doesn't wait on imports
+            try:
+                await self.chart_renderer.start()
+            except Exception as e:
+                logger.warning(f"Chart renderer warm-up failed: {e}")
+
             logger.info("Treasury Bot initialized successfully")
             return True
 
@@ -303,6 +311,8 @@ class TreasuryBotManager:
             except Exception:
                 pass
 
+        self.chart_renderer.shutdown()
+
         logger.info("Treasury Bot shutdown complete")
 
     # ==================== STATUS & REPORTING ====================